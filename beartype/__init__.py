@@ -33,7 +33,17 @@ automation.
 # ....................{ IMPORTS                           }....................
 # Publicize the private @beartype._decor.beartype decorator as
 # @beartype.beartype, preserving all implementation details as private.
-from beartype._decor.main import beartype
+from beartype._decor.main import (
+    beartype,
+    beartype_O1,
+    beartype_Ologn,
+    beartype_On,
+    beartype_freeze_unions,
+)
+
+# Publicize the private enumerations of container type-checking strategies and
+# container index sources accepted by the @beartype.beartype decorator.
+from beartype._decor._data import BeartypeIndexKind, BeartypeStrategyKind
 
 # For PEP 8 compliance, versions constants expected by external automation are
 # imported under their PEP 8-mandated names.
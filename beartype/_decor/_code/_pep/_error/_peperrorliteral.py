@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2020 Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Beartype PEP-compliant type hint call-time utilities** (i.e., callables
+operating on PEP-compliant type hints intended to be called by dynamically
+generated wrapper functions wrapping decorated callables).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                           }....................
+from beartype._decor._code._pep._error._peperrorsleuth import CauseSleuth
+from beartype._util.hint.data.pep.proposal.utilhintdatapep586 import (
+    HINT_PEP586_SIGNS_LITERAL)
+from beartype._util.text.utiltextrepr import get_object_representation
+
+# See the "beartype.__init__" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ GETTERS                           }....................
+def get_cause_or_none_literal(sleuth: CauseSleuth) -> 'Optional[str]':
+    '''
+    Human-readable string describing the failure of the passed arbitrary object
+    to satisfy the passed `PEP 586`_-compliant literal type hint if this object
+    actually fails to satisfy this hint *or* ``None`` otherwise (i.e., if this
+    object satisfies this hint).
+
+    Parameters
+    ----------
+    sleuth : CauseSleuth
+        Type-checking error cause sleuth.
+
+    .. _PEP 586:
+       https://www.python.org/dev/peps/pep-0586
+    '''
+    assert isinstance(sleuth, CauseSleuth), f'{repr(sleuth)} not cause sleuth.'
+    assert sleuth.hint_sign in HINT_PEP586_SIGNS_LITERAL, (
+        f'{repr(sleuth.hint)} not literal.')
+
+    # If this pith is of the same exact type as and compares equal to any
+    # literal object subscripting this hint, return "None".
+    #
+    # Note that this mirrors the type-qualified comparison performed by code
+    # generated by the pep_code_check_hint() function, preserving the
+    # distinction between literal objects comparing equal despite differing in
+    # type (e.g., "True" and "1").
+    if any(
+        type(sleuth.pith) is type(hint_literal) and sleuth.pith == hint_literal
+        for hint_literal in sleuth.hint_childs
+    ):
+        return None
+    # Else, this pith satisfies *NO* such object.
+
+    # Return a substring describing this failure intended to be embedded in a
+    # longer string.
+    return (
+        f'value {get_object_representation(sleuth.pith)} not any of '
+        f'{", ".join(repr(hint_literal) for hint_literal in sleuth.hint_childs)}'
+    )
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2020 Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Beartype PEP-compliant type hint call-time utilities** (i.e., callables
+operating on PEP-compliant type hints intended to be called by dynamically
+generated wrapper functions wrapping decorated callables).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                           }....................
+from beartype._decor._code._pep._error._peperrortype import (
+    get_cause_or_none_type)
+from beartype._decor._code._pep._error._peperrorsleuth import CauseSleuth
+from beartype._util.hint.data.pep.utilhintdatapep import (
+    HINT_PEP_SIGNS_MAPPING)
+from beartype._util.hint.pep.proposal.utilhintpep589 import (
+    get_hint_pep589_keys,
+    is_hint_pep589,
+)
+from beartype._util.hint.pep.utilhintpepget import get_hint_pep_type_origin
+from beartype._util.hint.utilhinttest import is_hint_ignorable
+from beartype._util.text.utiltextrepr import get_object_representation
+
+# See the "beartype.__init__" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ GETTERS ~ mapping                 }....................
+def get_cause_or_none_mapping(sleuth: CauseSleuth) -> 'Optional[str]':
+    '''
+    Human-readable string describing the failure of the passed arbitrary object
+    to satisfy the passed **PEP-compliant mapping type hint** (i.e.,
+    PEP-compliant type hint accepting either one or two subscripted type hint
+    arguments constraining *all* keys and values of this object, which
+    necessarily satisfies the :class:`collections.abc.Mapping` protocol) if
+    this object actually fails to satisfy this hint *or* ``None`` otherwise
+    (i.e., if this object satisfies this hint).
+
+    Parameters
+    ----------
+    sleuth : CauseSleuth
+        Type-checking error cause sleuth.
+    '''
+    assert isinstance(sleuth, CauseSleuth), f'{repr(sleuth)} not cause sleuth.'
+    assert sleuth.hint_sign in HINT_PEP_SIGNS_MAPPING, (
+        f'{repr(sleuth.hint)} not mapping.')
+
+    # Assert this mapping was subscripted by either one or two arguments. Note
+    # that the "typing" module should have already guaranteed this on our
+    # behalf.
+    assert 1 <= len(sleuth.hint_childs) <= 2, (
+        f'Mapping {repr(sleuth.hint)} not subscripted by one or two '
+        f'arguments.')
+
+    # Non-"typing" class originating this attribute (e.g., "dict" for "Dict").
+    hint_type_origin = get_hint_pep_type_origin(sleuth.hint)
+
+    # If this pith is *NOT* an instance of this class, defer to the getter
+    # function handling non-"typing" classes.
+    if not isinstance(sleuth.pith, hint_type_origin):
+        return get_cause_or_none_type(sleuth.permute(hint=hint_type_origin))
+    # Else, this pith is an instance of this class and is thus a mapping.
+
+    # Child hints constraining the keys and values of this mapping if
+    # unignorable *OR* "None" otherwise. Since the values of counters are
+    # implicitly integers, counters are subscripted by only a key child hint.
+    hint_child_key = sleuth.hint_childs[0]
+    if is_hint_ignorable(hint_child_key):
+        hint_child_key = None
+    hint_child_value = (
+        sleuth.hint_childs[1] if len(sleuth.hint_childs) == 2 else None)
+    if is_hint_ignorable(hint_child_value):
+        hint_child_value = None
+
+    # If both child hints are ignorable, all mappings satisfy this hint.
+    if hint_child_key is None and hint_child_value is None:
+        return None
+    # Else, either child hint is unignorable.
+
+    # Unqualified name of the class of this mapping.
+    pith_classname = sleuth.pith.__class__.__name__
+
+    # For each item of this mapping...
+    for pith_key, pith_value in sleuth.pith.items():
+        # If the key child hint is unignorable...
+        if hint_child_key is not None:
+            # Human-readable string describing the failure of this key to
+            # satisfy this child hint if this key actually fails to satisfy
+            # this child hint *or* "None" otherwise.
+            pith_key_cause = sleuth.permute(
+                pith=pith_key, hint=hint_child_key).get_cause_or_none()
+
+            # If this key is the cause of this failure, return a substring
+            # describing this failure by embedding this failure (itself
+            # intended to be embedded in a longer string).
+            if pith_key_cause is not None:
+                return f'{pith_classname} key {pith_key_cause}'
+            # Else, this key is *NOT* the cause of this failure.
+
+        # If the value child hint is unignorable...
+        if hint_child_value is not None:
+            # Human-readable string describing the failure of this value to
+            # satisfy this child hint if this value actually fails to satisfy
+            # this child hint *or* "None" otherwise.
+            pith_value_cause = sleuth.permute(
+                pith=pith_value, hint=hint_child_value).get_cause_or_none()
+
+            # If this value is the cause of this failure, return a substring
+            # describing this failure.
+            if pith_value_cause is not None:
+                # Truncated representation of the key of this value.
+                pith_key_repr = get_object_representation(pith_key)
+
+                # Return a substring describing this failure.
+                return (
+                    f'{pith_classname} value of key {pith_key_repr} '
+                    f'{pith_value_cause}'
+                )
+            # Else, this value is *NOT* the cause of this failure.
+
+    # Return "None", as all items of this pith are valid, implying this pith to
+    # deeply satisfy this hint.
+    return None
+
+# ....................{ GETTERS ~ typeddict               }....................
+def get_cause_or_none_typeddict(sleuth: CauseSleuth) -> 'Optional[str]':
+    '''
+    Human-readable string describing the failure of the passed arbitrary object
+    to satisfy the passed :class:`typing.TypedDict` subclass if this object
+    actually fails to satisfy this hint *or* ``None`` otherwise (i.e., if this
+    object satisfies this hint).
+
+    Since this object is type-checked against *all* type-checkable keys of
+    this typed dictionary, this getter reports the first invalid value of this
+    object even when the wrapper function calling this getter type-checked
+    only a pseudo-randomly selected subset of these keys.
+
+    Parameters
+    ----------
+    sleuth : CauseSleuth
+        Type-checking error cause sleuth.
+    '''
+    assert isinstance(sleuth, CauseSleuth), f'{repr(sleuth)} not cause sleuth.'
+    assert is_hint_pep589(sleuth.hint), (
+        f'{repr(sleuth.hint)} not typed dictionary.')
+
+    # If this pith is *NOT* a dictionary, defer to the getter function handling
+    # non-"typing" classes. Since typed dictionaries prohibit isinstance()
+    # checks, this pith is type-checked against the dictionary superclass of
+    # all typed dictionaries instead.
+    if not isinstance(sleuth.pith, dict):
+        return get_cause_or_none_type(sleuth.permute(hint=dict))
+    # Else, this pith is a dictionary.
+
+    # Frozen set of the names of all required keys of this typed dictionary
+    # and tuple describing all type-checkable keys of this typed dictionary.
+    keys_required, keys_checkable = get_hint_pep589_keys(sleuth.hint)
+
+    # Unqualified name of the class of this dictionary.
+    pith_classname = sleuth.pith.__class__.__name__
+
+    # Frozen set of the names of all required keys missing from this pith.
+    keys_missing = keys_required - sleuth.pith.keys()
+
+    # If this pith is missing one or more required keys, return a substring
+    # describing the first such key in sorted order for determinism.
+    if keys_missing:
+        return (
+            f'{pith_classname} {get_object_representation(sleuth.pith)} '
+            f'missing required key {repr(min(keys_missing))}'
+        )
+    # Else, this pith contains all required keys.
+
+    # For the name and child hint of each type-checkable key of this typed
+    # dictionary...
+    for key_name, key_hint, _ in keys_checkable:
+        # If this key is optional and absent from this pith, silently continue
+        # to the next.
+        if key_name not in sleuth.pith:
+            continue
+        # Else, this key is present in this pith.
+
+        # Human-readable string describing the failure of the value of this
+        # key to satisfy this child hint if this value actually fails to
+        # satisfy this child hint *or* "None" otherwise.
+        pith_value_cause = sleuth.permute(
+            pith=sleuth.pith[key_name], hint=key_hint).get_cause_or_none()
+
+        # If this value is the cause of this failure, return a substring
+        # describing this failure.
+        if pith_value_cause is not None:
+            return (
+                f'{pith_classname} value of key {repr(key_name)} '
+                f'{pith_value_cause}'
+            )
+        # Else, this value is *NOT* the cause of this failure. Silently
+        # continue to the next.
+
+    # Return "None", as all values of this pith are valid, implying this pith
+    # to deeply satisfy this hint.
+    return None
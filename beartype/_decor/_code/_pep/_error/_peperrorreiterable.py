@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2020 Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Beartype PEP-compliant type hint call-time utilities** (i.e., callables
+operating on PEP-compliant type hints intended to be called by dynamically
+generated wrapper functions wrapping decorated callables).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                           }....................
+from beartype._decor._code._pep._error._peperrortype import (
+    get_cause_or_none_type)
+from beartype._decor._code._pep._error._peperrorsleuth import CauseSleuth
+from beartype._decor._code._pep._pepsample import get_reiterable_items
+from beartype._util.hint.data.pep.utilhintdatapep import (
+    HINT_PEP_SIGNS_REITERABLE)
+from beartype._util.hint.pep.utilhintpepget import get_hint_pep_type_origin
+from beartype._util.hint.utilhinttest import is_hint_ignorable
+from beartype._util.text.utiltextrepr import get_object_representation
+
+# See the "beartype.__init__" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ GETTERS ~ reiterable              }....................
+def get_cause_or_none_reiterable(sleuth: CauseSleuth) -> 'Optional[str]':
+    '''
+    Human-readable string describing the failure of the passed arbitrary object
+    to satisfy the passed **PEP-compliant reiterable type hint** (i.e.,
+    PEP-compliant type hint accepting either one or two subscripted type hint
+    arguments constraining *all* items of this object, which is necessarily
+    iterable but neither a sequence nor mapping) if this object actually fails
+    to satisfy this hint *or* ``None`` otherwise (i.e., if this object
+    satisfies this hint).
+
+    Parameters
+    ----------
+    sleuth : CauseSleuth
+        Type-checking error cause sleuth.
+    '''
+    assert isinstance(sleuth, CauseSleuth), f'{repr(sleuth)} not cause sleuth.'
+    assert sleuth.hint_sign in HINT_PEP_SIGNS_REITERABLE, (
+        f'{repr(sleuth.hint)} not reiterable.')
+
+    # Assert this reiterable was subscripted by either one or two arguments.
+    # Note that the "typing" module should have already guaranteed this on our
+    # behalf.
+    assert 1 <= len(sleuth.hint_childs) <= 2, (
+        f'Reiterable {repr(sleuth.hint)} not subscripted by one or two '
+        f'arguments.')
+
+    # Non-"typing" class originating this attribute (e.g., "set" for "Set").
+    hint_type_origin = get_hint_pep_type_origin(sleuth.hint)
+
+    # If this pith is *NOT* an instance of this class, defer to the getter
+    # function handling non-"typing" classes.
+    if not isinstance(sleuth.pith, hint_type_origin):
+        return get_cause_or_none_type(sleuth.permute(hint=hint_type_origin))
+    # Else, this pith is an instance of this class and is thus iterable.
+
+    # Iterable over the items of this pith if this pith is safely sampleable
+    # *OR* the empty tuple otherwise. Since wrapper functions intentionally
+    # avoid iterating reiterables that are *NOT* safely sampleable (e.g.,
+    # user-defined collections, one-shot iterators), these reiterables are
+    # only shallowly type-checked and thus satisfy this hint. Likewise, avoid
+    # iterating these reiterables here.
+    pith_items_iter = get_reiterable_items(sleuth.pith)
+
+    # Unqualified name of the class of this reiterable.
+    pith_classname = sleuth.pith.__class__.__name__
+
+    # If this reiterable is subscripted by only one child hint, that hint
+    # constrains *ALL* items of this reiterable. In this case...
+    if len(sleuth.hint_childs) == 1:
+        # Lone child hint of this hint.
+        hint_child = sleuth.hint_childs[0]
+
+        # If this child hint is ignorable, all reiterables satisfy this hint.
+        if is_hint_ignorable(hint_child):
+            return None
+        # Else, this child hint is unignorable.
+
+        # For each item of this reiterable...
+        for pith_item in pith_items_iter:
+            # Human-readable string describing the failure of this item to
+            # satisfy this child hint if this item actually fails to satisfy
+            # this child hint *or* "None" otherwise.
+            pith_item_cause = sleuth.permute(
+                pith=pith_item, hint=hint_child).get_cause_or_none()
+
+            # If this item is the cause of this failure, return a substring
+            # describing this failure by embedding this failure (itself
+            # intended to be embedded in a longer string).
+            if pith_item_cause is not None:
+                return f'{pith_classname} item {pith_item_cause}'
+            # Else, this item is *NOT* the cause of this failure. Silently
+            # continue to the next.
+
+        # Return "None", as all items of this pith are valid, implying this
+        # pith to deeply satisfy this hint.
+        return None
+    # Else, this reiterable is an items view subscripted by two child hints
+    # constraining the keys and values of the 2-tuples "(key, value)" iterated
+    # by this view.
+
+    # Child hints constraining these keys and values if unignorable *OR*
+    # "None" otherwise.
+    hint_child_key = sleuth.hint_childs[0]
+    if is_hint_ignorable(hint_child_key):
+        hint_child_key = None
+    hint_child_value = sleuth.hint_childs[1]
+    if is_hint_ignorable(hint_child_value):
+        hint_child_value = None
+
+    # For each item of this items view...
+    for pith_key, pith_value in pith_items_iter:
+        # If the key child hint is unignorable *AND* this key is the cause of
+        # this failure, return a substring describing this failure.
+        if hint_child_key is not None:
+            pith_key_cause = sleuth.permute(
+                pith=pith_key, hint=hint_child_key).get_cause_or_none()
+            if pith_key_cause is not None:
+                return f'{pith_classname} key {pith_key_cause}'
+
+        # If the value child hint is unignorable *AND* this value is the cause
+        # of this failure, return a substring describing this failure.
+        if hint_child_value is not None:
+            pith_value_cause = sleuth.permute(
+                pith=pith_value, hint=hint_child_value).get_cause_or_none()
+            if pith_value_cause is not None:
+                # Truncated representation of the key of this value.
+                pith_key_repr = get_object_representation(pith_key)
+
+                # Return a substring describing this failure.
+                return (
+                    f'{pith_classname} value of key {pith_key_repr} '
+                    f'{pith_value_cause}'
+                )
+
+    # Return "None", as all items of this pith are valid, implying this pith to
+    # deeply satisfy this hint.
+    return None
@@ -19,6 +19,8 @@ from beartype._util.hint.data.pep.utilhintdatapep import (
     HINT_PEP_SIGNS_SEQUENCE_STANDARD,
     HINT_PEP_SIGNS_TUPLE,
 )
+from beartype._util.hint.pep.proposal.utilhintpep484 import (
+    get_hint_pep484_namedtuple_fields)
 from beartype._util.hint.pep.utilhintpepget import get_hint_pep_type_origin
 from beartype._util.hint.pep.utilhintpeptest import is_hint_pep_tuple_empty
 from beartype._util.hint.utilhinttest import is_hint_ignorable
@@ -168,6 +170,54 @@ def get_cause_or_none_tuple(sleuth: CauseSleuth) -> 'Optional[str]':
     # implying this pith to deeply satisfy this hint.
     return None
 
+
+def get_cause_or_none_namedtuple(sleuth: CauseSleuth) -> 'Optional[str]':
+    '''
+    Human-readable string describing the failure of the passed arbitrary object
+    to satisfy the passed :class:`typing.NamedTuple` subclass declaring one or
+    more type-checkable fields if this object actually fails to satisfy this
+    hint *or* ``None`` otherwise (i.e., if this object satisfies this hint).
+
+    Since this object is type-checked against *all* such fields, this getter
+    reports the first invalid field of this object even when the wrapper
+    function calling this getter type-checked only a pseudo-randomly selected
+    subset of these fields.
+
+    Parameters
+    ----------
+    sleuth : CauseSleuth
+        Type-checking error cause sleuth.
+    '''
+    assert isinstance(sleuth, CauseSleuth), f'{repr(sleuth)} not cause sleuth.'
+
+    # If this pith is *NOT* an instance of this named tuple, defer to the
+    # getter function handling non-"typing" classes.
+    if not isinstance(sleuth.pith, sleuth.hint):
+        return get_cause_or_none_type(sleuth)
+    # Else, this pith is an instance of this named tuple.
+
+    # For the 0-based index, name, and child hint of each type-checkable field
+    # of this named tuple...
+    for field_index, field_name, field_hint in (
+        get_hint_pep484_namedtuple_fields(sleuth.hint)):
+        # Human-readable string describing the failure of this field to
+        # satisfy this child hint if this field actually fails to satisfy this
+        # child hint *or* "None" otherwise.
+        pith_field_cause = sleuth.permute(
+            pith=sleuth.pith[field_index], hint=field_hint).get_cause_or_none()
+
+        # If this field is the cause of this failure, return a substring
+        # describing this failure by embedding this failure (itself intended
+        # to be embedded in a longer string).
+        if pith_field_cause is not None:
+            return f'named tuple field "{field_name}" {pith_field_cause}'
+        # Else, this field is *NOT* the cause of this failure. Silently
+        # continue to the next.
+
+    # Return "None", as all fields of this named tuple are valid, implying
+    # this pith to deeply satisfy this hint.
+    return None
+
 # ....................{ GETTERS ~ private                 }....................
 def _get_cause_or_none_sequence(sleuth: CauseSleuth) -> 'Optional[str]':
     '''
@@ -15,13 +15,17 @@ This private submodule is *not* intended for importation by downstream callers.
 # ....................{ IMPORTS                           }....................
 from beartype.roar import _BeartypeCallHintPepRaiseException
 from beartype._util.hint.pep.proposal.utilhintpep484 import (
+    get_hint_pep484_namedtuple_fields,
     get_hint_pep484_newtype_class,
     is_hint_pep484_newtype,
+    reduce_hint_pep484_typevar,
+    reduce_hint_pep484_union,
 )
 from beartype._util.hint.pep.proposal.utilhintpep544 import (
     get_hint_pep544_io_protocol_from_generic,
     is_hint_pep544_io_generic,
 )
+from beartype._util.hint.pep.proposal.utilhintpep589 import is_hint_pep589
 from beartype._util.hint.pep.proposal.utilhintpep593 import (
     get_hint_pep593_hint,
     is_hint_pep593,
@@ -181,6 +185,19 @@ class CauseSleuth(object):
         # hint to its origin (e.g., "str" in "Annotated[str, 50, False]").
         elif is_hint_pep593(self.hint):
             self.hint = get_hint_pep593_hint(self.hint)
+        # ................{ REDUCTION ~ pep 484 : typevar     }................
+        # If this is a PEP 484-compliant type variable bounded by a type hint
+        # *OR* constrained to two or more type hints, reduce this hint to that
+        # bound *OR* the normalized union of those constraints.
+        elif is_hint_pep_typevar(self.hint):
+            self.hint = reduce_hint_pep484_union(
+                reduce_hint_pep484_typevar(self.hint))
+        # ................{ REDUCTION ~ pep 484 : union       }................
+        # Else, reduce this hint to its normalized form if this hint is a
+        # union (e.g., "int" from "Union[int, bool]") *OR* preserve this hint
+        # as is otherwise.
+        else:
+            self.hint = reduce_hint_pep484_union(self.hint)
         # ................{ REDUCTION ~ end                   }................
 
         # If this hint is PEP-compliant...
@@ -267,12 +284,32 @@ class CauseSleuth(object):
         # If *NO* sign uniquely identifies this hint, this hint is
         # PEP-noncompliant. In this case...
         elif self.hint_sign is None:
-            # Avoid circular import dependencies.
-            from beartype._decor._code._pep._error._peperrortype import (
-                get_cause_or_none_type)
+            # If this hint is a named tuple declaring one or more
+            # type-checkable fields...
+            if get_hint_pep484_namedtuple_fields(self.hint):
+                # Avoid circular import dependencies.
+                from beartype._decor._code._pep._error._peperrorsequence import (
+                    get_cause_or_none_namedtuple)
+
+                # Defer to the getter function supporting named tuples.
+                get_cause_or_none = get_cause_or_none_namedtuple
+            # Else if this hint is a typed dictionary...
+            elif is_hint_pep589(self.hint):
+                # Avoid circular import dependencies.
+                from beartype._decor._code._pep._error._peperrormapping import (
+                    get_cause_or_none_typeddict)
+
+                # Defer to the getter function supporting typed dictionaries.
+                get_cause_or_none = get_cause_or_none_typeddict
+            # Else, this hint is any other non-"typing" class. In this case...
+            else:
+                # Avoid circular import dependencies.
+                from beartype._decor._code._pep._error._peperrortype import (
+                    get_cause_or_none_type)
 
-            # Defer to the getter function supporting non-"typing" classes.
-            get_cause_or_none = get_cause_or_none_type
+                # Defer to the getter function supporting non-"typing"
+                # classes.
+                get_cause_or_none = get_cause_or_none_type
         # Else, this hint is PEP-compliant.
         #
         # If this PEP-compliant hint is its own unsubscripted "typing"
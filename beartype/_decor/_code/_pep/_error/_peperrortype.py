@@ -14,14 +14,30 @@ This private submodule is *not* intended for importation by downstream callers.
 # ....................{ IMPORTS                           }....................
 from beartype.roar import _BeartypeCallHintPepRaiseException
 from beartype._decor._code._pep._error._peperrorsleuth import CauseSleuth
+from beartype._util.hint.data.pep.utilhintdatapep import (
+    HINT_PEP_SIGNS_SUBCLASS)
 from beartype._util.hint.data.pep.proposal.utilhintdatapep484 import (
-    HINT_PEP484_BASE_FORWARDREF)
+    HINT_PEP484_BASE_FORWARDREF,
+    HINT_PEP484_SIGNS_UNION,
+)
 from beartype._util.hint.utilhintget import (
     get_hint_forwardref_classname_relative_to_obj)
+from beartype._util.hint.utilhinttest import is_hint_ignorable
+from beartype._util.hint.pep.proposal.utilhintpep484 import (
+    reduce_hint_pep484_typevar,
+    reduce_hint_pep484_union,
+)
+from beartype._util.hint.pep.proposal.utilhintpep589 import is_hint_pep589
 from beartype._util.hint.pep.utilhintpepget import (
-    get_hint_pep_type_origin_or_none)
+    get_hint_pep_args,
+    get_hint_pep_sign,
+    get_hint_pep_type_origin_or_none,
+)
+from beartype._util.hint.pep.utilhintpeptest import is_hint_pep
 from beartype._util.py.utilpymodule import import_module_attr
 from beartype._util.text.utiltextcause import get_cause_object_not_type
+from beartype._util.text.utiltextjoin import join_delimited_disjunction_classes
+from beartype._util.text.utiltextlabel import label_class
 
 # See the "beartype.__init__" submodule for further commentary.
 __all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
@@ -122,3 +138,84 @@ def get_cause_or_none_type_origin(sleuth: CauseSleuth) -> 'Optional[str]':
 
     # Defer to the getter function handling non-"typing" classes. Presto!
     return get_cause_or_none_type(sleuth.permute(hint=hint_type_origin))
+
+# ....................{ GETTERS ~ subclass                }....................
+def get_cause_or_none_subclass(sleuth: CauseSleuth) -> 'Optional[str]':
+    '''
+    Human-readable string describing the failure of the passed arbitrary object
+    to satisfy the passed **PEP-compliant subclass type hint** (i.e.,
+    PEP-compliant type hint constraining the superclasses of compliant classes
+    (e.g., ``typing.Type[int]``)) if this object actually fails to satisfy
+    this hint *or* ``None`` otherwise (i.e., if this object satisfies this
+    hint).
+
+    Parameters
+    ----------
+    sleuth : CauseSleuth
+        Type-checking error cause sleuth.
+    '''
+    assert isinstance(sleuth, CauseSleuth), f'{repr(sleuth)} not cause sleuth.'
+    assert sleuth.hint_sign in HINT_PEP_SIGNS_SUBCLASS, (
+        f'{repr(sleuth.hint)} not subclass hint.')
+
+    # If this pith is *NOT* a class, return a substring describing this
+    # failure intended to be embedded in a longer string.
+    if not isinstance(sleuth.pith, type):
+        return get_cause_object_not_type(pith=sleuth.pith, hint=type)
+    # Else, this pith is a class.
+    #
+    # If this hint is unsubscripted, this class satisfies this hint.
+    elif not sleuth.hint_childs:
+        return None
+    # Else, this hint is subscripted by a child hint.
+
+    # Child hint subscripting this hint, reduced to the bound or union of the
+    # constraints of this child hint if this child hint is a type variable.
+    hint_child = reduce_hint_pep484_union(
+        reduce_hint_pep484_typevar(sleuth.hint_childs[0]))
+
+    # If this child hint is ignorable, this class satisfies this hint.
+    if is_hint_ignorable(hint_child):
+        return None
+    # Else, this child hint is unignorable.
+    #
+    # If this child hint is a non-"typing" class, this class is required to
+    # subclass only that class.
+    elif not is_hint_pep(hint_child):
+        hint_superclasses = (hint_child,)
+    # Else if this child hint is a union, this class is required to subclass
+    # any class subscripting that union.
+    elif get_hint_pep_sign(hint_child) in HINT_PEP484_SIGNS_UNION:
+        hint_superclasses = get_hint_pep_args(hint_child)
+    # Else, this child hint is neither (e.g., a type variable). Since code
+    # generated by the pep_code_check_hint() function only shallowly
+    # type-checks such hints, this class satisfies this hint.
+    else:
+        return None
+
+    # If any such superclass is either *NOT* a non-"typing" class (e.g., is a
+    # forward reference) *OR* is a typed dictionary prohibiting issubclass()
+    # checks, this hint is only shallowly type-checked as above.
+    #
+    # Note that this mirrors the _get_hint_types_or_none() function called by
+    # code generated by the pep_code_check_hint() function.
+    if not all(
+        isinstance(hint_superclass, type) and
+        not is_hint_pep(hint_superclass) and
+        not is_hint_pep589(hint_superclass)
+        for hint_superclass in hint_superclasses
+    ):
+        return None
+    # Else, all such superclasses are non-"typing" classes.
+    #
+    # If this class subclasses any such superclass, return "None".
+    elif issubclass(sleuth.pith, hint_superclasses):
+        return None
+    # Else, this class subclasses *NO* such superclass.
+
+    # Return a substring describing this failure intended to be embedded in a
+    # longer string.
+    return (
+        f'{label_class(sleuth.pith)} not subclass of '
+        f'{join_delimited_disjunction_classes(hint_superclasses)}'
+    )
@@ -17,6 +17,9 @@ from beartype._util.hint.utilhinttest import is_hint_ignorable
 from beartype._decor._code._pep._error._peperrorsleuth import CauseSleuth
 from beartype._util.hint.data.pep.proposal.utilhintdatapep484 import (
     HINT_PEP484_SIGNS_UNION)
+from beartype._util.hint.pep.proposal.utilhintpep484 import (
+    get_hint_pep484_namedtuple_fields)
+from beartype._util.hint.pep.proposal.utilhintpep589 import is_hint_pep589
 from beartype._util.hint.pep.utilhintpepget import (
     get_hint_pep_type_origin_or_none)
 from beartype._util.hint.pep.utilhintpeptest import is_hint_pep
@@ -119,10 +122,63 @@ def get_cause_or_none_union(sleuth: CauseSleuth) -> 'Optional[str]':
                 f'(i.e., neither PEP type hint nor non-"typing" class).')
             # Else, this child hint is a non-"typing" type.
 
-            # If this pith is an instance of this class, this pith satisfies
-            # this hint. In this case, return "None".
+            # If this class is a typed dictionary prohibiting isinstance()
+            # checks...
+            if is_hint_pep589(hint_child):
+                # If this pith is a dictionary...
+                if isinstance(sleuth.pith, dict):
+                    # Human-readable string describing the failure of the keys
+                    # and values of this pith to satisfy this typed dictionary
+                    # if any *OR* "None" otherwise.
+                    pith_cause_hint_child = sleuth.permute(
+                        hint=hint_child,
+                        cause_indent=CAUSE_INDENT_CHILD,
+                    ).get_cause_or_none()
+
+                    # If this pith satisfies this typed dictionary, return
+                    # "None".
+                    if pith_cause_hint_child is None:
+                        return None
+                    # Else, this pith does *NOT* satisfy this typed dictionary.
+
+                    # Append a cause as a discrete bullet-prefixed line.
+                    causes_union.append(pith_cause_hint_child)
+                # Else, this pith is *NOT* a dictionary. In this case, add
+                # this class to the subset of all classes this pith does *NOT*
+                # satisfy.
+                else:
+                    hint_classes_unsatisfied.add(hint_child)
+
+                # Continue to the next child hint.
+                continue
+            # Else, this class is *NOT* a typed dictionary.
+
+            # If this pith is an instance of this class...
             if isinstance(sleuth.pith, hint_child):
-                return None
+                # If this class is *NOT* a named tuple declaring one or more
+                # type-checkable fields, this pith satisfies this hint. In
+                # this case, return "None".
+                if not get_hint_pep484_namedtuple_fields(hint_child):
+                    return None
+                # Else, this class is such a named tuple.
+
+                # Human-readable string describing the failure of the fields
+                # of this pith to satisfy this named tuple if any *OR* "None"
+                # otherwise.
+                pith_cause_hint_child = sleuth.permute(
+                    hint=hint_child,
+                    cause_indent=CAUSE_INDENT_CHILD,
+                ).get_cause_or_none()
+
+                # If these fields satisfy this named tuple, return "None".
+                if pith_cause_hint_child is None:
+                    return None
+                # Else, these fields do *NOT* satisfy this named tuple.
+
+                # Append a cause as a discrete bullet-prefixed line and
+                # continue to the next child hint.
+                causes_union.append(pith_cause_hint_child)
+                continue
 
             # Else, this pith is *NOT* an instance of this class, implying this
             # pith to *NOT* satisfy this hint. In this case, add this class to
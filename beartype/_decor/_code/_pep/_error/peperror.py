@@ -21,6 +21,12 @@ from beartype.roar import (
 )
 from beartype._decor._code._pep._error._peperrorgeneric import (
     get_cause_or_none_generic)
+from beartype._decor._code._pep._error._peperrorliteral import (
+    get_cause_or_none_literal)
+from beartype._decor._code._pep._error._peperrormapping import (
+    get_cause_or_none_mapping)
+from beartype._decor._code._pep._error._peperrorreiterable import (
+    get_cause_or_none_reiterable)
 from beartype._decor._code._pep._error._peperrorsequence import (
     get_cause_or_none_sequence_standard,
     get_cause_or_none_tuple,
@@ -28,13 +34,17 @@ from beartype._decor._code._pep._error._peperrorsequence import (
 from beartype._decor._code._pep._error._peperrorsleuth import CauseSleuth
 from beartype._decor._code._pep._error._peperrortype import (
     get_cause_or_none_forwardref,
+    get_cause_or_none_subclass,
     get_cause_or_none_type_origin,
 )
 from beartype._decor._code._pep._error._peperrorunion import (
     get_cause_or_none_union,
 )
 from beartype._util.hint.data.pep.utilhintdatapep import (
+    HINT_PEP_SIGNS_MAPPING,
+    HINT_PEP_SIGNS_REITERABLE,
     HINT_PEP_SIGNS_SEQUENCE_STANDARD,
+    HINT_PEP_SIGNS_SUBCLASS,
     HINT_PEP_SIGNS_TUPLE,
     HINT_PEP_SIGNS_TYPE_ORIGIN,
 )
@@ -42,6 +52,8 @@ from beartype._util.hint.data.pep.proposal.utilhintdatapep484 import (
     HINT_PEP484_BASE_FORWARDREF,
     HINT_PEP484_SIGNS_UNION,
 )
+from beartype._util.hint.data.pep.proposal.utilhintdatapep586 import (
+    HINT_PEP586_SIGNS_LITERAL)
 from beartype._util.hint.utilhinttest import die_unless_hint
 from beartype._util.text.utiltextlabel import (
     label_callable_decorated_param_value,
@@ -258,16 +270,36 @@ def _init() -> None:
         PEP_HINT_SIGN_TO_GET_CAUSE_FUNC[pep_sign_sequence_standard] = (
             get_cause_or_none_sequence_standard)
 
+    # Map each mapping "typing" attribute to the appropriate getter.
+    for pep_sign_mapping in HINT_PEP_SIGNS_MAPPING:
+        PEP_HINT_SIGN_TO_GET_CAUSE_FUNC[pep_sign_mapping] = (
+            get_cause_or_none_mapping)
+
+    # Map each reiterable "typing" attribute to the appropriate getter.
+    for pep_sign_reiterable in HINT_PEP_SIGNS_REITERABLE:
+        PEP_HINT_SIGN_TO_GET_CAUSE_FUNC[pep_sign_reiterable] = (
+            get_cause_or_none_reiterable)
+
     # Map each tuple "typing" attribute to the appropriate getter.
     for pep_sign_tuple in HINT_PEP_SIGNS_TUPLE:
         PEP_HINT_SIGN_TO_GET_CAUSE_FUNC[pep_sign_tuple] = (
             get_cause_or_none_tuple)
 
+    # Map each subclass "typing" attribute to the appropriate getter.
+    for pep_sign_subclass in HINT_PEP_SIGNS_SUBCLASS:
+        PEP_HINT_SIGN_TO_GET_CAUSE_FUNC[pep_sign_subclass] = (
+            get_cause_or_none_subclass)
+
     # Map each unifying "typing" attribute to the appropriate getter.
     for pep_sign_type_union in HINT_PEP484_SIGNS_UNION:
         PEP_HINT_SIGN_TO_GET_CAUSE_FUNC[pep_sign_type_union] = (
             get_cause_or_none_union)
 
+    # Map each literal "typing" attribute to the appropriate getter.
+    for pep_sign_literal in HINT_PEP586_SIGNS_LITERAL:
+        PEP_HINT_SIGN_TO_GET_CAUSE_FUNC[pep_sign_literal] = (
+            get_cause_or_none_literal)
+
     # Map each "typing" attribute validated by a unique getter specific to that
     # attribute to that getter.
     PEP_HINT_SIGN_TO_GET_CAUSE_FUNC.update({
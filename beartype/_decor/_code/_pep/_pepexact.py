@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2020 Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Beartype PEP-compliant exact type getters** (i.e., callables returning the
+sets of **exact types** (i.e., types of items as returned by the builtin
+:func:`type` function) whose instances are guaranteed to satisfy child type
+hints, enabling full-scan container type-checking to compare the set of exact
+types of all items of a container against these sets rather than passing each
+item to the :func:`isinstance` builtin).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                           }....................
+import builtins
+from beartype._util.cache.utilcachecall import callable_cached
+
+# See the "beartype.__init__" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ PRIVATE ~ sets                    }....................
+_BUILTIN_TYPES = frozenset(
+    builtin_attr
+    for builtin_attr in vars(builtins).values()
+    if isinstance(builtin_attr, type)
+) | {type(None)}
+'''
+Frozen set of all **builtin types** (i.e., types declared by the standard
+:mod:`builtins` module *and* the type of the ``None`` singleton), whose
+instances comprise the vast majority of items of the containers type-checked
+under the ``O(n)`` container type-checking strategy.
+'''
+
+# ....................{ GETTERS                           }....................
+@callable_cached
+def get_types_exact(hint_types: tuple) -> frozenset:
+    '''
+    Frozen set of all exact types whose instances are guaranteed to satisfy
+    the passed tuple of non-:mod:`typing` classes (i.e., to be instances of one
+    or more of these classes).
+
+    This frozen set contains:
+
+    * Each such class.
+    * Each builtin type subclassing any such class (e.g., :class:`bool` for
+      :class:`int`, :class:`int` and :class:`float` for
+      :class:`numbers.Real`).
+
+    Since this set is *not* guaranteed to contain *all* exact types satisfying
+    these classes (e.g., user-defined subclasses of these classes), callers are
+    required to fallback to passing items whose exact types are *not* in this
+    set to the :func:`isinstance` builtin.
+
+    This getter is memoized for efficiency.
+
+    Parameters
+    ----------
+    hint_types : tuple
+        Tuple of the non-:mod:`typing` classes constraining a child hint
+        (e.g., ``(int,)`` for the ``int`` child of ``typing.List[int]``,
+        ``(int, str)`` for the ``Union[int, str]`` child of
+        ``typing.List[Union[int, str]]``).
+
+    Returns
+    ----------
+    frozenset
+        Frozen set of all such exact types.
+    '''
+    assert isinstance(hint_types, tuple), f'{repr(hint_types)} not tuple.'
+
+    # Set of all exact types satisfying these classes, initialized to these
+    # classes.
+    hint_types_exact = set(hint_types)
+
+    # For each builtin type...
+    for builtin_type in _BUILTIN_TYPES:
+        # If this type subclasses any of these classes, add this type. Since
+        # classes overriding the __subclasscheck__() dunder method (e.g.,
+        # abstract base classes) may raise arbitrary exceptions on being
+        # passed unexpected types, silently ignore these exceptions. Instances
+        # of this type are then type-checked with isinstance() as usual.
+        try:
+            if issubclass(builtin_type, hint_types):
+                hint_types_exact.add(builtin_type)
+        except Exception:
+            pass
+
+    # Return this set frozen for memoization.
+    return frozenset(hint_types_exact)
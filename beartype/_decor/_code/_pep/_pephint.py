@@ -16,282 +16,41 @@ This private submodule is *not* intended for importation by downstream callers.
 '''
 
 # ....................{ TODO                              }....................
-#FIXME: Significant optimizations still remain... when we have sufficient time.
-#Notably, we can replace most existing usage of the generic private
-#"__beartypistry" parameter unconditionally passed to all wrapper functions
-#with specific private "__beartype_hint_{beartypistry_key}" parameters
-#conditionally passed to each individual wrapper function, where:
-#* "{beartypistry_key}" signifies an existing string key of the "bear_typistry"
-#  singleton dictionary munged so as to produce a valid Python identifier.
-#  Notably:
-#  * Rather than use the fully-qualified names of types as we currently do,
-#    we'll instead need to use their hashes. Why? Because Python identifiers
-#    accept a sufficiently small set of permissible characters that there is
-#    *NO* character we could possibly globally replace all "." characters in a
-#    fully-qualified classname with to produce a disambiguous Python
-#    identifier. Consider, for example, the two distinct classnames
-#    "muh_package.muh_module.MuhClass" and
-#    "muh_package_muh_module.MuhClass". Replacing "." characters with "_"
-#    characters in both would produce the same munged Python identifier
-#    "muh_package_muh_module_MuhClass" -- an ambiguous collision. Ergo, hashes.
-#  * Hashes appear to be both negative and positive. So, we'll probably need to
-#    replace "-" substrings prefixing "str(hash(hint))" output with something
-#    sane complying with Python identifiers -- say, the "n" character. *shrug*
-#* "__beartype_hint_{beartypistry_key}" signifies a parameter name whose value
-#  defaults to either a type or tuple of types required by this wrapper
-#  function.
-#
-#For example, if a function internally requires a "muh_package.MuhClass" class,
-#we would then generate wrapper functions resembling:
-#
-#    def muh_wrapper(
-#        *args,
-#        __beartype_func=__beartype_func,
-#        __beartype_hint_24234234240=__beartype_hint_24234234240,
-#    )
-#
-#...where "__beartype_hint_24234234240" would need to be defined within the
-#locals() dictionary passed to the exec() builtin by the "beartype._decor.main"
-#submodule to refer to the "muh_package.MuhClass" class: e.g.,
-#
-#    # In "beartype._decor.main":
-#    local_vars = {
-#        __beartype_hint_24234234240: muh_package.MuhClass,
-#    }
-#
-#Why is this so much more efficient than the current approach? Because lookups
-#into large dictionaries inevitably have non-negligible constants, whereas
-#exploiting default function parameters *IS LITERALLY INSTANTEOUS.* Why?
-#Because Python actually stores function defaults in a tuple at function
-#declaration time, thus minimizing both space and time costs: e.g.,
-#    # It doesn't get faster than this, folks.
-#    >>> def defjam(hmm, yum='Yum!', oko='Kek!'): pass
-#    >>> defjam.__defaults__
-#    ('Yum!', 'Kek!')
-#
-#Clearly, we'll need to carefully consider how we might efficiently percolate
-#that metadata up from this breadth-first traversal to that top-level module.
-#Presumably, we'll want to add a new data structure to the "BeartypeData"
-#object -- say, a new "BeartypeData.param_name_to_value" dictionary mapping
-#private parameter names to values to be passed to the current wrapper.
-#
-#Note that we should still cache at least tuples in the "bear_typistry"
-#singleton dictionary to reduce space consumption for different tuple objects
-#containing the same types, but that we should no longer look those tuples up
-#in that dictionary at runtime from within wrapper functions.
-
-#FIXME: Note that there exist four possible approaches to random item selection
-#for arbitrary containers depending on container type. Either the actual pith
-#object (in descending order of desirability):
-#* Satisfies "collections.abc.Sequence" (*NOTE: NOT* "typing.Sequence", as we
-#  don't particularly care how the pith is type-hinted for this purpose), in
-#  which case the above approach trivially applies.
-#* Else is *NOT* a one-shot container (e.g., generator and... are there any
-#  other one-shot container types?) and is *NOT* slotted (i.e., has no
-#  "__slots__" attribute), then generalize the mapping-specific
-#  _get_dict_nonempty_random_key() approach delineated below.
-#* Else is *NOT* a one-shot container (e.g., generator and... are there any
-#  other one-shot container types?) but is slotted (i.e., has a "__slots__"
-#  attribute), then the best we can do is the trivial O(1) approach by
-#  calling "{hint_child_pith} := next({hint_curr_pith})" to unconditionally
-#  check the first item of this container. What you goin' do? *shrug* (Note
-#  that we could try getting around this with a global cache of weak references
-#  to iterators mapped on object ID, but... ain't nobody got time or interest
-#  for that. Also, prolly plenty dangerous.)
-#* Else is a one-shot container, in which case *DO ABSOLUTELY NUTHIN'.*
-#FIXME: We should ultimately make this user-configurable (e.g., as a global
-#configuration setting). Some users might simply prefer to *ALWAYS* look up a
-#fixed 0-based index (e.g., "0", "-1"). For the moment, however, the above
-#probably makes the most sense as a reasonably general-purpose default.
-
-#FIXME: Note that randomly checking mapping (e.g., "dict") keys and/or values
-#will be non-trivial, as there exists no out-of-the-box O(1) approach in either
-#the general case or the specific case of a "dict". Actually, there does -- but
-#we'll need to either internally or externally maintain one dict.items()
-#iterator for each passed mapping. We should probably investigate the space
-#costs of that *BEFORE* doing so. Assuming minimal costs, one solution under
-#Python >= 3.8 might resemble:
-#* Define a new _get_dict_random_key() function resembling:
-#      def _get_dict_nonempty_random_key(mapping: MappingType) -> object:
-#          '''
-#          Caveats
-#          ----------
-#          **This mapping is assumed to be non-empty.** If this is *not* the
-#          case, this function raises a :class:`StopIteration` exception.
-#          '''
-#          items_iter = getattr(mapping, '__beartype_items_iter', None)
-#          if items_iter is None:
-#              #FIXME: This should probably be a weak reference to prevent
-#              #unwanted reference cycles and hence memory leaks.
-#              #FIXME: We need to protect this both here and below with a
-#              #"try: ... except Exception: ..." block, where the body of the
-#              #"except Exception:" condition should probably just return
-#              #"beartype._util.utilobject.SENTINEL", as the only type hints
-#              #that would ever satisfy are type hints *ALL* objects satisfy
-#              #(e.g., "Any", "object").
-#              mapping.__beartype_items_iter = iter(mapping.items())
-#          try:
-#              return next(mapping.__beartype_items_iter)
-#          # If we get to the end (i.e., the prior call to next() raises a
-#          # "StopIteration" exception) *OR* anything else happens (i.e., the
-#          # prior call to next() raises a "RuntimeError" exception due to the
-#          # underlying mapping having since been externally mutated), just
-#          # start over. :p
-#          except Exception:
-#              mapping.__beartype_items_iter = None
-#
-#              # We could also recursively call ourselves: e.g.,
-#              #     return _get_dict_random_key(mapping)
-#              # However, that would be both inefficient and dangerous.
-#              mapping.__beartype_items_iter = iter(mapping.items())
-#              return next(mapping.__beartype_items_iter)
-#* In "beartype._decor._main":
-#     import _get_dict_nonempty_random_key as __beartype_get_dict_nonempty_random_key
-#* In code generated by this submodule, internally call that helper when
-#  checking keys of non-empty mappings *THAT ARE UNSLOTTED* (for obvious
-#  reasons) ala:
-#  (
-#     {hint_curr_pith} and
-#     not hasattr({hint_curr_pith}, '__slots__') and
-#     {!INSERT_CHILD_TEST_HERE@?(
-#         {hint_child_pith} := __beartype_get_dict_nonempty_random_key({hint_curr_pith}))
-#  )
-#  Obviously not quite right, but gives one the general gist of the thing.
-#
-#We could get around the slots limitation by using an external LRU cache
-#mapping from "dict" object ID to items iterator, and maybe that *IS* what we
-#should do. Actually... *NO.* We absolutely should *NOT* do that sort of thing
-#anywhere in the codebase, as doing so would guaranteeably induce memory leaks
-#by preventing "dict" objects cached in that LRU from being garbage collected.
-#
-#Note that we basically can't do this under Python < 3.8, due to the lack of
-#assignment expressions there. Since _get_dict_nonempty_random_key() returns a
-#new random key each call, we can't repeatedly call that for each child pith
-#and expect the same random key to be returned. So, Python >= 3.8 only. *shrug*
-#
-#Note that the above applies to both immutable mappings (i.e., objects
-#satisfying "Mapping" but *NOT* "MutableMapping"), which is basically none of
-#them, and mutable mappings. Why? Because we don't particularly care if the
-#caller externally modifies the underlying mapping between type-checks, even
-#though the result is the above call to "next(mapping.__beartype_items_iter)"
-#raising a "RuntimeError". Who cares? Whenever an exception occurs, we just
-#restart iteration over from the beginning and carry on. *GOOD 'NUFF.*
-#FIXME: When time permits, we can augment the pretty lame approach by
-#publishing our own "BeartypeDict" class that supports efficient random access
-#of both keys and values. Note that:
-#* The existing third-party "randomdict" package provides baseline logic that
-#  *MIGHT* be useful in getting "BeartypeDict" off the ground. The issue with
-#  "randomdict", however, is that it internally leverages a "list", which
-#  probably then constrains key-value pair deletions on the exterior
-#  "randomdict" object to an O(n) rather than O(1) operation, which is
-#  absolutely unacceptable.
-#* StackOverflow questions provide a number of solutions that appear to be
-#  entirely O(1), but which require maintaining considerably more internal data
-#  structures, which is also unacceptable (albeit less so), due to increased
-#  space consumption that probably grows unacceptable fast and thus fails to
-#  generally scale.
-#* Since we don't control "typing", we'll also need to augment "BeartypeDict"
-#  with a "__class_getitem__" dunder method (or whatever that is called) to
-#  enable that class to be subscripted with "typing"-style types ala:
-#     def muh_func(muh_mapping: BeartypeDict[str, int]) -> None: pass
-#In short, we'll need to conduct considerably more research here.
-
-#FIXME: Add support for "PEP 586 -- Literal Types". Sadly, doing so will be
-#surprisingly non-trivial.
-#
-#First, note that the user-defined literal object defined by a "typing.Literal"
-#hint is available as "hint.__args__[0]". That is, such hints *ALWAYS* have
-#exactly one child hint which is the user-defined literal object.
-#
-#Second, note that mutable objects are *NOT* hashable. So, registering these
-#objects with the "beartypistry" is *NOT* a valid generic solution. That said,
-#we *COULD* technically still do so for the subset of literal objects that are
-#hashable -- which will probably be most of them, actually. To do so, we would
-#then define a new beartype._decor._typistry.register_hashable() function
-#registering a generic hashable. This would then necessitate a new prefix
-#unique to hashables (e.g., "h"). In short, this actually entails quite a bit
-#of work and fails in the general case. So, we might simply avoid this for now.
-#
-#Third, note that one approach would be to augment the breadth-first search
-#performed below to record the "hint_path" used to access the currently visited
-#and possibly nested hint from the universally accessible
-#"__beartype_func.__annotations__[{param_name}]". This is obviously *NOT* the
-#optimally efficient approach, as this will entail multiple dictionary lookups
-#to type-check each literal object. Nonetheless, this is absolutely the
-#simplest approach and thus probably the one we should at least initially
-#pursue. Why? Because literal objects are unlikely to be used much (if at all)
-#in practical real-world applications. We certainly can't think of a single
-#valid use case ourselves. Literal objects are an obvious "code smell." If your
-#callable unconditionally accepts or returns an object, why even go to the
-#trouble of accepting or returning that object in the first place, right? So,
-#efficiency is *ABSOLUTELY* not a concern here.
-#
-#The issue, of course, is that we currently do *NOT* record the "hint_path"
-#used to access the currently visited and possibly nested hint from the
-#universally accessible "__beartype_func.__annotations__[{param_name}]". Doing
-#so will probably prove annoying and possibly non-trivial. Since we might need
-#to refactor quite a bit to do that and would increase the space complexity of
-#this algorithm by a little bit as well, we might consider alternatives.
-#
-#The obvious alternative is to refactor the pep_code_check_hint() function to
-#instead return the 3-tuple "Tuple[str, bool, Tuple[object]]" rather than the
-#2-tuple "Tuple[str, bool]" as we currently do. The new third item of that
-#3-tuple "Tuple[object]" is, of course, the tuple listing all user-defined
-#literal objects (i.e., "hint.__args__[0]" objects) such that the 0-based index
-#in this list of each such object is the breadth-first visitation order in
-#which this submodule discovers that object. Consider the callable with
-#signature:
-#      def muh_func(muh_param: Union[
-#          Literal[True],
-#          Tuple[str, List[Literal['ok']]],
-#          Sequence[Literal[5]],
-#      ]) -> Literal[23.35]: pass
-#
-#The third item of the tuple returned by the pep_code_check_hint() function
-#would then be the following tuple:
-#      (True, 5, 'ok',)
-#
-#Note the unexpected breadth-first ordering and omission of the "23.35" return
-#value literal. In any case, parent functions would then be responsible for
-#aggregating all literal object tuples returned by all calls to the
-#pep_code_check_hint() function for the decorated callable into a new
-#"data.func.__beartype_param_name_to_literals" dictionary mapping from the
-#name of each passed parameter as well as "return" for the return value to the
-#tuple returned by the pep_code_check_hint() function for that parameter.
-#
-#Given that, the pep_code_check_hint() function may then safely and reasonably
-#efficiently access each parameter-specific literal in breadth-first visitation
-#order with a placeholder expression resembling:
-#
-#    PEP586_CODE_PARAM_LITERAL_EXPR = (
-#        '''__beartype_func.__beartype_param_name_to_literals[PEP_CODE_PITH_ROOT_PARAM_NAME_PLACEHOLDER][{literal_curr_index}]''')
-#    '''
-#    `PEP 586`_-compliant Python expression yielding the literal object subscripting
-#    a possibly nested :attr:`typing.Literal` type hint annotated by the current
-#    parameter or return value.
-#
-#    .. _PEP 586:
-#       https://www.python.org/dev/peps/pep-0586
-#    '''
-#
-#This works, because "PEP_CODE_PITH_ROOT_PARAM_NAME_PLACEHOLDER" will be
-#globally replaced by the caller with the code-safe name of this parameter or
-#return value. Pretty sweet, yah? There's basically *NO* other way to
-#reasonably render literal objects accessible. This is sufficiently efficient
-#for these bizarre edge-case objects that this will suffice for all time.
+#FIXME: Containers lacking efficient random access (e.g., mappings, sets) are
+#currently sampled by the stateless getters of the "_pepsample" submodule,
+#which only ever select items from a window of ceil(log2(n + 1)) items at
+#either end of each such container of n items. Items outside that window are
+#thus never type-checked under the O(1) and O(lgn) strategies. Sampling those
+#items would require either caching iterators across calls (which the
+#"_pepsample" submodule intentionally avoids, as doing so would modify
+#caller-owned containers or leak memory) or publishing a beartype-specific
+#mapping type supporting efficient random access of both keys and values.
 
 # ....................{ IMPORTS                           }....................
+from beartype.cave import NoneType
 from beartype.roar import (
     BeartypeDecorHintPepException,
     BeartypeDecorHintPepUnsupportedException,
     BeartypeDecorHintPep484Exception,
 )
+from beartype._decor._data import BeartypeStrategyKind
 from beartype._decor._typistry import (
+    get_typistry_tuple,
     register_typistry_forwardref,
-    register_typistry_type,
-    register_typistry_tuple,
 )
-from beartype._decor._code.codesnip import CODE_INDENT_1, CODE_INDENT_2
+from beartype._decor._code.codesnip import (
+    CODE_INDENT_1,
+    CODE_INDENT_2,
+    PARAM_NAME_HINT_PREFIX,
+)
+from beartype._decor._code._pep._pepexact import get_types_exact
+from beartype._decor._code._pep._pephomogeneous import (
+    get_sequence_homogeneous_types_or_none)
+from beartype._decor._code._pep._pepsubclass import SubclassCache
+from beartype._decor._code._pep._pepunion import (
+    UNION_DISPATCH_INDEX_DETERMINED,
+    UnionTypeDispatch,
+)
 from beartype._decor._code._pep._pepsnip import (
     PEP_CODE_CHECK_HINT_ROOT,
     PEP_CODE_CHECK_HINT_TUPLE_FIXED_PREFIX,
@@ -300,25 +59,69 @@ from beartype._decor._code._pep._pepsnip import (
     PEP_CODE_HINT_CHILD_PLACEHOLDER_SUFFIX,
     PEP_CODE_HINT_FORWARDREF_UNQUALIFIED_PLACEHOLDER_PREFIX,
     PEP_CODE_HINT_FORWARDREF_UNQUALIFIED_PLACEHOLDER_SUFFIX,
+    PEP_CODE_PITH_ITEM_NAME_PREFIX,
     PEP_CODE_PITH_NAME_PREFIX,
     PEP_CODE_PITH_ROOT_NAME,
     PEP_CODE_CHECK_HINT_GENERIC_PREFIX,
     PEP_CODE_CHECK_HINT_GENERIC_SUFFIX,
+    PEP484_CODE_CHECK_HINT_NAMEDTUPLE_CHUNK_SUFFIX,
+    PEP484_CODE_CHECK_HINT_NAMEDTUPLE_PREFIX,
     PEP484_CODE_CHECK_HINT_UNION_PREFIX,
     PEP484_CODE_CHECK_HINT_UNION_SUFFIX,
+    PEP484_CODE_UNION_INDEX_NAME_PREFIX,
+    PEP484_CODE_UNION_TYPE_NAME_PREFIX,
+    PEP586_CODE_CHECK_HINT_LITERAL_PREFIX,
+    PEP586_CODE_LITERAL_TYPE_NAME_PREFIX,
+    PEP589_CODE_CHECK_HINT_TYPEDDICT_CHUNK_SUFFIX,
 
     # Bound format methods.
     PEP_CODE_CHECK_HINT_NONPEP_TYPE_format,
     PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_format,
+    PEP_CODE_CHECK_HINT_CONTAINER_CHILD_ALL_format,
+    PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_HOMOGENEOUS_CHILD_format,
     PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_PITH_CHILD_EXPR_format,
+    PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_PITH_ITEMS_LOG_EXPR_format,
+    PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_TYPES_EXACT_CHILD_format,
     PEP_CODE_CHECK_HINT_TUPLE_FIXED_EMPTY_format,
     PEP_CODE_CHECK_HINT_TUPLE_FIXED_LEN_format,
     PEP_CODE_CHECK_HINT_TUPLE_FIXED_NONEMPTY_CHILD_format,
     PEP_CODE_CHECK_HINT_TUPLE_FIXED_NONEMPTY_PITH_CHILD_EXPR_format,
     PEP_CODE_PITH_ASSIGN_EXPR_format,
     PEP_CODE_CHECK_HINT_GENERIC_CHILD_format,
+    PEP_CODE_CHECK_HINT_CONTAINER_ITEM_ASSIGN_format,
+    PEP_CODE_CHECK_HINT_MAPPING_format,
+    PEP_CODE_CHECK_HINT_MAPPING_PITH_ITEM_EXPR_format,
+    PEP_CODE_CHECK_HINT_MAPPING_PITH_ITEMS_EXPR_format,
+    PEP_CODE_CHECK_HINT_MAPPING_PITH_ITEMS_LOG_EXPR_format,
+    PEP_CODE_CHECK_HINT_MAPPING_PITH_KEY_EXPR_format,
+    PEP_CODE_CHECK_HINT_MAPPING_PITH_VALUE_EXPR_format,
+    PEP_CODE_CHECK_HINT_REITERABLE_format,
+    PEP_CODE_CHECK_HINT_REITERABLE_ITEM_CHILD_format,
+    PEP_CODE_CHECK_HINT_REITERABLE_PITH_ITEM_EXPR_format,
+    PEP_CODE_CHECK_HINT_REITERABLE_PITH_ITEM_TUPLE_EXPR_format,
+    PEP_CODE_CHECK_HINT_REITERABLE_PITH_ITEMS_EXPR_format,
+    PEP_CODE_CHECK_HINT_REITERABLE_PITH_ITEMS_LOG_EXPR_format,
     PEP484_CODE_CHECK_HINT_UNION_CHILD_PEP_format,
     PEP484_CODE_CHECK_HINT_UNION_CHILD_NONPEP_format,
+    PEP484_CODE_CHECK_HINT_UNION_CHILD_NONE_format,
+    PEP484_CODE_CHECK_HINT_UNION_DISPATCH_PREFIX_format,
+    PEP484_CODE_CHECK_HINT_UNION_DISPATCH_CHILD_PEP_format,
+    PEP484_CODE_CHECK_HINT_UNION_DISPATCH_CHILD_NONPEP_format,
+    PEP484_CODE_CHECK_HINT_UNION_DISPATCH_ADAPTIVE_PREFIX_format,
+    PEP484_CODE_CHECK_HINT_UNION_DISPATCH_ADAPTIVE_CHILD_PEP_format,
+    PEP484_CODE_CHECK_HINT_UNION_DISPATCH_ADAPTIVE_CHILD_PEP_FALLBACK_format,
+    PEP484_CODE_CHECK_HINT_SUBCLASS_format,
+    PEP484_CODE_CHECK_HINT_NAMEDTUPLE_CHUNK_PREFIX_format,
+    PEP586_CODE_LITERAL_TYPE_ASSIGN_EXPR_format,
+    PEP586_CODE_CHECK_HINT_LITERAL_SUFFIX_format,
+    PEP586_CODE_CHECK_HINT_LITERAL_CHILDS_HASHABLE_format,
+    PEP586_CODE_CHECK_HINT_LITERAL_CHILD_UNHASHABLE_format,
+    PEP589_CODE_CHECK_HINT_TYPEDDICT_PREFIX_format,
+    PEP589_CODE_CHECK_HINT_TYPEDDICT_KEYS_REQUIRED_format,
+    PEP589_CODE_CHECK_HINT_TYPEDDICT_CHUNK_PREFIX_format,
+    PEP589_CODE_CHECK_HINT_TYPEDDICT_KEY_REQUIRED_CHILD_format,
+    PEP589_CODE_CHECK_HINT_TYPEDDICT_KEY_OPTIONAL_CHILD_format,
+    PEP589_CODE_CHECK_HINT_TYPEDDICT_PITH_VALUE_EXPR_format,
 )
 from beartype._util.cache.utilcachecall import callable_cached
 from beartype._util.cache.pool.utilcachepoollistfixed import (
@@ -334,26 +137,38 @@ from beartype._util.cache.utilcacheerror import (
     EXCEPTION_CACHED_PLACEHOLDER)
 from beartype._util.hint.data.pep.utilhintdatapep import (
     HINT_PEP_SIGNS_SUPPORTED_DEEP,
+    HINT_PEP_SIGNS_MAPPING,
+    HINT_PEP_SIGNS_REITERABLE,
     HINT_PEP_SIGNS_SEQUENCE_STANDARD,
+    HINT_PEP_SIGNS_SUBCLASS,
     HINT_PEP_SIGNS_TUPLE,
 )
 from beartype._util.hint.data.pep.proposal.utilhintdatapep484 import (
     HINT_PEP484_BASE_FORWARDREF,
     HINT_PEP484_SIGNS_UNION,
 )
+from beartype._util.hint.data.pep.proposal.utilhintdatapep586 import (
+    HINT_PEP586_SIGNS_LITERAL)
 from beartype._util.hint.data.utilhintdata import HINTS_IGNORABLE_SHALLOW
 from beartype._util.hint.utilhintget import get_hint_forwardref_classname
 from beartype._util.hint.utilhinttest import is_hint_ignorable
 from beartype._util.hint.pep.proposal.utilhintpep484 import (
     get_hint_pep484_generic_base_erased_from_unerased,
+    get_hint_pep484_namedtuple_fields,
     get_hint_pep484_newtype_class,
     is_hint_pep484_newtype,
+    reduce_hint_pep484_typevar,
+    reduce_hint_pep484_union,
 )
 from beartype._util.hint.pep.proposal.utilhintpep544 import (
     get_hint_pep544_io_protocol_from_generic,
     is_hint_pep544_io_generic,
 )
 from beartype._util.hint.pep.proposal.utilhintpep585 import is_hint_pep585
+from beartype._util.hint.pep.proposal.utilhintpep589 import (
+    get_hint_pep589_keys,
+    is_hint_pep589,
+)
 from beartype._util.hint.pep.proposal.utilhintpep593 import (
     get_hint_pep593_hint,
     is_hint_pep593,
@@ -369,6 +184,7 @@ from beartype._util.hint.pep.utilhintpeptest import (
     die_if_hint_pep_sign_unsupported,
     is_hint_pep,
     is_hint_pep_tuple_empty,
+    is_hint_pep_typevar,
     is_hint_pep_typing,
     warn_if_hint_pep_sign_deprecated,
 )
@@ -504,10 +320,78 @@ Length of the builtin ``or`` operator when suffixing Python code snippets
 generated by the :func:`pep_code_check_hint` function.
 '''
 
+# ....................{ CONSTANTS ~ namedtuple            }....................
+_NAMEDTUPLE_FIELDS_CHUNK_LEN_MAX = 8
+'''
+Maximum number of type-checkable fields of a :class:`typing.NamedTuple`
+subclass type-checked by each call under the ``O(1)`` and ``O(log n)``
+strategies.
+
+Named tuples declaring more such fields are partitioned into chunks of at most
+this many fields, exactly one of which is pseudo-randomly selected and
+type-checked by each call. Under the ``O(n)`` strategy, all such fields are
+type-checked by each call regardless of this limit.
+'''
+
+# ....................{ CONSTANTS ~ typeddict             }....................
+_TYPEDDICT_KEYS_CHUNK_LEN_MAX = 8
+'''
+Maximum number of type-checkable keys of a :class:`typing.TypedDict` subclass
+whose values are type-checked by each call under the ``O(1)`` and ``O(log n)``
+strategies.
+
+Typed dictionaries declaring more such keys are partitioned into chunks of at
+most this many keys, exactly one of which is pseudo-randomly selected and
+type-checked by each call. The presence of *all* required keys is type-checked
+by each call regardless of this limit.
+'''
+
+# ....................{ CONSTANTS ~ union                 }....................
+_UNION_DISPATCH_HINT_CHILDS_PEP_LEN_MIN = 2
+'''
+Minimum number of PEP-compliant child hints subscripting a :class:`typing.Union`
+type for the :func:`pep_code_check_hint` function to generate code dispatching
+on the exact type of the current pith via a union dispatch table rather than
+sequentially type-checking that pith against each such child hint.
+
+Unions subscripted by fewer such hints gain nothing from dispatching, as the
+existing code already type-checks that pith against at most one
+:func:`isinstance` call and one PEP-compliant child hint.
+'''
+
+
+_UNION_DISPATCH_HINT_PEP_SIGNS_DEEP = (
+    HINT_PEP_SIGNS_SEQUENCE_STANDARD |
+    HINT_PEP_SIGNS_TUPLE |
+    HINT_PEP_SIGNS_MAPPING |
+    HINT_PEP_SIGNS_REITERABLE |
+    HINT_PEP_SIGNS_SUBCLASS
+)
+'''
+Frozen set of all signs uniquely identifying deeply type-checked PEP-compliant
+type hints whose generated code is guaranteed to first type-check the current
+pith as an instance of the origin type originating that sign (e.g., ``list``
+for ``typing.List[int]``) and thus dispatchable on by union dispatch tables.
+'''
+
+
+_UNION_DISPATCH_HINT_PEP_SIGNS_UNDISPATCHABLE = frozenset((
+    HINT_PEP484_BASE_FORWARDREF,
+    NoReturn,
+))
+'''
+Frozen set of all signs uniquely identifying PEP-compliant type hints *not*
+deeply supported but nonetheless *not* shallowly type-checked as instances of
+their origin types and thus *not* dispatchable on by union dispatch tables.
+'''
+
 # ....................{ CODERS                            }....................
 @callable_cached
-def pep_code_check_hint(hint: object) -> (
-    'Tuple[str, bool, Optional[Set[str]]'):
+def pep_code_check_hint(
+    hint: object,
+    strategy_kind: BeartypeStrategyKind,
+    is_union_adaptive: bool,
+) -> 'Tuple[str, bool, Tuple[str], Dict[str, object]]':
     '''
     Python code type-checking the previously localized parameter or return
     value annotated by the passed PEP-compliant type hint against this hint of
@@ -540,12 +424,26 @@ def pep_code_check_hint(hint: object) -> (
     ----------
     hint : object
         PEP-compliant type hint to be type-checked.
+    strategy_kind : BeartypeStrategyKind
+        **Container type-checking strategy** (i.e., member of the
+        :class:`beartype._decor._data.BeartypeStrategyKind` enumeration
+        governing how many items of each container transitively visitable
+        from this hint are type-checked). Since the code generated for this
+        hint depends on this strategy, this strategy is intentionally part of
+        the key this code generator is memoized against.
+    is_union_adaptive : bool
+        ``True`` only if unions dispatched on the exact types of piths are to
+        be type-checked via adaptive union dispatch tables (i.e., tables
+        learning which child hint piths of each exact type most frequently
+        satisfy). Since these tables are specific to the code generated for
+        this hint, this boolean is also part of the key this code generator is
+        memoized against.
 
     Returns
     ----------
-    Tuple[str, bool, Optional[Tuple[str]]
-        3-tuple ``(func_code, is_func_code_needs_random_int,
-        hints_forwardref_class_basename)``, where:
+    Tuple[str, bool, Tuple[str], Dict[str, object]]
+        4-tuple ``(func_code, is_func_code_needs_random_int,
+        hints_forwardref_class_basename, hint_param_name_to_hint)``, where:
 
         * ``func_code`` is Python code type-checking the previously localized
           parameter or return value against this hint.
@@ -560,6 +458,12 @@ def pep_code_check_hint(hint: object) -> (
           classnames of `PEP 484`_-compliant relative forward references
           visitable from this root hint (e.g., ``('MuhClass', 'YoClass')``
           given the root hint ``Union['MuhClass', List['YoClass']]``).
+        * ``hint_param_name_to_hint`` is a dictionary mapping from the name of
+          each private hint parameter referenced by ``func_code`` to the
+          type, tuple of types, frozen set of types, or forward reference
+          proxy to be passed as the default value of that parameter to the
+          wrapper function. Since this dictionary is memoized, callers should
+          treat this dictionary as read-only.
 
     Raises
     ----------
@@ -712,6 +616,12 @@ def pep_code_check_hint(hint: object) -> (
     # hint.
     hint_childs_pep = None
 
+    # ..................{ HINT ~ param                      }..................
+    # Dictionary mapping from the name of each private hint parameter required
+    # by this code to the type or tuple of types passed as the default value of
+    # that parameter to the wrapper function.
+    hint_param_name_to_hint = {}
+
     # ..................{ HINT ~ pep 484 : forwardref       }..................
     # Set of the unqualified classnames referred to by all relative forward
     # references visitable from this root hint if any *OR* "None" otherwise
@@ -722,6 +632,10 @@ def pep_code_check_hint(hint: object) -> (
     # forward reference type hint.
     hint_curr_forwardref_classname = None
 
+    # Forward reference proxy deferring the resolution of the class referred
+    # to by the currently visited fully-qualified forward reference type hint.
+    hint_curr_forwardref = None
+
     # ..................{ HINT ~ pep 572                    }..................
     # The following local variables isolated to this subsection are only
     # relevant when these conditions hold:
@@ -812,13 +726,11 @@ def pep_code_check_hint(hint: object) -> (
     # inefficient (and dangerous, due to both unavoidable stack exhaustion and
     # avoidable infinite recursion) recursive algorithm.
     #
-    # Note that this list is guaranteed by the previously called
-    # _die_if_hint_repr_exceeds_child_limit() function to be larger than the
-    # number of hints transitively visitable from this root hint. Ergo, *ALL*
-    # indexation into this list performed by this BFS is guaranteed to be safe.
-    # Ergo, avoid explicitly testing below that the "hints_meta_index_last"
-    # integer maintained by this BFS is strictly less than "SIZE_BIG", as this
-    # constraint is already guaranteed to be the case.
+    # Note that the _enqueue_hint_child() closure defined below structurally
+    # validates the number of hints transitively visitable from this root hint
+    # to *NOT* exceed the length of this list before enqueueing each such hint.
+    # Ergo, *ALL* indexation into this list performed by this BFS is guaranteed
+    # to be safe.
     hints_meta = acquire_fixed_list(SIZE_BIG)
 
     # 0-based index of metadata describing the currently visited hint in the
@@ -871,11 +783,23 @@ def pep_code_check_hint(hint: object) -> (
         # Increment the 0-based index of metadata describing the last visitable
         # hint in the "hints_meta" list *BEFORE* overwriting the existing
         # metadata at this index.
-        #
-        # Note this index is guaranteed to *NOT* exceed the fixed length of
-        # this list, by prior validation.
         hints_meta_index_last += 1
 
+        # If this index exceeds the fixed length of this list, the number of
+        # hints transitively visitable from the root hint exceeds the maximum
+        # number of hints supported by this BFS. In this case, raise an
+        # exception.
+        #
+        # Note that this structural validation replaces the prior approach of
+        # counting delimiters in the machine-readable representation of the
+        # root hint, which needlessly stringified all hints at decoration time.
+        if hints_meta_index_last >= SIZE_BIG:
+            raise BeartypeDecorHintPepException(
+                f'{hint_root_label} {repr(hint_root)} '
+                f'transitively subscripted by more than '
+                f'{SIZE_BIG - 1} child hints exceeding maximum limit.'
+            )
+
         # Increment the unique identifier of the currently iterated child hint.
         hint_child_placeholder_id += 1
 
@@ -1008,6 +932,19 @@ def pep_code_check_hint(hint: object) -> (
         # hint to its origin (e.g., "str" in "Annotated[str, 50, False]").
         elif is_hint_pep593(hint_curr):
             hint_curr = get_hint_pep593_hint(hint_curr)
+        # ................{ REDUCTION ~ pep 484 : typevar     }................
+        # If this is a PEP 484-compliant type variable bounded by a type hint
+        # *OR* constrained to two or more type hints, reduce this hint to that
+        # bound *OR* the normalized union of those constraints.
+        elif is_hint_pep_typevar(hint_curr):
+            hint_curr = reduce_hint_pep484_union(
+                reduce_hint_pep484_typevar(hint_curr))
+        # ................{ REDUCTION ~ pep 484 : union       }................
+        # Else, reduce this hint to its normalized form if this hint is a
+        # union (e.g., "int" from "Union[int, bool]") *OR* preserve this hint
+        # as is otherwise.
+        else:
+            hint_curr = reduce_hint_pep484_union(hint_curr)
         # ................{ REDUCTION ~ end                   }................
 
         #FIXME: Comment this sanity check out after we're sufficiently
@@ -1369,8 +1306,14 @@ def pep_code_check_hint(hint: object) -> (
                         f'{hint_curr_label} ignorable PEP union type hint '
                         f'{repr(hint_curr)} not ignored.')
 
-                    # If this child hint is PEP-compliant...
-                    if is_hint_pep(hint_child):
+                    # If this child hint is either PEP-compliant *OR* a named
+                    # tuple declaring one or more type-checkable fields *OR* a
+                    # typed dictionary...
+                    if (
+                        is_hint_pep(hint_child) or
+                        get_hint_pep484_namedtuple_fields(hint_child) or
+                        is_hint_pep589(hint_child)
+                    ):
                         # Filter this child hint into the set of PEP-compliant
                         # child hints.
                         #
@@ -1389,130 +1332,335 @@ def pep_code_check_hint(hint: object) -> (
                     else:
                         hint_childs_nonpep.add(hint_child)
 
-                # Initialize the code type-checking the current pith against
-                # these arguments to the substring prefixing all such code.
-                func_curr_code = PEP484_CODE_CHECK_HINT_UNION_PREFIX
-
-                # If this union is subscripted by one or more PEP-noncompliant
-                # child hints, generate and append efficient code type-checking
-                # these child hints *BEFORE* less efficient code type-checking
-                # any PEP-compliant child hints subscripting this union.
-                if hint_childs_nonpep:
-                    func_curr_code += (
-                        PEP484_CODE_CHECK_HINT_UNION_CHILD_NONPEP_format(
-                            # Python expression yielding the value of the
-                            # current pith. Specifically...
-                            pith_curr_expr=(
-                                # If this union is subscripted by one or more
-                                # PEP-compliant child hints, prefer the
-                                # expression assigning this value to a local
-                                # variable efficiently reused by subsequent
-                                # code generated for PEP-compliant child hints.
-                                pith_curr_assign_expr if hint_childs_pep else
-                                # Else, this union is *NOT* subscripted by one
-                                # or more PEP-compliant child hints. Since this
-                                # is the first and only test generated for this
-                                # union, prefer the expression yielding the
-                                # value of the current pith *WITHOUT* assigning
-                                # this value to a local variable, which would
-                                # otherwise pointlessly go unused.
-                                pith_curr_expr
-                            ),
-                            # Python expression evaluating to a tuple of these
-                            # arguments when accessed via the private
-                            # "__beartypistry" parameter.
-                            #
-                            # Note that:
-                            # * We would ideally avoid coercing this set into a
-                            #   tuple when this set only contains one type by
-                            #   passing that type directly to the
-                            #   register_typistry_type() function. Sadly, the
-                            #   "set" class defines no convenient or efficient
-                            #   means of retrieving the only item of a 1-set.
-                            #   Indeed, the most efficient means of doing so is
-                            #   to iterate over that set and immediately break:
-                            #     for first_item in muh_set: break
-                            #   While we *COULD* technically leverage that
-                            #   approach here, doing so would also mandate
-                            #   adding a number of intermediate tests, which
-                            #   would certainly reduce any performance gains.
-                            #   Ultimately, we avoid doing so by falling back
-                            #   to the standard approach. See also this
-                            #   relevant self-StackOverflow post:
-                            #       https://stackoverflow.com/a/40054478/2809027
-                            # * These parameters are intentionally passed as
-                            #   positional rather than keyword arguments for
-                            #   optimal memoization efficiency.
-                            hint_curr_expr=register_typistry_tuple(
-                                tuple(hint_childs_nonpep),
-                                # Inform this function it needn't attempt to
-                                # uselessly omit duplicates, since the "typing"
-                                # module already does so for all "Union"
-                                # arguments. Well, that's nice.
-                                True,
-                            )
-                        ))
+                # Union dispatch table mapping from the exact type of the
+                # current pith to the union dispatch index of these child hints
+                # if this union is dispatchable *OR* "None" otherwise.
+                hint_curr_dispatch = (
+                    _get_hint_union_dispatch_or_none(
+                        hint_childs_nonpep, hint_childs_pep, is_union_adaptive)
+                    if (
+                        # The active Python interpreter targets Python >= 3.8
+                        # and thus supports assignment expressions *AND*...
+                        IS_PYTHON_AT_LEAST_3_8 and
+                        # This union is subscripted by enough PEP-compliant
+                        # child hints to benefit from dispatching...
+                        len(hint_childs_pep) >=
+                        _UNION_DISPATCH_HINT_CHILDS_PEP_LEN_MIN
+                    ) else
+                    None
+                )
 
-                # For each PEP-compliant child hint of this union, generate and
-                # append code type-checking this child hint.
-                for hint_child_index, hint_child in enumerate(hint_childs_pep):
-                    func_curr_code += (
-                        PEP484_CODE_CHECK_HINT_UNION_CHILD_PEP_format(
-                            # Python expression yielding the value of the
-                            # current pith.
-                            hint_child_placeholder=_enqueue_hint_child(
-                                # If this union is subscripted by either...
-                                #
-                                # Then prefer the expression efficiently
-                                # reusing the value previously assigned to a
-                                # local variable by either the above
-                                # conditional or prior iteration of the current
-                                # conditional.
-                                pith_curr_assigned_expr
-                                if (
-                                    # One or more PEP-noncompliant child hints
-                                    # *OR*...
-                                    hint_childs_nonpep or
-                                    # This is any PEP-compliant child hint but
-                                    # the first...
-                                    hint_child_index > 1
-                                ) else
-                                # Else, this union is both subscripted by no
-                                # PEP-noncompliant child hints *AND* this is
-                                # the first PEP-compliant child hint, prefer
-                                # the expression assigning this value to a
-                                # local variable efficiently reused by code
-                                # generated by the following "else" condition
-                                # under subsequent iteration.
-                                #
-                                # Note this child hint is guaranteed to be at
-                                # least one more child hint. Why? Because the
-                                # "typing" module forces unions to be
-                                # subscripted by two or more child hints. By
-                                # deduction, this union must thus be
-                                # subscripted by two or more PEP-compliant
-                                # child hints. Ergo, we needn't explicitly
-                                # validate that constraint here.
-                                pith_curr_assign_expr
-                            )))
-
-                # If this code is *NOT* its initial value, this union is
-                # subscripted by one or more unignorable child hints and the
-                # above logic generated code type-checking these child hints.
-                # In this case...
-                if func_curr_code is not PEP484_CODE_CHECK_HINT_UNION_PREFIX:
-                    # Munge this code to...
+                # If this union is dispatchable, generate code type-checking
+                # the current pith against these child hints by looking up the
+                # union dispatch index of the exact type of that pith in this
+                # table *BEFORE* type-checking that pith against only the child
+                # hints that pith could possibly satisfy. Specifically, if this
+                # index is:
+                # * 0, that pith satisfies a type-determined child hint and
+                #   thus this union. No further type-checking is required.
+                # * A positive integer, that pith can only satisfy the
+                #   PEP-compliant child hint with that 1-based index.
+                # * Negative, that pith is type-checked against *ALL* child
+                #   hints as usual. If this table is adaptive, that pith is
+                #   first type-checked against the child hint whose 1-based
+                #   index is the bitwise negation of this index if any (i.e.,
+                #   the child hint most frequently satisfied by piths of that
+                #   type) *BEFORE* being type-checked against all child hints,
+                #   each recording the child hint satisfied by that pith.
+                if hint_curr_dispatch is not None:
+                    # Name of the local variable providing this index, unique
+                    # to this union across all code generated for this hint.
+                    union_index_name = (
+                        PEP484_CODE_UNION_INDEX_NAME_PREFIX +
+                        str(hints_meta_index_curr))
+
+                    # Name of the private hint parameter whose default value
+                    # is this table.
+                    union_dispatch_expr = _register_hint_param(
+                        hint_curr_dispatch, hint_param_name_to_hint)
+
+                    # If this table is adaptive...
+                    if is_union_adaptive:
+                        # Name of the local variable providing the exact type
+                        # of the current pith, passed to this table on
+                        # recording fallbacks.
+                        union_type_name = (
+                            PEP484_CODE_UNION_TYPE_NAME_PREFIX +
+                            str(hints_meta_index_curr))
+
+                        # Initialize this code to the substring prefixing all
+                        # such code, assigning the current pith, the type of
+                        # that pith, and this index to local variables reused
+                        # by subsequent code.
+                        func_curr_code = (
+                            PEP484_CODE_CHECK_HINT_UNION_DISPATCH_ADAPTIVE_PREFIX_format(
+                                union_index_name=union_index_name,
+                                union_type_name=union_type_name,
+                                union_dispatch_expr=union_dispatch_expr,
+                                pith_curr_assign_expr=pith_curr_assign_expr,
+                            ))
+
+                        # Code type-checking the current pith against each
+                        # PEP-compliant child hint on falling back, appended
+                        # after the code generated below for these hints.
+                        func_curr_code_fallback = ''
+
+                        # For each PEP-compliant child hint of this union...
+                        for hint_child_index, hint_child in enumerate(
+                            hint_childs_pep, 1):
+                            # Placeholder string to be subsequently replaced by
+                            # code type-checking this child hint. Since the
+                            # pep_code_check_hint() function replaces *ALL*
+                            # occurrences of this placeholder, this code is
+                            # generated only once despite being embedded
+                            # twice below.
+                            hint_child_placeholder = _enqueue_hint_child(
+                                pith_curr_assigned_expr)
+
+                            # Generate and append code type-checking this
+                            # child hint when dispatched to directly.
+                            func_curr_code += (
+                                PEP484_CODE_CHECK_HINT_UNION_DISPATCH_ADAPTIVE_CHILD_PEP_format(
+                                    union_index_name=union_index_name,
+                                    hint_child_index=hint_child_index,
+                                    hint_child_index_preferred=(
+                                        ~hint_child_index),
+                                    hint_child_placeholder=(
+                                        hint_child_placeholder),
+                                ))
+
+                            # Generate and append code type-checking this
+                            # child hint when falling back.
+                            func_curr_code_fallback += (
+                                PEP484_CODE_CHECK_HINT_UNION_DISPATCH_ADAPTIVE_CHILD_PEP_FALLBACK_format(
+                                    union_index_name=union_index_name,
+                                    union_dispatch_expr=union_dispatch_expr,
+                                    union_type_name=union_type_name,
+                                    hint_child_index=hint_child_index,
+                                    hint_child_placeholder=(
+                                        hint_child_placeholder),
+                                ))
+
+                        # Append the latter code to the former.
+                        func_curr_code += func_curr_code_fallback
+                    # Else, this table is static. In this case...
+                    else:
+                        # Initialize this code to the substring prefixing all
+                        # such code, assigning both the current pith and this
+                        # index to local variables reused by subsequent code.
+                        func_curr_code = (
+                            PEP484_CODE_CHECK_HINT_UNION_DISPATCH_PREFIX_format(
+                                union_index_name=union_index_name,
+                                union_dispatch_expr=union_dispatch_expr,
+                                pith_curr_assign_expr=pith_curr_assign_expr,
+                            ))
+
+                        # For each PEP-compliant child hint of this union,
+                        # generate and append code type-checking this child
+                        # hint. Note that this iteration order is guaranteed
+                        # to be the same order in which the above getter
+                        # indexed these child hints, as sets are iterated in a
+                        # deterministic order until modified.
+                        for hint_child_index, hint_child in enumerate(
+                            hint_childs_pep, 1):
+                            func_curr_code += (
+                                PEP484_CODE_CHECK_HINT_UNION_DISPATCH_CHILD_PEP_format(
+                                    union_index_name=union_index_name,
+                                    hint_child_index=hint_child_index,
+                                    hint_child_placeholder=_enqueue_hint_child(
+                                        pith_curr_assigned_expr),
+                                ))
+
+                    # If this union is subscripted by one or more
+                    # PEP-noncompliant child hints, generate and append code
+                    # type-checking these child hints *ONLY* on falling back.
+                    if hint_childs_nonpep:
+                        func_curr_code += (
+                            PEP484_CODE_CHECK_HINT_UNION_DISPATCH_CHILD_NONPEP_format(
+                                union_index_name=union_index_name,
+                                pith_curr_assigned_expr=(
+                                    pith_curr_assigned_expr),
+                                hint_curr_expr=_register_hint_param(
+                                    get_typistry_tuple(
+                                        tuple(hint_childs_nonpep), True),
+                                    hint_param_name_to_hint,
+                                ),
+                            ))
+
+                    # Munge this code as below.
                     func_curr_code = (
-                        # Strip the erroneous " or" suffix appended by the
-                        # last child hint from this code.
                         func_curr_code[:-_OPERATOR_SUFFIX_LEN_OR] +
-                        # Suffix this code by the substring suffixing all such
-                        # code.
                         PEP484_CODE_CHECK_HINT_UNION_SUFFIX
-                    # Format the "indent_curr" prefix into this code deferred
-                    # above for efficiency.
                     ).format(indent_curr=indent_curr)
-                # Else, this snippet is its initial value and thus ignorable.
+                # Else, this union is *NOT* dispatchable. In this case...
+                else:
+                    # Initialize the code type-checking the current pith
+                    # against these arguments to the substring prefixing all
+                    # such code.
+                    func_curr_code = PEP484_CODE_CHECK_HINT_UNION_PREFIX
+
+                    # True only if this union is subscripted by the "NoneType"
+                    # class (e.g., "typing.Optional[int]").
+                    is_hint_child_none = NoneType in hint_childs_nonpep
+
+                    # If this union is subscripted by that class, remove that
+                    # class from these PEP-noncompliant child hints *BEFORE*
+                    # generating and appending code type-checking the current
+                    # pith against the "None" singleton by object identity,
+                    # which is both faster than and preferable to passing
+                    # that class to the isinstance() builtin below.
+                    #
+                    # Note that this union is necessarily subscripted by one
+                    # or more other child hints. Since subsequent code reuses
+                    # the value of the current pith, this code unconditionally
+                    # prefers the expression assigning this value to a local
+                    # variable.
+                    if is_hint_child_none:
+                        hint_childs_nonpep.remove(NoneType)
+                        func_curr_code += (
+                            PEP484_CODE_CHECK_HINT_UNION_CHILD_NONE_format(
+                                pith_curr_expr=pith_curr_assign_expr))
+
+                    # If this union is subscripted by one or more
+                    # PEP-noncompliant child hints, generate and append
+                    # efficient code type-checking these child hints *BEFORE*
+                    # less efficient code type-checking any PEP-compliant child
+                    # hints subscripting this union.
+                    if hint_childs_nonpep:
+                        func_curr_code += (
+                            PEP484_CODE_CHECK_HINT_UNION_CHILD_NONPEP_format(
+                                # Python expression yielding the value of the
+                                # current pith. Specifically...
+                                pith_curr_expr=(
+                                    # If the above code already assigned this
+                                    # value to a local variable, prefer the
+                                    # expression reusing that variable.
+                                    pith_curr_assigned_expr
+                                    if is_hint_child_none else
+                                    # If this union is subscripted by one or
+                                    # more PEP-compliant child hints, prefer
+                                    # the expression assigning this value to a
+                                    # local variable efficiently reused by
+                                    # subsequent code generated for
+                                    # PEP-compliant child hints.
+                                    pith_curr_assign_expr
+                                    if hint_childs_pep else
+                                    # Else, this union is *NOT* subscripted by
+                                    # one or more PEP-compliant child hints.
+                                    # Since this is the first and only test
+                                    # generated for this union, prefer the
+                                    # expression yielding the value of the
+                                    # current pith *WITHOUT* assigning this
+                                    # value to a local variable, which would
+                                    # otherwise pointlessly go unused.
+                                    pith_curr_expr
+                                ),
+                                # Name of the private hint parameter whose
+                                # default value is a tuple of these arguments.
+                                #
+                                # Note that:
+                                # * We would ideally avoid coercing this set
+                                #   into a tuple when this set only contains
+                                #   one type by passing that type directly to
+                                #   the _register_hint_param() function. Sadly,
+                                #   the "set" class defines no convenient or
+                                #   efficient means of retrieving the only item
+                                #   of a 1-set. Indeed, the most efficient
+                                #   means of doing so is to iterate over that
+                                #   set and immediately break:
+                                #     for first_item in muh_set: break
+                                #   While we *COULD* technically leverage that
+                                #   approach here, doing so would also mandate
+                                #   adding a number of intermediate tests,
+                                #   which would certainly reduce any performance
+                                #   gains. Ultimately, we avoid doing so by
+                                #   falling back to the standard approach. See
+                                #   also this relevant self-StackOverflow post:
+                                #       https://stackoverflow.com/a/40054478/2809027
+                                # * These parameters are intentionally passed
+                                #   as positional rather than keyword arguments
+                                #   for optimal memoization efficiency.
+                                hint_curr_expr=_register_hint_param(
+                                    get_typistry_tuple(
+                                        tuple(hint_childs_nonpep),
+                                        # Inform this function it needn't
+                                        # attempt to uselessly omit duplicates,
+                                        # since the "typing" module already
+                                        # does so for all "Union" arguments.
+                                        # Well, that's nice.
+                                        True,
+                                    ),
+                                    hint_param_name_to_hint,
+                                )
+                            ))
+
+                    # For each PEP-compliant child hint of this union, generate
+                    # and append code type-checking this child hint.
+                    for hint_child_index, hint_child in enumerate(
+                        hint_childs_pep):
+                        func_curr_code += (
+                            PEP484_CODE_CHECK_HINT_UNION_CHILD_PEP_format(
+                                # Python expression yielding the value of the
+                                # current pith.
+                                hint_child_placeholder=_enqueue_hint_child(
+                                    # If this union is subscripted by either...
+                                    #
+                                    # Then prefer the expression efficiently
+                                    # reusing the value previously assigned to
+                                    # a local variable by either the above
+                                    # conditional or prior iteration of the
+                                    # current conditional.
+                                    pith_curr_assigned_expr
+                                    if (
+                                        # The "NoneType" class *OR*...
+                                        is_hint_child_none or
+                                        # One or more PEP-noncompliant child
+                                        # hints *OR*...
+                                        hint_childs_nonpep or
+                                        # This is any PEP-compliant child hint
+                                        # but the first...
+                                        hint_child_index > 1
+                                    ) else
+                                    # Else, this union is both subscripted by
+                                    # no PEP-noncompliant child hints *AND*
+                                    # this is the first PEP-compliant child
+                                    # hint, prefer the expression assigning
+                                    # this value to a local variable
+                                    # efficiently reused by code generated by
+                                    # the following "else" condition under
+                                    # subsequent iteration.
+                                    #
+                                    # Note this child hint is guaranteed to be
+                                    # at least one more child hint. Why?
+                                    # Because the "typing" module forces unions
+                                    # to be subscripted by two or more child
+                                    # hints. By deduction, this union must thus
+                                    # be subscripted by two or more
+                                    # PEP-compliant child hints. Ergo, we
+                                    # needn't explicitly validate that
+                                    # constraint here.
+                                    pith_curr_assign_expr
+                                )))
+
+                    # If this code is *NOT* its initial value, this union is
+                    # subscripted by one or more unignorable child hints and
+                    # the above logic generated code type-checking these child
+                    # hints. In this case...
+                    if (func_curr_code is not
+                        PEP484_CODE_CHECK_HINT_UNION_PREFIX):
+                        # Munge this code to...
+                        func_curr_code = (
+                            # Strip the erroneous " or" suffix appended by the
+                            # last child hint from this code.
+                            func_curr_code[:-_OPERATOR_SUFFIX_LEN_OR] +
+                            # Suffix this code by the substring suffixing all
+                            # such code.
+                            PEP484_CODE_CHECK_HINT_UNION_SUFFIX
+                        # Format the "indent_curr" prefix into this code
+                        # deferred above for efficiency.
+                        ).format(indent_curr=indent_curr)
+                    # Else, this snippet is its initial value and thus
+                    # ignorable.
 
                 # Release this pair of sets back to their respective pools.
                 release_object_typed(hint_childs_nonpep)
@@ -1669,9 +1817,10 @@ def pep_code_check_hint(hint: object) -> (
                 ).format(
                     indent_curr=indent_curr,
                     pith_curr_assign_expr=pith_curr_assign_expr,
-                    # Python expression evaluating to the builtin "tuple" type
-                    # when accessed via the private "__beartypistry" parameter.
-                    hint_curr_expr=register_typistry_type(hint_curr),
+                    # Name of the private hint parameter whose default value
+                    # is this generic.
+                    hint_curr_expr=_register_hint_param(
+                        hint_curr, hint_param_name_to_hint),
                 )
                 # print(f'{hint_curr_label} PEP generic {repr(hint)} handled.')
             # Else, this hint is *NOT* a generic.
@@ -1686,10 +1835,18 @@ def pep_code_check_hint(hint: object) -> (
                 # If this classname contains one or more "." characters, this
                 # classname is fully-qualified. In this case...
                 if '.' in hint_curr_forwardref_classname:
-                    # Python expression evaluating to this class when accessed
-                    # via the private "__beartypistry" parameter.
-                    hint_curr_expr = register_typistry_forwardref(
+                    # Forward reference proxy deferring the resolution of
+                    # this class to the first call of this wrapper.
+                    hint_curr_forwardref = register_typistry_forwardref(
                         hint_curr_forwardref_classname)
+
+                    # Name of the private hint parameter whose default value
+                    # is this proxy.
+                    hint_curr_expr = hint_curr_forwardref.param_name
+
+                    # Pass this proxy as the default value of this parameter.
+                    hint_param_name_to_hint[hint_curr_expr] = (
+                        hint_curr_forwardref)
                 # Else, this classname is unqualified. In this case...
                 else:
                     # If the set of unqualified classnames referred to by all
@@ -1703,11 +1860,12 @@ def pep_code_check_hint(hint: object) -> (
                     hints_forwardref_class_basename.add(
                         hint_curr_forwardref_classname)
 
-                    # Placeholder substring to be replaced by the caller with a
-                    # Python expression evaluating to this unqualified
-                    # classname canonicalized relative to the module declaring
-                    # the currently decorated callable when accessed via the
-                    # private "__beartypistry" parameter.
+                    # Placeholder substring to be replaced by the caller with
+                    # the name of the private hint parameter whose default
+                    # value is the forward reference proxy deferring the
+                    # resolution of this unqualified classname canonicalized
+                    # relative to the module declaring the currently
+                    # decorated callable.
                     hint_curr_expr = (
                         f'{PEP_CODE_HINT_FORWARDREF_UNQUALIFIED_PLACEHOLDER_PREFIX}'
                         f'{hint_curr_forwardref_classname}'
@@ -1740,6 +1898,133 @@ def pep_code_check_hint(hint: object) -> (
                 )
             # Else, this hint is *NOT* "NoReturn".
 
+            # ..............{ LITERALS                          }..............
+            # If this hint is a PEP 586-compliant literal (e.g.,
+            # "typing.Literal['r', 'w', 'a']")...
+            #
+            # Note that the child "hints" subscripting this hint are literal
+            # objects rather than type hints and are thus *NOT* visited.
+            elif hint_curr_sign in HINT_PEP586_SIGNS_LITERAL:
+                # If this literal is unsubscripted, raise an exception. Since
+                # the unsubscripted "typing.Literal" singleton is satisfied by
+                # no objects, this is almost certainly a user error.
+                if not hint_childs:
+                    raise BeartypeDecorHintPepException(
+                        f'{hint_curr_label} PEP type hint '
+                        f'{repr(hint_curr)} unsubscripted.')
+                # Else, this literal is subscripted by one or more literal
+                # objects.
+
+                # Set of the 2-tuples "(type(literal), literal)" of all
+                # hashable literal objects subscripting this hint *AND* list
+                # of all unhashable literal objects subscripting this hint.
+                # Qualifying hashable literal objects by their exact types
+                # preserves the distinction between literal objects comparing
+                # equal despite differing in type (e.g., "True" and "1").
+                hint_literals_hashable = set()
+                hint_literals_unhashable = []
+
+                # For each literal object subscripting this hint, filter this
+                # object into the appropriate container.
+                for hint_literal in hint_childs:
+                    try:
+                        hint_literals_hashable.add(
+                            (type(hint_literal), hint_literal))
+                    except TypeError:
+                        hint_literals_unhashable.append(hint_literal)
+
+                # Name of the local variable providing the exact type of the
+                # current pith, unique to this literal across all code
+                # generated for this hint.
+                literal_type_name = (
+                    PEP586_CODE_LITERAL_TYPE_NAME_PREFIX +
+                    str(hints_meta_index_curr))
+
+                # Python expression yielding that type, initialized to the
+                # assignment expression assigning both the current pith and
+                # that type to local variables reused by subsequent code.
+                literal_type_expr = (
+                    PEP586_CODE_LITERAL_TYPE_ASSIGN_EXPR_format(
+                        literal_type_name=literal_type_name,
+                        pith_curr_assign_expr=pith_curr_assign_expr,
+                    ))
+
+                # Initialize the code type-checking the current pith against
+                # these literal objects to the substring prefixing all such
+                # code.
+                func_curr_code = PEP586_CODE_CHECK_HINT_LITERAL_PREFIX
+
+                # If this hint is subscripted by one or more hashable literal
+                # objects, generate and append code type-checking the current
+                # pith against *ALL* of these objects with a single hashed
+                # membership test in a frozen set of these 2-tuples *BEFORE*
+                # less efficient code type-checking any unhashable objects.
+                if hint_literals_hashable:
+                    func_curr_code += (
+                        PEP586_CODE_CHECK_HINT_LITERAL_CHILDS_HASHABLE_format(
+                            indent_curr=indent_curr,
+                            literal_type_expr=literal_type_expr,
+                            literal_type_name=literal_type_name,
+                            pith_curr_assigned_expr=pith_curr_assigned_expr,
+                            hint_literal_types_expr=_register_hint_param(
+                                frozenset(
+                                    hint_literal_type
+                                    for hint_literal_type, _ in (
+                                        hint_literals_hashable)
+                                ),
+                                hint_param_name_to_hint,
+                            ),
+                            hint_literals_expr=_register_hint_param(
+                                frozenset(hint_literals_hashable),
+                                hint_param_name_to_hint,
+                            ),
+                        ))
+
+                    # Prefer the local variable assigned above to subsequent
+                    # code.
+                    literal_type_expr = literal_type_name
+
+                # If this hint is subscripted by one or more unhashable literal
+                # objects...
+                if hint_literals_unhashable:
+                    # Name of the private hint parameter whose default value
+                    # is the tuple of these objects.
+                    hint_literals_expr = _register_hint_param(
+                        tuple(hint_literals_unhashable),
+                        hint_param_name_to_hint,
+                    )
+
+                    # For each such object, generate and append code comparing
+                    # the current pith to this object only if the exact types
+                    # of both are the same.
+                    for hint_literal_index, hint_literal in enumerate(
+                        hint_literals_unhashable):
+                        func_curr_code += (
+                            PEP586_CODE_CHECK_HINT_LITERAL_CHILD_UNHASHABLE_format(
+                                indent_curr=indent_curr,
+                                literal_type_expr=literal_type_expr,
+                                hint_literal_type_expr=_register_hint_param(
+                                    type(hint_literal),
+                                    hint_param_name_to_hint,
+                                ),
+                                pith_curr_assigned_expr=(
+                                    pith_curr_assigned_expr),
+                                hint_literals_expr=hint_literals_expr,
+                                hint_literal_index=hint_literal_index,
+                            ))
+
+                        # Prefer the local variable assigned above to
+                        # subsequent code.
+                        literal_type_expr = literal_type_name
+
+                # Munge this code as for unions above.
+                func_curr_code = (
+                    func_curr_code[:-_OPERATOR_SUFFIX_LEN_OR] +
+                    PEP586_CODE_CHECK_HINT_LITERAL_SUFFIX_format(
+                        indent_curr=indent_curr)
+                )
+            # Else, this hint is *NOT* a literal.
+
             # ..............{ SHALLOW or ARGUMENTLESS           }..............
             # If this hint either...
             elif (
@@ -1758,18 +2043,74 @@ def pep_code_check_hint(hint: object) -> (
                 # Code type-checking the current pith against this origin type.
                 func_curr_code = PEP_CODE_CHECK_HINT_NONPEP_TYPE_format(
                     pith_curr_expr=pith_curr_expr,
-                    # Python expression evaluating to this origin type when
-                    # accessed via the private "__beartypistry" parameter.
-                    hint_curr_expr=register_typistry_type(
+                    # Name of the private hint parameter whose default value
+                    # is this origin type.
+                    hint_curr_expr=_register_hint_param(
                         # Origin type of this hint if any *OR* raise an
                         # exception -- which should *NEVER* happen, as this
                         # hint was validated above to be supported.
-                        get_hint_pep_type_origin(hint_curr)),
+                        get_hint_pep_type_origin(hint_curr),
+                        hint_param_name_to_hint,
+                    ),
                 )
             # Else, this hint is *NOT* its own unsubscripted "typing" attribute
             # (e.g., "typing.List") and is thus subscripted by one or more
             # child hints.
 
+            # ..............{ SUBCLASSES                        }..............
+            # If this hint is a subclass hint (e.g., "typing.Type[int]")...
+            #
+            # Note that the child hint subscripting this hint constrains the
+            # superclasses of the current pith rather than the type of some
+            # item of that pith and is thus *NOT* visited.
+            elif hint_curr_sign in HINT_PEP_SIGNS_SUBCLASS:
+                # Assert this hint is subscripted by exactly one child hint.
+                # Note that the "typing" module should have already
+                # guaranteed this on our behalf.
+                assert hint_childs_len == 1, (
+                    f'{hint_curr_label} PEP subclass type hint '
+                    f'{repr(hint_curr)} not subscripted by one child hint.')
+
+                # Child hint subscripting this hint.
+                hint_child = hint_childs[0]
+
+                # Tuple of all superclasses constraining this hint if this
+                # child hint is either an unignorable non-"typing" class *OR*
+                # a union of only such classes *OR* "None" otherwise (e.g.,
+                # "typing.Any", type variables, forward references).
+                hint_superclasses = (
+                    None
+                    if is_hint_ignorable(hint_child) else
+                    _get_hint_types_or_none(hint_child)
+                )
+
+                # If this hint is constrained by such superclasses, generate
+                # code type-checking the current pith to be a class
+                # subclassing these superclasses via a subclass cache unique
+                # to this hint, memoizing each issubclass() call.
+                if hint_superclasses is not None:
+                    func_curr_code = PEP484_CODE_CHECK_HINT_SUBCLASS_format(
+                        indent_curr=indent_curr,
+                        pith_curr_assign_expr=pith_curr_assign_expr,
+                        pith_curr_assigned_expr=pith_curr_assigned_expr,
+                        # Name of the private hint parameter whose default
+                        # value is this cache.
+                        hint_subclass_cache_expr=_register_hint_param(
+                            SubclassCache(hint_superclasses),
+                            hint_param_name_to_hint,
+                        ),
+                    )
+                # Else, this hint is constrained by *NO* such superclasses.
+                # In this case, generate trivial code shallowly type-checking
+                # the current pith to be a class.
+                else:
+                    func_curr_code = PEP_CODE_CHECK_HINT_NONPEP_TYPE_format(
+                        pith_curr_expr=pith_curr_expr,
+                        hint_curr_expr=_register_hint_param(
+                            type, hint_param_name_to_hint),
+                    )
+            # Else, this hint is *NOT* a subclass hint.
+
             # ............{ SEQUENCES ~ standard OR tuple vari. }..............
             # If this hint is either...
             elif (
@@ -1795,13 +2136,15 @@ def pep_code_check_hint(hint: object) -> (
             # semantically resembling a standard sequence, subscripted by one
             # or more child hints.
 
-                # Python expression evaluating to this origin type when
-                # accessed with the private "__beartypistry" parameter.
-                hint_curr_expr = register_typistry_type(
-                    # Origin type of this attribute if any *OR* raise an
-                    # exception -- which should *NEVER* happen, as all standard
-                    # sequences originate from an origin type.
-                    get_hint_pep_type_origin(hint_curr))
+                # Origin type of this attribute if any *OR* raise an exception
+                # -- which should *NEVER* happen, as all standard sequences
+                # originate from an origin type.
+                hint_type_origin = get_hint_pep_type_origin(hint_curr)
+
+                # Name of the private hint parameter whose default value is
+                # this origin type.
+                hint_curr_expr = _register_hint_param(
+                    hint_type_origin, hint_param_name_to_hint)
 
                 # Assert this sequence is either subscripted by exactly one
                 # argument *OR* a non-standard sequence (e.g., "typing.Tuple").
@@ -1824,8 +2167,149 @@ def pep_code_check_hint(hint: object) -> (
                 # the type of the current pith *AND* a randomly indexed item of
                 # this pith. Specifically...
                 if not is_hint_ignorable(hint_child):
-                    # Record that a pseudo-random integer is now required.
-                    is_func_code_needs_random_int = True
+                    # If type-checking only a single randomly indexed item of
+                    # this pith, do so.
+                    if strategy_kind is BeartypeStrategyKind.O1:
+                        # Record that a pseudo-random integer is now required.
+                        is_func_code_needs_random_int = True
+
+                        # Placeholder string to be subsequently replaced by
+                        # code type-checking this item against this child hint.
+                        hint_child_placeholder = _enqueue_hint_child(
+                            # Python expression yielding the value of a
+                            # randomly indexed item of the current pith (i.e.,
+                            # standard sequence) to be type-checked against
+                            # this child hint.
+                            PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_PITH_CHILD_EXPR_format(
+                                pith_curr_assigned_expr=(
+                                    pith_curr_assigned_expr)))
+                    # Else if type-checking *ALL* items of this pith against a
+                    # child hint that is either a non-"typing" class *OR* a
+                    # union of only such classes, compare the set of the exact
+                    # types of these items against the frozen set of exact
+                    # types satisfying this child hint *BEFORE* passing only
+                    # items of other types to the isinstance() builtin. Since
+                    # this child hint is then type-checked directly here, this
+                    # child hint is intentionally *NOT* enqueued.
+                    #
+                    # Note that named tuples declaring one or more
+                    # type-checkable fields are excluded, as the fields of
+                    # these items must still be deeply type-checked.
+                    elif (
+                        strategy_kind is BeartypeStrategyKind.On and
+                        _get_hint_types_or_none(hint_child) is not None and
+                        not any(
+                            get_hint_pep484_namedtuple_fields(hint_child_type)
+                            for hint_child_type in _get_hint_types_or_none(
+                                hint_child)
+                        )
+                    ):
+                        # Tuple of all classes constraining this child hint.
+                        hint_child_types = _get_hint_types_or_none(hint_child)
+
+                        # Python expression type-checking these items.
+                        hint_child_placeholder = (
+                            PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_TYPES_EXACT_CHILD_format(
+                                pith_curr_assigned_expr=(
+                                    pith_curr_assigned_expr),
+                                pith_item_name=(
+                                    f'{PEP_CODE_PITH_ITEM_NAME_PREFIX}'
+                                    f'{hints_meta_index_last + 1}'
+                                ),
+                                # Name of the private hint parameter whose
+                                # default value is the frozen set of all exact
+                                # types satisfying these classes.
+                                hint_types_exact_expr=_register_hint_param(
+                                    get_types_exact(hint_child_types),
+                                    hint_param_name_to_hint,
+                                ),
+                                # Name of the private hint parameter whose
+                                # default value is either the only such class
+                                # *OR* the tuple of all such classes.
+                                hint_child_expr=_register_hint_param(
+                                    hint_child
+                                    if isinstance(hint_child, type) else
+                                    hint_child_types,
+                                    hint_param_name_to_hint,
+                                ),
+                            ))
+                    # Else, multiple items of this pith are type-checked by a
+                    # generator expression iteratively binding each such item
+                    # to a local variable uniquely named for this child hint.
+                    else:
+                        # If type-checking a logarithmic number of items at
+                        # distinct pseudo-random indices of this pith...
+                        if strategy_kind is BeartypeStrategyKind.Ologn:
+                            # Record that a pseudo-random integer is now
+                            # required.
+                            is_func_code_needs_random_int = True
+
+                            # Python expression yielding these items.
+                            pith_items_expr = (
+                                PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_PITH_ITEMS_LOG_EXPR_format(
+                                    pith_curr_assigned_expr=(
+                                        pith_curr_assigned_expr)))
+                        # Else, all items of this pith are type-checked. In
+                        # this case, iterate this pith directly.
+                        else:
+                            pith_items_expr = pith_curr_assigned_expr
+
+                        # Name of the local variable bound to each such item,
+                        # suffixed by the 0-based index of the metadata
+                        # describing this child hint in the "hints_meta" list
+                        # and thus guaranteed to be unique across this code.
+                        pith_item_name = (
+                            f'{PEP_CODE_PITH_ITEM_NAME_PREFIX}'
+                            f'{hints_meta_index_last + 1}'
+                        )
+
+                        # Python expression type-checking these items against
+                        # this child hint.
+                        hint_child_placeholder = (
+                            PEP_CODE_CHECK_HINT_CONTAINER_CHILD_ALL_format(
+                                hint_child_placeholder=_enqueue_hint_child(
+                                    pith_item_name),
+                                pith_item_name=pith_item_name,
+                                pith_items_expr=pith_items_expr,
+                            ))
+
+                    # If this child hint is a non-"typing" class, attempt to
+                    # prove *ALL* items of this pith to satisfy this class in
+                    # O(1) time by the type and (if any) typecode or format of
+                    # this pith *BEFORE* type-checking these items as usual.
+                    # Since builtin homogeneous sequences (e.g., "range",
+                    # "array.array") fully determine the types of their items,
+                    # doing so avoids boxing indexed items of possibly huge
+                    # numeric buffers.
+                    if (
+                        isinstance(hint_child, type) and
+                        not is_hint_pep(hint_child) and
+                        not is_hint_pep589(hint_child)
+                    ):
+                        # Tuple of all builtin homogeneous sequence types
+                        # provable against this class if any *OR* "None".
+                        hint_sequence_types = (
+                            get_sequence_homogeneous_types_or_none(
+                                hint_type_origin, hint_child))
+
+                        # If any such types exist, prefix the code
+                        # type-checking these items by code proving these
+                        # items.
+                        if hint_sequence_types is not None:
+                            hint_child_placeholder = (
+                                PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_HOMOGENEOUS_CHILD_format(
+                                    pith_curr_assigned_expr=(
+                                        pith_curr_assigned_expr),
+                                    hint_sequence_types_expr=(
+                                        _register_hint_param(
+                                            hint_sequence_types,
+                                            hint_param_name_to_hint,
+                                        )),
+                                    hint_child_expr=_register_hint_param(
+                                        hint_child, hint_param_name_to_hint),
+                                    hint_child_placeholder=(
+                                        hint_child_placeholder),
+                                ))
 
                     # Code type-checking the current pith against this type.
                     func_curr_code = (
@@ -1834,14 +2318,7 @@ def pep_code_check_hint(hint: object) -> (
                             pith_curr_assign_expr=pith_curr_assign_expr,
                             pith_curr_assigned_expr=pith_curr_assigned_expr,
                             hint_curr_expr=hint_curr_expr,
-                            hint_child_placeholder=_enqueue_hint_child(
-                                # Python expression yielding the value of a
-                                # randomly indexed item of the current pith
-                                # (i.e., standard sequence) to be type-checked
-                                # against this child hint.
-                                PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_PITH_CHILD_EXPR_format(
-                                    pith_curr_assigned_expr=(
-                                        pith_curr_assigned_expr))),
+                            hint_child_placeholder=hint_child_placeholder,
                         ))
                 # Else, this child hint is ignorable. In this case,
                 # fallback to generating trivial code shallowly
@@ -1855,6 +2332,317 @@ def pep_code_check_hint(hint: object) -> (
             # Else, this hint is neither a standard sequence *NOR* variadic
             # tuple.
 
+            # ..............{ MAPPINGS                          }..............
+            # If this hint is a mapping (e.g., "typing.Dict[str, int]")...
+            elif hint_curr_sign in HINT_PEP_SIGNS_MAPPING:
+                # Name of the private hint parameter whose default value is
+                # this origin type.
+                hint_curr_expr = _register_hint_param(
+                    # Origin type of this attribute if any *OR* raise an
+                    # exception -- which should *NEVER* happen, as all mappings
+                    # originate from an origin type.
+                    get_hint_pep_type_origin(hint_curr),
+                    hint_param_name_to_hint,
+                )
+
+                # Assert this mapping is subscripted by either one (e.g.,
+                # "typing.Counter[str]") or two child hints. Note that the
+                # "typing" module should have already guaranteed this.
+                assert 1 <= hint_childs_len <= 2, (
+                    f'{hint_curr_label} PEP mapping type hint '
+                    f'{repr(hint_curr)} not subscripted by one or two '
+                    f'arguments.')
+
+                # Child hints constraining the keys and values of this mapping
+                # if unignorable *OR* "None" otherwise. Since the values of
+                # counters are implicitly integers, counters are subscripted
+                # by only a key child hint.
+                hint_child_key = hint_childs[0]
+                if is_hint_ignorable(hint_child_key):
+                    hint_child_key = None
+                hint_child_value = (
+                    hint_childs[1] if hint_childs_len == 2 else None)
+                if is_hint_ignorable(hint_child_value):
+                    hint_child_value = None
+
+                # If either child hint is unignorable, deeply type-check both
+                # the type of the current pith *AND* one or more items of this
+                # pith. Specifically...
+                if hint_child_key is not None or hint_child_value is not None:
+                    # Name of the local variable bound to each such item,
+                    # suffixed by the 0-based index of the metadata describing
+                    # the first child hint enqueued below in the "hints_meta"
+                    # list and thus guaranteed to be unique across this code.
+                    pith_item_name = (
+                        f'{PEP_CODE_PITH_ITEM_NAME_PREFIX}'
+                        f'{hints_meta_index_last + 1}'
+                    )
+
+                    # Python expression yielding the 2-tuple "(key, value)"
+                    # of each such item, defaulting to this local variable.
+                    pith_item_expr = pith_item_name
+
+                    # Code prefixing the code type-checking the key and value
+                    # of each such item, defaulting to the empty string.
+                    pith_item_assign_code = ''
+
+                    # If type-checking only a single item of this pith...
+                    if strategy_kind is BeartypeStrategyKind.O1:
+                        # Record that a pseudo-random integer is now required.
+                        is_func_code_needs_random_int = True
+
+                        # Python expression yielding this item.
+                        pith_item_expr = (
+                            PEP_CODE_CHECK_HINT_MAPPING_PITH_ITEM_EXPR_format(
+                                pith_curr_assigned_expr=(
+                                    pith_curr_assigned_expr)))
+
+                        # If the active Python interpreter targets Python >=
+                        # 3.8, assign this item to this local variable
+                        # *BEFORE* type-checking the key and value of this
+                        # item. Otherwise, this expression is evaluated once
+                        # for each of that key and value, which then
+                        # type-check the key and value of possibly differing
+                        # items. Since all such items are items of this pith,
+                        # doing so remains sound if slightly less consistent.
+                        if IS_PYTHON_AT_LEAST_3_8:
+                            pith_item_assign_code = (
+                                PEP_CODE_CHECK_HINT_CONTAINER_ITEM_ASSIGN_format(
+                                    pith_item_name=pith_item_name,
+                                    pith_item_expr=pith_item_expr,
+                                ) + ' and '
+                            )
+                            pith_item_expr = pith_item_name
+                    # Else, multiple items of this pith are type-checked by a
+                    # generator expression iteratively binding each such item
+                    # to this local variable.
+
+                    # Code type-checking the key and value of this item.
+                    hint_child_placeholders = []
+                    if hint_child_key is not None:
+                        hint_child = hint_child_key
+                        hint_child_placeholders.append(_enqueue_hint_child(
+                            PEP_CODE_CHECK_HINT_MAPPING_PITH_KEY_EXPR_format(
+                                pith_item_expr=pith_item_expr)))
+                    if hint_child_value is not None:
+                        hint_child = hint_child_value
+                        hint_child_placeholders.append(_enqueue_hint_child(
+                            PEP_CODE_CHECK_HINT_MAPPING_PITH_VALUE_EXPR_format(
+                                pith_item_expr=pith_item_expr)))
+                    hint_child_placeholder = (
+                        f'({pith_item_assign_code}'
+                        f'{" and ".join(hint_child_placeholders)})'
+                    )
+
+                    # If type-checking multiple items of this pith, wrap this
+                    # code in a generator expression iterating these items.
+                    if strategy_kind is not BeartypeStrategyKind.O1:
+                        # If type-checking a logarithmic number of items of
+                        # this pith...
+                        if strategy_kind is BeartypeStrategyKind.Ologn:
+                            # Record that a pseudo-random integer is now
+                            # required.
+                            is_func_code_needs_random_int = True
+
+                            # Python expression yielding these items.
+                            pith_items_expr = (
+                                PEP_CODE_CHECK_HINT_MAPPING_PITH_ITEMS_LOG_EXPR_format(
+                                    pith_curr_assigned_expr=(
+                                        pith_curr_assigned_expr)))
+                        # Else, all items of this pith are type-checked.
+                        else:
+                            pith_items_expr = (
+                                PEP_CODE_CHECK_HINT_MAPPING_PITH_ITEMS_EXPR_format(
+                                    pith_curr_assigned_expr=(
+                                        pith_curr_assigned_expr)))
+
+                        # Python expression type-checking these items.
+                        hint_child_placeholder = (
+                            PEP_CODE_CHECK_HINT_CONTAINER_CHILD_ALL_format(
+                                hint_child_placeholder=hint_child_placeholder,
+                                pith_item_name=pith_item_name,
+                                pith_items_expr=pith_items_expr,
+                            ))
+
+                    # Code type-checking the current pith against this type.
+                    func_curr_code = PEP_CODE_CHECK_HINT_MAPPING_format(
+                        indent_curr=indent_curr,
+                        pith_curr_assign_expr=pith_curr_assign_expr,
+                        pith_curr_assigned_expr=pith_curr_assigned_expr,
+                        hint_curr_expr=hint_curr_expr,
+                        hint_child_placeholder=hint_child_placeholder,
+                    )
+                # Else, both child hints are ignorable. In this case, fallback
+                # to generating trivial code shallowly type-checking the
+                # current pith as an instance of this origin type.
+                else:
+                    func_curr_code = PEP_CODE_CHECK_HINT_NONPEP_TYPE_format(
+                        pith_curr_expr=pith_curr_expr,
+                        hint_curr_expr=hint_curr_expr,
+                    )
+            # Else, this hint is *NOT* a mapping.
+
+            # ..............{ REITERABLES                       }..............
+            # If this hint is a reiterable (e.g., "typing.AbstractSet[str]")...
+            elif hint_curr_sign in HINT_PEP_SIGNS_REITERABLE:
+                # Name of the private hint parameter whose default value is
+                # this origin type.
+                hint_curr_expr = _register_hint_param(
+                    # Origin type of this attribute if any *OR* raise an
+                    # exception -- which should *NEVER* happen, as all
+                    # reiterables originate from an origin type.
+                    get_hint_pep_type_origin(hint_curr),
+                    hint_param_name_to_hint,
+                )
+
+                # Assert this reiterable is subscripted by either one or two
+                # (e.g., "typing.ItemsView[str, int]") child hints. Note that
+                # the "typing" module should have already guaranteed this.
+                assert 1 <= hint_childs_len <= 2, (
+                    f'{hint_curr_label} PEP reiterable type hint '
+                    f'{repr(hint_curr)} not subscripted by one or two '
+                    f'arguments.')
+
+                # Name of the local variable bound to each item of the current
+                # pith to be type-checked, suffixed by the 0-based index of the
+                # metadata describing the first child hint enqueued below in
+                # the "hints_meta" list and thus guaranteed to be unique
+                # across this code.
+                pith_item_name = (
+                    f'{PEP_CODE_PITH_ITEM_NAME_PREFIX}'
+                    f'{hints_meta_index_last + 1}'
+                )
+
+                # List of placeholder strings to be subsequently replaced by
+                # code type-checking each such item against each unignorable
+                # child hint of this hint. Specifically, if this hint is
+                # subscripted by:
+                # * One child hint, that hint constrains each such item.
+                # * Two child hints, these hints constrain the key and value of
+                #   each such item (i.e., 2-tuple "(key, value)" iterated by an
+                #   items view) *EXACTLY* as for mappings.
+                hint_child_placeholders = []
+                if hint_childs_len == 1:
+                    hint_child = hint_childs[0]
+                    if not is_hint_ignorable(hint_child):
+                        hint_child_placeholders.append(
+                            _enqueue_hint_child(pith_item_name))
+                else:
+                    hint_child = hint_childs[0]
+                    if not is_hint_ignorable(hint_child):
+                        hint_child_placeholders.append(_enqueue_hint_child(
+                            PEP_CODE_CHECK_HINT_MAPPING_PITH_KEY_EXPR_format(
+                                pith_item_expr=pith_item_name)))
+                    hint_child = hint_childs[1]
+                    if not is_hint_ignorable(hint_child):
+                        hint_child_placeholders.append(_enqueue_hint_child(
+                            PEP_CODE_CHECK_HINT_MAPPING_PITH_VALUE_EXPR_format(
+                                pith_item_expr=pith_item_name)))
+
+                # If any child hint is unignorable, deeply type-check both the
+                # type of the current pith *AND* one or more items of this
+                # pith. Specifically...
+                if hint_child_placeholders:
+                    # Python expression type-checking each such item against
+                    # these child hints.
+                    hint_child_placeholder = ' and '.join(
+                        hint_child_placeholders)
+                    if len(hint_child_placeholders) > 1:
+                        hint_child_placeholder = f'({hint_child_placeholder})'
+
+                    # If type-checking only a single item of this pith...
+                    if strategy_kind is BeartypeStrategyKind.O1:
+                        # Record that a pseudo-random integer is now required.
+                        is_func_code_needs_random_int = True
+
+                        # Python expression yielding this item if this pith is
+                        # both non-empty *AND* safely sampleable *OR* the
+                        # sentinel placeholder otherwise.
+                        pith_item_expr = (
+                            PEP_CODE_CHECK_HINT_REITERABLE_PITH_ITEM_EXPR_format(
+                                pith_curr_assigned_expr=(
+                                    pith_curr_assigned_expr)))
+
+                        # If the active Python interpreter targets Python >=
+                        # 3.8, assign this item to this local variable *BEFORE*
+                        # comparing this item to that placeholder.
+                        if IS_PYTHON_AT_LEAST_3_8:
+                            hint_child_placeholder = (
+                                PEP_CODE_CHECK_HINT_REITERABLE_ITEM_CHILD_format(
+                                    pith_item_assign_expr=(
+                                        PEP_CODE_CHECK_HINT_CONTAINER_ITEM_ASSIGN_format(
+                                            pith_item_name=pith_item_name,
+                                            pith_item_expr=pith_item_expr,
+                                        )),
+                                    hint_child_placeholder=(
+                                        hint_child_placeholder),
+                                ))
+                        # Else, bind this item to this local variable by
+                        # iterating a 1-tuple of this item in a generator
+                        # expression.
+                        else:
+                            hint_child_placeholder = (
+                                PEP_CODE_CHECK_HINT_CONTAINER_CHILD_ALL_format(
+                                    hint_child_placeholder=(
+                                        PEP_CODE_CHECK_HINT_REITERABLE_ITEM_CHILD_format(
+                                            pith_item_assign_expr=(
+                                                pith_item_name),
+                                            hint_child_placeholder=(
+                                                hint_child_placeholder),
+                                        )),
+                                    pith_item_name=pith_item_name,
+                                    pith_items_expr=(
+                                        PEP_CODE_CHECK_HINT_REITERABLE_PITH_ITEM_TUPLE_EXPR_format(
+                                            pith_item_expr=pith_item_expr)),
+                                ))
+                    # Else, multiple items of this pith are type-checked by a
+                    # generator expression iteratively binding each such item
+                    # to this local variable.
+                    else:
+                        # If type-checking a logarithmic number of items of
+                        # this pith...
+                        if strategy_kind is BeartypeStrategyKind.Ologn:
+                            # Record that a pseudo-random integer is now
+                            # required.
+                            is_func_code_needs_random_int = True
+
+                            # Python expression yielding these items.
+                            pith_items_expr = (
+                                PEP_CODE_CHECK_HINT_REITERABLE_PITH_ITEMS_LOG_EXPR_format(
+                                    pith_curr_assigned_expr=(
+                                        pith_curr_assigned_expr)))
+                        # Else, all items of this pith are type-checked.
+                        else:
+                            pith_items_expr = (
+                                PEP_CODE_CHECK_HINT_REITERABLE_PITH_ITEMS_EXPR_format(
+                                    pith_curr_assigned_expr=(
+                                        pith_curr_assigned_expr)))
+
+                        # Python expression type-checking these items.
+                        hint_child_placeholder = (
+                            PEP_CODE_CHECK_HINT_CONTAINER_CHILD_ALL_format(
+                                hint_child_placeholder=hint_child_placeholder,
+                                pith_item_name=pith_item_name,
+                                pith_items_expr=pith_items_expr,
+                            ))
+
+                    # Code type-checking the current pith against this type.
+                    func_curr_code = PEP_CODE_CHECK_HINT_REITERABLE_format(
+                        indent_curr=indent_curr,
+                        pith_curr_assign_expr=pith_curr_assign_expr,
+                        hint_curr_expr=hint_curr_expr,
+                        hint_child_placeholder=hint_child_placeholder,
+                    )
+                # Else, all child hints are ignorable. In this case, fallback
+                # to generating trivial code shallowly type-checking the
+                # current pith as an instance of this origin type.
+                else:
+                    func_curr_code = PEP_CODE_CHECK_HINT_NONPEP_TYPE_format(
+                        pith_curr_expr=pith_curr_expr,
+                        hint_curr_expr=hint_curr_expr,
+                    )
+            # Else, this hint is *NOT* a reiterable.
+
             # ..............{ SEQUENCES ~ tuple : fixed         }..............
             # If this hint is a tuple, this tuple is *NOT* of the variadic form
             # and *MUST* thus be of the fixed-length form.
@@ -1958,9 +2746,10 @@ def pep_code_check_hint(hint: object) -> (
                 ).format(
                     indent_curr=indent_curr,
                     pith_curr_assign_expr=pith_curr_assign_expr,
-                    # Python expression evaluating to the builtin "tuple" type
-                    # when accessed via the private "__beartypistry" parameter.
-                    hint_curr_expr=register_typistry_type(tuple),
+                    # Name of the private hint parameter whose default value
+                    # is the builtin "tuple" type.
+                    hint_curr_expr=_register_hint_param(
+                        tuple, hint_param_name_to_hint),
                 )
             # Else, this hint is *NOT* a tuple.
 
@@ -1979,6 +2768,162 @@ def pep_code_check_hint(hint: object) -> (
         # ................{ NON-PEP                           }................
         # Else, this hint is *NOT* PEP-compliant.
         #
+        # ................{ TYPEDDICT                         }................
+        # If this hint is a typed dictionary, generate code type-checking the
+        # current pith to be a dictionary containing all required keys of
+        # this typed dictionary *BEFORE* type-checking the values of these
+        # keys against their child hints. Since typed dictionaries prohibit
+        # isinstance() checks, this test is intentionally performed *BEFORE*
+        # that testing whether this hint is a non-"typing" class.
+        #
+        # Note that keys of this pith *NOT* declared by this typed dictionary
+        # are intentionally ignored rather than rejected. Since typed
+        # dictionaries are structurally subtyped, a dictionary satisfying a
+        # typed dictionary subclass also satisfies its typed dictionary
+        # superclasses despite containing additional keys.
+        elif is_hint_pep589(hint_curr):
+            # If the active Python interpreter targets Python >= 3.8 and the
+            # current pith is *NOT* the root pith, assign the current pith to
+            # a unique local variable via an assignment expression. See the
+            # corresponding logic above for further commentary.
+            if IS_PYTHON_AT_LEAST_3_8 and pith_curr_expr != pith_root_expr:
+                pith_curr_assign_expr_name_counter += 1
+                pith_curr_assigned_expr = (
+                    PEP_CODE_PITH_NAME_PREFIX +
+                    str(pith_curr_assign_expr_name_counter))
+                pith_curr_assign_expr = PEP_CODE_PITH_ASSIGN_EXPR_format(
+                    pith_curr_assigned_expr=pith_curr_assigned_expr,
+                    pith_curr_expr=pith_curr_expr,
+                )
+            # Else, preserve the current pith expression as is.
+            else:
+                pith_curr_assign_expr = pith_curr_assigned_expr = (
+                    pith_curr_expr)
+
+            # Python code snippet expanding to the current level of
+            # indentation appropriate for the child hints of these keys.
+            indent_child = indent_curr + CODE_INDENT_1
+
+            # Frozen set of the names of all required keys of this typed
+            # dictionary and tuple describing all type-checkable keys of this
+            # typed dictionary.
+            hint_curr_keys_required, hint_curr_keys = get_hint_pep589_keys(
+                hint_curr)
+
+            # Initialize the code type-checking the current pith against this
+            # typed dictionary to the substring prefixing all such code.
+            #
+            # Note that *ALL* snippets type-checking typed dictionaries are
+            # formatted eagerly rather than deferring the formatting of the
+            # "{indent_curr}" prefix, as the names of these keys embedded in
+            # this code may contain "{" and "}" format delimiters.
+            func_curr_code = PEP589_CODE_CHECK_HINT_TYPEDDICT_PREFIX_format(
+                indent_curr=indent_curr,
+                pith_curr_assign_expr=pith_curr_assign_expr,
+                # Name of the private hint parameter whose default value is
+                # the dictionary superclass of all typed dictionaries.
+                hint_curr_expr=_register_hint_param(
+                    dict, hint_param_name_to_hint),
+            )
+
+            # If this typed dictionary declares one or more required keys,
+            # append code type-checking this pith to contain *ALL* of these
+            # keys with a single set comparison of the keys view of this pith
+            # against the frozen set of these keys.
+            if hint_curr_keys_required:
+                func_curr_code += (
+                    PEP589_CODE_CHECK_HINT_TYPEDDICT_KEYS_REQUIRED_format(
+                        indent_curr=indent_curr,
+                        pith_curr_assigned_expr=pith_curr_assigned_expr,
+                        # Name of the private hint parameter whose default
+                        # value is this frozen set.
+                        keys_required_expr=_register_hint_param(
+                            hint_curr_keys_required, hint_param_name_to_hint),
+                    ))
+
+            # Number of chunks these keys are partitioned into, exactly one of
+            # which is pseudo-randomly selected and type-checked by each call.
+            # If type-checking *ALL* keys of this pith *OR* this typed
+            # dictionary declares only a few such keys, these keys are
+            # type-checked as a single chunk.
+            hint_curr_keys_chunks_len = (
+                1
+                if strategy_kind is BeartypeStrategyKind.On else
+                -(-len(hint_curr_keys) // _TYPEDDICT_KEYS_CHUNK_LEN_MAX)
+            )
+
+            # If these keys are partitioned into two or more chunks, record
+            # that a pseudo-random integer is now required.
+            if hint_curr_keys_chunks_len > 1:
+                is_func_code_needs_random_int = True
+
+            # For the 0-based index of each such chunk...
+            for hint_curr_keys_chunk_index in range(hint_curr_keys_chunks_len):
+                # If these keys are partitioned into two or more chunks,
+                # append code skipping this chunk unless selected.
+                if hint_curr_keys_chunks_len > 1:
+                    func_curr_code += (
+                        PEP589_CODE_CHECK_HINT_TYPEDDICT_CHUNK_PREFIX_format(
+                            indent_curr=indent_curr,
+                            chunks_len=hint_curr_keys_chunks_len,
+                            chunk_index=hint_curr_keys_chunk_index,
+                        ))
+
+                # For the name, child hint, and requiredness of each key in
+                # this chunk...
+                for key_name, hint_child, is_key_required in hint_curr_keys[
+                    hint_curr_keys_chunk_index::hint_curr_keys_chunks_len]:
+                    # Python expression evaluating to the name of this key.
+                    key_expr = repr(key_name)
+
+                    # Placeholder string to be subsequently replaced by code
+                    # type-checking the value of this key against this child
+                    # hint.
+                    hint_child_placeholder = _enqueue_hint_child(
+                        PEP589_CODE_CHECK_HINT_TYPEDDICT_PITH_VALUE_EXPR_format(
+                            pith_curr_assigned_expr=pith_curr_assigned_expr,
+                            key_expr=key_expr,
+                        ))
+
+                    # If this key is required, append code type-checking the
+                    # value of this key, guaranteed to exist by the above set
+                    # comparison.
+                    if is_key_required:
+                        func_curr_code += (
+                            PEP589_CODE_CHECK_HINT_TYPEDDICT_KEY_REQUIRED_CHILD_format(
+                                indent_curr=indent_curr,
+                                hint_child_placeholder=hint_child_placeholder,
+                            ))
+                    # Else, this key is optional. In this case, append code
+                    # type-checking the value of this key only if present.
+                    else:
+                        func_curr_code += (
+                            PEP589_CODE_CHECK_HINT_TYPEDDICT_KEY_OPTIONAL_CHILD_format(
+                                indent_curr=indent_curr,
+                                key_expr=key_expr,
+                                pith_curr_assigned_expr=(
+                                    pith_curr_assigned_expr),
+                                hint_child_placeholder=hint_child_placeholder,
+                            ))
+
+                # If these keys are partitioned into two or more chunks, strip
+                # the erroneous " and" suffix appended by the last key of this
+                # chunk *BEFORE* suffixing this chunk.
+                if hint_curr_keys_chunks_len > 1:
+                    func_curr_code = (
+                        func_curr_code[:-_OPERATOR_SUFFIX_LEN_AND] +
+                        PEP589_CODE_CHECK_HINT_TYPEDDICT_CHUNK_SUFFIX
+                    )
+
+            # Strip the erroneous " and" suffix appended by the last key,
+            # chunk, or required key test from this code *BEFORE* suffixing
+            # this code by the substring suffixing all such code.
+            func_curr_code = (
+                func_curr_code[:-_OPERATOR_SUFFIX_LEN_AND] +
+                PEP_CODE_CHECK_HINT_TUPLE_FIXED_SUFFIX.format(
+                    indent_curr=indent_curr)
+            )
+
         # ................{ CLASSES                           }................
         # If this hint is a non-"typing" class...
         #
@@ -2004,13 +2949,130 @@ def pep_code_check_hint(hint: object) -> (
             # CAVEATS: Synchronize changes here with similar logic above.
             #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 
-            # Code type-checking the current pith against this class.
-            func_curr_code = PEP_CODE_CHECK_HINT_NONPEP_TYPE_format(
-                pith_curr_expr=pith_curr_expr,
-                # Python expression evaluating to this class when accessed via
-                # the private "__beartypistry" parameter.
-                hint_curr_expr=register_typistry_type(hint_curr),
-            )
+            # Tuple of all type-checkable fields of this class if this class
+            # is a named tuple *OR* the empty tuple otherwise.
+            hint_curr_fields = get_hint_pep484_namedtuple_fields(hint_curr)
+
+            # If this class is *NOT* a named tuple declaring one or more
+            # type-checkable fields, generate code shallowly type-checking the
+            # current pith against this class.
+            if not hint_curr_fields:
+                func_curr_code = PEP_CODE_CHECK_HINT_NONPEP_TYPE_format(
+                    pith_curr_expr=pith_curr_expr,
+                    # Name of the private hint parameter whose default value
+                    # is this class.
+                    hint_curr_expr=_register_hint_param(
+                        hint_curr, hint_param_name_to_hint),
+                )
+            # Else, this class is a named tuple declaring one or more such
+            # fields. In this case, generate code type-checking the current
+            # pith to be an instance of this class *BEFORE* type-checking
+            # these fields of that pith against their child hints. Since this
+            # function is memoized, this code is generated only once for each
+            # named tuple and then inlined into each wrapper type-checking
+            # that named tuple.
+            else:
+                # If the active Python interpreter targets Python >= 3.8 and
+                # the current pith is *NOT* the root pith, assign the current
+                # pith to a unique local variable via an assignment
+                # expression. See the corresponding logic above for further
+                # commentary.
+                if IS_PYTHON_AT_LEAST_3_8 and pith_curr_expr != pith_root_expr:
+                    pith_curr_assign_expr_name_counter += 1
+                    pith_curr_assigned_expr = (
+                        PEP_CODE_PITH_NAME_PREFIX +
+                        str(pith_curr_assign_expr_name_counter))
+                    pith_curr_assign_expr = (
+                        PEP_CODE_PITH_ASSIGN_EXPR_format(
+                            pith_curr_assigned_expr=pith_curr_assigned_expr,
+                            pith_curr_expr=pith_curr_expr,
+                        ))
+                # Else, preserve the current pith expression as is.
+                else:
+                    pith_curr_assign_expr = pith_curr_assigned_expr = (
+                        pith_curr_expr)
+
+                # Python code snippet expanding to the current level of
+                # indentation appropriate for the child hints of these fields.
+                indent_child = indent_curr + CODE_INDENT_1
+
+                # Number of chunks these fields are partitioned into, exactly
+                # one of which is pseudo-randomly selected and type-checked by
+                # each call. If type-checking *ALL* fields of this pith *OR*
+                # this named tuple declares only a few such fields, these
+                # fields are type-checked as a single chunk.
+                hint_curr_fields_chunks_len = (
+                    1
+                    if strategy_kind is BeartypeStrategyKind.On else
+                    -(-len(hint_curr_fields) //
+                      _NAMEDTUPLE_FIELDS_CHUNK_LEN_MAX)
+                )
+
+                # If these fields are partitioned into two or more chunks,
+                # record that a pseudo-random integer is now required.
+                if hint_curr_fields_chunks_len > 1:
+                    is_func_code_needs_random_int = True
+
+                # Initialize the code type-checking the current pith against
+                # this named tuple to the substring prefixing all such code.
+                func_curr_code = PEP484_CODE_CHECK_HINT_NAMEDTUPLE_PREFIX
+
+                # For the 0-based index of each such chunk...
+                for hint_curr_fields_chunk_index in range(
+                    hint_curr_fields_chunks_len):
+                    # If these fields are partitioned into two or more chunks,
+                    # append code skipping this chunk unless selected.
+                    if hint_curr_fields_chunks_len > 1:
+                        func_curr_code += (
+                            PEP484_CODE_CHECK_HINT_NAMEDTUPLE_CHUNK_PREFIX_format(
+                                chunks_len=hint_curr_fields_chunks_len,
+                                chunk_index=hint_curr_fields_chunk_index,
+                            ))
+
+                    # For the 0-based index and child hint of each field in
+                    # this chunk, append code type-checking this field.
+                    for field_index, _, hint_child in hint_curr_fields[
+                        hint_curr_fields_chunk_index::
+                        hint_curr_fields_chunks_len
+                    ]:
+                        func_curr_code += (
+                            PEP_CODE_CHECK_HINT_TUPLE_FIXED_NONEMPTY_CHILD_format(
+                                hint_child_placeholder=_enqueue_hint_child(
+                                    # Python expression yielding the value of
+                                    # this field of this named tuple.
+                                    PEP_CODE_CHECK_HINT_TUPLE_FIXED_NONEMPTY_PITH_CHILD_EXPR_format(
+                                        pith_curr_assigned_expr=(
+                                            pith_curr_assigned_expr),
+                                        pith_child_index=field_index)),
+                            ))
+
+                    # If these fields are partitioned into two or more chunks,
+                    # strip the erroneous " and" suffix appended by the last
+                    # field of this chunk *BEFORE* suffixing this chunk.
+                    if hint_curr_fields_chunks_len > 1:
+                        func_curr_code = (
+                            func_curr_code[:-_OPERATOR_SUFFIX_LEN_AND] +
+                            PEP484_CODE_CHECK_HINT_NAMEDTUPLE_CHUNK_SUFFIX
+                        )
+
+                # Munge this code to...
+                func_curr_code = (
+                    # Strip the erroneous " and" suffix appended by the last
+                    # field or chunk from this code.
+                    func_curr_code[:-_OPERATOR_SUFFIX_LEN_AND] +
+                    # Suffix this code by the substring suffixing all such
+                    # code.
+                    PEP_CODE_CHECK_HINT_TUPLE_FIXED_SUFFIX
+                # Format the "indent_curr" prefix into this code deferred
+                # above for efficiency.
+                ).format(
+                    indent_curr=indent_curr,
+                    pith_curr_assign_expr=pith_curr_assign_expr,
+                    # Name of the private hint parameter whose default value
+                    # is this named tuple.
+                    hint_curr_expr=_register_hint_param(
+                        hint_curr, hint_param_name_to_hint),
+                )
 
         # Else, this hint is neither PEP-compliant *NOR* a class. In this
         # case, raise an exception. Note that:
@@ -2078,4 +3140,224 @@ def pep_code_check_hint(hint: object) -> (
         func_code,
         is_func_code_needs_random_int,
         hints_forwardref_class_basename,
+        hint_param_name_to_hint,
     )
+
+# ....................{ PRIVATE ~ getters                 }....................
+def _get_hint_union_dispatch_or_none(
+    hint_childs_nonpep: set,
+    hint_childs_pep: set,
+    is_union_adaptive: bool,
+) -> 'Optional[UnionTypeDispatch]':
+    '''
+    **Union dispatch table** (i.e., dictionary mapping from the exact type of
+    each pith to the index of the only child hint subscripting a
+    :class:`typing.Union` type that pith could possibly satisfy) describing the
+    union subscripted by the passed PEP-noncompliant and -compliant child hints
+    if this union is **dispatchable** (i.e., if each such PEP-noncompliant
+    child hint is a class *and* each such PEP-compliant child hint is either
+    shallowly type-checked as an instance of its origin type *or* deeply
+    type-checked as a container first type-checked as an instance of its origin
+    type) *or* ``None`` otherwise.
+
+    The 1-based index of each deeply type-checked PEP-compliant child hint in
+    the returned table is the 1-based index of that child hint in the passed
+    set of PEP-compliant child hints, which the caller is thus required to
+    iterate in the same order *without* modifying that set in the interim.
+
+    Parameters
+    ----------
+    hint_childs_nonpep : set
+        Set of all PEP-noncompliant child hints subscripting this union.
+    hint_childs_pep : set
+        Set of all PEP-compliant child hints subscripting this union.
+    is_union_adaptive : bool
+        ``True`` only if the returned table is to be adaptive.
+
+    Returns
+    ----------
+    Optional[UnionTypeDispatch]
+        Either this table if this union is dispatchable *or* ``None``
+        otherwise.
+    '''
+
+    # List of 2-tuples "(hint_child_type, hint_child_index)" describing these
+    # child hints, initialized to those describing these PEP-noncompliant
+    # child hints, all of which are type-determined.
+    hint_childs_meta = []
+    for hint_child in hint_childs_nonpep:
+        # If this child hint is *NOT* a class (e.g., is a forward reference),
+        # this union is undispatchable.
+        if not isinstance(hint_child, type):
+            return None
+        hint_childs_meta.append((hint_child, UNION_DISPATCH_INDEX_DETERMINED))
+
+    # For the 1-based index of each PEP-compliant child hint and that hint...
+    for hint_child_index, hint_child in enumerate(hint_childs_pep, 1):
+        # If this child hint is a named tuple whose fields are deeply
+        # type-checked after type-checking the current pith as an instance of
+        # this named tuple, dispatch to this child hint by this index.
+        if get_hint_pep484_namedtuple_fields(hint_child):
+            hint_childs_meta.append((hint_child, hint_child_index))
+            continue
+        # Else, this child hint is *NOT* such a named tuple.
+        #
+        # If this child hint is a typed dictionary whose keys and values are
+        # deeply type-checked after type-checking the current pith as a
+        # dictionary, dispatch to this child hint by this index.
+        if is_hint_pep589(hint_child):
+            hint_childs_meta.append((dict, hint_child_index))
+            continue
+        # Else, this child hint is *NOT* a typed dictionary.
+        #
+        # If this child hint is either a new type, type metahint, or IO generic
+        # base class, this hint is type-checked as some hint other than itself
+        # and thus undispatchable.
+        if (
+            is_hint_pep484_newtype(hint_child) or
+            is_hint_pep593(hint_child) or
+            is_hint_pep544_io_generic(hint_child)
+        ):
+            return None
+
+        # Attempt to...
+        try:
+            # Sign uniquely identifying this child hint.
+            hint_child_sign = get_hint_pep_sign(hint_child)
+
+            # If this child hint is shallowly type-checked as an instance of
+            # its origin type, this child hint is type-determined.
+            if (
+                hint_child_sign not in HINT_PEP_SIGNS_SUPPORTED_DEEP or
+                hint_child is hint_child_sign
+            ):
+                # If this child hint is *NOT* actually type-checked as such,
+                # this union is undispatchable.
+                if (hint_child_sign in
+                    _UNION_DISPATCH_HINT_PEP_SIGNS_UNDISPATCHABLE):
+                    return None
+                hint_child_type_index = UNION_DISPATCH_INDEX_DETERMINED
+            # Else if this child hint is a container deeply type-checked after
+            # type-checking the current pith as an instance of its origin
+            # type, dispatch to this child hint by this index.
+            elif hint_child_sign in _UNION_DISPATCH_HINT_PEP_SIGNS_DEEP:
+                hint_child_type_index = hint_child_index
+            # Else, this child hint is deeply type-checked in some other manner
+            # (e.g., generic, protocol). In this case, this union is
+            # undispatchable.
+            else:
+                return None
+
+            # Describe this child hint by its origin type.
+            hint_childs_meta.append((
+                get_hint_pep_type_origin(hint_child), hint_child_type_index))
+        # If doing so raises an exception (e.g., due to this child hint being
+        # unsupported), this union is undispatchable. Since this child hint is
+        # subsequently visited by the pep_code_check_hint() function, that
+        # function then raises a human-readable exception as usual.
+        except Exception:
+            return None
+
+    # Return a new dispatch table describing these child hints.
+    return UnionTypeDispatch(tuple(hint_childs_meta), is_union_adaptive)
+
+def _get_hint_types_or_none(hint: object) -> 'Optional[tuple]':
+    '''
+    Tuple of all non-:mod:`typing` classes constraining the passed child hint
+    if this hint is either such a class *or* a union of only such classes *or*
+    ``None`` otherwise.
+
+    If this hint is a type variable bounded by *or* constrained to such
+    classes, this tuple is that of the classes constraining that bound *or*
+    those constraints.
+
+    Parameters
+    ----------
+    hint : object
+        Child hint to be inspected.
+
+    Returns
+    ----------
+    Optional[tuple]
+        Either this tuple if this hint is such a class or union *or* ``None``
+        otherwise.
+    '''
+
+    # Reduce this hint to the bound or union of the constraints of this hint if
+    # this hint is a type variable *OR* preserve this hint as is otherwise.
+    hint = reduce_hint_pep484_union(reduce_hint_pep484_typevar(hint))
+
+    # If this hint is a non-"typing" class *OTHER* than a typed dictionary
+    # (which prohibits isinstance() and issubclass() checks), return a 1-tuple
+    # of this class.
+    if not is_hint_pep(hint):
+        return (
+            (hint,)
+            if isinstance(hint, type) and not is_hint_pep589(hint) else
+            None
+        )
+    # Else, this hint is PEP-compliant.
+    #
+    # If this hint is a union of only such classes, return the tuple of all
+    # arguments subscripting this union.
+    elif get_hint_pep_sign(hint) in HINT_PEP484_SIGNS_UNION:
+        hint_args = get_hint_pep_args(hint)
+        if all(
+            isinstance(hint_arg, type) and
+            not is_hint_pep(hint_arg) and
+            not is_hint_pep589(hint_arg)
+            for hint_arg in hint_args
+        ):
+            return hint_args
+
+    # Else, this hint is neither.
+    return None
+
+# ....................{ PRIVATE ~ registrars              }....................
+def _register_hint_param(hint: object, hint_param_name_to_hint: dict) -> str:
+    '''
+    Register the passed type, tuple of types or literal objects, frozen set of
+    types or type-qualified literal objects, union dispatch table, or subclass
+    cache as the default value of a private hint parameter of the wrapper
+    function with the passed dictionary *and* return the name of that
+    parameter.
+
+    The name of this parameter is the concatenation of the
+    :data:`beartype._decor._code.codesnip.PARAM_NAME_HINT_PREFIX` substring
+    with the object ID of this object. Since the memoized
+    :func:`pep_code_check_hint` function caches (and thus preserves) all hints
+    transitively visitable from all root hints passed to that function, this
+    object is guaranteed to remain alive and thus this ID unique for the
+    lifetime of the active Python interpreter. Ergo, the same name is
+    guaranteed to refer to the same object across *all* code generated by that
+    function, enabling higher-level callers to safely merge these dictionaries
+    across all parameters and return values of the decorated callable.
+
+    Parameters
+    ----------
+    hint : object
+        Type, tuple of types or literal objects, frozen set of types or
+        type-qualified literal objects, union dispatch table, or subclass cache
+        to be registered.
+    hint_param_name_to_hint : dict
+        Dictionary mapping from the name of each private hint parameter to the
+        default value of that parameter, updated in-place by this function.
+
+    Returns
+    ----------
+    str
+        Name of the private hint parameter whose default value is this object.
+    '''
+    assert isinstance(
+        hint, (type, tuple, frozenset, UnionTypeDispatch, SubclassCache)), (
+        f'{repr(hint)} neither type, tuple, frozen set, union dispatch, '
+        f'nor subclass cache.')
+
+    # Name of this parameter.
+    hint_param_name = f'{PARAM_NAME_HINT_PREFIX}{id(hint)}'
+
+    # Register this object as the default value of this parameter.
+    hint_param_name_to_hint[hint_param_name] = hint
+
+    # Return this name.
+    return hint_param_name
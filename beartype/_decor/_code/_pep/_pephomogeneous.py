@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2020 Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Beartype PEP-compliant homogeneous sequence provers** (i.e., callables
+proving *all* items of builtin sequences whose types or typecodes fully
+determine the types of their items to satisfy child type hints *without*
+indexing into these sequences).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                           }....................
+from array import array, typecodes as array_typecodes
+from beartype._util.cache.utilcachecall import callable_cached
+
+# See the "beartype.__init__" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ PRIVATE ~ mappings                }....................
+_SEQUENCE_TYPE_TO_ITEM_TYPE = {
+    bytearray: int,
+    bytes: int,
+    range: int,
+    str: str,
+}
+'''
+Dictionary mapping from each builtin **homogeneous sequence type** (i.e.,
+sequence type whose instances only contain items of the same type) to the type
+of *all* items of *all* instances of that sequence type.
+'''
+
+
+_ARRAY_TYPECODE_TO_ITEM_TYPE = {}
+'''
+Dictionary mapping from each **array typecode** (i.e., single character
+uniquely identifying the C type of all items of an :class:`array.array`
+instance) supported by the active Python interpreter to the type of *all*
+items of *all* arrays with that typecode.
+
+This dictionary is dynamically derived at importation time by indexing a
+zeroed array of each such typecode rather than hard-coded, guaranteeing
+agreement with the active Python interpreter.
+'''
+
+
+_MEMORYVIEW_FORMAT_TO_ITEM_TYPE = {}
+'''
+Dictionary mapping from each **memory view format** (i.e., :mod:`struct`
+format string describing the C type of all items of a one-dimensional
+:class:`memoryview` instance) whose items the active Python interpreter
+supports indexing to the type of *all* items of *all* one-dimensional memory
+views with that format.
+
+This dictionary is dynamically derived at importation time by indexing a
+zeroed memory view cast to each such format rather than hard-coded. Since
+:class:`memoryview` only supports indexing memory views whose formats are
+native single characters optionally prefixed by ``@``, this dictionary
+contains *only* these formats.
+'''
+
+# ....................{ PRIVATE ~ initializers            }....................
+def _init() -> None:
+    '''
+    Initialize this submodule.
+    '''
+
+    # For each array typecode supported by the active Python interpreter,
+    # map this typecode to the type of the first item of a zeroed array of
+    # this typecode.
+    for array_typecode in array_typecodes:
+        array_zeroed = array(array_typecode)
+        array_zeroed.frombytes(bytes(array_zeroed.itemsize))
+        _ARRAY_TYPECODE_TO_ITEM_TYPE[array_typecode] = (
+            array_zeroed[0].__class__)
+
+    # For each native single-character "struct" format...
+    for memoryview_format in 'cbB?hHiIlLqQnNefdP':
+        # Attempt to map this format to the type of the first item of a zeroed
+        # memory view cast to this format.
+        try:
+            memoryview_zeroed = memoryview(bytes(16)).cast(memoryview_format)
+            item_type = memoryview_zeroed[0].__class__
+        # If the active Python interpreter fails to support either casting to
+        # or indexing memory views of this format, silently ignore this
+        # format. Memory views of this format are then type-checked as usual.
+        except (NotImplementedError, TypeError, ValueError):
+            continue
+
+        # Map both this format and this format prefixed by the optional "@"
+        # native byte order character to this type.
+        _MEMORYVIEW_FORMAT_TO_ITEM_TYPE[memoryview_format] = item_type
+        _MEMORYVIEW_FORMAT_TO_ITEM_TYPE[f'@{memoryview_format}'] = item_type
+
+
+# Initialize this submodule.
+_init()
+
+# ....................{ GETTERS                           }....................
+@callable_cached
+def get_sequence_homogeneous_types_or_none(
+    hint_type_origin: type, hint_child: type) -> 'Optional[tuple]':
+    '''
+    Tuple of all builtin homogeneous sequence types that are subclasses of the
+    passed origin type *and* whose items may be proven to satisfy the passed
+    child class by the :func:`is_sequence_homogeneous` tester if any *or*
+    ``None`` otherwise.
+
+    This getter is memoized for efficiency, guaranteeing that all hints
+    subscripted by the same origin type and child class share the same tuple
+    returned by this getter.
+
+    Parameters
+    ----------
+    hint_type_origin : type
+        Origin type of the parent standard sequence hint (e.g.,
+        :class:`collections.abc.Sequence` for ``typing.Sequence[int]``).
+    hint_child : type
+        Non-:mod:`typing` class subscripting that hint (e.g., :class:`int` for
+        ``typing.Sequence[int]``).
+
+    Returns
+    ----------
+    Optional[tuple]
+        Either this tuple if one or more such types exist *or* ``None``
+        otherwise.
+    '''
+    assert isinstance(hint_type_origin, type), (
+        f'{repr(hint_type_origin)} not type.')
+    assert isinstance(hint_child, type), f'{repr(hint_child)} not type.'
+
+    # Set of all builtin homogeneous sequence types whose items satisfy this
+    # child class, regardless of origin type.
+    sequence_types = {
+        sequence_type
+        for sequence_type, item_type in _SEQUENCE_TYPE_TO_ITEM_TYPE.items()
+        if issubclass(item_type, hint_child)
+    }
+
+    # If the items of any array typecode satisfy this child class, arrays of
+    # that typecode are provable.
+    if any(
+        issubclass(item_type, hint_child)
+        for item_type in _ARRAY_TYPECODE_TO_ITEM_TYPE.values()
+    ):
+        sequence_types.add(array)
+
+    # If the items of any memory view format satisfy this child class, memory
+    # views of that format are provable.
+    if any(
+        issubclass(item_type, hint_child)
+        for item_type in _MEMORYVIEW_FORMAT_TO_ITEM_TYPE.values()
+    ):
+        sequence_types.add(memoryview)
+
+    # Tuple of all such types that are also subclasses of this origin type
+    # (e.g., excluding "range" from "typing.MutableSequence[int]"), sorted by
+    # name for deterministic code generation.
+    sequence_types = tuple(sorted(
+        (
+            sequence_type
+            for sequence_type in sequence_types
+            if issubclass(sequence_type, hint_type_origin)
+        ),
+        key=lambda sequence_type: sequence_type.__name__,
+    ))
+
+    # Return either this tuple if non-empty *OR* "None" otherwise.
+    return sequence_types or None
+
+# ....................{ TESTERS                           }....................
+def is_sequence_homogeneous(sequence: 'Sequence', hint_child: type) -> bool:
+    '''
+    ``True`` only if the passed sequence is guaranteed to contain *only* items
+    satisfying the passed child class, as proven in ``O(1)`` time by only the
+    type and (if any) typecode or format of this sequence *without* indexing
+    into this sequence.
+
+    This tester is intended to be called by dynamically generated wrapper
+    functions *only* for sequences whose types are contained in the tuple
+    returned by the :func:`get_sequence_homogeneous_types_or_none` getter
+    when passed this child class. Since indexing into arrays and memory views
+    boxes the indexed item into a new Python object, this tester avoids that
+    cost for large numeric buffers.
+
+    Parameters
+    ----------
+    sequence : Sequence
+        Sequence to be inspected.
+    hint_child : type
+        Non-:mod:`typing` class to be proven.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if this sequence is proven to satisfy this child class.
+    '''
+
+    # Type of this sequence.
+    sequence_type = sequence.__class__
+
+    # Type of all items of this sequence if provable *OR* "None" otherwise.
+    #
+    # If this sequence is an array, prove this sequence by typecode.
+    if sequence_type is array:
+        item_type = _ARRAY_TYPECODE_TO_ITEM_TYPE.get(sequence.typecode)
+    # Else if this sequence is a memory view, prove this sequence by format.
+    # Since only one-dimensional memory views are indexable as sequences of
+    # items, multidimensional memory views are type-checked as usual.
+    elif sequence_type is memoryview:
+        item_type = (
+            _MEMORYVIEW_FORMAT_TO_ITEM_TYPE.get(sequence.format)
+            if sequence.ndim == 1 else
+            None
+        )
+    # Else, prove this sequence by type.
+    else:
+        item_type = _SEQUENCE_TYPE_TO_ITEM_TYPE.get(sequence_type)
+
+    # Return true only if these items satisfy this child class.
+    return item_type is not None and issubclass(item_type, hint_child)
@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2020 Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Beartype PEP-compliant container item samplers** (i.e., callables selecting
+subsets of container items to be type-checked, intended to be called by
+dynamically generated wrapper functions wrapping decorated callables).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                           }....................
+from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_8
+from beartype._util.utilobject import SENTINEL
+from collections import Counter, OrderedDict, defaultdict
+from itertools import islice
+
+# See the "beartype.__init__" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ PRIVATE ~ constants               }....................
+_MAPPING_TYPES_ITEMS_REVERSIBLE = (
+    frozenset((dict, defaultdict, OrderedDict, Counter))
+    if IS_PYTHON_AT_LEAST_3_8 else
+    frozenset((OrderedDict,))
+)
+'''
+Frozen set of all standard mapping types whose ``items()`` views are
+guaranteed to be efficiently reversible by the :func:`reversed` builtin
+*without* side effects (i.e., :class:`collections.OrderedDict` and, under
+Python >= 3.8, the builtin :class:`dict` type and standard subclasses of that
+type).
+'''
+
+
+_REITERABLE_TYPES_INDEXABLE = frozenset((list, tuple))
+'''
+Frozen set of all builtin reiterable types guaranteed to provide ``O(1)``
+indexation across all items, whose items are thus sampled by pseudo-random
+index rather than by iteration when type-checked against reiterable type hints
+(e.g., a list passed as a parameter annotated by ``typing.Iterable[int]``).
+'''
+
+
+_REITERABLE_TYPES_REVERSIBLE = (
+    frozenset((type({}.keys()), type({}.values()), type({}.items())))
+    if IS_PYTHON_AT_LEAST_3_8 else
+    frozenset()
+)
+'''
+Frozen set of all builtin reiterable types guaranteed to be efficiently
+reversible by the :func:`reversed` builtin (i.e., under Python >= 3.8, the
+builtin dictionary view types).
+'''
+
+
+_REITERABLE_TYPES_SAMPLEABLE = frozenset((
+    set,
+    frozenset,
+    type({}.keys()),
+    type({}.values()),
+    type({}.items()),
+))
+'''
+Frozen set of all builtin reiterable types guaranteed to be safely iterable
+*without* side effects, whose items are thus sampled by iteration when
+type-checked against reiterable type hints.
+
+Reiterables of all other types (including subclasses of these types,
+user-defined collections, and one-shot iterators such as generators) are only
+shallowly type-checked. Iterating such a reiterable could invoke arbitrary
+user-defined ``__iter__`` methods with arbitrary side effects (e.g.,
+consuming the items of a one-shot iterator, querying a database).
+'''
+
+# ....................{ GETTERS ~ mapping                 }....................
+def get_mapping_item(mapping: 'Mapping', random_int: int) -> tuple:
+    '''
+    2-tuple ``(key, value)`` of the next item of the passed non-empty mapping
+    of ``n`` items to be type-checked, selected by skipping at most
+    ``ceil(log2(n + 1)) - 1`` items.
+
+    This getter implements the ``O(1)`` container type-checking strategy
+    (i.e., :attr:`beartype._decor._data.BeartypeStrategyKind.O1`) for
+    mappings. Since mappings provide *no* efficient random access, this getter
+    returns the item at a pseudo-random offset into the same bounded window of
+    ``ceil(log2(n + 1))`` items sampled by the :func:`get_mapping_items_log`
+    getter: either the first such items or, if the ``items()`` view of this
+    mapping is efficiently reversible (e.g., :class:`dict` under Python >=
+    3.8, :class:`collections.OrderedDict`), last such items of this mapping,
+    both as selected by the passed pseudo-random integer.
+
+    Caveats
+    ----------
+    **Items outside this window are never type-checked.** Notably, invalid
+    items in the middle of large mappings are *never* detected by this getter.
+    Sampling these items would require either linear-time iteration or caching
+    iterators across calls (see below).
+
+    **This getter never modifies this mapping.** Notably, this getter
+    intentionally avoids caching iterators over this mapping across calls in
+    the dictionary of this mapping. Doing so would silently add attributes to
+    objects owned by callers, corrupt mappings whose dictionaries are
+    themselves (e.g., the common ``self.__dict__ = self`` idiom), and leak
+    private objects into pickled mappings.
+
+    Parameters
+    ----------
+    mapping : Mapping
+        Non-empty mapping to be sampled.
+    random_int : int
+        Pseudo-random non-negative integer (typically generated by the
+        :data:`beartype._decor._code.codesnip.CODE_INIT_RANDOM_INT` snippet).
+
+    Returns
+    ----------
+    tuple
+        2-tuple ``(key, value)`` of this item.
+    '''
+
+    # Items view of this mapping, reversed if this integer selects the last
+    # items of this mapping *AND* these items are efficiently reversible.
+    mapping_items = mapping.items()
+    if (
+        random_int & 1 and
+        mapping.__class__ in _MAPPING_TYPES_ITEMS_REVERSIBLE
+    ):
+        mapping_items = reversed(mapping_items)
+
+    # Return the item at the offset into the window of items sampled by the
+    # get_mapping_items_log() getter selected by the remaining bits of this
+    # integer.
+    return next(islice(
+        mapping_items, (random_int >> 1) % len(mapping).bit_length(), None))
+
+
+def get_mapping_items_log(mapping: 'Mapping', random_int: int) -> list:
+    '''
+    List of ``ceil(log2(n + 1))`` 2-tuples ``(key, value)`` of the next items
+    of the passed non-empty mapping of ``n`` items to be type-checked,
+    selected in ``O(lgn)`` time.
+
+    This getter implements the ``O(lgn)`` container type-checking strategy
+    (i.e., :attr:`beartype._decor._data.BeartypeStrategyKind.Ologn`) for
+    mappings by generalizing the :func:`get_mapping_item` getter to return
+    either the first or last such items of this mapping.
+
+    Parameters
+    ----------
+    mapping : Mapping
+        Non-empty mapping to be sampled.
+    random_int : int
+        Pseudo-random non-negative integer.
+
+    Returns
+    ----------
+    list
+        List of these items.
+    '''
+
+    # Number of items to be sampled from this mapping.
+    items_len = len(mapping).bit_length()
+
+    # Items view of this mapping, reversed if this integer selects the last
+    # items of this mapping *AND* these items are efficiently reversible.
+    mapping_items = mapping.items()
+    if (
+        random_int & 1 and
+        mapping.__class__ in _MAPPING_TYPES_ITEMS_REVERSIBLE
+    ):
+        mapping_items = reversed(mapping_items)
+
+    # Return the first such items.
+    return list(islice(mapping_items, items_len))
+
+# ....................{ GETTERS ~ reiterable              }....................
+def get_reiterable_item(reiterable: 'Iterable', random_int: int) -> object:
+    '''
+    Next item of the passed **reiterable** (i.e., iterable that is neither a
+    sequence nor mapping, such as a set, frozen set, or dictionary view) to be
+    type-checked, selected in ``O(1)`` time, if this reiterable is both
+    non-empty *and* safely sampleable *or* the :data:`SENTINEL` placeholder
+    otherwise.
+
+    This getter implements the ``O(1)`` container type-checking strategy
+    (i.e., :attr:`beartype._decor._data.BeartypeStrategyKind.O1`) for
+    reiterables. Since reiterables provide *no* efficient random access, this
+    getter instead:
+
+    * If this reiterable is a builtin list or tuple (e.g., passed as a
+      parameter annotated by ``typing.Iterable[int]``), returns the item at
+      the pseudo-random index selected by the passed pseudo-random integer.
+    * Else if this reiterable is a builtin set, frozen set, or dictionary
+      view of ``n`` items, returns the item at a pseudo-random offset into
+      either the first or, for dictionary views under Python >= 3.8, last
+      ``ceil(log2(n + 1))`` items of this reiterable as selected by the passed
+      pseudo-random integer (i.e., the same window sampled by the
+      :func:`get_reiterable_items_log` getter). As with the
+      :func:`get_mapping_item` getter, items outside this window are never
+      type-checked.
+    * Else, returns the :data:`SENTINEL` placeholder.
+
+    Caveats
+    ----------
+    **This getter never iterates reiterables of other types** (e.g.,
+    user-defined collections, subclasses of builtin sets, one-shot iterators
+    such as generators and file handles), which are thus only shallowly
+    type-checked. Iterating such a reiterable could invoke arbitrary
+    user-defined ``__iter__`` methods with arbitrary side effects, including
+    silently consuming the items of one-shot iterators that the decorated
+    callable would then never receive.
+
+    **This getter never modifies this reiterable.** See the
+    :func:`get_mapping_item` getter for further details.
+
+    Parameters
+    ----------
+    reiterable : Iterable
+        Possibly empty reiterable to be sampled.
+    random_int : int
+        Pseudo-random non-negative integer (typically generated by the
+        :data:`beartype._decor._code.codesnip.CODE_INIT_RANDOM_INT` snippet).
+
+    Returns
+    ----------
+    object
+        Either:
+
+        * If this reiterable is both non-empty *and* safely sampleable, this
+          item.
+        * Else, the :data:`SENTINEL` placeholder.
+    '''
+
+    # Type of this reiterable.
+    reiterable_type = reiterable.__class__
+
+    # If this reiterable is efficiently indexable, return the item at the
+    # pseudo-random index selected by this integer if this reiterable is
+    # non-empty *OR* this placeholder otherwise.
+    if reiterable_type in _REITERABLE_TYPES_INDEXABLE:
+        return (
+            reiterable[random_int % len(reiterable)] if reiterable else
+            SENTINEL
+        )
+    # Else if this reiterable is *NOT* safely sampleable, return this
+    # placeholder *WITHOUT* iterating this reiterable.
+    elif reiterable_type not in _REITERABLE_TYPES_SAMPLEABLE:
+        return SENTINEL
+    # Else, this reiterable is safely sampleable.
+
+    # Iterator over the items of this reiterable, reversed if this integer
+    # selects the last item of this reiterable *AND* these items are
+    # efficiently reversible.
+    items_iter = (
+        reversed(reiterable)
+        if random_int & 1 and reiterable_type in _REITERABLE_TYPES_REVERSIBLE
+        else iter(reiterable)
+    )
+
+    # Return the item at the offset into the window of items sampled by the
+    # get_reiterable_items_log() getter selected by the remaining bits of this
+    # integer if this reiterable is non-empty *OR* this placeholder otherwise.
+    return next(
+        islice(
+            items_iter,
+            (random_int >> 1) % (len(reiterable).bit_length() or 1),
+            None,
+        ),
+        SENTINEL,
+    )
+
+
+def get_reiterable_items_log(
+    reiterable: 'Iterable', random_int: int) -> 'Sequence':
+    '''
+    Sequence of ``ceil(log2(n + 1))`` items of the passed possibly empty
+    reiterable of ``n`` items to be type-checked, selected in ``O(lgn)`` time,
+    if this reiterable is safely sampleable *or* the empty tuple otherwise.
+
+    This getter implements the ``O(lgn)`` container type-checking strategy
+    (i.e., :attr:`beartype._decor._data.BeartypeStrategyKind.Ologn`) for
+    reiterables by generalizing the :func:`get_reiterable_item` getter.
+
+    Parameters
+    ----------
+    reiterable : Iterable
+        Possibly empty reiterable to be sampled.
+    random_int : int
+        Pseudo-random non-negative integer.
+
+    Returns
+    ----------
+    Sequence
+        Sequence of these items.
+    '''
+
+    # Type of this reiterable.
+    reiterable_type = reiterable.__class__
+
+    # If this reiterable is efficiently indexable, defer to the getter
+    # sampling sequences if this reiterable is non-empty.
+    if reiterable_type in _REITERABLE_TYPES_INDEXABLE:
+        return (
+            get_sequence_items_log(reiterable, random_int) if reiterable else
+            ()
+        )
+    # Else if this reiterable is *NOT* safely sampleable, return the empty
+    # tuple *WITHOUT* iterating this reiterable.
+    elif reiterable_type not in _REITERABLE_TYPES_SAMPLEABLE:
+        return ()
+    # Else, this reiterable is safely sampleable and thus sized.
+
+    # Iterator over the items of this reiterable. See get_reiterable_item().
+    items_iter = (
+        reversed(reiterable)
+        if random_int & 1 and reiterable_type in _REITERABLE_TYPES_REVERSIBLE
+        else iter(reiterable)
+    )
+
+    # Return the first such items of this iterator.
+    return tuple(islice(items_iter, len(reiterable).bit_length()))
+
+
+def get_reiterable_items(reiterable: 'Iterable') -> 'Iterable':
+    '''
+    Iterable over *all* items of the passed reiterable if this reiterable is
+    safely sampleable *or* the empty tuple otherwise.
+
+    This getter implements the ``O(n)`` container type-checking strategy
+    (i.e., :attr:`beartype._decor._data.BeartypeStrategyKind.On`) for
+    reiterables. See the :func:`get_reiterable_item` getter for further
+    details on which reiterables are safely sampleable.
+
+    Parameters
+    ----------
+    reiterable : Iterable
+        Possibly empty reiterable to be iterated.
+
+    Returns
+    ----------
+    Iterable
+        Either this reiterable *or* the empty tuple.
+    '''
+
+    # Return this reiterable if this reiterable is safely sampleable *OR* the
+    # empty tuple otherwise.
+    return (
+        reiterable
+        if (
+            reiterable.__class__ in _REITERABLE_TYPES_INDEXABLE or
+            reiterable.__class__ in _REITERABLE_TYPES_SAMPLEABLE
+        ) else
+        ()
+    )
+
+# ....................{ GETTERS ~ sequence                }....................
+def get_sequence_items_log(sequence: 'Sequence', random_int: int) -> list:
+    '''
+    List of ``ceil(log2(n + 1))`` items at distinct pseudo-random indices of
+    the passed non-empty sequence of ``n`` items, selected by the passed
+    pseudo-random integer.
+
+    This getter implements the ``O(lgn)`` container type-checking strategy
+    (i.e., :attr:`beartype._decor._data.BeartypeStrategyKind.Ologn`) for
+    sequences. For efficiency, these indices are derived from this single
+    pseudo-random integer rather than by calling the inefficient pure-Python
+    functions declared by the :mod:`random` module (e.g.,
+    :func:`random.sample`). Specifically, these indices are uniformly spaced
+    across this sequence with a stride of ``n // ceil(log2(n + 1))``, starting
+    at the pseudo-random index selected by this integer and wrapping around
+    the end of this sequence. Since the span of these indices is strictly less
+    than ``n``, these indices are guaranteed to be distinct.
+
+    Parameters
+    ----------
+    sequence : Sequence
+        Non-empty sequence to be sampled.
+    random_int : int
+        Pseudo-random non-negative integer (typically generated by the
+        :data:`beartype._decor._code.codesnip.CODE_INIT_RANDOM_INT` snippet).
+
+    Returns
+    ----------
+    list
+        List of these items.
+    '''
+
+    # Number of items in this sequence.
+    sequence_len = len(sequence)
+
+    # Number of items to be sampled from this sequence.
+    items_len = sequence_len.bit_length()
+
+    # Distance between the indices of successively sampled items.
+    index_step = sequence_len // items_len
+
+    # 0-based index of the first sampled item.
+    index_first = random_int % sequence_len
+
+    # Return the list of these items.
+    return [
+        sequence[index % sequence_len]
+        for index in range(
+            index_first, index_first + items_len*index_step, index_step)
+    ]
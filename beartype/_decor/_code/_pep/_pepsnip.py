@@ -20,7 +20,7 @@ This private submodule is *not* intended for importation by downstream callers.
 
 # ....................{ IMPORTS                           }....................
 from beartype._decor._code.codesnip import (
-    PARAM_NAME_FUNC, PARAM_NAME_TYPISTRY)
+    PARAM_NAME_FUNC, PARAM_NAME_TYPES_CACHE, PARAM_NAME_TYPISTRY)
 from inspect import Parameter
 
 # ....................{ PITH                              }....................
@@ -40,6 +40,19 @@ current parameter or return value *or* item contained the current parameter or
 return value being type-checked by the current call).
 '''
 
+
+PEP_CODE_PITH_ITEM_NAME_PREFIX = '__beartype_pith_item_'
+'''
+Substring prefixing all local variables iteratively bound to each item of the
+current pith by generator expressions type-checking multiple items of that
+pith under either the ``O(lgn)`` or ``O(n)`` container type-checking
+strategies (i.e.,
+:attr:`beartype._decor._data.BeartypeStrategyKind.Ologn` or
+:attr:`beartype._decor._data.BeartypeStrategyKind.On`) *or* bound to the
+single item of the current pith (e.g., the ``(key, value)`` 2-tuple of a
+mapping item) by assignment expressions under the ``O(1)`` strategy.
+'''
+
 # ....................{ PITH ~ root                       }....................
 PEP_CODE_PITH_ROOT_NAME = f'{PEP_CODE_PITH_NAME_PREFIX}0'
 '''
@@ -115,11 +128,82 @@ Dictionary mapping from the type of each callable parameter supported by the
 that callable's next parameter to be type-checked.
 '''
 
+
+PARAM_KIND_TO_PEP_CODE_GET_MIRRORED = {
+    # Snippet localizing any positional or keyword parameter *WITHOUT* a
+    # default value. Since the wrapper function signature mirrors that of the
+    # decorated callable in this mode, the active Python interpreter has
+    # already bound this parameter to a local variable of the same name.
+    # Since this parameter has *NO* default value, this parameter is
+    # guaranteed to have been passed.
+    Parameter.POSITIONAL_OR_KEYWORD: f'''
+    # Localize this positional or keyword parameter.
+    {PEP_CODE_PITH_ROOT_NAME} = {{arg_name}}
+
+    # Noop required to artifically increase indentation level. Note that
+    # CPython implicitly optimizes this conditional away - which is nice.
+    if True:''',
+
+    # Snippet localizing any keyword-only parameter *WITHOUT* a default value.
+    # (See above.)
+    Parameter.KEYWORD_ONLY: f'''
+    # Localize this keyword-only parameter.
+    {PEP_CODE_PITH_ROOT_NAME} = {{arg_name}}
+
+    # Noop required to artifically increase indentation level. Note that
+    # CPython implicitly optimizes this conditional away - which is nice.
+    if True:''',
+
+    # Snippet iteratively localizing all variadic positional parameters from
+    # the tuple already bound to a local variable of the same name.
+    Parameter.VAR_POSITIONAL: f'''
+    # For all passed positional variadic parameters...
+    for {PEP_CODE_PITH_ROOT_NAME} in {{arg_name}}:''',
+}
+'''
+Dictionary mapping from the type of each callable parameter supported by the
+:func:`beartype.beartype` decorator to a PEP-compliant code snippet localizing
+that callable's next parameter to be type-checked by a wrapper function whose
+signature mirrors that of that callable.
+'''
+
+
+PEP_CODE_GET_MIRRORED_DEFAULT = f'''
+    # Localize this positional or keyword parameter.
+    {PEP_CODE_PITH_ROOT_NAME} = {{arg_name}}
+
+    # If this parameter was *NOT* passed (i.e., is still the private sentinel
+    # this wrapper declares as its default value), replace this sentinel by
+    # the actual default value of this parameter *WITHOUT* type-checking that
+    # value.
+    if {PEP_CODE_PITH_ROOT_NAME} is {PARAM_NAME_TYPISTRY}:
+        {{arg_name}} = {{arg_default_expr}}
+    # Else, this parameter was passed. In this case, type-check this parameter
+    # (even if this parameter is that default value).
+    else:'''
+'''
+PEP-compliant code snippet localizing any positional or keyword parameter *with*
+a default value to be type-checked by a wrapper function whose signature
+mirrors that of the decorated callable.
+
+Default values are intentionally *not* type-checked, preserving parity with
+wrapper functions in variadic mode, which only type-check passed parameters.
+Since comparing a parameter against its default value by identity would also
+silently skip type-checking parameters explicitly passed that same value
+(e.g., ``None`` passed to a parameter annotated as ``int`` defaulting to
+``None``), the wrapper instead declares each such parameter as defaulting to
+the private :data:`beartype._decor._code.codesnip.PARAM_NAME_TYPISTRY`
+parameter, which callers *never* pass. This snippet detects unpassed
+parameters by identity with that sentinel and then replaces that sentinel by
+the actual default value, accessed via a private parameter prefixed by
+:data:`beartype._decor._code.codesnip.PARAM_NAME_DEFAULT_PREFIX`.
+'''
+
 # ....................{ RETURN                            }....................
 PEP_CODE_CHECK_RETURN_PREFIX = f'''
     # Call this function with all passed parameters and localize the value
     # returned from this call.
-    {PEP_CODE_PITH_ROOT_NAME} = {PARAM_NAME_FUNC}(*args, **kwargs)
+    {PEP_CODE_PITH_ROOT_NAME} = {PARAM_NAME_FUNC}({{func_call_args}})
 
     # Noop required to artifically increase indentation level. Note that
     # CPython implicitly optimizes this conditional away - which is nice.
@@ -128,6 +212,10 @@ PEP_CODE_CHECK_RETURN_PREFIX = f'''
 PEP-compliant code snippet calling the decorated callable and localizing the
 value returned by that call.
 
+This snippet is a template to be formatted by the Python code passing all
+parameters passed to the wrapper function to the decorated callable (see
+:data:`beartype._decor._code.codesnip.CODE_RETURN_UNCHECKED`).
+
 Note that this snippet intentionally terminates on a line containing only the
 ``(`` character, enabling subsequent type-checking code to effectively ignore
 indentation level and thus uniformly operate on both:
@@ -159,7 +247,7 @@ Note that this snippet intentionally terminates on a line containing only the
 PEP484_CODE_CHECK_NORETURN = f'''
     # Call this function with all passed parameters and localize the value
     # returned from this call.
-    {PEP_CODE_PITH_ROOT_NAME} = {PARAM_NAME_FUNC}(*args, **kwargs)
+    {PEP_CODE_PITH_ROOT_NAME} = {PARAM_NAME_FUNC}({{func_call_args}})
 
     # Since this function annotated by "typing.NoReturn" successfully returned
     # a value rather than raising an exception or halting the active Python
@@ -175,6 +263,10 @@ the :attr:`typing.NoReturn` singleton and raising an exception if this call
 successfully returned a value rather than raising an exception or halting the
 active Python interpreter.
 
+This snippet is a template to be formatted by the Python code passing all
+parameters passed to the wrapper function to the decorated callable (see
+:data:`beartype._decor._code.codesnip.CODE_RETURN_UNCHECKED`).
+
 .. _PEP 484:
    https://www.python.org/dev/peps/pep-0484
 '''
@@ -241,9 +333,45 @@ current child PEP-compliant type hint and are thus intended to be dynamically
 embedded
 '''
 
+# ....................{ HINT ~ pith : root : types cache  }....................
+PEP_CODE_CHECK_HINT_ROOT_TYPES_CACHED_PREFIX = f'''
+        # If this pith is *NOT* of the exact type of the last pith to have
+        # satisfied this type-determined hint, type-check this pith. Else,
+        # this pith is guaranteed to satisfy this hint.
+        if __beartype_builtin_type({PEP_CODE_PITH_ROOT_NAME}) is not {PARAM_NAME_TYPES_CACHE}[{{types_cache_index}}]:'''
+'''
+PEP-compliant code snippet prefixing the code type-checking the **root pith**
+(i.e., value of the current parameter or return value) against a
+**type-determined root hint** (i.e., hint whose satisfaction depends only on
+the type of that pith) by a monomorphic inline cache of the type of the last
+pith to have satisfied that hint.
+
+The caller is expected to indent the code type-checking that pith (i.e., the
+:data:`PEP_CODE_CHECK_HINT_ROOT` snippet) by one additional level *before*
+appending that code and the :data:`PEP_CODE_CHECK_HINT_ROOT_TYPES_CACHED_SUFFIX`
+snippet to this snippet.
+'''
+
+
+PEP_CODE_CHECK_HINT_ROOT_TYPES_CACHED_SUFFIX = f'''
+
+            # Cache the type of this pith as satisfying this hint.
+            {PARAM_NAME_TYPES_CACHE}[{{types_cache_index}}] = __beartype_builtin_type({PEP_CODE_PITH_ROOT_NAME})
+'''
+'''
+PEP-compliant code snippet suffixing the code type-checking the root pith
+against a type-determined root hint by caching the type of that pith *after*
+that pith has successfully satisfied that hint.
+
+See Also
+----------
+:data:`PEP_CODE_CHECK_HINT_ROOT_TYPES_CACHED_PREFIX`
+    Further details.
+'''
+
 # ....................{ HINT ~ nonpep                     }....................
 PEP_CODE_CHECK_HINT_NONPEP_TYPE = (
-    '''isinstance({pith_curr_expr}, {hint_curr_expr})''')
+    '''__beartype_builtin_isinstance({pith_curr_expr}, {hint_curr_expr})''')
 '''
 PEP-compliant code snippet type-checking the current pith against the
 current child PEP-compliant type expected to be a trivial non-:mod:`typing`
@@ -253,7 +381,7 @@ type (e.g., :class:`int`, :class:`str`).
 # ....................{ HINT ~ generic                    }....................
 PEP_CODE_CHECK_HINT_GENERIC_PREFIX = '''(
 {indent_curr}    # True only if this pith is an instance of this generic.
-{indent_curr}    isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and'''
+{indent_curr}    __beartype_builtin_isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and'''
 '''
 PEP-compliant code snippet prefixing all code type-checking the current pith
 against each unerased pseudo-superclass subclassed by a `PEP 484`_-compliant
@@ -306,10 +434,38 @@ snippet type-checking the current pith against *all* subscripted arguments of
 this parent type has been generated.
 '''
 
+# ....................{ HINT ~ container                  }....................
+PEP_CODE_CHECK_HINT_CONTAINER_CHILD_ALL = (
+    '''__beartype_builtin_all({hint_child_placeholder} '''
+    '''for {pith_item_name} in {pith_items_expr})''')
+'''
+PEP-compliant Python expression type-checking multiple items of the current
+pith (which, by definition, *must* be a container) against the child hints of
+a parent container type under either the ``O(lgn)`` or ``O(n)`` container
+type-checking strategies, iteratively binding each item yielded by the passed
+iterable expression to a local variable of the passed name *and*
+short-circuiting on the first item violating these hints.
+'''
+
+
+PEP_CODE_CHECK_HINT_CONTAINER_ITEM_ASSIGN = (
+    '''({pith_item_name} := {pith_item_expr})''')
+'''
+Python >= 3.8-specific assignment expression assigning the item of the current
+pith (which, by definition, *must* be a container) to be type-checked under
+the ``O(1)`` container type-checking strategy to a unique local variable,
+guaranteeing that all expressions type-checking that item (e.g., the key and
+value of a mapping item) type-check the *same* item.
+
+If the current pith is a mapping, this item is a non-empty and thus truthy
+2-tuple ``(key, value)``, in which case this expression is safely conjoinable
+with the expressions type-checking that key and value.
+'''
+
 # ....................{ HINT ~ sequence : standard        }....................
 PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD = '''(
 {indent_curr}    # True only if this pith shallowly satisfies this hint.
-{indent_curr}    isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and
+{indent_curr}    __beartype_builtin_isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and
 {indent_curr}    # True only if either this pith is empty *OR* this pith is
 {indent_curr}    # both non-empty and deeply satisfies this hint.
 {indent_curr}    (not {pith_curr_assigned_expr} or {hint_child_placeholder})
@@ -337,7 +493,7 @@ sequences with a seemingly reasonable ternary conditional:
 .. code-block:: python
 
    PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD = \'\'\'(
-   {indent_curr}    isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and
+   {indent_curr}    __beartype_builtin_isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and
    {indent_curr}    {hint_child_placeholder} if {pith_curr_assigned_expr} else True
    {indent_curr})\'\'\'
 
@@ -351,16 +507,85 @@ based on ternary conditional (albeit slightly less intuitive).
 
 
 PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_PITH_CHILD_EXPR = (
-    '''{pith_curr_assigned_expr}[__beartype_random_int % len({pith_curr_assigned_expr})]''')
+    '''{pith_curr_assigned_expr}[__beartype_random_int % __beartype_builtin_len({pith_curr_assigned_expr})]''')
 '''
 PEP-compliant Python expression yielding the value of a randomly indexed item
 of the current pith (which, by definition, *must* be a standard sequence).
 '''
 
+
+PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_PITH_ITEMS_LOG_EXPR = (
+    '''__beartype_get_sequence_items_log('''
+    '''{pith_curr_assigned_expr}, __beartype_random_int)''')
+'''
+PEP-compliant Python expression yielding a logarithmic number of items at
+distinct pseudo-random indices of the current pith (which, by definition,
+*must* be a non-empty standard sequence) under the ``O(lgn)`` container
+type-checking strategy.
+
+See Also
+----------
+:func:`beartype._decor._code._pep._pepsample.get_sequence_items_log`
+    Further details.
+'''
+
+
+PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_TYPES_EXACT_CHILD = (
+    '''(__beartype_builtin_set(__beartype_builtin_map(__beartype_builtin_type, {pith_curr_assigned_expr})) <= {hint_types_exact_expr} '''
+    '''or __beartype_builtin_all(__beartype_builtin_isinstance({pith_item_name}, {hint_child_expr}) '''
+    '''for {pith_item_name} in {pith_curr_assigned_expr} '''
+    '''if __beartype_builtin_type({pith_item_name}) not in {hint_types_exact_expr}))''')
+'''
+PEP-compliant Python expression type-checking *all* items of the current pith
+(which, by definition, *must* be a non-empty standard sequence) against a
+child hint that is either a non-:mod:`typing` class *or* a union of only such
+classes under the ``O(n)`` container type-checking strategy.
+
+This expression first computes the set of the exact types of all items of this
+pith in a single C-level pass and compares that set against the precomputed
+frozen set of exact types guaranteed to satisfy this child hint. Only if this
+pith contains one or more items whose exact types are *not* members of that
+frozen set (e.g., instances of user-defined subclasses) are only those items
+passed to the :func:`isinstance` builtin. Since the items of most sequences
+share a handful of builtin types, this is typically several times faster than
+the equivalent :data:`PEP_CODE_CHECK_HINT_CONTAINER_CHILD_ALL` expression.
+
+See Also
+----------
+:func:`beartype._decor._code._pep._pepexact.get_hint_types_exact_or_none`
+    Further details.
+'''
+
+
+PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_HOMOGENEOUS_CHILD = (
+    '''(({pith_curr_assigned_expr}.__class__ in {hint_sequence_types_expr} '''
+    '''and __beartype_is_sequence_homogeneous('''
+    '''{pith_curr_assigned_expr}, {hint_child_expr})) or '''
+    '''{hint_child_placeholder})''')
+'''
+PEP-compliant Python expression type-checking the items of the current pith
+(which, by definition, *must* be a non-empty standard sequence) against a
+non-:mod:`typing` child class, first attempting to prove *all* items of this
+pith to satisfy this class in ``O(1)`` time by only the type and (if any)
+typecode or format of this pith (e.g., :class:`range`, :class:`bytes`,
+:class:`array.array`, :class:`memoryview`) *before* falling back to
+type-checking one or more items of this pith against this class as usual.
+
+Since the type of this pith is first tested against the tuple of all builtin
+homogeneous sequence types provable against this class, the overhead of this
+expression for all other sequences (e.g., lists) is a single tuple membership
+test.
+
+See Also
+----------
+:func:`beartype._decor._code._pep._pephomogeneous.is_sequence_homogeneous`
+    Further details.
+'''
+
 # ....................{ HINT ~ sequence : tuple           }....................
 PEP_CODE_CHECK_HINT_TUPLE_FIXED_PREFIX = '''(
 {indent_curr}    # True only if this pith is a tuple.
-{indent_curr}    isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and'''
+{indent_curr}    __beartype_builtin_isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and'''
 '''
 PEP-compliant code snippet prefixing all code type-checking the current pith
 against each subscripted child hint of an itemized :class:`typing.Tuple` type
@@ -394,7 +619,7 @@ See Also
 
 PEP_CODE_CHECK_HINT_TUPLE_FIXED_LEN = '''
 {{indent_curr}}    # True only if this tuple is of the expected length.
-{{indent_curr}}    len({pith_curr_assigned_expr}) == {hint_childs_len} and'''
+{{indent_curr}}    __beartype_builtin_len({pith_curr_assigned_expr}) == {hint_childs_len} and'''
 '''
 PEP-compliant code snippet prefixing all code type-checking the current pith
 to be of the expected length against an itemized :class:`typing.Tuple` type of
@@ -437,6 +662,177 @@ PEP-compliant Python expression yielding the value of the currently indexed
 item of the current pith (which, by definition, *must* be a tuple).
 '''
 
+# ....................{ HINT ~ mapping                    }....................
+PEP_CODE_CHECK_HINT_MAPPING = '''(
+{indent_curr}    # True only if this pith shallowly satisfies this hint.
+{indent_curr}    __beartype_builtin_isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and
+{indent_curr}    # True only if either this pith is empty *OR* this pith is
+{indent_curr}    # both non-empty and deeply satisfies this hint.
+{indent_curr}    (not {pith_curr_assigned_expr} or {hint_child_placeholder})
+{indent_curr})'''
+'''
+PEP-compliant code snippet type-checking the current pith against a parent
+**mapping type** (i.e., PEP-compliant type hint accepting either one or two
+subscripted type hints constraining *all* keys and values of this pith, which
+necessarily satisfies the :class:`collections.abc.Mapping` protocol).
+
+See Also
+----------
+:data:`PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD`
+    Further details, including caveats applying equally to this snippet.
+'''
+
+
+PEP_CODE_CHECK_HINT_MAPPING_PITH_ITEM_EXPR = (
+    '''__beartype_get_mapping_item('''
+    '''{pith_curr_assigned_expr}, __beartype_random_int)''')
+'''
+PEP-compliant Python expression yielding the 2-tuple ``(key, value)`` of the
+next item of the current pith (which, by definition, *must* be a non-empty
+mapping) under the ``O(1)`` container type-checking strategy.
+
+See Also
+----------
+:func:`beartype._decor._code._pep._pepsample.get_mapping_item`
+    Further details.
+'''
+
+
+PEP_CODE_CHECK_HINT_MAPPING_PITH_ITEMS_LOG_EXPR = (
+    '''__beartype_get_mapping_items_log('''
+    '''{pith_curr_assigned_expr}, __beartype_random_int)''')
+'''
+PEP-compliant Python expression yielding a logarithmic number of 2-tuples
+``(key, value)`` of the items of the current pith (which, by definition,
+*must* be a non-empty mapping) under the ``O(lgn)`` container type-checking
+strategy.
+
+See Also
+----------
+:func:`beartype._decor._code._pep._pepsample.get_mapping_items_log`
+    Further details.
+'''
+
+
+PEP_CODE_CHECK_HINT_MAPPING_PITH_ITEMS_EXPR = (
+    '''{pith_curr_assigned_expr}.items()''')
+'''
+PEP-compliant Python expression yielding *all* 2-tuples ``(key, value)`` of
+the items of the current pith (which, by definition, *must* be a mapping)
+under the ``O(n)`` container type-checking strategy.
+'''
+
+
+PEP_CODE_CHECK_HINT_MAPPING_PITH_KEY_EXPR = '''{pith_item_expr}[0]'''
+'''
+PEP-compliant Python expression yielding the key of the 2-tuple ``(key,
+value)`` yielded by the passed expression.
+'''
+
+
+PEP_CODE_CHECK_HINT_MAPPING_PITH_VALUE_EXPR = '''{pith_item_expr}[1]'''
+'''
+PEP-compliant Python expression yielding the value of the 2-tuple ``(key,
+value)`` yielded by the passed expression.
+'''
+
+# ....................{ HINT ~ reiterable                 }....................
+PEP_CODE_CHECK_HINT_REITERABLE = '''(
+{indent_curr}    # True only if this pith shallowly satisfies this hint.
+{indent_curr}    __beartype_builtin_isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and
+{indent_curr}    # True only if this pith deeply satisfies this hint.
+{indent_curr}    {hint_child_placeholder}
+{indent_curr})'''
+'''
+PEP-compliant code snippet type-checking the current pith against a parent
+**reiterable type** (i.e., PEP-compliant type hint accepting either one or two
+subscripted type hints constraining *all* items of this pith, which is
+iterable but neither a sequence nor mapping).
+
+Unlike the :data:`PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD` snippet, this snippet
+intentionally avoids testing the truthiness of this pith, which need *not* be
+sized (e.g., ``typing.Iterable``) *and* may even prohibit such tests (e.g.,
+NumPy arrays). Empty reiterables and reiterables that are *not* safely
+sampleable (e.g., one-shot iterators) are instead detected by the helpers
+sampling these items.
+
+See Also
+----------
+:data:`PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD`
+    Further details, including caveats applying equally to this snippet.
+'''
+
+
+PEP_CODE_CHECK_HINT_REITERABLE_ITEM_CHILD = (
+    '''({pith_item_assign_expr} is __beartype_sentinel or '''
+    '''{hint_child_placeholder})''')
+'''
+PEP-compliant Python expression type-checking the item of the current pith
+(which, by definition, *must* be a reiterable) sampled under the ``O(1)``
+container type-checking strategy against the child hints of this reiterable
+type, trivially succeeding if this pith is either empty *or* not safely
+sampleable (e.g., a one-shot iterator) and thus yielded no such item.
+'''
+
+
+PEP_CODE_CHECK_HINT_REITERABLE_PITH_ITEM_EXPR = (
+    '''__beartype_get_reiterable_item('''
+    '''{pith_curr_assigned_expr}, __beartype_random_int)''')
+'''
+PEP-compliant Python expression yielding the next item of the current pith
+(which, by definition, *must* be a reiterable) under the ``O(1)`` container
+type-checking strategy if this pith is both non-empty *and* safely
+sampleable *or* the ``__beartype_sentinel`` placeholder otherwise.
+
+See Also
+----------
+:func:`beartype._decor._code._pep._pepsample.get_reiterable_item`
+    Further details.
+'''
+
+
+PEP_CODE_CHECK_HINT_REITERABLE_PITH_ITEM_TUPLE_EXPR = (
+    '''({pith_item_expr},)''')
+'''
+Python < 3.8-specific Python expression yielding a 1-tuple of the item yielded
+by the passed expression.
+
+Since Python < 3.8 lacks assignment expressions, the
+:data:`PEP_CODE_CHECK_HINT_REITERABLE_ITEM_CHILD` snippet instead binds this
+item to a unique local variable by iterating this 1-tuple in the generator
+expression generated by the :data:`PEP_CODE_CHECK_HINT_CONTAINER_CHILD_ALL`
+snippet.
+'''
+
+
+PEP_CODE_CHECK_HINT_REITERABLE_PITH_ITEMS_LOG_EXPR = (
+    '''__beartype_get_reiterable_items_log('''
+    '''{pith_curr_assigned_expr}, __beartype_random_int)''')
+'''
+PEP-compliant Python expression yielding a logarithmic number of items of the
+current pith (which, by definition, *must* be a reiterable) under the
+``O(lgn)`` container type-checking strategy.
+
+See Also
+----------
+:func:`beartype._decor._code._pep._pepsample.get_reiterable_items_log`
+    Further details.
+'''
+
+
+PEP_CODE_CHECK_HINT_REITERABLE_PITH_ITEMS_EXPR = (
+    '''__beartype_get_reiterable_items({pith_curr_assigned_expr})''')
+'''
+PEP-compliant Python expression yielding *all* items of the current pith
+(which, by definition, *must* be a reiterable) under the ``O(n)`` container
+type-checking strategy.
+
+See Also
+----------
+:func:`beartype._decor._code._pep._pepsample.get_reiterable_items`
+    Further details.
+'''
+
 # ....................{ HINT ~ pep484 : union             }....................
 PEP484_CODE_CHECK_HINT_UNION_PREFIX = '''('''
 '''
@@ -474,7 +870,7 @@ this parent type has been generated.
 
 
 PEP484_CODE_CHECK_HINT_UNION_CHILD_NONPEP = '''
-{{indent_curr}}    isinstance({pith_curr_expr}, {hint_curr_expr}) or'''
+{{indent_curr}}    __beartype_builtin_isinstance({pith_curr_expr}, {hint_curr_expr}) or'''
 '''
 PEP-compliant code snippet type-checking the current pith against the current
 PEP-noncompliant child argument subscripting a parent :class:`typing.Union`
@@ -486,6 +882,408 @@ See Also
     Further details.
 '''
 
+
+PEP484_CODE_CHECK_HINT_UNION_CHILD_NONE = '''
+{{indent_curr}}    ({pith_curr_expr}) is None or'''
+'''
+PEP-compliant code snippet type-checking the current pith against the
+``None`` singleton (i.e., the :class:`NoneType` child argument subscripting
+a parent :class:`typing.Union` type, as in ``typing.Optional[int]``) by object
+identity rather than by passing :class:`NoneType` to the :func:`isinstance`
+builtin.
+
+The current pith expression is intentionally parenthesized, as that expression
+may be a Python >= 3.8-specific assignment expression binding less tightly
+than the ``is`` operator.
+
+See Also
+----------
+:data:`PEP484_CODE_CHECK_HINT_UNION_CHILD_PEP`
+    Further details.
+'''
+
+
+PEP484_CODE_UNION_INDEX_NAME_PREFIX = '__beartype_union_index_'
+'''
+Substring prefixing all local variables providing the **union dispatch index**
+(i.e., integer looked up from a union dispatch table on the exact type of the
+current pith) of a :class:`typing.Union` type.
+'''
+
+
+PEP484_CODE_UNION_TYPE_NAME_PREFIX = '__beartype_union_type_'
+'''
+Substring prefixing all local variables providing the exact type of the
+current pith dispatched on by an adaptive union dispatch table.
+'''
+
+
+PEP484_CODE_CHECK_HINT_UNION_DISPATCH_PREFIX = '''(
+{{indent_curr}}    ({union_index_name} := {union_dispatch_expr}[__beartype_builtin_type({pith_curr_assign_expr})]) == 0 or'''
+'''
+PEP-compliant code snippet prefixing all code type-checking the current pith
+against each subscripted argument of a :class:`typing.Union` type by
+dispatching on the exact type of that pith.
+
+This snippet looks up the union dispatch index of the exact type of this pith
+in the union dispatch table (i.e., dictionary mapping from exact types to
+union dispatch indices) whose name is ``{union_dispatch_expr}``, reducing to
+``True`` if that index implies this pith to satisfy a type-determined child
+hint *and* assigning that index to a local variable reused by subsequent code
+generated for all remaining child hints otherwise.
+
+See Also
+----------
+:class:`beartype._decor._code._pep._pepunion.UnionTypeDispatch`
+    Further details.
+'''
+
+
+PEP484_CODE_CHECK_HINT_UNION_DISPATCH_CHILD_PEP = '''
+{{indent_curr}}    ({union_index_name} == {hint_child_index} or {union_index_name} < 0) and {hint_child_placeholder} or'''
+'''
+PEP-compliant code snippet type-checking the current pith against the current
+PEP-compliant child argument subscripting a parent :class:`typing.Union` type
+dispatched on by the :data:`PEP484_CODE_CHECK_HINT_UNION_DISPATCH_PREFIX`
+snippet *only* if the union dispatch index of the exact type of that pith is
+either the 1-based index of this child argument *or* negative (i.e., requires
+falling back to type-checking that pith against *all* child arguments).
+
+See Also
+----------
+:data:`PEP484_CODE_CHECK_HINT_UNION_CHILD_PEP`
+    Further details.
+'''
+
+
+PEP484_CODE_CHECK_HINT_UNION_DISPATCH_ADAPTIVE_PREFIX = '''(
+{{indent_curr}}    ({union_index_name} := {union_dispatch_expr}[({union_type_name} := __beartype_builtin_type({pith_curr_assign_expr}))]) == 0 or'''
+'''
+PEP-compliant code snippet prefixing all code type-checking the current pith
+against each subscripted argument of a :class:`typing.Union` type by
+dispatching on the exact type of that pith via an adaptive union dispatch
+table, additionally assigning that type to a local variable passed to the
+:meth:`beartype._decor._code._pep._pepunion.UnionTypeDispatch.hit` method by
+subsequent code.
+
+See Also
+----------
+:data:`PEP484_CODE_CHECK_HINT_UNION_DISPATCH_PREFIX`
+    Further details.
+'''
+
+
+PEP484_CODE_CHECK_HINT_UNION_DISPATCH_ADAPTIVE_CHILD_PEP = '''
+{{indent_curr}}    ({union_index_name} == {hint_child_index} or {union_index_name} == {hint_child_index_preferred}) and {hint_child_placeholder} or'''
+'''
+PEP-compliant code snippet type-checking the current pith against the current
+PEP-compliant child argument subscripting a parent :class:`typing.Union` type
+dispatched on by an adaptive union dispatch table *only* if the union dispatch
+index of the exact type of that pith is either the 1-based index of this child
+argument *or* the bitwise negation of that index (i.e., signifying this child
+argument to be the argument most frequently satisfied by piths of that type).
+'''
+
+
+PEP484_CODE_CHECK_HINT_UNION_DISPATCH_ADAPTIVE_CHILD_PEP_FALLBACK = '''
+{{indent_curr}}    {union_index_name} < 0 and {hint_child_placeholder} and {union_dispatch_expr}.hit({union_type_name}, {hint_child_index}) or'''
+'''
+PEP-compliant code snippet type-checking the current pith against the current
+PEP-compliant child argument subscripting a parent :class:`typing.Union` type
+dispatched on by an adaptive union dispatch table *only* if the union dispatch
+index of the exact type of that pith is negative (i.e., requires falling back
+to type-checking that pith against *all* child arguments) *and*, if that pith
+satisfies this child argument, recording that fact with that table.
+'''
+
+
+PEP484_CODE_CHECK_HINT_UNION_DISPATCH_CHILD_NONPEP = '''
+{{indent_curr}}    {union_index_name} < 0 and __beartype_builtin_isinstance({pith_curr_assigned_expr}, {hint_curr_expr}) or'''
+'''
+PEP-compliant code snippet type-checking the current pith against all
+PEP-noncompliant child arguments subscripting a parent :class:`typing.Union`
+type dispatched on by the :data:`PEP484_CODE_CHECK_HINT_UNION_DISPATCH_PREFIX`
+snippet *only* if the union dispatch index of the exact type of that pith is
+negative. Since a non-negative index implies the exact type of that pith to
+either satisfy or *not* subclass these arguments, these arguments need *not*
+be type-checked otherwise.
+
+See Also
+----------
+:data:`PEP484_CODE_CHECK_HINT_UNION_CHILD_PEP`
+    Further details.
+'''
+
+# ....................{ HINT ~ pep484 : subclass          }....................
+PEP484_CODE_CHECK_HINT_SUBCLASS = '''(
+{indent_curr}    # True only if this pith is a class.
+{indent_curr}    __beartype_builtin_isinstance({pith_curr_assign_expr}, __beartype_builtin_type) and
+{indent_curr}    # True only if this class subclasses these superclasses.
+{indent_curr}    {hint_subclass_cache_expr}[{pith_curr_assigned_expr}]
+{indent_curr})'''
+'''
+PEP-compliant code snippet type-checking the current pith against the
+superclasses subscripting a :attr:`typing.Type` type hint (e.g.,
+``typing.Type[int]``, ``typing.Type[typing.Union[int, str]]``).
+
+Rather than passing this pith to the :func:`issubclass` builtin directly, this
+snippet looks this pith up in a subclass cache (i.e.,
+:class:`beartype._decor._code._pep._pepsubclass.SubclassCache` instance)
+memoizing the result of each such call.
+'''
+
+# ....................{ HINT ~ pep484 : namedtuple        }....................
+PEP484_CODE_CHECK_HINT_NAMEDTUPLE_PREFIX = '''(
+{indent_curr}    # True only if this pith is an instance of this named tuple.
+{indent_curr}    __beartype_builtin_isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and'''
+'''
+PEP-compliant code snippet prefixing all code type-checking the current pith
+against each type-checkable field of a :class:`typing.NamedTuple` subclass.
+
+The caller is expected to append code type-checking each such field of this
+pith by the :data:`PEP_CODE_CHECK_HINT_TUPLE_FIXED_NONEMPTY_CHILD` snippet
+*before* appending the :data:`PEP_CODE_CHECK_HINT_TUPLE_FIXED_SUFFIX` snippet.
+'''
+
+
+PEP484_CODE_CHECK_HINT_NAMEDTUPLE_CHUNK_PREFIX = '''
+{{indent_curr}}    # True only if either this chunk of fields is *NOT* the chunk
+{{indent_curr}}    # pseudo-randomly selected for this call *OR* these fields of
+{{indent_curr}}    # this pith deeply satisfy their child hints.
+{{indent_curr}}    (__beartype_random_int % {chunks_len} != {chunk_index} or ('''
+'''
+PEP-compliant code snippet prefixing all code type-checking the current pith
+against one chunk of the type-checkable fields of a :class:`typing.NamedTuple`
+subclass declaring more such fields than are type-checked by each call under
+the ``O(1)`` and ``O(log n)`` strategies.
+
+Since only one chunk is pseudo-randomly selected for each call, the code
+type-checking each other chunk reduces to a single integer comparison.
+'''
+
+
+PEP484_CODE_CHECK_HINT_NAMEDTUPLE_CHUNK_SUFFIX = ')) and'
+'''
+PEP-compliant code snippet suffixing all code type-checking the current pith
+against one chunk of the type-checkable fields of a :class:`typing.NamedTuple`
+subclass.
+
+Caveats
+----------
+The caller is required to manually slice the trailing suffix ``" and"`` from
+the code type-checking the last field of this chunk *before* appending this
+snippet.
+'''
+
+# ....................{ HINT ~ pep586 : literal           }....................
+PEP586_CODE_LITERAL_TYPE_NAME_PREFIX = '__beartype_literal_type_'
+'''
+Substring prefixing the name of each local variable providing the exact type
+of the current pith type-checked against a :attr:`typing.Literal` type,
+suffixed by an integer uniquifying this variable across all code generated for
+the same root hint.
+'''
+
+
+PEP586_CODE_LITERAL_TYPE_ASSIGN_EXPR = (
+    '''({literal_type_name} := __beartype_builtin_type({pith_curr_assign_expr}))''')
+'''
+`PEP 586`_-compliant Python expression assigning the exact type of the current
+pith to the local variable referenced by all subsequent code type-checking that
+pith against the literal objects subscripting a :attr:`typing.Literal` type.
+
+Since :attr:`typing.Literal` is only available under Python >= 3.8, this
+assignment expression is unconditionally safe.
+
+.. _PEP 586:
+   https://www.python.org/dev/peps/pep-0586
+'''
+
+
+PEP586_CODE_CHECK_HINT_LITERAL_PREFIX = '''('''
+'''
+`PEP 586`_-compliant code snippet prefixing all code type-checking the current
+pith against the literal objects subscripting a :attr:`typing.Literal` type.
+
+.. _PEP 586:
+   https://www.python.org/dev/peps/pep-0586
+'''
+
+
+PEP586_CODE_CHECK_HINT_LITERAL_SUFFIX = '''
+{indent_curr})'''
+'''
+`PEP 586`_-compliant code snippet suffixing all code type-checking the current
+pith against the literal objects subscripting a :attr:`typing.Literal` type.
+
+.. _PEP 586:
+   https://www.python.org/dev/peps/pep-0586
+'''
+
+
+PEP586_CODE_CHECK_HINT_LITERAL_CHILDS_HASHABLE = '''
+{indent_curr}    {literal_type_expr} in {hint_literal_types_expr} and ({literal_type_name}, {pith_curr_assigned_expr}) in {hint_literals_expr} or'''
+'''
+`PEP 586`_-compliant code snippet type-checking the current pith against *all*
+hashable literal objects subscripting a :attr:`typing.Literal` type in
+amortized ``O(1)`` time.
+
+This snippet tests whether the 2-tuple ``(type(pith), pith)`` is in the frozen
+set of the 2-tuples ``(type(literal), literal)`` of these literal objects,
+qualifying each literal object by its exact type and thus preserving the
+distinction between literal objects comparing equal despite differing in type
+(e.g., ``True`` and ``1``, ``False`` and ``0``). To avoid hashing unhashable
+piths (which would raise a :class:`TypeError`), this snippet first tests
+whether the exact type of that pith is that of any of these literal objects.
+
+See Also
+----------
+:data:`PEP484_CODE_CHECK_HINT_UNION_CHILD_PEP`
+    Further details on the trailing ``" or"`` suffix.
+
+.. _PEP 586:
+   https://www.python.org/dev/peps/pep-0586
+'''
+
+
+PEP586_CODE_CHECK_HINT_LITERAL_CHILD_UNHASHABLE = '''
+{indent_curr}    {literal_type_expr} is {hint_literal_type_expr} and {pith_curr_assigned_expr} == {hint_literals_expr}[{hint_literal_index}] or'''
+'''
+`PEP 586`_-compliant code snippet type-checking the current pith against the
+current unhashable literal object subscripting a :attr:`typing.Literal` type
+by comparing that pith to that literal object only if the exact types of both
+are the same.
+
+Unhashable literal objects (e.g., ``[]`` in ``typing.Literal[[]]``) are
+*not* valid under `PEP 586`_ but are nonetheless accepted by the
+:mod:`typing` module at runtime and thus supported here.
+
+See Also
+----------
+:data:`PEP586_CODE_CHECK_HINT_LITERAL_CHILDS_HASHABLE`
+    Further details.
+
+.. _PEP 586:
+   https://www.python.org/dev/peps/pep-0586
+'''
+
+# ....................{ HINT ~ pep589 : typeddict         }....................
+PEP589_CODE_CHECK_HINT_TYPEDDICT_PREFIX = '''(
+{indent_curr}    # True only if this pith is a dictionary.
+{indent_curr}    __beartype_builtin_isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and'''
+'''
+`PEP 589`_-compliant code snippet prefixing all code type-checking the current
+pith against a :class:`typing.TypedDict` subclass.
+
+Since typed dictionaries prohibit :func:`isinstance` checks, this snippet
+type-checks this pith against the :class:`dict` superclass of *all* typed
+dictionaries instead.
+
+Caveats
+----------
+**All snippets type-checking typed dictionaries are formatted exactly once.**
+Since the names of keys of typed dictionaries are arbitrary strings possibly
+containing ``{`` and ``}`` delimiters, the caller is required to format each
+such snippet with *all* format variables (including ``{indent_curr}``) rather
+than deferring the formatting of any such variable.
+
+.. _PEP 589:
+   https://www.python.org/dev/peps/pep-0589
+'''
+
+
+PEP589_CODE_CHECK_HINT_TYPEDDICT_KEYS_REQUIRED = '''
+{indent_curr}    # True only if this dictionary contains all required keys.
+{indent_curr}    {pith_curr_assigned_expr}.keys() >= {keys_required_expr} and'''
+'''
+`PEP 589`_-compliant code snippet type-checking the current pith to contain all
+required keys of a :class:`typing.TypedDict` subclass.
+
+Since the :meth:`dict.keys` view implements set comparison in C, this snippet
+type-checks the presence of *all* required keys with a single superset
+comparison against a frozen set precomputed at decoration time rather than a
+Python-level membership test for each such key.
+
+.. _PEP 589:
+   https://www.python.org/dev/peps/pep-0589
+'''
+
+
+PEP589_CODE_CHECK_HINT_TYPEDDICT_CHUNK_PREFIX = '''
+{indent_curr}    # True only if either this chunk of keys is *NOT* the chunk
+{indent_curr}    # pseudo-randomly selected for this call *OR* the values of
+{indent_curr}    # these keys of this pith deeply satisfy their child hints.
+{indent_curr}    (__beartype_random_int % {chunks_len} != {chunk_index} or ('''
+'''
+`PEP 589`_-compliant code snippet prefixing all code type-checking the current
+pith against one chunk of the type-checkable keys of a :class:`typing.TypedDict`
+subclass declaring more such keys than are type-checked by each call under the
+``O(1)`` and ``O(log n)`` strategies.
+
+.. _PEP 589:
+   https://www.python.org/dev/peps/pep-0589
+'''
+
+
+PEP589_CODE_CHECK_HINT_TYPEDDICT_CHUNK_SUFFIX = ')) and'
+'''
+`PEP 589`_-compliant code snippet suffixing all code type-checking the current
+pith against one chunk of the type-checkable keys of a :class:`typing.TypedDict`
+subclass.
+
+Caveats
+----------
+The caller is required to manually slice the trailing suffix ``" and"`` from
+the code type-checking the last key of this chunk *before* appending this
+snippet.
+
+.. _PEP 589:
+   https://www.python.org/dev/peps/pep-0589
+'''
+
+
+PEP589_CODE_CHECK_HINT_TYPEDDICT_KEY_REQUIRED_CHILD = '''
+{indent_curr}    # True only if the value of this required key deeply
+{indent_curr}    # satisfies this child hint.
+{indent_curr}    {hint_child_placeholder} and'''
+'''
+`PEP 589`_-compliant code snippet type-checking the value of the current
+required key of the current pith against the child hint annotating that key.
+
+Since the presence of this key has already been type-checked by the
+:data:`PEP589_CODE_CHECK_HINT_TYPEDDICT_KEYS_REQUIRED` snippet, this snippet
+safely indexes this key *without* first testing its presence.
+
+.. _PEP 589:
+   https://www.python.org/dev/peps/pep-0589
+'''
+
+
+PEP589_CODE_CHECK_HINT_TYPEDDICT_KEY_OPTIONAL_CHILD = '''
+{indent_curr}    # True only if either this optional key is absent *OR* the
+{indent_curr}    # value of this key deeply satisfies this child hint.
+{indent_curr}    ({key_expr} not in {pith_curr_assigned_expr} or
+{indent_curr}     {hint_child_placeholder}) and'''
+'''
+`PEP 589`_-compliant code snippet type-checking the value of the current
+optional key of the current pith (if present) against the child hint
+annotating that key.
+
+.. _PEP 589:
+   https://www.python.org/dev/peps/pep-0589
+'''
+
+
+PEP589_CODE_CHECK_HINT_TYPEDDICT_PITH_VALUE_EXPR = (
+    '''{pith_curr_assigned_expr}[{key_expr}]''')
+'''
+`PEP 589`_-compliant Python expression yielding the value of the current key
+of the current pith (which, by definition, *must* be a dictionary).
+
+.. _PEP 589:
+   https://www.python.org/dev/peps/pep-0589
+'''
+
 # ....................{ FORMATTERS                        }....................
 # Bound format methods of string globals defined above, preserved as discrete
 # global variables for efficient lookup elsewhere.
@@ -497,8 +1295,40 @@ PEP_CODE_CHECK_HINT_GENERIC_CHILD_format = (
     PEP_CODE_CHECK_HINT_GENERIC_CHILD.format)
 PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_format = (
     PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD.format)
+PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_HOMOGENEOUS_CHILD_format = (
+    PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_HOMOGENEOUS_CHILD.format)
+PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_TYPES_EXACT_CHILD_format = (
+    PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_TYPES_EXACT_CHILD.format)
 PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_PITH_CHILD_EXPR_format = (
     PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_PITH_CHILD_EXPR.format)
+PEP_CODE_CHECK_HINT_CONTAINER_CHILD_ALL_format = (
+    PEP_CODE_CHECK_HINT_CONTAINER_CHILD_ALL.format)
+PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_PITH_ITEMS_LOG_EXPR_format = (
+    PEP_CODE_CHECK_HINT_SEQUENCE_STANDARD_PITH_ITEMS_LOG_EXPR.format)
+PEP_CODE_CHECK_HINT_CONTAINER_ITEM_ASSIGN_format = (
+    PEP_CODE_CHECK_HINT_CONTAINER_ITEM_ASSIGN.format)
+PEP_CODE_CHECK_HINT_MAPPING_format = PEP_CODE_CHECK_HINT_MAPPING.format
+PEP_CODE_CHECK_HINT_MAPPING_PITH_ITEM_EXPR_format = (
+    PEP_CODE_CHECK_HINT_MAPPING_PITH_ITEM_EXPR.format)
+PEP_CODE_CHECK_HINT_MAPPING_PITH_ITEMS_EXPR_format = (
+    PEP_CODE_CHECK_HINT_MAPPING_PITH_ITEMS_EXPR.format)
+PEP_CODE_CHECK_HINT_MAPPING_PITH_ITEMS_LOG_EXPR_format = (
+    PEP_CODE_CHECK_HINT_MAPPING_PITH_ITEMS_LOG_EXPR.format)
+PEP_CODE_CHECK_HINT_MAPPING_PITH_KEY_EXPR_format = (
+    PEP_CODE_CHECK_HINT_MAPPING_PITH_KEY_EXPR.format)
+PEP_CODE_CHECK_HINT_MAPPING_PITH_VALUE_EXPR_format = (
+    PEP_CODE_CHECK_HINT_MAPPING_PITH_VALUE_EXPR.format)
+PEP_CODE_CHECK_HINT_REITERABLE_format = PEP_CODE_CHECK_HINT_REITERABLE.format
+PEP_CODE_CHECK_HINT_REITERABLE_ITEM_CHILD_format = (
+    PEP_CODE_CHECK_HINT_REITERABLE_ITEM_CHILD.format)
+PEP_CODE_CHECK_HINT_REITERABLE_PITH_ITEM_EXPR_format = (
+    PEP_CODE_CHECK_HINT_REITERABLE_PITH_ITEM_EXPR.format)
+PEP_CODE_CHECK_HINT_REITERABLE_PITH_ITEM_TUPLE_EXPR_format = (
+    PEP_CODE_CHECK_HINT_REITERABLE_PITH_ITEM_TUPLE_EXPR.format)
+PEP_CODE_CHECK_HINT_REITERABLE_PITH_ITEMS_EXPR_format = (
+    PEP_CODE_CHECK_HINT_REITERABLE_PITH_ITEMS_EXPR.format)
+PEP_CODE_CHECK_HINT_REITERABLE_PITH_ITEMS_LOG_EXPR_format = (
+    PEP_CODE_CHECK_HINT_REITERABLE_PITH_ITEMS_LOG_EXPR.format)
 PEP_CODE_CHECK_HINT_TUPLE_FIXED_EMPTY_format = (
     PEP_CODE_CHECK_HINT_TUPLE_FIXED_EMPTY.format)
 PEP_CODE_CHECK_HINT_TUPLE_FIXED_LEN_format = (
@@ -511,4 +1341,49 @@ PEP484_CODE_CHECK_HINT_UNION_CHILD_PEP_format = (
     PEP484_CODE_CHECK_HINT_UNION_CHILD_PEP.format)
 PEP484_CODE_CHECK_HINT_UNION_CHILD_NONPEP_format = (
     PEP484_CODE_CHECK_HINT_UNION_CHILD_NONPEP.format)
+PEP484_CODE_CHECK_HINT_UNION_CHILD_NONE_format = (
+    PEP484_CODE_CHECK_HINT_UNION_CHILD_NONE.format)
+PEP484_CODE_CHECK_HINT_SUBCLASS_format = (
+    PEP484_CODE_CHECK_HINT_SUBCLASS.format)
+PEP484_CODE_CHECK_HINT_NAMEDTUPLE_CHUNK_PREFIX_format = (
+    PEP484_CODE_CHECK_HINT_NAMEDTUPLE_CHUNK_PREFIX.format)
+PEP586_CODE_LITERAL_TYPE_ASSIGN_EXPR_format = (
+    PEP586_CODE_LITERAL_TYPE_ASSIGN_EXPR.format)
+PEP586_CODE_CHECK_HINT_LITERAL_SUFFIX_format = (
+    PEP586_CODE_CHECK_HINT_LITERAL_SUFFIX.format)
+PEP586_CODE_CHECK_HINT_LITERAL_CHILDS_HASHABLE_format = (
+    PEP586_CODE_CHECK_HINT_LITERAL_CHILDS_HASHABLE.format)
+PEP586_CODE_CHECK_HINT_LITERAL_CHILD_UNHASHABLE_format = (
+    PEP586_CODE_CHECK_HINT_LITERAL_CHILD_UNHASHABLE.format)
+PEP589_CODE_CHECK_HINT_TYPEDDICT_PREFIX_format = (
+    PEP589_CODE_CHECK_HINT_TYPEDDICT_PREFIX.format)
+PEP589_CODE_CHECK_HINT_TYPEDDICT_KEYS_REQUIRED_format = (
+    PEP589_CODE_CHECK_HINT_TYPEDDICT_KEYS_REQUIRED.format)
+PEP589_CODE_CHECK_HINT_TYPEDDICT_CHUNK_PREFIX_format = (
+    PEP589_CODE_CHECK_HINT_TYPEDDICT_CHUNK_PREFIX.format)
+PEP589_CODE_CHECK_HINT_TYPEDDICT_KEY_REQUIRED_CHILD_format = (
+    PEP589_CODE_CHECK_HINT_TYPEDDICT_KEY_REQUIRED_CHILD.format)
+PEP589_CODE_CHECK_HINT_TYPEDDICT_KEY_OPTIONAL_CHILD_format = (
+    PEP589_CODE_CHECK_HINT_TYPEDDICT_KEY_OPTIONAL_CHILD.format)
+PEP589_CODE_CHECK_HINT_TYPEDDICT_PITH_VALUE_EXPR_format = (
+    PEP589_CODE_CHECK_HINT_TYPEDDICT_PITH_VALUE_EXPR.format)
+PEP484_CODE_CHECK_HINT_UNION_DISPATCH_PREFIX_format = (
+    PEP484_CODE_CHECK_HINT_UNION_DISPATCH_PREFIX.format)
+PEP484_CODE_CHECK_HINT_UNION_DISPATCH_CHILD_PEP_format = (
+    PEP484_CODE_CHECK_HINT_UNION_DISPATCH_CHILD_PEP.format)
+PEP484_CODE_CHECK_HINT_UNION_DISPATCH_CHILD_NONPEP_format = (
+    PEP484_CODE_CHECK_HINT_UNION_DISPATCH_CHILD_NONPEP.format)
+PEP484_CODE_CHECK_HINT_UNION_DISPATCH_ADAPTIVE_PREFIX_format = (
+    PEP484_CODE_CHECK_HINT_UNION_DISPATCH_ADAPTIVE_PREFIX.format)
+PEP484_CODE_CHECK_HINT_UNION_DISPATCH_ADAPTIVE_CHILD_PEP_format = (
+    PEP484_CODE_CHECK_HINT_UNION_DISPATCH_ADAPTIVE_CHILD_PEP.format)
+PEP484_CODE_CHECK_HINT_UNION_DISPATCH_ADAPTIVE_CHILD_PEP_FALLBACK_format = (
+    PEP484_CODE_CHECK_HINT_UNION_DISPATCH_ADAPTIVE_CHILD_PEP_FALLBACK.format)
 PEP_CODE_PITH_ASSIGN_EXPR_format = PEP_CODE_PITH_ASSIGN_EXPR.format
+PEP_CODE_GET_MIRRORED_DEFAULT_format = PEP_CODE_GET_MIRRORED_DEFAULT.format
+PEP_CODE_CHECK_RETURN_PREFIX_format = PEP_CODE_CHECK_RETURN_PREFIX.format
+PEP_CODE_CHECK_HINT_ROOT_TYPES_CACHED_PREFIX_format = (
+    PEP_CODE_CHECK_HINT_ROOT_TYPES_CACHED_PREFIX.format)
+PEP_CODE_CHECK_HINT_ROOT_TYPES_CACHED_SUFFIX_format = (
+    PEP_CODE_CHECK_HINT_ROOT_TYPES_CACHED_SUFFIX.format)
+PEP484_CODE_CHECK_NORETURN_format = PEP484_CODE_CHECK_NORETURN.format
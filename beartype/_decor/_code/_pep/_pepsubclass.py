@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2020 Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Beartype PEP-compliant subclass caches** (i.e., dictionaries mapping from
+each previously type-checked class to whether that class subclasses the
+superclasses constraining a :class:`typing.Type` type hint, enabling code
+type-checking that hint to replace a call to the :func:`issubclass` builtin
+with a single dictionary lookup).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                           }....................
+# See the "beartype.__init__" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ CONSTANTS                         }....................
+SUBCLASS_CACHE_LEN_MAX = 256
+'''
+Maximum number of classes memoized by each subclass cache, bounding the space
+consumed by hints type-checking arbitrarily many distinct classes (e.g.,
+dynamically generated classes). Classes resolved after this cache is full are
+resolved on each lookup instead.
+'''
+
+# ....................{ CLASSES                           }....................
+class SubclassCache(dict):
+    '''
+    **Subclass cache** (i.e., dictionary mapping from each previously
+    type-checked class to ``True`` only if that class subclasses one or more
+    of the superclasses constraining a :class:`typing.Type` type hint).
+
+    Each such boolean is lazily resolved by the :meth:`__missing__` dunder
+    method on the first lookup of each class and memoized thereafter, reducing
+    subsequent lookups to a single hashed access implemented in C. Since the
+    :func:`issubclass` builtin is comparatively expensive when passed abstract
+    base classes (ABCs) *or* classes whose metaclasses override the
+    ``__subclasscheck__`` dunder method, this cache is particularly beneficial
+    when the same small set of classes is repeatedly type-checked.
+
+    Caveats
+    ----------
+    **This dictionary is shared between all wrapper functions type-checking the
+    same hint.** Since memoizing a boolean is a single atomic dictionary
+    assignment, concurrent lookups of the same unresolved class are safe; at
+    worst, that class is redundantly resolved to the same boolean.
+
+    Attributes
+    ----------
+    hint_superclasses : tuple
+        Tuple of all superclasses constraining this hint.
+    '''
+
+    # ..................{ CLASS VARIABLES                   }..................
+    # Slot all instance variables defined on this object to minimize space
+    # consumption and maximize lookup efficiency.
+    __slots__ = ('hint_superclasses',)
+
+    # ..................{ INITIALIZERS                      }..................
+    def __init__(self, hint_superclasses: tuple) -> None:
+        '''
+        Initialize this subclass cache.
+
+        Parameters
+        ----------
+        hint_superclasses : tuple
+            Tuple of all superclasses constraining this hint.
+        '''
+        assert isinstance(hint_superclasses, tuple), (
+            f'{repr(hint_superclasses)} not tuple.')
+
+        # Initialize our superclass to the empty dictionary.
+        super().__init__()
+
+        # Classify all passed parameters.
+        self.hint_superclasses = hint_superclasses
+
+    # ..................{ DUNDERS                           }..................
+    def __missing__(self, pith: type) -> bool:
+        '''
+        Resolve whether the passed class *not* previously looked up in this
+        dictionary subclasses one or more of the superclasses constraining this
+        hint, memoize this boolean if this dictionary is *not* full, and return
+        this boolean.
+
+        If the :func:`issubclass` builtin raises an exception (e.g., due to an
+        ABC overriding the ``__subclasscheck__`` dunder method rejecting this
+        class), this exception is propagated to the caller *without* memoizing
+        this class.
+
+        Parameters
+        ----------
+        pith : type
+            Current pith, guaranteed by the caller to be a class.
+
+        Returns
+        ----------
+        bool
+            ``True`` only if this class subclasses one or more such
+            superclasses.
+        '''
+
+        # True only if this class subclasses one or more such superclasses.
+        is_subclass = issubclass(pith, self.hint_superclasses)
+
+        # If this dictionary is *NOT* full, memoize this boolean.
+        if len(self) < SUBCLASS_CACHE_LEN_MAX:
+            self[pith] = is_subclass
+
+        # Return this boolean.
+        return is_subclass
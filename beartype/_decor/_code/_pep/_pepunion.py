@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2020 Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Beartype PEP-compliant union dispatch tables** (i.e., dictionaries mapping
+from the exact type of each previously type-checked pith to the 1-based index
+of the only child hint subscripting a :class:`typing.Union` type that pith
+could possibly satisfy, enabling code type-checking that union to replace a
+chain of :func:`isinstance` calls with a single dictionary lookup).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                           }....................
+from threading import Lock
+from weakref import WeakValueDictionary
+
+# See the "beartype.__init__" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ CONSTANTS                         }....................
+UNION_DISPATCH_INDEX_DETERMINED = 0
+'''
+**Union dispatch index** (i.e., integer value of a union dispatch table)
+signifying the pith to satisfy one or more **type-determined child hints**
+(i.e., PEP-noncompliant classes or PEP-compliant child hints shallowly
+type-checked as instances of their origin types) and thus the union.
+'''
+
+
+UNION_DISPATCH_INDEX_FALLBACK = -1
+'''
+Union dispatch index signifying the pith to require type-checking against
+*all* child hints of the union, either because that pith is an instance of
+the origin types of either none or two or more deeply type-checked child hints
+*or* because testing the type of that pith raised an exception.
+
+Adaptive union dispatch tables subsequently replace this index for each exact
+type by the bitwise negation ``~k`` of the 1-based index ``k`` of the child
+hint most frequently satisfied by piths of that type, signifying these piths
+to be type-checked against that child hint first *before* falling back to all
+child hints. Since ``~k`` is negative, these indices are also fallbacks.
+'''
+
+
+UNION_DISPATCH_HITS_WARMUP = 64
+'''
+Number of fallbacks on each exact type an adaptive union dispatch table
+records before preferring the child hint most frequently satisfied by piths of
+that type.
+'''
+
+
+UNION_DISPATCH_LEN_MAX = 256
+'''
+Maximum number of exact types memoized by each union dispatch table, bounding
+the space consumed by unions type-checking piths of arbitrarily many distinct
+types (e.g., dynamically generated classes). Exact types resolved after this
+table is full are resolved on each lookup instead.
+'''
+
+# ....................{ CLASSES                           }....................
+class UnionTypeDispatch(dict):
+    '''
+    **Union dispatch table** (i.e., dictionary mapping from the exact type of
+    each previously type-checked pith to the **union dispatch index** of the
+    child hints subscripting a :class:`typing.Union` type that pith could
+    possibly satisfy).
+
+    Each union dispatch index is either:
+
+    * :data:`UNION_DISPATCH_INDEX_DETERMINED`, if that pith satisfies a
+      type-determined child hint and thus this union.
+    * A positive integer ``k``, if that pith is an instance of the origin type
+      of *only* the ``k``-th deeply type-checked child hint (e.g., ``list``
+      for ``typing.List[int]``) and thus *cannot* satisfy any other child hint.
+    * :data:`UNION_DISPATCH_INDEX_FALLBACK` otherwise.
+
+    Dispatch indices are lazily resolved by the :meth:`__missing__` dunder
+    method on the first lookup of each exact type and memoized thereafter,
+    reducing subsequent lookups to a single hashed access implemented in C.
+
+    Caveats
+    ----------
+    **This dictionary is shared between all wrapper functions type-checking the
+    same union.** Since memoizing a dispatch index is a single atomic
+    dictionary assignment, concurrent lookups of the same unresolved type are
+    safe; at worst, that type is redundantly resolved to the same index.
+    Likewise, all fallbacks recorded by adaptive tables are recorded under a
+    lock private to this table.
+
+    Attributes
+    ----------
+    is_adaptive : bool
+        ``True`` only if this table is **adaptive** (i.e., records which child
+        hint each fallback pith satisfies via the :meth:`hit` method *and*
+        thereafter prefers the most frequently satisfied child hint).
+    is_frozen : bool
+        ``True`` only if this table has been frozen by the :meth:`freeze`
+        method, ceasing to record fallbacks and thus preserving all preferred
+        child hints learned so far.
+    hint_childs_meta : tuple
+        Tuple of 2-tuples ``(hint_child_type, hint_child_index)``, where:
+
+        * ``hint_child_type`` is either a PEP-noncompliant class *or* the
+          origin type of a PEP-compliant child hint subscripting this union.
+        * ``hint_child_index`` is either
+          :data:`UNION_DISPATCH_INDEX_DETERMINED` if this child hint is
+          type-determined *or* the 1-based index of this child hint in the
+          code type-checking this union otherwise.
+    _pith_type_to_hint_child_hits : dict
+        Dictionary mapping from each exact type memoized as a fallback by this
+        table to a dictionary mapping from the 1-based index of each child hint
+        satisfied by piths of that type to the number of times those piths did
+        so, discarded on preferring a child hint for that type.
+    _lock : Lock
+        Non-reentrant lock serializing access to
+        :attr:`_pith_type_to_hint_child_hits`.
+    '''
+
+    # ..................{ CLASS VARIABLES                   }..................
+    # Slot all instance variables defined on this object to minimize space
+    # consumption and maximize lookup efficiency.
+    __slots__ = (
+        'hint_childs_meta',
+        'is_adaptive',
+        'is_frozen',
+        '_lock',
+        '_pith_type_to_hint_child_hits',
+        '__weakref__',
+    )
+
+    # ..................{ INITIALIZERS                      }..................
+    def __init__(
+        self, hint_childs_meta: tuple, is_adaptive: bool = False) -> None:
+        '''
+        Initialize this dispatch table.
+
+        Parameters
+        ----------
+        hint_childs_meta : tuple
+            Tuple of 2-tuples ``(hint_child_type, hint_child_index)``
+            describing the child hints subscripting this union. See the class
+            docstring for further details.
+        is_adaptive : bool
+            ``True`` only if this table is adaptive. Defaults to ``False``.
+        '''
+        assert isinstance(hint_childs_meta, tuple), (
+            f'{repr(hint_childs_meta)} not tuple.')
+        assert isinstance(is_adaptive, bool), (
+            f'{repr(is_adaptive)} not boolean.')
+
+        # Initialize our superclass to the empty dictionary.
+        super().__init__()
+
+        # Classify all passed parameters.
+        self.hint_childs_meta = hint_childs_meta
+        self.is_adaptive = is_adaptive
+
+        # Initialize all remaining instance variables.
+        self.is_frozen = False
+        self._lock = Lock()
+        self._pith_type_to_hint_child_hits = {}
+
+        # If this table is adaptive, register this table for freezing.
+        if is_adaptive:
+            _UNION_DISPATCHES_ADAPTIVE[id(self)] = self
+
+    # ..................{ DUNDERS                           }..................
+    def __missing__(self, pith_type: type) -> int:
+        '''
+        Resolve the union dispatch index of the passed exact type of a pith
+        *not* previously looked up in this dictionary, memoize this index if
+        this dictionary is *not* full, and return this index.
+
+        Parameters
+        ----------
+        pith_type : type
+            Exact type of the current pith.
+
+        Returns
+        ----------
+        int
+            Union dispatch index of this type.
+        '''
+
+        # 1-based index of the only deeply type-checked child hint whose origin
+        # type this type subclasses if any *OR* "None" otherwise.
+        hint_child_index_candidate = None
+
+        # For each child type and index describing this union...
+        for hint_child_type, hint_child_index in self.hint_childs_meta:
+            # If this type subclasses this child type...
+            #
+            # Since classes overriding the __subclasscheck__() dunder method
+            # (e.g., abstract base classes) may raise arbitrary exceptions on
+            # being passed unexpected types, fallback to type-checking piths of
+            # this type against all child hints *WITHOUT* memoizing this index.
+            # The exceptions raised by these child hints are then propagated to
+            # the caller as usual.
+            try:
+                if not issubclass(pith_type, hint_child_type):
+                    continue
+            except Exception:
+                return UNION_DISPATCH_INDEX_FALLBACK
+
+            # If this child hint is type-determined, this type satisfies this
+            # union regardless of all remaining child hints.
+            if hint_child_index == UNION_DISPATCH_INDEX_DETERMINED:
+                pith_type_index = UNION_DISPATCH_INDEX_DETERMINED
+                break
+            # Else if this is the first deeply type-checked child hint whose
+            # origin type this type subclasses, record this child hint.
+            elif hint_child_index_candidate is None:
+                hint_child_index_candidate = hint_child_index
+            # Else, this type subclasses the origin types of two or more deeply
+            # type-checked child hints, any of which this pith could satisfy.
+            else:
+                hint_child_index_candidate = UNION_DISPATCH_INDEX_FALLBACK
+        # Else, this type satisfies no type-determined child hint.
+        else:
+            pith_type_index = (
+                UNION_DISPATCH_INDEX_FALLBACK
+                if hint_child_index_candidate is None else
+                hint_child_index_candidate
+            )
+
+        # If this dictionary is *NOT* full, memoize this index.
+        if len(self) < UNION_DISPATCH_LEN_MAX:
+            self[pith_type] = pith_type_index
+
+        # Return this index.
+        return pith_type_index
+
+    # ..................{ RECORDERS                         }..................
+    def hit(self, pith_type: type, hint_child_index: int) -> bool:
+        '''
+        Record that a pith of the passed exact type dispatched by this table
+        as a fallback satisfied the child hint with the passed 1-based index
+        *and* unconditionally return ``True``, enabling code generated for
+        adaptive tables to efficiently chain calls to this method after
+        type-checking each child hint with the ``and`` operator.
+
+        After recording :data:`UNION_DISPATCH_HITS_WARMUP` such fallbacks for
+        this type, this method replaces the fallback index memoized for this
+        type by the bitwise negation of the 1-based index of the child hint
+        most frequently satisfied by piths of this type. This method silently
+        reduces to a noop if either this table is frozen *or* this type is
+        *not* memoized as a fallback (e.g., due to having already been
+        assigned a preferred child hint *or* this table being full),
+        bounding the space consumed by these records.
+
+        Parameters
+        ----------
+        pith_type : type
+            Exact type of the current pith.
+        hint_child_index : int
+            1-based index of the child hint this pith satisfied.
+
+        Returns
+        ----------
+        bool
+            Always ``True``.
+        '''
+
+        # If this table is frozen *OR* this type is *NOT* memoized as a
+        # fallback, silently reduce to a noop.
+        if (
+            self.is_frozen or
+            self.get(pith_type) != UNION_DISPATCH_INDEX_FALLBACK
+        ):
+            return True
+        # Else, this table is unfrozen and this type is memoized as a fallback.
+
+        # With this table locked...
+        with self._lock:
+            # Dictionary mapping from the 1-based index of each child hint
+            # satisfied by piths of this type to the number of such times.
+            hint_child_hits = self._pith_type_to_hint_child_hits.get(pith_type)
+            if hint_child_hits is None:
+                hint_child_hits = self._pith_type_to_hint_child_hits[
+                    pith_type] = {}
+
+            # Record this fallback.
+            hint_child_hits[hint_child_index] = (
+                hint_child_hits.get(hint_child_index, 0) + 1)
+
+            # If this type has now been warmed up by sufficiently many
+            # fallbacks *AND* this table remains unfrozen, prefer the child
+            # hint most frequently satisfied by piths of this type.
+            if (
+                sum(hint_child_hits.values()) >= UNION_DISPATCH_HITS_WARMUP and
+                not self.is_frozen
+            ):
+                del self._pith_type_to_hint_child_hits[pith_type]
+                self[pith_type] = ~max(
+                    hint_child_hits, key=hint_child_hits.get)
+
+        # Return true.
+        return True
+
+    # ..................{ FREEZERS                          }..................
+    def freeze(self) -> None:
+        '''
+        Freeze this table, preserving all preferred child hints learned so far
+        *and* discarding all fallbacks recorded for exact types not yet
+        assigned a preferred child hint.
+        '''
+
+        # With this table locked, freeze this table.
+        with self._lock:
+            self.is_frozen = True
+            self._pith_type_to_hint_child_hits.clear()
+
+# ....................{ PRIVATE ~ globals                 }....................
+_UNION_DISPATCHES_ADAPTIVE = WeakValueDictionary()
+'''
+Weak dictionary mapping from the object ID of each adaptive union dispatch
+table currently alive to that table, enabling the
+:func:`freeze_union_dispatches` function to freeze these tables. Since these
+tables are dictionaries and thus unhashable, these tables are keyed by object
+ID rather than stored in a weak set.
+'''
+
+# ....................{ FREEZERS                          }....................
+def freeze_union_dispatches() -> None:
+    '''
+    Freeze all adaptive union dispatch tables currently alive, preserving the
+    preferred child hints learned by these tables so far.
+
+    Adaptive tables subsequently created (e.g., by decorating callables
+    annotated by unions *not* previously type-checked) are *not* frozen.
+    '''
+
+    # For each such table, freeze this table. Since this weak dictionary may
+    # be concurrently modified, iterate over a copy of its values.
+    for union_dispatch in tuple(_UNION_DISPATCHES_ADAPTIVE.values()):
+        union_dispatch.freeze()
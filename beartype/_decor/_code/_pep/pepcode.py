@@ -26,31 +26,71 @@ from beartype.roar import (
     BeartypeDecorHintPepException,
     BeartypeDecorHintPep484Exception,
 )
+from beartype._decor._code.codesnip import (
+    CODE_INDENT_1,
+    PARAM_NAME_DEFAULT_PREFIX,
+)
 from beartype._decor._code._pep._pepsnip import (
     PARAM_KIND_TO_PEP_CODE_GET,
-    PEP_CODE_CHECK_RETURN_PREFIX,
+    PARAM_KIND_TO_PEP_CODE_GET_MIRRORED,
+    PEP_CODE_CHECK_HINT_ROOT_TYPES_CACHED_PREFIX_format,
+    PEP_CODE_CHECK_HINT_ROOT_TYPES_CACHED_SUFFIX_format,
+    PEP_CODE_CHECK_RETURN_PREFIX_format,
     PEP_CODE_CHECK_RETURN_SUFFIX,
+    PEP_CODE_GET_MIRRORED_DEFAULT_format,
     PEP_CODE_HINT_FORWARDREF_UNQUALIFIED_PLACEHOLDER_PREFIX,
     PEP_CODE_HINT_FORWARDREF_UNQUALIFIED_PLACEHOLDER_SUFFIX,
-    PEP484_CODE_CHECK_NORETURN,
+    PEP484_CODE_CHECK_NORETURN_format,
 )
 from beartype._decor._code._pep._pephint import pep_code_check_hint
 from beartype._decor._code._pep._pepsnip import (
     PEP_CODE_PITH_ROOT_PARAM_NAME_PLACEHOLDER)
-from beartype._decor._data import BeartypeData
+from beartype._decor._data import PARAM_EMPTY, BeartypeData
 from beartype._decor._typistry import register_typistry_forwardref
+from beartype._util.cache.utilcachecall import callable_cached
 from beartype._util.cache.utilcacheerror import reraise_exception_cached
+from beartype._util.hint.data.pep.utilhintdatapep import (
+    HINT_PEP_SIGNS_SUPPORTED_DEEP)
+from beartype._util.hint.data.pep.proposal.utilhintdatapep484 import (
+    HINT_PEP484_BASE_FORWARDREF,
+    HINT_PEP484_SIGNS_UNION,
+)
 from beartype._util.hint.utilhintget import (
     get_hint_forwardref_classname_relative_to_obj,
 )
-from beartype._util.hint.utilhinttest import die_unless_hint
+from beartype._util.hint.utilhinttest import (
+    die_unless_hint,
+    is_hint_ignorable,
+)
+from beartype._util.hint.pep.proposal.utilhintpep484 import (
+    get_hint_pep484_namedtuple_fields,
+    get_hint_pep484_newtype_class,
+    is_hint_pep484_newtype,
+    reduce_hint_pep484_typevar,
+    reduce_hint_pep484_union,
+)
+from beartype._util.hint.pep.proposal.utilhintpep544 import (
+    is_hint_pep544_io_generic)
+from beartype._util.hint.pep.proposal.utilhintpep589 import is_hint_pep589
+from beartype._util.hint.pep.proposal.utilhintpep593 import (
+    get_hint_pep593_hint,
+    is_hint_pep593,
+)
+from beartype._util.hint.pep.utilhintpepget import (
+    get_hint_pep_args,
+    get_hint_pep_sign,
+)
+from beartype._util.hint.pep.utilhintpeptest import (
+    is_hint_pep,
+    is_hint_pep_typevar,
+)
 from beartype._util.text.utiltextlabel import (
     label_callable_decorated_param,
     label_callable_decorated_return,
 )
 from collections.abc import Callable, Iterable
 from inspect import Parameter
-from typing import NoReturn, Union
+from typing import Generic, NoReturn, Union
 
 # See the "beartype.__init__" submodule for further commentary.
 __all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
@@ -63,6 +103,18 @@ Python objects (e.g., the ``__annotations__`` dunder dictionary of annotated
 callables).
 '''
 
+
+_HINT_SIGNS_TYPE_UNDETERMINED = frozenset((
+    Generic,
+    HINT_PEP484_BASE_FORWARDREF,
+    NoReturn,
+))
+'''
+Frozen set of all signs uniquely identifying PEP-compliant type hints *not*
+type-checked as instances of their origin types and thus *not*
+type-determined, regardless of whether those signs are deeply supported.
+'''
+
 # ....................{ COERCERS                          }....................
 def coerce_hint_pep(
     func: Callable,
@@ -154,11 +206,14 @@ def coerce_hint_pep(
 def pep_code_check_param(
     data: BeartypeData,
     hint: object,
-    param: Parameter,
+    param_name: str,
+    param_kind: object,
+    param_default: object,
     param_index: int,
 ) -> 'Tuple[str, bool]':
     '''
-    Python code type-checking the parameter with the passed signature and index
+    Python code type-checking the parameter with the passed name, kind, default
+    value, and index
     annotated by a **PEP-compliant type hint** (e.g., :mod:`beartype`-agnostic
     annotation compliant with annotation-centric PEPs) of the decorated
     callable.
@@ -169,8 +224,14 @@ def pep_code_check_param(
         Decorated callable to be type-checked.
     hint : object
         PEP-compliant type hint annotating this parameter.
-    param : Parameter
-        :mod:`inspect`-specific object describing this parameter.
+    param_name : str
+        Name of this parameter.
+    param_kind : object
+        :mod:`inspect`-specific kind of this parameter (e.g.,
+        :attr:`inspect.Parameter.KEYWORD_ONLY`).
+    param_default : object
+        Default value of this parameter if any *or*
+        :data:`beartype._decor._data.PARAM_EMPTY` otherwise.
     param_index : int
         0-based index of this parameter in this callable's signature.
 
@@ -190,15 +251,18 @@ def pep_code_check_param(
     # (e.g., by explicitly calling the die_if_hint_pep_unsupported()
     # function). By design, the caller already guarantees this to be the case.
     assert data.__class__ is BeartypeData, f'{repr(data)} not @beartype data.'
-    assert isinstance(param, Parameter), (
-        f'{repr(param)} not parameter metadata.')
+    assert isinstance(param_name, str), f'{repr(param_name)} not string.'
     assert isinstance(param_index, int), (
         f'{repr(param_index)} not integer.')
 
     # Python code template localizing this parameter if this kind of parameter
-    # is supported *OR* "None" otherwise.
-    get_arg_code_template = PARAM_KIND_TO_PEP_CODE_GET.get(
-        param.kind, None)
+    # is supported *OR* "None" otherwise, conditionally depending on whether
+    # the signature of this wrapper mirrors that of the decorated callable.
+    get_arg_code_template = (
+        PARAM_KIND_TO_PEP_CODE_GET_MIRRORED
+        if data.is_func_wrapper_sig_mirrored else
+        PARAM_KIND_TO_PEP_CODE_GET
+    ).get(param_kind, None)
 
     # If this kind of parameter is unsupported...
     #
@@ -211,11 +275,11 @@ def pep_code_check_param(
 
         # Human-readable label describing this parameter.
         hint_label = label_callable_decorated_param(
-            func=data.func, param_name=param.name)
+            func=data.func, param_name=param_name)
 
         # Raise an exception embedding this label.
         raise BeartypeDecorHintPepException(
-            f'{hint_label} kind {repr(param.kind)} unsupported.')
+            f'{hint_label} kind {repr(param_kind)} unsupported.')
     # Else, this kind of parameter is supported. Ergo, this code is non-"None".
 
     # If this is the PEP 484-compliant "typing.NoReturn" type hint permitted
@@ -223,7 +287,7 @@ def pep_code_check_param(
     if hint is NoReturn:
         # Human-readable label describing this parameter.
         hint_label = label_callable_decorated_param(
-            func=data.func, param_name=param.name)
+            func=data.func, param_name=param_name)
 
         # Raise an exception embedding this label.
         raise BeartypeDecorHintPep484Exception(
@@ -232,6 +296,10 @@ def pep_code_check_param(
         )
     # Else, this is a standard PEP-compliant type hint.
 
+    # Reduce this hint to its normalized form if this hint is a union, enabling
+    # equivalent unions to share the same code memoized below.
+    hint = reduce_hint_pep484_union(hint)
+
     # Attempt to...
     try:
         # Generate memoized parameter-agnostic Python code type-checking a
@@ -240,7 +308,18 @@ def pep_code_check_param(
             func_code,
             is_func_code_needs_random_int,
             hints_forwardref_class_basename,
-        ) = pep_code_check_hint(hint)
+            hint_param_name_to_hint,
+        ) = pep_code_check_hint(
+            hint, data.strategy_kind, data.is_union_adaptive)
+
+        # Pass all types and tuples of types required by this code to this
+        # wrapper as the default values of private hint parameters.
+        data.func_wrapper_locals.update(hint_param_name_to_hint)
+
+        # If caching the types of objects satisfying type-determined hints,
+        # conditionally wrap this code in such a cache.
+        if data.is_types_cached:
+            func_code = _code_check_hint_types_cached(data, hint, func_code)
 
         # Generate unmemoized parameter-specific Python code type-checking this
         # exact parameter by globally replacing in this parameter-agnostic
@@ -249,7 +328,7 @@ def pep_code_check_param(
             # This placeholder substring cached into this code with...
             PEP_CODE_PITH_ROOT_PARAM_NAME_PLACEHOLDER,
             # This object representation of this parameter's name.
-            repr(param.name),
+            repr(param_name),
         )
 
         # If this code contains one or more relative forward reference
@@ -268,22 +347,42 @@ def pep_code_check_param(
     except Exception as exception:
         # Human-readable label describing this parameter.
         hint_label = label_callable_decorated_param(
-            func=data.func, param_name=param.name) + ' PEP type hint'
+            func=data.func, param_name=param_name) + ' PEP type hint'
 
         # Reraise this cached exception's memoized parameter-agnostic message
         # into an unmemoized parameter-specific message.
         reraise_exception_cached(exception=exception, target_str=hint_label)
 
+    # Python code localizing this parameter.
+    get_arg_code = None
+
+    # If the signature of this wrapper mirrors that of the decorated callable
+    # *AND* this non-variadic parameter has a default value, this parameter is
+    # only type-checked if this parameter was passed. In this case, generate
+    # code detecting whether this parameter was passed and, if not, replacing
+    # the sentinel this wrapper declares as the default value of this
+    # parameter by a private parameter whose default value is the actual
+    # default value. Record this fact for the parent caller generating the
+    # signature of this wrapper.
+    if (
+        data.is_func_wrapper_sig_mirrored and
+        param_default is not PARAM_EMPTY and
+        param_kind is not Parameter.VAR_POSITIONAL
+    ):
+        data.func_param_names_default_private.append(param_name)
+        get_arg_code = PEP_CODE_GET_MIRRORED_DEFAULT_format(
+            arg_name=param_name,
+            arg_default_expr=f'{PARAM_NAME_DEFAULT_PREFIX}{param_name}',
+        )
+    # Else, this parameter is unconditionally type-checked if passed.
+    else:
+        get_arg_code = get_arg_code_template.format(
+            arg_name=param_name, arg_index=param_index)
+
     # Return all metadata required by higher-level callers, including...
     return (
-        # Python code to....
-        (
-            # Localize this parameter *AND*...
-            get_arg_code_template.format(
-                arg_name=param.name, arg_index=param_index) +
-            # Type-check this parameter.
-            func_code
-        ),
+        # Python code to localize and type-check this parameter.
+        get_arg_code + func_code,
         # Boolean true only if type-checking this parameter requires first
         # localizing a pseudo-random integer.
         is_func_code_needs_random_int,
@@ -336,9 +435,14 @@ def pep_code_check_return(
     # *ONLY* as a return annotation, prefer pregenerated code type-checking
     # this peculiar type hint against this hint.
     if hint is NoReturn:
-        func_code = PEP484_CODE_CHECK_NORETURN
+        func_code = PEP484_CODE_CHECK_NORETURN_format(
+            func_call_args=data.func_wrapper_call_args)
     # Else, this is a standard PEP-compliant type hint. In this case...
     else:
+        # Reduce this hint to its normalized form if this hint is a union,
+        # enabling equivalent unions to share the same code memoized below.
+        hint = reduce_hint_pep484_union(hint)
+
         # Attempt to generate memoized parameter-agnostic Python code
         # type-checking a parameter or return value with an arbitrary name.
         try:
@@ -346,7 +450,19 @@ def pep_code_check_return(
                 func_code,
                 is_func_code_needs_random_int,
                 hints_forwardref_class_basename,
-            ) = pep_code_check_hint(hint)
+                hint_param_name_to_hint,
+            ) = pep_code_check_hint(
+                hint, data.strategy_kind, data.is_union_adaptive)
+
+            # Pass all types and tuples of types required by this code to this
+            # wrapper as the default values of private hint parameters.
+            data.func_wrapper_locals.update(hint_param_name_to_hint)
+
+            # If caching the types of objects satisfying type-determined
+            # hints, conditionally wrap this code in such a cache.
+            if data.is_types_cached:
+                func_code = _code_check_hint_types_cached(
+                    data, hint, func_code)
 
             # If this code contains one or more relative forward reference
             # placeholder substrings memoized into this code, unmemoize this
@@ -366,8 +482,10 @@ def pep_code_check_return(
             # * Type-check this return value *AND*...
             # * Return this value from this wrapper function.
             func_code = (
-                f'{PEP_CODE_CHECK_RETURN_PREFIX}{func_code}'
-                f'{PEP_CODE_CHECK_RETURN_SUFFIX}'
+                PEP_CODE_CHECK_RETURN_PREFIX_format(
+                    func_call_args=data.func_wrapper_call_args) +
+                func_code +
+                PEP_CODE_CHECK_RETURN_SUFFIX
             )
         # If the prior call to the memoized _pep_code_check() function raises a
         # cached exception...
@@ -407,9 +525,9 @@ def resolve_pep_code_hints_forwardref_class_basename(
     Passed memoized Python code type-checking a parameter or return value of
     the currently decorated callable unmemoized by globally replacing all
     relative forward reference placeholder substrings cached into this code
-    with Python expressions evaluating to the classes referred to by these
-    substrings relative to that callable when accessed via the private
-    ``__beartypistry`` parameter.
+    with the names of private hint parameters whose default values are
+    forward reference proxies deferring the resolution of the classes referred
+    to by these substrings relative to that callable.
 
     Parameters
     ----------
@@ -437,6 +555,20 @@ def resolve_pep_code_hints_forwardref_class_basename(
     # For each unqualified classname referred to by a relative forward
     # reference type hints visitable from the current root type hint...
     for hint_forwardref_class_basename in hints_forwardref_class_basename:
+        # Forward reference proxy deferring the resolution of the
+        # fully-qualified classname referred to by this forward reference
+        # relative to the decorated callable.
+        hint_forwardref = register_typistry_forwardref(
+            get_hint_forwardref_classname_relative_to_obj(
+                obj=data.func,
+                hint=hint_forwardref_class_basename,
+            )
+        )
+
+        # Pass this proxy to this wrapper as the default value of a private
+        # hint parameter.
+        data.func_wrapper_locals[hint_forwardref.param_name] = hint_forwardref
+
         # Generate unmemoized callable-specific Python code type-checking this
         # class by globally replacing in this callable-agnostic code...
         func_code = func_code.replace(
@@ -446,17 +578,169 @@ def resolve_pep_code_hints_forwardref_class_basename(
                 f'{hint_forwardref_class_basename}'
                 f'{PEP_CODE_HINT_FORWARDREF_UNQUALIFIED_PLACEHOLDER_SUFFIX}'
             ),
-            # Python expression evaluating to this class when accessed
-            # via the private "__beartypistry" parameter.
-            register_typistry_forwardref(
-                # Fully-qualified classname referred to by this forward
-                # reference relative to the decorated callable.
-                get_hint_forwardref_classname_relative_to_obj(
-                    obj=data.func,
-                    hint=hint_forwardref_class_basename,
-                )
-            )
+            # The name of this parameter.
+            hint_forwardref.param_name,
         )
 
     # Return this unmemoized callable-specific Python code.
     return func_code
+
+# ....................{ PRIVATE ~ coders                  }....................
+def _code_check_hint_types_cached(
+    data: BeartypeData, hint: object, func_code: str) -> str:
+    '''
+    Passed Python code type-checking the root pith (i.e., current parameter or
+    return value) against the passed root hint wrapped in a **monomorphic
+    inline cache** (i.e., identity test skipping that type-checking if that
+    pith is of the exact type of the last pith to have satisfied this hint) if
+    this hint is **type-determined** (i.e., satisfied by an object depending
+    only on the type of that object) *or* this code as is otherwise.
+
+    On a cache hit, the resulting code reduces type-checking to a single
+    identity test, bypassing all :func:`isinstance` calls and thus
+    ``__instancecheck__`` dunder methods implied by this hint (e.g., of
+    abstract base classes). On a cache miss, that code type-checks that pith as
+    usual and, if that pith satisfies this hint, caches the type of that pith.
+
+    Parameters
+    ----------
+    data : BeartypeData
+        Decorated callable to be type-checked.
+    hint : object
+        PEP-compliant root hint annotating this pith.
+    func_code : str
+        Memoized Python code type-checking this pith against this hint.
+
+    Returns
+    ----------
+    str
+        Either this code wrapped in such a cache *or* this code as is.
+    '''
+    assert data.__class__ is BeartypeData, f'{repr(data)} not @beartype data.'
+    assert isinstance(func_code, str), f'{repr(func_code)} not string.'
+
+    # If this hint is *NOT* type-determined, caching the types of piths
+    # satisfying this hint would erroneously skip type-checking of subsequent
+    # piths of the same type (e.g., lists of invalid items for "List[int]").
+    # In this case, return this code as is.
+    if not _is_hint_type_determined(hint):
+        return func_code
+    # Else, this hint is type-determined.
+
+    # 0-based index of the item of the types cache list privately passed to
+    # this wrapper caching the type of the last pith satisfying this hint.
+    types_cache_index = data.func_wrapper_types_cache_len
+    data.func_wrapper_types_cache_len += 1
+
+    # Return this code indented by one level and wrapped in this cache. Since
+    # this code embeds no multiline string literals, globally indenting all
+    # newlines in this code is guaranteed to be safe.
+    return (
+        PEP_CODE_CHECK_HINT_ROOT_TYPES_CACHED_PREFIX_format(
+            types_cache_index=types_cache_index) +
+        func_code.rstrip('\n').replace('\n', f'\n{CODE_INDENT_1}') +
+        PEP_CODE_CHECK_HINT_ROOT_TYPES_CACHED_SUFFIX_format(
+            types_cache_index=types_cache_index)
+    )
+
+# ....................{ PRIVATE ~ testers                 }....................
+@callable_cached
+def _is_hint_type_determined(hint: object) -> bool:
+    '''
+    ``True`` only if the passed PEP-compliant type hint is **type-determined**
+    (i.e., whether an arbitrary object satisfies this hint depends only on the
+    type of that object), enabling wrapper functions to safely cache the types
+    of objects satisfying this hint.
+
+    Specifically, this tester returns ``True`` only if this hint is either:
+
+    * Ignorable (e.g., :attr:`typing.Any`).
+    * A non-:mod:`typing` class (e.g., :class:`int`, :class:`numbers.Real`)
+      other than a :class:`typing.NamedTuple` subclass declaring one or more
+      type-checkable fields.
+    * A `PEP 484`_-compliant new type, `PEP 484`_-compliant type variable, or
+      `PEP 593`_-compliant type metahint reducing to a type-determined hint.
+    * A **shallow hint** (i.e., hint shallowly type-checked as an instance of
+      its origin type), including both unsubscripted :mod:`typing` attributes
+      (e.g., :attr:`typing.List`) and subscriptions of :mod:`typing`
+      attributes *not* deeply supported by :mod:`beartype` (e.g.,
+      ``typing.Callable[[int], str]``).
+    * A union of only type-determined hints.
+
+    Conversely, this tester conservatively returns ``False`` for *all* other
+    hints (e.g., deeply type-checked containers, generics, protocols, forward
+    references), whose satisfaction depends on the contents of that object.
+
+    This tester is memoized for efficiency.
+
+    Parameters
+    ----------
+    hint : object
+        PEP-compliant type hint to be inspected.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if this hint is type-determined.
+
+    .. _PEP 484:
+       https://www.python.org/dev/peps/pep-0484
+    .. _PEP 593:
+       https://www.python.org/dev/peps/pep-0593
+    '''
+
+    # If this hint is a new type or type metahint, defer to the hint this hint
+    # reduces to.
+    if is_hint_pep484_newtype(hint):
+        return _is_hint_type_determined(get_hint_pep484_newtype_class(hint))
+    elif is_hint_pep593(hint):
+        return _is_hint_type_determined(get_hint_pep593_hint(hint))
+    # Else if this hint is ignorable, this hint is trivially satisfied by *ALL*
+    # objects regardless of type.
+    elif is_hint_ignorable(hint):
+        return True
+    # Else if this hint is a type variable, this type variable is necessarily
+    # bounded or constrained (as unbounded type variables are ignorable). In
+    # this case, defer to the bound or union of constraints this type variable
+    # reduces to.
+    elif is_hint_pep_typevar(hint):
+        return _is_hint_type_determined(reduce_hint_pep484_typevar(hint))
+    # Else if this hint is PEP-noncompliant, this hint is type-determined only
+    # if this hint is a class (rather than a forward reference) *OTHER* than
+    # either a named tuple declaring one or more type-checkable fields *OR* a
+    # typed dictionary.
+    elif not is_hint_pep(hint):
+        return (
+            isinstance(hint, type) and
+            not get_hint_pep484_namedtuple_fields(hint) and
+            not is_hint_pep589(hint)
+        )
+    # Else if this hint is an IO generic base class reduced to a protocol by
+    # the pep_code_check_hint() function, this hint is *NOT* type-determined.
+    elif is_hint_pep544_io_generic(hint):
+        return False
+    # Else, this hint is a standard PEP-compliant hint.
+
+    # Sign uniquely identifying this hint.
+    hint_sign = get_hint_pep_sign(hint)
+
+    # If this hint is a union, this hint is type-determined only if *ALL*
+    # child hints subscripting this union are.
+    if hint_sign in HINT_PEP484_SIGNS_UNION:
+        return all(
+            _is_hint_type_determined(hint_child)
+            for hint_child in get_hint_pep_args(hint)
+        )
+
+    # Else, this hint is type-determined only if this hint is shallowly
+    # type-checked by the pep_code_check_hint() function as an instance of its
+    # origin type (i.e., if this hint is either not deeply supported *OR* its
+    # own unsubscripted sign). Since that function type-checks generics,
+    # protocols, and forward references before shallow hints, these hints are
+    # explicitly excluded.
+    return (
+        hint_sign not in _HINT_SIGNS_TYPE_UNDETERMINED and (
+            hint_sign not in HINT_PEP_SIGNS_SUPPORTED_DEEP or
+            hint is hint_sign
+        )
+    )
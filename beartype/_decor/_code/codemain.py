@@ -34,13 +34,6 @@ This private submodule is *not* intended for importation by downstream callers.
 #Why? Because the builtin str.replace() method performs *NO* such validation,
 #inviting non-human-readable exceptions when we inevitably muck things up.
 
-#FIXME: Major optimization: duplicate the signature of the decorated callable
-#as the signature of our wrapper function. Why? Because doing so obviates the
-#need to explicitly test whether each possible parameter was passed and how
-#that parameter was passed (e.g., positional, keyword) as well as the need to
-#localize "__beartype_args_len" and so on. In short, this is a massive win.
-#Again, see the third-party "makefun" package, which purports to already do so.
-
 #FIXME: Remove duplicates from tuple annotations for efficiency: e.g.,
 #
 #    # This...
@@ -138,23 +131,38 @@ This private submodule is *not* intended for importation by downstream callers.
 # ....................{ IMPORTS                           }....................
 from beartype.roar import BeartypeDecorParamNameException
 from beartype._decor._code.codesnip import (
+    CODE_CALL_ARGS_VARIADIC,
     CODE_INIT_PARAMS_POSITIONAL_LEN,
     CODE_INIT_RANDOM_INT,
-    CODE_RETURN_UNCHECKED,
-    CODE_SIGNATURE,
+    CODE_INIT_ROUND_ROBIN_INT,
+    CODE_RETURN_UNCHECKED_format,
+    CODE_SIGNATURE_format,
+    CODE_SIGNATURE_MIRRORED_DEFAULT_KEYWORD_format,
+    CODE_SIGNATURE_MIRRORED_DEFAULT_POSITIONAL_format,
+    CODE_SIGNATURE_MIRRORED_PARAMS_PRIVATE,
+    CODE_SIGNATURE_MIRRORED_format,
+    CODE_SIGNATURE_PARAM_PRIVATE_format,
+    FUNC_WRAPPER_NAME_CANONICAL,
+    PARAM_NAME_DEFAULT_PREFIX,
+    PARAM_NAME_INDEX_NEXT,
+    PARAM_NAME_TYPES_CACHE,
+    PARAM_NAME_TYPISTRY,
 )
 from beartype._decor._code._pep.pepcode import (
     coerce_hint_pep,
     pep_code_check_param,
     pep_code_check_return,
 )
-from beartype._decor._data import BeartypeData
+from beartype._decor._data import (
+    PARAM_EMPTY, BeartypeData, BeartypeIndexKind)
 from beartype._util.hint.utilhinttest import is_hint_ignorable
 from beartype._util.text.utiltextlabel import (
     label_callable_decorated_param,
     label_callable_decorated_return,
 )
-from inspect import Parameter, Signature
+from beartype._util.utilcallable import is_func_sig_codeobj
+from inspect import Parameter
+from keyword import iskeyword
 
 # See the "beartype.__init__" submodule for further commentary.
 __all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
@@ -169,21 +177,29 @@ This includes:
 
 * Constants specific to variadic keyword parameters (e.g., ``**kwargs``), which
   are currently unsupported by :func:`beartype`.
-* Constants specific to positional-only parameters, which apply only to
-  non-pure-Python callables (e.g., defined by C extensions). The
-  :func:`beartype` decorator applies *only* to pure-Python callables, which
-  provide no syntactic means for specifying positional-only parameters.
+* Constants specific to positional-only parameters, which are currently
+  *not* type-checked by :func:`beartype`. Although wrapper functions whose
+  signatures mirror those of decorated callables preserve these parameters
+  (i.e., by declaring the ``/`` delimiter), the code generated for those
+  wrappers does *not* type-check these parameters.
 '''
 
 # ....................{ CONSTANTS ~ private : empty       }....................
-_PARAM_HINT_EMPTY = Parameter.empty
+_PARAM_DEFAULT_EMPTY = PARAM_EMPTY
+'''
+:mod:`inspect`-specific sentinel value indicating a parameter with *no*
+default value.
+'''
+
+
+_PARAM_HINT_EMPTY = PARAM_EMPTY
 '''
 :mod:`inspect`-specific sentinel value indicating an **unannotated parameter**
 (i.e., parameter *not* annotated with a type hint).
 '''
 
 
-_RETURN_HINT_EMPTY = Signature.empty
+_RETURN_HINT_EMPTY = PARAM_EMPTY
 '''
 :mod:`inspect`-specific sentinel value indicating an **unannotated return**
 (i.e., return *not* annotated with a type hint).
@@ -270,8 +286,23 @@ def generate_code(data: BeartypeData) -> None:
     '''
     assert data.__class__ is BeartypeData, f'{repr(data)} not @beartype data.'
 
-    # Python code snippet declaring the signature of this wrapper.
-    code_sig = CODE_SIGNATURE.format(func_wrapper_name=data.func_wrapper_name)
+    # If the signature of this callable is mirrorable by the signature of this
+    # wrapper, generate this wrapper in mirrored mode.
+    if _is_func_sig_mirrorable(data):
+        data.is_func_wrapper_sig_mirrored = True
+
+        # Name this wrapper the same as this callable, ensuring exceptions
+        # raised by the active Python interpreter on passing invalid parameters
+        # to this wrapper to be indistinguishable from those raised on passing
+        # the same parameters to this callable.
+        data.func_wrapper_name = data.func.__name__
+
+        # Python code passing all parameters passed to this wrapper to this
+        # callable by name.
+        data.func_wrapper_call_args = _code_call_args_mirrored(data)
+    # Else, generate this wrapper in variadic mode.
+    else:
+        data.func_wrapper_call_args = CODE_CALL_ARGS_VARIADIC
 
     # Python code snippet type-checking all parameters annotated on this
     # callable if any *or* the empty string otherwise.
@@ -281,14 +312,24 @@ def generate_code(data: BeartypeData) -> None:
     # callable if any *or* the empty string otherwise.
     code_return, is_code_return_needs_random_int = _code_check_return(data)
 
+    # Python code snippet declaring the signature of this wrapper *AFTER*
+    # generating snippets type-checking parameters and return values, which
+    # record the names of all private parameters to be passed to this wrapper.
+    code_sig = (
+        _code_signature_mirrored(data)
+        if data.is_func_wrapper_sig_mirrored else
+        _code_signature_variadic(data)
+    )
+
     # Python code snippet declaring the signature of this wrapper followed by
     # preliminary statements (e.g., assignment initializations) if desired
     # *AFTER* generating snippets type-checking parameters and return values,
     # both of which modify instance variables of the dataclass tested below.
     code_init = (
         # If the body of this wrapper requires a pseudo-random integer, append
-        # code generating and localizing such an integer to this signature.
-        f'{code_sig}{CODE_INIT_RANDOM_INT}'
+        # code generating and localizing such an integer from the container
+        # index source of this wrapper to this signature.
+        f'{code_sig}{_get_code_init_index_int(data)}'
         if (is_code_params_needs_random_int or is_code_return_needs_random_int)
         else
         # Else, this body requires *NO* such integer. In this case, preserve
@@ -311,12 +352,423 @@ def generate_code(data: BeartypeData) -> None:
     func_code = f'{code_init}{code_params}{code_return}'
 
     # True only if this code proxies this callable *WITHOUT* type checking.
-    is_func_code_noop = (func_code == f'{code_sig}{CODE_RETURN_UNCHECKED}')
+    is_func_code_noop = func_code == code_sig + CODE_RETURN_UNCHECKED_format(
+        func_call_args=data.func_wrapper_call_args)
 
     # Return this code and accompanying boolean.
     return func_code, is_func_code_noop
 
+# ....................{ GETTERS ~ private                 }....................
+def _get_code_func_wrapper_name(data: BeartypeData) -> str:
+    '''
+    Name of the wrapper function as declared by the code generated for the
+    decorated callable.
+
+    Parameters
+    ----------
+    data : BeartypeData
+        Decorated callable to be type-checked.
+
+    Returns
+    ----------
+    str
+        Either:
+
+        * If the active Python interpreter supports renaming code objects, the
+          canonical wrapper name shared by *all* generated code.
+        * Else, the actual name of this wrapper.
+
+    See Also
+    ----------
+    :data:`beartype._decor._code.codesnip.FUNC_WRAPPER_NAME_CANONICAL`
+        Further details.
+    '''
+
+    return FUNC_WRAPPER_NAME_CANONICAL or data.func_wrapper_name
+
+
+def _get_code_init_index_int(data: BeartypeData) -> str:
+    '''
+    Python code localizing the integer from which the wrapper function
+    type-checking the decorated callable selects container items to be
+    type-checked, generated by the container index source of that wrapper.
+
+    Parameters
+    ----------
+    data : BeartypeData
+        Decorated callable to be type-checked.
+
+    Returns
+    ----------
+    str
+        Either:
+
+        * If this wrapper selects container items in a round-robin manner,
+          :data:`beartype._decor._code.codesnip.CODE_INIT_ROUND_ROBIN_INT`.
+        * Else, :data:`beartype._decor._code.codesnip.CODE_INIT_RANDOM_INT`.
+    '''
+
+    return (
+        CODE_INIT_ROUND_ROBIN_INT
+        if data.index_kind is BeartypeIndexKind.ROUND_ROBIN else
+        CODE_INIT_RANDOM_INT
+    )
+
+
+def _get_func_wrapper_params_private(data: BeartypeData) -> list:
+    '''
+    List of the declarations of all private parameters conditionally accepted
+    by the wrapper function type-checking the decorated callable, each of which
+    is declared in the signature of that wrapper as
+    ``{param_name}={param_name}`` unless otherwise noted.
+
+    These parameters comprise:
+
+    * If this wrapper selects container items in a round-robin manner, the
+      :data:`beartype._decor._code.codesnip.PARAM_NAME_INDEX_NEXT` parameter.
+      Since the default value of this parameter is private to each wrapper,
+      that value is passed by the :func:`beartype.beartype` decorator on
+      defining each wrapper rather than recorded in the
+      :attr:`BeartypeData.func_wrapper_locals` dictionary shared between all
+      wrappers defined from the same cached code object.
+    * If this wrapper caches the types of objects satisfying type-determined
+      root hints, the
+      :data:`beartype._decor._code.codesnip.PARAM_NAME_TYPES_CACHE` parameter
+      declared as ``{param_name}=[None, ...]``, whose list display is
+      evaluated anew on each definition of each wrapper.
+    * Each key of that dictionary.
+
+    Parameters
+    ----------
+    data : BeartypeData
+        Decorated callable to be type-checked.
+
+    Returns
+    ----------
+    list
+        List of the declarations of all such parameters.
+    '''
+
+    # List of the declarations of all such parameters.
+    param_decls = []
+
+    # If this wrapper selects container items in a round-robin manner, declare
+    # the parameter privately counting calls to this wrapper.
+    if data.index_kind is BeartypeIndexKind.ROUND_ROBIN:
+        param_decls.append(f'{PARAM_NAME_INDEX_NEXT}={PARAM_NAME_INDEX_NEXT}')
+
+    # If this wrapper caches the types of objects satisfying one or more root
+    # hints, declare the parameter privately caching these types.
+    if data.func_wrapper_types_cache_len:
+        param_decls.append(
+            f'{PARAM_NAME_TYPES_CACHE}='
+            f'[{", ".join(("None",) * data.func_wrapper_types_cache_len)}]'
+        )
+
+    # For the name of each local variable to be passed to this wrapper, declare
+    # a private parameter defaulting to the value of that variable.
+    param_decls.extend(
+        f'{param_name}={param_name}'
+        for param_name in data.func_wrapper_locals
+    )
+
+    # Return this list.
+    return param_decls
+
+# ....................{ TESTERS ~ private                 }....................
+def _is_func_sig_mirrorable(data: BeartypeData) -> bool:
+    '''
+    ``True`` only if the signature of the wrapper function type-checking the
+    decorated callable is safely able to mirror the signature of that callable
+    (i.e., accept the same parameters of the same kinds with the same defaults
+    as that callable).
+
+    Specifically, this tester returns ``True`` only if:
+
+    * This callable is a pure-Python function whose signature is that of its
+      code object. This excludes callables whose signatures are merely proxied
+      by other callables (e.g., via the ``__wrapped__`` dunder attribute set by
+      the :func:`functools.wraps` decorator) and non-function callables (e.g.,
+      bound methods, callable objects), whose signatures are *not* reflected
+      by their ``__defaults__`` and ``__kwdefaults__`` dunder attributes.
+    * The name of this callable is a valid identifier *not* reserved by the
+      :func:`beartype.beartype` decorator.
+    * The name of each parameter accepted by this callable is *not* reserved
+      by that decorator. Parameters shadowing builtins (e.g., ``type``,
+      ``id``) are mirrorable, as the code generated by that decorator only
+      accesses builtins via private aliases whose names are prefixed by
+      :data:`beartype._decor._code.codesnip.ATTR_NAME_BUILTIN_PREFIX`.
+
+    Parameters
+    ----------
+    data : BeartypeData
+        Decorated callable to be type-checked.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if this wrapper is safely able to mirror this signature.
+    '''
+    assert data.__class__ is BeartypeData, f'{repr(data)} not @beartype data.'
+
+    # Decorated callable.
+    func = data.func
+
+    # If this callable is *NOT* a pure-Python function whose signature is that
+    # of its code object, return false.
+    if not is_func_sig_codeobj(func):
+        return False
+
+    # Unqualified name of this callable.
+    func_name = func.__name__
+
+    # Return true only if...
+    return (
+        # The name of this callable is a valid unreserved identifier *AND*...
+        func_name.isidentifier() and
+        not iskeyword(func_name) and
+        not func_name.startswith('__bear') and
+        # The name of each parameter accepted by this callable is *NOT*
+        # reserved by @beartype.
+        not any(
+            param_name.startswith('__bear')
+            for param_name, _, _, _ in data.func_params
+        )
+    )
+
 # ....................{ CODERS ~ private                  }....................
+def _code_signature_variadic(data: BeartypeData) -> str:
+    '''
+    Python code declaring the signature of the wrapper function type-checking
+    the decorated callable in **variadic mode** (i.e., accepting all passed
+    parameters as the variadic ``*args`` and ``**kwargs`` parameters).
+
+    This function is intended to be called *after* generating all code
+    type-checking parameters and return values, which records the names of all
+    private parameters to be passed to this wrapper.
+
+    Parameters
+    ----------
+    data : BeartypeData
+        Decorated callable to be type-checked.
+
+    Returns
+    ----------
+    str
+        Python code declaring the signature of this wrapper.
+    '''
+    assert data.__class__ is BeartypeData, f'{repr(data)} not @beartype data.'
+
+    # Return this signature, declaring one private parameter for each local
+    # variable to be passed to this wrapper.
+    return CODE_SIGNATURE_format(
+        func_wrapper_name=_get_code_func_wrapper_name(data),
+        func_wrapper_params_private=''.join(
+            CODE_SIGNATURE_PARAM_PRIVATE_format(param_decl=param_decl)
+            for param_decl in _get_func_wrapper_params_private(data)
+        ),
+    )
+
+
+def _code_signature_mirrored(data: BeartypeData) -> str:
+    '''
+    Python code declaring the signature of the wrapper function type-checking
+    the decorated callable in **mirrored mode** (i.e., accepting the same
+    parameters of the same kinds with the same defaults as that callable).
+
+    This function is intended to be called *after* generating all code
+    type-checking parameters and return values, which records the names of all
+    private parameters to be passed to this wrapper.
+
+    Parameters
+    ----------
+    data : BeartypeData
+        Decorated callable to be type-checked.
+
+    Returns
+    ----------
+    str
+        Python code declaring the signature of this wrapper.
+
+    See Also
+    ----------
+    :data:`beartype._decor._code.codesnip.CODE_SIGNATURE_MIRRORED`
+        Further details.
+    '''
+    assert data.__class__ is BeartypeData, f'{repr(data)} not @beartype data.'
+
+    # List of Python code snippets declaring each parameter of this wrapper.
+    func_wrapper_params = []
+
+    # Dictionary mapping from the name of each parameter of this callable with
+    # a default value to Python code evaluating to that value at wrapper
+    # definition time.
+    param_name_to_default_code = {}
+
+    # Python code declaring the variadic keyword parameter accepted by this
+    # callable if any *OR* "None" otherwise. Since this parameter *MUST* be
+    # declared last, this parameter is deferred until after all private
+    # keyword-only parameters are declared.
+    param_var_keyword_code = None
+
+    # 0-based index of the default value of the next positional parameter with
+    # a default value into the "__defaults__" tuple of this callable.
+    param_default_index = 0
+
+    # Python code evaluating to the default value of the current parameter.
+    param_default_code = None
+
+    # True only if the prior parameter was positional-only.
+    is_param_prev_positional_only = False
+
+    # True only if all subsequently declared parameters are keyword-only
+    # (i.e., if either a variadic positional parameter or the "*" delimiter
+    # has already been declared).
+    is_params_keyword_only = False
+
+    # For each parameter accepted by this callable (in declaration order)...
+    for param_name, param_kind, param_default, _ in data.func_params:
+        # If the prior parameter was positional-only but this parameter is
+        # not, declare the "/" delimiter terminating positional-only
+        # parameters.
+        if (
+            is_param_prev_positional_only and
+            param_kind is not Parameter.POSITIONAL_ONLY
+        ):
+            func_wrapper_params.append('/')
+        is_param_prev_positional_only = (
+            param_kind is Parameter.POSITIONAL_ONLY)
+
+        # If this is a variadic positional parameter, declare this parameter.
+        if param_kind is Parameter.VAR_POSITIONAL:
+            func_wrapper_params.append(f'*{param_name}')
+            is_params_keyword_only = True
+            continue
+        # Else if this is a variadic keyword parameter, defer this parameter.
+        elif param_kind is Parameter.VAR_KEYWORD:
+            param_var_keyword_code = f'**{param_name}'
+            continue
+        # Else if this is the first keyword-only parameter *NOT* preceded by a
+        # variadic positional parameter, declare the "*" delimiter.
+        elif (
+            param_kind is Parameter.KEYWORD_ONLY and
+            not is_params_keyword_only
+        ):
+            func_wrapper_params.append('*')
+            is_params_keyword_only = True
+
+        # If this parameter has *NO* default value, declare this parameter.
+        if param_default is _PARAM_DEFAULT_EMPTY:
+            func_wrapper_params.append(param_name)
+            continue
+        # Else, this parameter has a default value.
+
+        # Python code evaluating to this default value, accessed via either
+        # the "__kwdefaults__" dictionary if this parameter is keyword-only
+        # *OR* the "__defaults__" tuple otherwise.
+        if param_kind is Parameter.KEYWORD_ONLY:
+            param_default_code = (
+                CODE_SIGNATURE_MIRRORED_DEFAULT_KEYWORD_format(
+                    arg_name=param_name))
+        else:
+            param_default_code = (
+                CODE_SIGNATURE_MIRRORED_DEFAULT_POSITIONAL_format(
+                    arg_default_index=param_default_index))
+            param_default_index += 1
+
+        # Record this default value for the private parameter declared below.
+        param_name_to_default_code[param_name] = param_default_code
+
+        # If this parameter is type-checked only when passed, declare this
+        # parameter as defaulting to a private sentinel that callers *NEVER*
+        # pass, enabling this wrapper to reliably detect whether this
+        # parameter was passed (even if passed its default value). Since this
+        # wrapper unconditionally declares a private parameter defaulting to
+        # the beartypistry, that singleton suffices as this sentinel.
+        if param_name in data.func_param_names_default_private:
+            func_wrapper_params.append(f'{param_name}={PARAM_NAME_TYPISTRY}')
+        # Else, declare this parameter as defaulting to this value.
+        else:
+            func_wrapper_params.append(f'{param_name}={param_default_code}')
+
+    # If the last parameter was positional-only, terminate all positional-only
+    # parameters.
+    if is_param_prev_positional_only:
+        func_wrapper_params.append('/')
+
+    # If *NO* keyword-only parameters have been declared yet, declare the "*"
+    # delimiter. Since private parameters are keyword-only, this prevents
+    # callers from erroneously overwriting these parameters by passing
+    # excessive positional parameters.
+    if not is_params_keyword_only:
+        func_wrapper_params.append('*')
+
+    # Declare all private parameters unconditionally passed to this wrapper.
+    func_wrapper_params.append(CODE_SIGNATURE_MIRRORED_PARAMS_PRIVATE)
+
+    # For the name of each parameter whose default value is to be privately
+    # passed to this wrapper, declare a private parameter defaulting to the
+    # same value.
+    for param_name in data.func_param_names_default_private:
+        func_wrapper_params.append(
+            f'{PARAM_NAME_DEFAULT_PREFIX}{param_name}='
+            f'{param_name_to_default_code[param_name]}'
+        )
+
+    # Declare all private parameters conditionally passed to this wrapper.
+    func_wrapper_params.extend(_get_func_wrapper_params_private(data))
+
+    # If this callable accepts a variadic keyword parameter, declare this
+    # parameter last.
+    if param_var_keyword_code is not None:
+        func_wrapper_params.append(param_var_keyword_code)
+
+    # Return this signature.
+    return CODE_SIGNATURE_MIRRORED_format(
+        func_wrapper_name=_get_code_func_wrapper_name(data),
+        func_wrapper_params=', '.join(func_wrapper_params),
+    )
+
+
+def _code_call_args_mirrored(data: BeartypeData) -> str:
+    '''
+    Python code passing all parameters passed to the wrapper function
+    type-checking the decorated callable in **mirrored mode** (i.e., accepting
+    the same parameters of the same kinds with the same defaults as that
+    callable) to that callable.
+
+    Parameters
+    ----------
+    data : BeartypeData
+        Decorated callable to be type-checked.
+
+    Returns
+    ----------
+    str
+        Python code passing these parameters to this callable.
+    '''
+    assert data.__class__ is BeartypeData, f'{repr(data)} not @beartype data.'
+
+    # List of Python code snippets passing each parameter to this callable.
+    func_call_args = []
+
+    # For each parameter accepted by this callable (in declaration order)...
+    for param_name, param_kind, _, _ in data.func_params:
+        # Pass this parameter as is if positional, unpacked if variadic, *OR*
+        # by name if keyword-only.
+        if param_kind is Parameter.VAR_POSITIONAL:
+            func_call_args.append(f'*{param_name}')
+        elif param_kind is Parameter.VAR_KEYWORD:
+            func_call_args.append(f'**{param_name}')
+        elif param_kind is Parameter.KEYWORD_ONLY:
+            func_call_args.append(f'{param_name}={param_name}')
+        else:
+            func_call_args.append(param_name)
+
+    # Return these snippets delimited by commas.
+    return ', '.join(func_call_args)
+
+
 def _code_check_params(data: BeartypeData) -> 'Tuple[str, bool]':
     '''
     Python code type-checking all annotated parameters of the decorated
@@ -362,9 +814,10 @@ def _code_check_params(data: BeartypeData) -> 'Tuple[str, bool]':
     # Python code snippet type-checking the current parameter.
     func_code_param = ''
 
-    # Name and kind of the current parameter.
+    # Name, kind, and default value of the current parameter.
     param_name = None
     param_kind = None
+    param_default = None
 
     # Human-readable label describing the current parameter.
     pith_label = None
@@ -386,24 +839,15 @@ def _code_check_params(data: BeartypeData) -> 'Tuple[str, bool]':
     # True only if this callable accepts one or more positional parameters.
     is_params_positional = False
 
-    # For the name of each parameter accepted by this callable and the
-    # "Parameter" instance encapsulating this parameter (in declaration
-    # order)...
-    for param_index, param in enumerate(
-        data.func_sig.parameters.values()):
-        # Type hint annotating this parameter if any *OR* "_PARAM_HINT_EMPTY"
-        # otherwise (i.e., if this parameter is unannotated).
-        hint = param.annotation
-
+    # For the 0-based index, name, kind, default value, and type hint of each
+    # parameter accepted by this callable (in declaration order)...
+    for param_index, (param_name, param_kind, param_default, hint) in (
+        enumerate(data.func_params)):
         # If this parameter is unannotated, continue to the next parameter.
         if hint is _PARAM_HINT_EMPTY:
             continue
         # Else, this parameter is annotated.
 
-        # Name and kind of the current parameter.
-        param_name = param.name
-        param_kind = param.kind
-
         # Human-readable labels describing the current parameter and type
         # hint annotating this parameter.
         pith_label = label_callable_decorated_param(func, param_name)
@@ -455,7 +899,9 @@ def _code_check_params(data: BeartypeData) -> 'Tuple[str, bool]':
             pep_code_check_param(
                 data=data,
                 hint=hint,
-                param=param,
+                param_name=param_name,
+                param_kind=param_kind,
+                param_default=param_default,
                 param_index=param_index,
             ))
 
@@ -473,13 +919,16 @@ def _code_check_params(data: BeartypeData) -> 'Tuple[str, bool]':
     return (
         # Python code, defined as either...
         (
-            # If this callable accepts one or more positional parameters, this
-            # snippet preceded by code localizing the number of these
-            # parameters.
+            # If this callable accepts one or more positional parameters *AND*
+            # this wrapper accepts these parameters as variadic positional
+            # parameters, this snippet preceded by code localizing the number
+            # of these parameters.
             f'{CODE_INIT_PARAMS_POSITIONAL_LEN}{func_code}'
-            if is_params_positional else
-            # Else, this callable accepts *NO* positional parameters. In this
-            # case, this snippet as is.
+            if (
+                is_params_positional and
+                not data.is_func_wrapper_sig_mirrored
+            ) else
+            # Else, this snippet as is.
             func_code
         ),
         # This boolean.
@@ -540,12 +989,13 @@ def _code_check_return(data: BeartypeData) -> 'Tuple[str, bool]':
 
     # Type hint annotating this callable's return if any *OR*
     # "_RETURN_HINT_EMPTY" otherwise (i.e., if this return is unannotated).
-    hint = data.func_sig.return_annotation
+    hint = data.func_return_hint
 
     # If this return is unannotated, generate code calling this callable
     # unchecked and returning this value from this wrapper.
     if hint is _RETURN_HINT_EMPTY:
-        func_code = CODE_RETURN_UNCHECKED
+        func_code = CODE_RETURN_UNCHECKED_format(
+            func_call_args=data.func_wrapper_call_args)
     # Else, this return is annotated.
     else:
         # PEP-compliant type hint converted from this PEP-noncompliant type
@@ -565,7 +1015,8 @@ def _code_check_return(data: BeartypeData) -> 'Tuple[str, bool]':
         # unchecked and returning that return value from this wrapper.
         if is_hint_ignorable(hint):
             # print(f'Ignoring {data.func_name} return hint {repr(hint)}...')
-            func_code = CODE_RETURN_UNCHECKED
+            func_code = CODE_RETURN_UNCHECKED_format(
+                func_call_args=data.func_wrapper_call_args)
         # Else, this hint is unignorable.
         else:
             # Python code snippet type-checking this return against this hint.
@@ -14,8 +14,57 @@ This private submodule is *not* intended for importation by downstream callers.
 '''
 
 # ....................{ IMPORTS                           }....................
+from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_8
 from beartype._util.py.utilpyword import WORD_SIZE
 
+# ....................{ CONSTANTS ~ func                  }....................
+FUNC_WRAPPER_NAME_CANONICAL = (
+    '__beartype_func_wrapper' if IS_PYTHON_AT_LEAST_3_8 else None)
+'''
+**Canonical wrapper function name** (i.e., name of the wrapper function
+declared by *all* code generated by the :func:`beartype.beartype` decorator,
+regardless of the actual name of that wrapper) if the active Python
+interpreter supports renaming code objects via the :meth:`CodeType.replace`
+method (i.e., Python >= 3.8) *or* ``None`` otherwise.
+
+Canonicalizing this name ensures that decorated callables with the same
+signature and type hints but differing names generate byte-identical code,
+which that decorator then compiles only once into a shared code object cached
+by that code. That decorator then renames each wrapper defined from that code
+object to its actual name. Under Python < 3.8, that code instead declares each
+wrapper under its actual name, which then remains part of that cache key.
+'''
+
+# ....................{ CONSTANTS ~ builtin               }....................
+ATTR_NAME_BUILTIN_PREFIX = '__beartype_builtin_'
+'''
+Substring prefixing the name of each **builtin alias** (i.e., attribute
+aliasing a builtin accessed by wrapper functions generated by the
+:func:`beartype.beartype` decorator under an alternate private name).
+
+Since wrapper functions whose signatures mirror those of decorated callables
+bind each passed parameter to a local variable of the same name, parameters
+named after builtins (e.g., ``type``, ``id``) would shadow those builtins in
+the bodies of those wrappers. Code generated by that decorator thus *never*
+accesses builtins by their unqualified names but instead by these aliases,
+which are either:
+
+* For builtins frequently accessed by that code and listed by the
+  :data:`BUILTIN_NAMES_PARAM` tuple, private parameters (i.e., fast local
+  variables) implicitly passed to all wrappers.
+* For all other builtins (e.g., builtin types annotating parameters), global
+  attributes of all wrappers.
+'''
+
+
+BUILTIN_NAMES_PARAM = ('all', 'isinstance', 'len', 'map', 'set', 'type')
+'''
+Tuple of the unqualified names of all builtins frequently accessed by wrapper
+functions generated by the :func:`beartype.beartype` decorator, each of which
+is implicitly passed to all wrappers as a private parameter whose name is
+prefixed by :data:`ATTR_NAME_BUILTIN_PREFIX`.
+'''
+
 # ....................{ CONSTANTS ~ param                 }....................
 PARAM_NAME_FUNC = '__beartype_func'
 '''
@@ -33,22 +82,214 @@ parameter whose default value is the beartypistry singleton implicitly passed
 to all wrapper functions generated by the :func:`beartype.beartype` decorator).
 '''
 
+PARAM_NAME_TRAMPOLINE = '__beartype_trampoline'
+'''
+Name of the **private trampoline parameter** (i.e., :mod:`beartype`-specific
+parameter whose default value is either the trampoline function itself if that
+trampoline has yet to be resolved *or* ``None`` otherwise, implicitly passed to
+all trampoline functions generated by the :func:`beartype.beartype` decorator
+in lazy mode).
+
+See Also
+----------
+:data:`CODE_TRAMPOLINE`
+    Further details.
+'''
+
+
+PARAM_NAME_INDEX_NEXT = '__beartype_index_next'
+'''
+Name of the **private index counter parameter** (i.e., :mod:`beartype`-specific
+parameter whose default value is the bound :meth:`itertools.count.__next__`
+method of a counter private to the wrapper function, implicitly passed to all
+wrapper functions generated by the :func:`beartype.beartype` decorator under
+the :attr:`beartype._decor._data.BeartypeIndexKind.ROUND_ROBIN` container index
+source).
+
+See Also
+----------
+:data:`CODE_INIT_ROUND_ROBIN_INT`
+    Further details.
+'''
+
+PARAM_NAME_TYPES_CACHE = '__beartype_types_cache'
+'''
+Name of the **private types cache parameter** (i.e., :mod:`beartype`-specific
+parameter whose default value is a list private to the wrapper function whose
+items are the types of the last objects to have satisfied the type-determined
+root hints type-checked by that wrapper, implicitly passed to all wrapper
+functions generated by the :func:`beartype.beartype` decorator passed
+``is_types_cached=True``).
+
+Since the default value of this parameter is a list display (e.g.,
+``[None, None]``) evaluated by the :func:`exec` builtin on each definition of
+that wrapper, this list is private to that wrapper despite the code object
+defining that wrapper being shared between all wrappers with the same
+signature and type hints.
+'''
+
+
+PARAM_NAME_HINT_PREFIX = '__beartype_hint_'
+'''
+Substring prefixing the name of each **private hint parameter** (i.e.,
+:mod:`beartype`-specific parameter whose default value is a type or tuple of
+types required by the body of the wrapper function, implicitly passed to that
+wrapper by the :func:`beartype.beartype` decorator).
+
+Accessing these objects as private parameters (i.e., fast local variables)
+rather than as items of the beartypistry singleton dictionary passed as the
+private ``__beartypistry`` parameter avoids one dictionary lookup per
+type-check per call to that wrapper.
+'''
+
+
+PARAM_NAME_DEFAULT_PREFIX = '__beartype_default_'
+'''
+Substring prefixing the name of each **private default parameter**
+(i.e., :mod:`beartype`-specific parameter whose default value is the default
+value of the parameter of the decorated callable with the same name suffixing
+this substring, implicitly passed to wrapper functions generated by the
+:func:`beartype.beartype` decorator in mirrored mode).
+
+See Also
+----------
+:data:`CODE_SIGNATURE_MIRRORED`
+    Further details.
+'''
+
 # ....................{ CODE                              }....................
+CODE_SIGNATURE_PARAMS_BUILTIN = ', '.join(
+    f'{ATTR_NAME_BUILTIN_PREFIX}{builtin_name}={builtin_name}'
+    for builtin_name in BUILTIN_NAMES_PARAM
+)
+'''
+PEP-agnostic code snippet declaring all private keyword-only parameters
+aliasing builtins unconditionally accepted by the wrapper function in both
+variadic and mirrored modes.
+
+See Also
+----------
+:data:`ATTR_NAME_BUILTIN_PREFIX`
+    Further details.
+'''
+
+
 CODE_SIGNATURE = f'''def {{func_wrapper_name}}(
     *args,
     {PARAM_NAME_FUNC}={PARAM_NAME_FUNC},
     {PARAM_NAME_TYPISTRY}={PARAM_NAME_TYPISTRY},
+    {CODE_SIGNATURE_PARAMS_BUILTIN},{{func_wrapper_params_private}}
     **kwargs
 ):'''
 '''
 PEP-agnostic code snippet declaring the signature of the wrapper function
-type-checking the decorated callable.
+type-checking the decorated callable in **variadic mode** (i.e., accepting all
+passed parameters as the variadic ``*args`` and ``**kwargs`` parameters).
+
+This snippet is a template to be formatted by the Python code declaring all
+private hint parameters conditionally required by this wrapper, each formatted
+by the :data:`CODE_SIGNATURE_PARAM_PRIVATE` snippet.
+'''
+
+
+CODE_SIGNATURE_PARAM_PRIVATE = '''
+    {param_decl},'''
+'''
+PEP-agnostic code snippet declaring a private keyword-only parameter of the
+wrapper function in variadic mode, typically of the form
+``{param_name}={param_name}`` whose default value is the value of the local
+variable of the same name passed to the :func:`exec` builtin by the
+:func:`beartype.beartype` decorator.
+'''
+
+
+CODE_SIGNATURE_MIRRORED = '''def {func_wrapper_name}({func_wrapper_params}):'''
+'''
+PEP-agnostic code snippet declaring the signature of the wrapper function
+type-checking the decorated callable in **mirrored mode** (i.e., accepting the
+same parameters of the same kinds with the same defaults as that callable).
+
+In this mode, all parameters passed to this wrapper are already bound to local
+variables of the same names by the active Python interpreter on calling this
+wrapper, obviating the need to manually localize these parameters from the
+variadic ``*args`` and ``**kwargs`` parameters accepted in variadic mode.
+
+Each default value of each parameter accepted by this wrapper is the default
+value of the parameter of the same name accepted by the decorated callable,
+accessed *once* at wrapper definition time via the ``__defaults__`` and
+``__kwdefaults__`` dunder attributes of that callable. The sole exception are
+parameters type-checked only when passed, each of which instead defaults to
+the private :data:`PARAM_NAME_TYPISTRY` parameter serving as a sentinel
+enabling the body of this wrapper to decide whether that parameter was passed.
+Since that body has *no* access to these dunder attributes without
+inefficient attribute lookups, the actual default value of each such parameter
+is instead passed as the default value of a private keyword-only parameter
+whose name is prefixed by :data:`PARAM_NAME_DEFAULT_PREFIX`.
+'''
+
+
+CODE_SIGNATURE_MIRRORED_DEFAULT_POSITIONAL = (
+    f'{PARAM_NAME_FUNC}.__defaults__[{{arg_default_index}}]')
+'''
+PEP-agnostic code snippet evaluating to the default value of a positional
+parameter of the decorated callable at wrapper definition time in mirrored
+mode.
+'''
+
+
+CODE_SIGNATURE_MIRRORED_DEFAULT_KEYWORD = (
+    f'{PARAM_NAME_FUNC}.__kwdefaults__[{{arg_name!r}}]')
+'''
+PEP-agnostic code snippet evaluating to the default value of a keyword-only
+parameter of the decorated callable at wrapper definition time in mirrored
+mode.
+'''
+
+
+CODE_SIGNATURE_MIRRORED_PARAMS_PRIVATE = (
+    f'{PARAM_NAME_FUNC}={PARAM_NAME_FUNC}, '
+    f'{PARAM_NAME_TYPISTRY}={PARAM_NAME_TYPISTRY}, '
+    f'{CODE_SIGNATURE_PARAMS_BUILTIN}'
+)
+'''
+PEP-agnostic code snippet declaring all private keyword-only parameters
+unconditionally accepted by the wrapper function in mirrored mode.
+'''
+
+CODE_TRAMPOLINE = f'''def {PARAM_NAME_TRAMPOLINE}(
+    *args,
+    {PARAM_NAME_FUNC}={PARAM_NAME_FUNC},
+    {PARAM_NAME_TRAMPOLINE}=None,
+    **kwargs
+):
+    # If this trampoline has yet to be resolved, resolve this trampoline by
+    # generating the wrapper type-checking this function and call the result.
+    if {PARAM_NAME_TRAMPOLINE} is not None:
+        return __beartype_resolve_trampoline(
+            {PARAM_NAME_FUNC}, {PARAM_NAME_TRAMPOLINE})(*args, **kwargs)
+
+    # Else, this function requires no type-checking. Call this function as is.
+    return {PARAM_NAME_FUNC}(*args, **kwargs)'''
+'''
+PEP-agnostic code snippet declaring the **trampoline function** (i.e.,
+lightweight wrapper function deferring all decoration-time work to its first
+call) returned by the :func:`beartype.beartype` decorator in **lazy mode**.
+
+On the first call to this trampoline, this trampoline generates the wrapper
+function type-checking the decorated callable *and* replaces its own code
+object and default values with those of that wrapper. Since this trampoline is
+defined with the same globals as all wrappers, all subsequent calls to this
+trampoline directly run the code of that wrapper *without* an additional
+function call.
+
+Since this snippet is *not* a template, this snippet is compiled exactly once
+at importation time rather than on each decoration.
 '''
 
 # ....................{ CODE ~ init                       }....................
 CODE_INIT_PARAMS_POSITIONAL_LEN = '''
     # Localize the number of passed positional arguments for efficiency.
-    __beartype_args_len = len(args)'''
+    __beartype_args_len = __beartype_builtin_len(args)'''
 '''
 PEP-agnostic code snippet localizing the number of passed positional arguments
 for callables accepting one or more such arguments.
@@ -143,14 +384,56 @@ https://eli.thegreenplace.net/2018/slow-and-fast-methods-for-generating-random-i
     Authoritative article profiling various :mod:`random` callables.
 '''
 
+
+CODE_INIT_ROUND_ROBIN_INT = f'''
+    # Localize the next multiple of a large prime stride from the counter
+    # private to this wrapper for subsequent indexation in type-checking
+    # round-robin selected container items.
+    __beartype_random_int = {PARAM_NAME_INDEX_NEXT}()'''
+'''
+PEP-specific code snippet localizing the next integer generated by the counter
+private to the wrapper function for subsequent reference when type-checking
+container items under the
+:attr:`beartype._decor._data.BeartypeIndexKind.ROUND_ROBIN` container index
+source, replacing the :data:`CODE_INIT_RANDOM_INT` snippet.
+
+This counter generates successive multiples ``0, p, 2p, ...`` of a large prime
+``p``. Since ``p`` is coprime to the length ``n`` of every container smaller
+than ``p``, the indices ``k*p % n`` selected by ``n`` successive calls to that
+wrapper are a permutation of ``range(n)``, guaranteeing that every item of a
+container of fixed length is type-checked in at most ``n`` calls. Since this
+counter is private to that wrapper, this snippet neither contends with other
+threads for the global Mersenne Twister nor perturbs the sequence of items
+type-checked by other wrappers, rendering that sequence reproducible across
+replays of the same calls.
+
+This snippet intentionally localizes the same ``__beartype_random_int`` local
+variable as the :data:`CODE_INIT_RANDOM_INT` snippet, which *all* code
+type-checking container items (including nested containers) is already
+expected to reference.
+'''
+
 # ....................{ CODE ~ return                     }....................
+CODE_CALL_ARGS_VARIADIC = '*args, **kwargs'
+'''
+PEP-agnostic code snippet passing all parameters passed to the wrapper function
+in variadic mode to the decorated callable.
+'''
+
+
 CODE_RETURN_UNCHECKED = f'''
     # Call this function with all passed parameters and return the value
     # returned from this call.
-    return {PARAM_NAME_FUNC}(*args, **kwargs)'''
+    return {PARAM_NAME_FUNC}({{func_call_args}})'''
 '''
 PEP-agnostic code snippet calling the decorated callable *without*
 type-checking the value returned by that call (if any).
+
+This snippet is a template to be formatted by the Python code passing all
+parameters passed to the wrapper function to the decorated callable, either:
+
+* In variadic mode, :data:`CODE_CALL_ARGS_VARIADIC`.
+* In mirrored mode, the comma-delimited names of these parameters.
 '''
 
 # ....................{ CODE ~ indent                     }....................
@@ -170,3 +453,15 @@ CODE_INDENT_3 = CODE_INDENT_2 + CODE_INDENT_1
 '''
 PEP-agnostic code snippet expanding to three levels of indentation.
 '''
+
+# ....................{ FORMATTERS                        }....................
+# Bound format methods of string globals defined above, preserved as discrete
+# global variables for efficient lookup elsewhere.
+CODE_SIGNATURE_format = CODE_SIGNATURE.format
+CODE_SIGNATURE_PARAM_PRIVATE_format = CODE_SIGNATURE_PARAM_PRIVATE.format
+CODE_SIGNATURE_MIRRORED_format = CODE_SIGNATURE_MIRRORED.format
+CODE_SIGNATURE_MIRRORED_DEFAULT_POSITIONAL_format = (
+    CODE_SIGNATURE_MIRRORED_DEFAULT_POSITIONAL.format)
+CODE_SIGNATURE_MIRRORED_DEFAULT_KEYWORD_format = (
+    CODE_SIGNATURE_MIRRORED_DEFAULT_KEYWORD.format)
+CODE_RETURN_UNCHECKED_format = CODE_RETURN_UNCHECKED.format
@@ -10,36 +10,106 @@ currently being decorated by the :func:`beartype.beartype` decorator).**
 This private submodule is *not* intended for importation by downstream callers.
 '''
 
-# ....................{ TODO                              }....................
-#FIXME: Optimize away the call to the inspect.signature() function by
-#reimplementing this function to assign to instance variables of the current
-#"BeartypeData" object rather than instantiating a new "Signature" object and
-#then one new "Parameter" object for each parameter of the decorated callable.
-#Note, for example, that we don't need to replicate that function's copying of
-#parameter and return value annotations already trivially accessible via the
-#"self.func.__annotations__" dunder attribute. Indeed, we only require these
-#new "BeartypeData" instance variables:
-#
-#* "func_param_names", a tuple of all parameter names.
-#* "func_param_name_to_kind", a dictionary mapping from each parameter name
-#  (including the 'return' pseudo-parameter signifying the return value) to
-#  that parameter's kind (e.g., keyword-only, variadic positional). Naturally,
-#  parameter kinds should probably be defined as enumeration members of a
-#  global public "Enum" class defined in this submodule and accessed elsewhere.
-#
-#Doing so will be non-trivial but entirely feasible and absolutely worthwhile,
-#as the inspect.signature() function is *GUARANTEED* to be a performance
-#bottleneck for us. This is low-priority for the moment and may actually never
-#happen... but it really should.
-
 # ....................{ IMPORTS                           }....................
-import inspect
 from beartype.cave import CallableTypes
 from beartype._util.text.utiltextlabel import label_callable_decorated
+from beartype._util.utilcallable import is_func_sig_codeobj
+from enum import Enum
+from inspect import CO_VARARGS, CO_VARKEYWORDS, Parameter, signature
+from types import MethodType
 
 # See the "beartype.__init__" submodule for further commentary.
 __all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
 
+# ....................{ CONSTANTS                         }....................
+PARAM_EMPTY = Parameter.empty
+'''
+:mod:`inspect`-specific sentinel value indicating either an **unannotated
+parameter or return** (i.e., parameter or return *not* annotated with a type
+hint) *or* a parameter with *no* default value.
+'''
+
+# ....................{ PRIVATE ~ constants               }....................
+# :mod:`inspect`-specific parameter kinds, localized for negligible efficiency
+# gains when extracting parameters from code objects.
+_PARAM_POSITIONAL_ONLY = Parameter.POSITIONAL_ONLY
+_PARAM_POSITIONAL_OR_KEYWORD = Parameter.POSITIONAL_OR_KEYWORD
+_PARAM_VAR_POSITIONAL = Parameter.VAR_POSITIONAL
+_PARAM_KEYWORD_ONLY = Parameter.KEYWORD_ONLY
+_PARAM_VAR_KEYWORD = Parameter.VAR_KEYWORD
+
+
+_PARAM_KINDS_POSITIONAL = frozenset((
+    _PARAM_POSITIONAL_ONLY, _PARAM_POSITIONAL_OR_KEYWORD))
+'''
+Frozen set of all :mod:`inspect`-specific kinds of positional parameters.
+'''
+
+# ....................{ ENUMERATIONS                      }....................
+class BeartypeStrategyKind(Enum):
+    '''
+    Enumeration of all kinds of **container type-checking strategies** (i.e.,
+    competing procedures for type-checking items of containers passed to or
+    returned from callables decorated by the :func:`beartype.beartype`
+    decorator, trading efficiency for completeness and vice versa).
+
+    Attributes
+    ----------
+    O1 : EnumMemberType
+        **Constant-time strategy** (i.e., the default ``O(1)`` strategy,
+        type-checking a single randomly selected item of each container).
+        Since containers lacking efficient random access (e.g., mappings,
+        sets) are sampled *without* caching iterators across calls, this item
+        is selected from only the first or last ``ceil(log2(n + 1))`` items of
+        each such container of ``n`` items. Invalid items in the middle of
+        large such containers are thus *never* detected by this strategy.
+    Ologn : EnumMemberType
+        **Logarithmic-time strategy** (i.e., the ``O(lgn)`` strategy,
+        type-checking a logarithmic number of distinct items randomly selected
+        from each container of ``n`` items). As with the ``O(1)`` strategy,
+        these items are selected from only the first or last such items of
+        containers lacking efficient random access.
+    On : EnumMemberType
+        **Linear-time strategy** (i.e., the ``O(n)`` strategy, exhaustively
+        type-checking *all* items of each container with early exit on the
+        first invalid item). This strategy is *not* recommended for large
+        containers, whose type-checking scales linearly with their size.
+    '''
+
+    O1 = 1
+    Ologn = 2
+    On = 3
+
+
+class BeartypeIndexKind(Enum):
+    '''
+    Enumeration of all kinds of **container index sources** (i.e., competing
+    procedures for generating the integer from which wrapper functions generated
+    by the :func:`beartype.beartype` decorator select the indices of items of
+    containers to be type-checked under the ``O(1)`` and ``O(lgn)`` container
+    type-checking strategies).
+
+    Attributes
+    ----------
+    RANDOM : EnumMemberType
+        **Pseudo-random index source** (i.e., the default source, generating a
+        new pseudo-random integer on each call to each wrapper function via the
+        :func:`random.getrandbits` function and thus the global Mersenne
+        Twister shared across all threads).
+    ROUND_ROBIN : EnumMemberType
+        **Round-robin index source** (i.e., source generating successive
+        multiples of a large prime stride from a counter private to each
+        wrapper function). Since this stride is coprime to the length ``n`` of
+        any container smaller than that stride, ``n`` successive calls to that
+        wrapper passed a container of fixed length ``n`` are guaranteed to
+        type-check *every* item of that container. Since this counter is
+        deterministic, replaying the same sequence of calls to that wrapper
+        type-checks the same sequence of items.
+    '''
+
+    RANDOM = 1
+    ROUND_ROBIN = 2
+
 # ....................{ CLASSES                           }....................
 class BeartypeData(object):
     '''
@@ -83,18 +153,103 @@ class BeartypeData(object):
         **Decorated callable** (i.e., callable currently being decorated by the
         :func:`beartype.beartype` decorator).
 
+    Attributes (Boolean)
+    ----------
+    is_types_cached : bool
+        ``True`` only if the wrapper function to be generated and returned by
+        this decorator caches the type of the last passed parameter or
+        returned value to have satisfied each **type-determined root hint**
+        (i.e., hint whose satisfaction depends only on the type of that
+        object), skipping type-checking of subsequent objects of the same type.
+        Defaults to ``False``.
+    is_union_adaptive : bool
+        ``True`` only if the wrapper function to be generated and returned by
+        this decorator type-checks unions dispatched on the exact types of
+        objects by testing the child hint most frequently satisfied by objects
+        of each such type first, learned from prior calls. Defaults to
+        ``False``.
+    is_func_wrapper_sig_mirrored : bool
+        ``True`` only if the signature of the wrapper function to be generated
+        and returned by this decorator mirrors that of the decorated callable
+        (i.e., accepts the same parameters of the same kinds with the same
+        defaults) rather than accepting all passed parameters as the variadic
+        ``*args`` and ``**kwargs`` parameters. Defaults to ``False``.
+
     Attributes (String)
     ----------
+    func_wrapper_call_args : str
+        Python code passing all parameters passed to the wrapper function to
+        be generated and returned by this decorator to the decorated callable.
     func_wrapper_name : str
         Machine-readable name of the wrapper function to be generated and
         returned by this decorator. To efficiently (albeit imperfectly) avoid
         clashes with existing attributes of the module defining that function,
-        this name is obfuscated while still preserving human-readability.
+        this name is obfuscated while still preserving human-readability. If
+        :attr:`is_func_wrapper_sig_mirrored` is ``True``, this name is instead
+        the unobfuscated name of the decorated callable, ensuring the
+        exceptions raised by the active Python interpreter on calling this
+        wrapper with invalid parameters to be indistinguishable from those
+        raised on calling that callable with the same parameters.
+
+    Attributes (Integer)
+    ----------
+    func_wrapper_types_cache_len : int
+        Number of items of the **types cache** (i.e., list private to the
+        wrapper function to be generated and returned by this decorator whose
+        items are the types of the last objects to have satisfied
+        type-determined root hints) if :attr:`is_types_cached` is ``True``
+        *or* 0 otherwise, subsequently incremented by the
+        :mod:`beartype._decor._code._pep.pepcode` submodule on type-checking
+        each such hint.
 
     Attributes (Object)
     ----------
-    func_sig : inspect.Signature
-        :class:`inspect.Signature` object describing this signature.
+    func_param_names_default_private : list
+        List of the names of all parameters of the decorated callable whose
+        default values are to be passed to the wrapper function as private
+        parameters (i.e., parameters prefixed by
+        :data:`beartype._decor._code.codesnip.PARAM_NAME_DEFAULT_PREFIX`) and
+        whose public parameters instead default to a private sentinel. This
+        list is only non-empty if :attr:`is_func_wrapper_sig_mirrored` is
+        ``True``.
+    func_params : tuple
+        Tuple of one 4-tuple ``(param_name, param_kind, param_default,
+        param_hint)`` describing each parameter accepted by the decorated
+        callable (in declaration order), where:
+
+        * ``param_name`` is the name of this parameter.
+        * ``param_kind`` is the :mod:`inspect`-specific kind of this parameter
+          (e.g., :attr:`inspect.Parameter.KEYWORD_ONLY`).
+        * ``param_default`` is the default value of this parameter if any *or*
+          :data:`PARAM_EMPTY` otherwise.
+        * ``param_hint`` is the type hint annotating this parameter if any *or*
+          :data:`PARAM_EMPTY` otherwise.
+
+        For efficiency, this tuple is extracted directly from the code object
+        of this callable where feasible rather than from the comparatively
+        heavyweight :class:`inspect.Signature` object returned by the
+        :func:`inspect.signature` function.
+    func_return_hint : object
+        Type hint annotating the return of the decorated callable if any *or*
+        :data:`PARAM_EMPTY` otherwise.
+    strategy_kind : BeartypeStrategyKind
+        Kind of container type-checking strategy with which the wrapper
+        function to be generated and returned by this decorator type-checks
+        items of containers. Defaults to :attr:`BeartypeStrategyKind.O1`.
+    index_kind : BeartypeIndexKind
+        Kind of container index source with which the wrapper function to be
+        generated and returned by this decorator selects items of containers
+        to be type-checked. Defaults to :attr:`BeartypeIndexKind.RANDOM`.
+    func_wrapper_locals : dict
+        Dictionary mapping from the name of each private parameter
+        conditionally accepted by the wrapper function to be generated and
+        returned by this decorator (e.g., private hint parameters whose default
+        values are types, tuples of types, or forward reference proxies
+        required by the body of that wrapper) to the default value of that
+        parameter. Each such parameter
+        is declared in the signature of that wrapper as
+        ``{param_name}={param_name}`` and this dictionary passed as local
+        variables to the :func:`exec` builtin defining that wrapper.
 
     .. _PEP 563:
         https://www.python.org/dev/peps/pep-0563
@@ -105,8 +260,18 @@ class BeartypeData(object):
     # and time complexity across frequently called @beartype decorations.
     __slots__ = (
         'func',
-        'func_sig',
+        'func_param_names_default_private',
+        'func_params',
+        'func_return_hint',
+        'func_wrapper_call_args',
+        'func_wrapper_locals',
         'func_wrapper_name',
+        'func_wrapper_types_cache_len',
+        'index_kind',
+        'is_func_wrapper_sig_mirrored',
+        'is_types_cached',
+        'is_union_adaptive',
+        'strategy_kind',
         '_pep_hint_placeholder_id',
     )
 
@@ -142,11 +307,28 @@ class BeartypeData(object):
 
         # Nullify all remaining instance variables.
         self.func = None
-        self.func_sig = None
+        self.func_param_names_default_private = None
+        self.func_params = None
+        self.func_return_hint = None
+        self.func_wrapper_call_args = None
+        self.func_wrapper_locals = None
         self.func_wrapper_name = None
-
-
-    def reinit(self, func: CallableTypes) -> None:
+        self.func_wrapper_types_cache_len = 0
+        self.index_kind = BeartypeIndexKind.RANDOM
+        self.is_func_wrapper_sig_mirrored = False
+        self.is_types_cached = False
+        self.is_union_adaptive = False
+        self.strategy_kind = BeartypeStrategyKind.O1
+
+
+    def reinit(
+        self,
+        func: CallableTypes,
+        strategy_kind: BeartypeStrategyKind = BeartypeStrategyKind.O1,
+        index_kind: BeartypeIndexKind = BeartypeIndexKind.RANDOM,
+        is_types_cached: bool = False,
+        is_union_adaptive: bool = False,
+    ) -> None:
         '''
         Reinitialize this metadata from the passed callable, typically after
         acquisition of a previously cached instance of this class from the
@@ -161,6 +343,20 @@ class BeartypeData(object):
         ----------
         func : CallableTypes
             Callable currently being decorated by :func:`beartype.beartype`.
+        strategy_kind : BeartypeStrategyKind
+            Kind of container type-checking strategy with which to type-check
+            this callable. Defaults to :attr:`BeartypeStrategyKind.O1`.
+        index_kind : BeartypeIndexKind
+            Kind of container index source with which to type-check this
+            callable. Defaults to :attr:`BeartypeIndexKind.RANDOM`.
+        is_types_cached : bool
+            ``True`` only if the wrapper function type-checking this callable
+            is to cache the types of objects satisfying type-determined root
+            hints. Defaults to ``False``.
+        is_union_adaptive : bool
+            ``True`` only if the wrapper function type-checking this callable
+            is to adaptively reorder the child hints of unions. Defaults to
+            ``False``.
 
         Raises
         ----------
@@ -173,6 +369,14 @@ class BeartypeData(object):
            https://www.python.org/dev/peps/pep-0563
         '''
         assert callable(func), f'{repr(func)} uncallable.'
+        assert isinstance(strategy_kind, BeartypeStrategyKind), (
+            f'{repr(strategy_kind)} not container type-checking strategy.')
+        assert isinstance(index_kind, BeartypeIndexKind), (
+            f'{repr(index_kind)} not container index source.')
+        assert isinstance(is_types_cached, bool), (
+            f'{repr(is_types_cached)} not boolean.')
+        assert isinstance(is_union_adaptive, bool), (
+            f'{repr(is_union_adaptive)} not boolean.')
 
         # Avoid circular import dependencies.
         from beartype._decor._pep563 import resolve_hints_postponed_if_needed
@@ -180,20 +384,45 @@ class BeartypeData(object):
         # Callable currently being decorated.
         self.func = func
 
+        # Kind of container type-checking strategy.
+        self.strategy_kind = strategy_kind
+
+        # Kind of container index source.
+        self.index_kind = index_kind
+
+        # True only if caching the types of objects satisfying root hints.
+        self.is_types_cached = is_types_cached
+
+        # True only if adaptively reordering the child hints of unions.
+        self.is_union_adaptive = is_union_adaptive
+
         # Machine-readable name of the wrapper function to be generated.
         self.func_wrapper_name = f'__beartyped_{func.__name__}'
 
         # Nullify all remaining attributes for safety *BEFORE* passing this
         # object to any functions (e.g., resolve_hints_postponed_if_needed()).
-        self.func_sig = None
+        self.func_params = None
+        self.func_return_hint = None
+        self.func_wrapper_call_args = None
+        self.func_wrapper_types_cache_len = 0
+        self.is_func_wrapper_sig_mirrored = False
+
+        # List of the names of all parameters whose default values are to be
+        # privately passed to this wrapper, subsequently appended to by the
+        # beartype._decor._code._pep.pepcode.pep_code_check_param() function.
+        self.func_param_names_default_private = []
+
+        # Dictionary mapping from the name to default value of each private
+        # parameter conditionally passed to this wrapper, subsequently updated
+        # by lower-level functions generating code type-checking this callable.
+        self.func_wrapper_locals = {}
 
         # Resolve all postponed annotations if any on this callable *BEFORE*
         # parsing the actual annotations these postponed annotations refer to.
         resolve_hints_postponed_if_needed(self)
 
-        # "Signature" instance encapsulating this callable's signature,
-        # dynamically parsed by the stdlib "inspect" module from this callable.
-        self.func_sig = inspect.signature(func)
+        # Parameters and return hint of this callable.
+        self.func_params, self.func_return_hint = _get_func_params(func)
 
     # ..................{ PROPERTIES ~ read-only            }..................
     @property
@@ -207,3 +436,138 @@ class BeartypeData(object):
         '''
 
         return label_callable_decorated(self.func)
+
+# ....................{ PRIVATE ~ getters                 }....................
+def _get_func_params(func: CallableTypes) -> 'Tuple[tuple, object]':
+    '''
+    2-tuple ``(func_params, func_return_hint)`` describing the signature of the
+    passed callable, where ``func_params`` and ``func_return_hint`` are as
+    documented by the :class:`BeartypeData` class.
+
+    If this callable is either a pure-Python function *or* a method bound to
+    such a function whose signature is that of its code object (i.e.,
+    satisfying the :func:`beartype._util.utilcallable.is_func_sig_codeobj`
+    tester), this getter efficiently extracts this signature directly from
+    that code object and the ``__defaults__`` and ``__kwdefaults__`` dunder
+    attributes of that function. Else, this getter falls back to the comparatively inefficient
+    :func:`inspect.signature` function, which additionally handles the
+    remaining edge cases (e.g., :func:`functools.wraps`-decorated callables,
+    callable objects).
+
+    Parameters
+    ----------
+    func : CallableTypes
+        Callable to be inspected.
+
+    Returns
+    ----------
+    Tuple[tuple, object]
+        2-tuple ``(func_params, func_return_hint)`` describing this signature.
+    '''
+
+    # Pure-Python function underlying this callable if this callable is either
+    # such a function *OR* a method bound to such a function.
+    func_pure = func.__func__ if isinstance(func, MethodType) else func
+
+    # If this function is *NOT* a pure-Python function whose signature is that
+    # of its code object, fallback to the inefficient inspect.signature()
+    # function handling all remaining edge cases.
+    if not is_func_sig_codeobj(func_pure):
+        func_sig = signature(func)
+        return (
+            tuple(
+                (param.name, param.kind, param.default, param.annotation)
+                for param in func_sig.parameters.values()
+            ),
+            func_sig.return_annotation,
+        )
+    # Else, this function is a pure-Python function whose signature is that of
+    # its code object.
+
+    # Localize attributes of this function for negligible efficiency gains.
+    func_codeobj = func_pure.__code__
+    func_hints = func_pure.__annotations__
+    func_defaults = func_pure.__defaults__ or ()
+    func_kwdefaults = func_pure.__kwdefaults__ or {}
+    args_name = func_codeobj.co_varnames
+    args_flags = func_codeobj.co_flags
+
+    # Number of positional-only, positional, and keyword-only parameters
+    # accepted by this function, where positional parameters include
+    # positional-only parameters.
+    args_len_posonly = getattr(func_codeobj, 'co_posonlyargcount', 0)
+    args_len_pos = func_codeobj.co_argcount
+    args_len_kwonly = func_codeobj.co_kwonlyargcount
+
+    # 0-based index of the first positional parameter with a default value.
+    args_index_default = args_len_pos - len(func_defaults)
+
+    # List of all parameters to be returned.
+    func_params = []
+
+    # For the 0-based index of each positional parameter...
+    for arg_index in range(args_len_pos):
+        arg_name = args_name[arg_index]
+        func_params.append((
+            arg_name,
+            (
+                _PARAM_POSITIONAL_ONLY
+                if arg_index < args_len_posonly else
+                _PARAM_POSITIONAL_OR_KEYWORD
+            ),
+            (
+                func_defaults[arg_index - args_index_default]
+                if arg_index >= args_index_default else
+                PARAM_EMPTY
+            ),
+            func_hints.get(arg_name, PARAM_EMPTY),
+        ))
+
+    # 0-based index of the next variadic parameter in the "co_varnames" tuple,
+    # which lists variadic parameters *AFTER* keyword-only parameters.
+    arg_index = args_len_pos + args_len_kwonly
+
+    # If this function accepts a variadic positional parameter, append this
+    # parameter.
+    if args_flags & CO_VARARGS:
+        arg_name = args_name[arg_index]
+        func_params.append((
+            arg_name,
+            _PARAM_VAR_POSITIONAL,
+            PARAM_EMPTY,
+            func_hints.get(arg_name, PARAM_EMPTY),
+        ))
+        arg_index += 1
+
+    # For the name of each keyword-only parameter, append this parameter.
+    for arg_name in args_name[args_len_pos:args_len_pos + args_len_kwonly]:
+        func_params.append((
+            arg_name,
+            _PARAM_KEYWORD_ONLY,
+            func_kwdefaults.get(arg_name, PARAM_EMPTY),
+            func_hints.get(arg_name, PARAM_EMPTY),
+        ))
+
+    # If this function accepts a variadic keyword parameter, append this
+    # parameter.
+    if args_flags & CO_VARKEYWORDS:
+        arg_name = args_name[arg_index]
+        func_params.append((
+            arg_name,
+            _PARAM_VAR_KEYWORD,
+            PARAM_EMPTY,
+            func_hints.get(arg_name, PARAM_EMPTY),
+        ))
+
+    # If this callable is a bound method *AND* the first parameter accepted by
+    # the underlying function is positional, ignore that parameter (i.e., the
+    # "self" or "cls" parameter to which this method is bound).
+    if (
+        func is not func_pure and
+        func_params and
+        func_params[0][1] in _PARAM_KINDS_POSITIONAL
+    ):
+        del func_params[0]
+
+    # Return this metadata.
+    return (tuple(func_params), func_hints.get('return', PARAM_EMPTY))
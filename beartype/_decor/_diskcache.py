@@ -0,0 +1,760 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2020 Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Beartype decorator on-disk wrapper cache.**
+
+This private submodule persists the code objects of wrapper functions generated
+by the :func:`beartype.beartype` decorator into an opt-in cache directory
+across interpreter runs, enabling that decorator to skip both generating *and*
+compiling the code of these wrappers for callables whose signatures and type
+hints are unchanged since a prior run. This cache is the :mod:`beartype`
+analogue of the standard ``__pycache__`` directory.
+
+This cache is disabled by default and enabled *only* if the
+``${BEARTYPE_CACHE_DIR}`` environment variable is set to the path of a
+(possibly non-existent) directory at importation time of this submodule.
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                           }....................
+import marshal, os
+from beartype.meta import VERSION
+from beartype._decor._code._pep._pepsubclass import SubclassCache
+from beartype._decor._code._pep._pepunion import UnionTypeDispatch
+from beartype._decor._pep563 import (
+    get_func_hints_postponed_resolved,
+    is_func_hints_postponed,
+)
+from beartype._decor._typistry import (
+    BeartypistryForwardRef,
+    register_typistry_forwardref,
+)
+from beartype._util.utilcallable import is_func_sig_codeobj
+from hashlib import sha256
+from importlib import import_module
+from importlib.util import MAGIC_NUMBER
+from inspect import CO_VARARGS, CO_VARKEYWORDS
+from sys import modules as sys_modules, version as sys_version
+from tempfile import mkstemp
+from types import FunctionType
+from typing import Union
+
+# See the "beartype.__init__" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ CONSTANTS                         }....................
+CACHE_DIRNAME = os.environ.get('BEARTYPE_CACHE_DIR') or None
+'''
+Dirname of the **on-disk wrapper cache** (i.e., directory containing one
+marshalled file for each wrapper function previously generated by the
+:func:`beartype.beartype` decorator) if the ``${BEARTYPE_CACHE_DIR}``
+environment variable is set to a non-empty string *or* ``None`` otherwise
+(i.e., if this cache is disabled).
+'''
+
+# ....................{ PRIVATE ~ constants               }....................
+_CACHE_FORMAT = 6
+'''
+Version of the format of files in the on-disk wrapper cache, embedded in all
+cache keys to invalidate all previously cached files on changing this format
+*without* bumping the :mod:`beartype` version.
+'''
+
+
+_CO_FLAGS_VARIADIC = CO_VARARGS | CO_VARKEYWORDS
+'''
+Bit mask of all code object flags signifying the decorated callable to accept
+variadic positional and/or keyword parameters.
+'''
+
+
+_HINT_PACKED_KIND_TYPE = 't'
+'''
+Kind of **packed hint** (i.e., marshallable tuple describing the default value
+of a private hint parameter) describing a type by the 2-tuple
+``(module_name, type_qualname)``.
+'''
+
+
+_HINT_PACKED_KIND_TUPLE = 'u'
+'''
+Kind of packed hint describing a tuple of types by the tuple of the packed
+hints describing those types.
+'''
+
+
+_HINT_PACKED_KIND_FROZENSET = 's'
+'''
+Kind of packed hint describing a frozen set of types by the tuple of the
+packed hints describing those types.
+'''
+
+
+_HINT_PACKED_KIND_FORWARDREF = 'f'
+'''
+Kind of packed hint describing a forward reference proxy by the
+fully-qualified classname referred to by that proxy.
+'''
+
+
+_HINT_PACKED_KIND_VALUE = 'v'
+'''
+Kind of packed hint describing a marshallable scalar (e.g., the ``1`` and
+``'r'`` literal objects subscripting the ``typing.Literal[1, 'r']`` hint) by
+that scalar as is.
+'''
+
+
+_HINT_PACKED_VALUE_TYPES = frozenset((
+    bool, bytes, complex, float, int, str, type(None)))
+'''
+Frozen set of the exact types of all scalars packable as is by the
+:func:`_pack_hint` function, all of which are natively supported by the
+standard :mod:`marshal` module.
+'''
+
+
+_HINT_PACKED_KIND_UNION_DISPATCH = 'd'
+'''
+Kind of packed hint describing a union dispatch table by both the tuple of the
+2-tuples ``(hint_child_type_packed, hint_child_index)`` describing the child
+hints of the union dispatched on by that table *and* whether that table is
+adaptive. Since the exact types memoized by that table are merely an
+optimization, these types are *not* packed.
+'''
+
+
+_HINT_PACKED_KIND_SUBCLASS_CACHE = 'c'
+'''
+Kind of packed hint describing a subclass cache by the tuple of the packed
+superclasses constraining the subclass hint type-checked by that cache. Since
+the classes memoized by that cache are merely an optimization, these classes
+are *not* packed.
+'''
+
+
+_MODULE_NAME_TO_FILE_STAT = {}
+'''
+Dictionary mapping from the fully-qualified name of each previously inspected
+module to either the 2-tuple ``(st_mtime_ns, st_size)`` describing the file
+declaring that module *or* ``None`` if that module has no such file (e.g.,
+C-based builtin modules).
+
+Since modules are (almost) never modified after importation, this dictionary
+reduces the number of filesystem calls performed by the :func:`get_cache_key`
+function to at most one per module per interpreter run.
+'''
+
+# ....................{ GETTERS                           }....................
+def get_cache_key(
+    func: object,
+    strategy_kind: 'BeartypeStrategyKind',
+    index_kind: 'BeartypeIndexKind',
+    is_types_cached: bool,
+    is_union_adaptive: bool,
+) -> 'Optional[str]':
+    '''
+    **Cache key** (i.e., hexadecimal digest uniquely identifying the wrapper
+    function generated by the :func:`beartype.beartype` decorator for the
+    passed callable) if this callable is cacheable *or* ``None`` otherwise.
+
+    This key is the SHA-256 digest of the concatenation of:
+
+    * The versions of both :mod:`beartype` and the active Python interpreter
+      (including the bytecode magic number, as code objects are marshalled).
+    * The fully-qualified name of this callable.
+    * The container type-checking strategy to decorate this callable under.
+    * The container index source to decorate this callable under.
+    * Whether to decorate this callable to cache the types of objects
+      satisfying type-determined root hints.
+    * Whether to decorate this callable to adaptively reorder the child hints
+      of unions.
+    * The signature of this callable, including the names and kinds of all
+      parameters accepted by this callable *and* which of these parameters
+      have default values.
+    * The machine-readable representations of all annotations on this callable.
+    * The modification times and sizes of the files declaring the modules
+      declaring both this callable *and* all objects transitively visitable
+      from these annotations, invalidating this key on modifying any of these
+      modules in a manner analogous to that of ``__pycache__`` files.
+
+    This key is computable from the passed callable *without* inspecting the
+    signature of, resolving `PEP 563`_-postponed annotations on, or generating
+    code for this callable, enabling callers to efficiently skip all of that
+    work on cache hits. Since `PEP 563`_-postponed annotations are merely
+    strings, however, this key *cannot* reflect the modules declaring the
+    objects these annotations refer to. The :func:`store_cached_wrapper`
+    function thus additionally records the modules declaring all objects
+    transitively visitable from the resolved annotations on this callable
+    into the cached file, which the :func:`load_cached_wrapper` function then
+    validates on loading that file.
+
+    Parameters
+    ----------
+    func : object
+        Callable to be decorated.
+    strategy_kind : BeartypeStrategyKind
+        Container type-checking strategy to decorate this callable under.
+    index_kind : BeartypeIndexKind
+        Container index source to decorate this callable under.
+    is_types_cached : bool
+        ``True`` only if decorating this callable to cache the types of objects
+        satisfying type-determined root hints.
+    is_union_adaptive : bool
+        ``True`` only if decorating this callable to adaptively reorder the
+        child hints of unions.
+
+    Returns
+    ----------
+    Optional[str]
+        Either:
+
+        * If the on-disk wrapper cache is enabled *and* this callable is a
+          pure-Python function, the cache key of this function.
+        * Else, ``None``.
+
+    .. _PEP 563:
+       https://www.python.org/dev/peps/pep-0563
+    '''
+
+    # If either the on-disk wrapper cache is disabled *OR* this callable is
+    # *NOT* a pure-Python function and thus has no code object from which to
+    # derive this key, return "None".
+    if CACHE_DIRNAME is None or not isinstance(func, FunctionType):
+        return None
+    # Else, this cache is enabled and this callable is a pure-Python function.
+
+    # Code object underlying this function.
+    func_codeobj = func.__code__
+
+    # Number of parameters accepted by this function.
+    args_len = (
+        func_codeobj.co_argcount +
+        func_codeobj.co_kwonlyargcount +
+        bool(func_codeobj.co_flags & CO_VARARGS) +
+        bool(func_codeobj.co_flags & CO_VARKEYWORDS)
+    )
+
+    # Set of the fully-qualified names of all modules declaring this function
+    # and objects transitively visitable from annotations on this function.
+    module_names = {func.__module__}
+    for hint in func.__annotations__.values():
+        _add_hint_module_names(hint, module_names)
+
+    # Tuple of all metadata uniquely identifying the wrapper function to be
+    # generated for this function.
+    cache_key_parts = (
+        _CACHE_FORMAT,
+        VERSION,
+        sys_version,
+        MAGIC_NUMBER,
+        func.__module__,
+        func.__qualname__,
+        strategy_kind.name,
+        index_kind.name,
+        is_types_cached,
+        is_union_adaptive,
+        getattr(func_codeobj, 'co_posonlyargcount', 0),
+        func_codeobj.co_argcount,
+        func_codeobj.co_kwonlyargcount,
+        func_codeobj.co_flags & _CO_FLAGS_VARIADIC,
+        func_codeobj.co_varnames[:args_len],
+        len(func.__defaults__ or ()),
+        tuple(sorted(func.__kwdefaults__ or ())),
+        is_func_sig_codeobj(func),
+        tuple(
+            (pith_name, repr(hint))
+            for pith_name, hint in func.__annotations__.items()
+        ),
+        tuple(
+            (module_name, _get_module_file_stat(module_name))
+            for module_name in sorted(module_names)
+        ),
+    )
+
+    # Return the hexadecimal digest of the representation of this tuple.
+    return sha256(repr(cache_key_parts).encode()).hexdigest()
+
+# ....................{ LOADERS                           }....................
+def load_cached_wrapper(
+    func: 'FunctionType',
+    cache_key: str,
+) -> 'Optional[Tuple[str, Optional[CodeType], dict]]':
+    '''
+    3-tuple ``(func_wrapper_name, func_code_compiled, func_wrapper_locals)``
+    describing the wrapper function previously cached under the passed cache
+    key if this wrapper is cached, loadable, *and* still fresh (i.e., no module
+    declaring an object transitively visitable from the resolved annotations
+    on the decorated callable has since been modified) *or* ``None``
+    otherwise, where:
+
+    * ``func_wrapper_name`` is the name of that wrapper.
+    * ``func_code_compiled`` is either:
+
+      * If that wrapper type-checks one or more parameters or return values,
+        the code object of the module defining that wrapper.
+      * Else, ``None``, in which case the decorated callable should be
+        returned as is.
+
+    * ``func_wrapper_locals`` is the dictionary mapping from the name of each
+      private parameter conditionally accepted by that wrapper to the default
+      value of that parameter.
+
+    If this wrapper is loaded, the annotations on the passed callable are
+    also replaced in-place exactly as decorating this callable would have
+    (i.e., by resolving `PEP 563`_-postponed annotations *and* coercing
+    PEP-noncompliant tuple unions into PEP-compliant unions).
+
+    Parameters
+    ----------
+    func : FunctionType
+        Callable to be decorated.
+    cache_key : str
+        Cache key previously returned by the :func:`get_cache_key` function
+        for this callable.
+
+    Returns
+    ----------
+    Optional[Tuple[str, Optional[CodeType], dict]]
+        Either this 3-tuple if this wrapper is cached *or* ``None`` otherwise.
+
+    .. _PEP 563:
+       https://www.python.org/dev/peps/pep-0563
+    '''
+    assert isinstance(cache_key, str), f'{repr(cache_key)} not string.'
+
+    # Attempt to load this wrapper. Since this cache is merely an optimization,
+    # *ANY* failure to do so (e.g., due to this file not existing, having been
+    # corrupted, or describing a type since removed from its module) reduces
+    # to a cache miss rather than an exception.
+    try:
+        with open(os.path.join(CACHE_DIRNAME, cache_key), 'rb') as cache_file:
+            (
+                func_wrapper_name,
+                func_code_compiled,
+                hint_params_packed,
+                module_file_stats,
+                hint_pith_names_tuple,
+            ) = marshal.load(cache_file)
+
+        # If any module declaring any object transitively visitable from the
+        # resolved annotations on the decorated callable has been modified
+        # since this wrapper was cached, this wrapper is stale. In this case,
+        # reduce to a cache miss.
+        for module_name, module_file_stat in module_file_stats:
+            if _get_module_file_stat(module_name) != module_file_stat:
+                return None
+
+        # Unpack the default values of all private hint parameters.
+        func_wrapper_locals = {
+            hint_param_name: _unpack_hint(hint_packed)
+            for hint_param_name, hint_packed in hint_params_packed
+        }
+
+        # Dictionary mapping from each pith name to its resolved annotation,
+        # resolving postponed annotations as
+        # _pep563.resolve_hints_postponed_if_needed() would have.
+        func_hints = (
+            get_func_hints_postponed_resolved(func)
+            if is_func_hints_postponed(func) else
+            func.__annotations__
+        )
+
+        # Coerce each PEP-noncompliant tuple union into a PEP-compliant union
+        # as pepcode.coerce_hint_pep() would have, excluding tuple unions left
+        # as is by decoration (e.g., annotating ignorable parameters).
+        for pith_name, hint in tuple(func_hints.items()):
+            if (
+                hint.__class__ is tuple and
+                pith_name not in hint_pith_names_tuple
+            ):
+                func_hints[pith_name] = Union.__getitem__(hint)
+    except Exception:
+        return None
+
+    # Replace the annotations on this callable with these annotations.
+    func.__annotations__ = func_hints
+
+    # Return this metadata.
+    return (func_wrapper_name, func_code_compiled, func_wrapper_locals)
+
+# ....................{ STORERS                           }....................
+def store_cached_wrapper(
+    cache_key: str,
+    func_hints: dict,
+    func_wrapper_name: str,
+    func_code_compiled: 'Optional[CodeType]',
+    func_wrapper_locals: dict,
+) -> None:
+    '''
+    Cache the wrapper function described by the passed metadata under the
+    passed cache key if this wrapper is cacheable *or* silently reduce to a
+    noop otherwise.
+
+    This wrapper is cacheable only if the default value of each private hint
+    parameter accepted by this wrapper is either a forward reference proxy
+    *or* a type or tuple of types importable by fully-qualified name (e.g.,
+    *not* a class declared in the body of a function).
+
+    This function writes this wrapper atomically by writing to a temporary
+    file in the cache directory *before* renaming that file to its final
+    name, preventing concurrent processes from loading partially written
+    files.
+
+    Parameters
+    ----------
+    cache_key : str
+        Cache key previously returned by the :func:`get_cache_key` function.
+    func_hints : dict
+        Annotations on the decorated callable *after* decorating this callable
+        and thus resolving all `PEP 563`_-postponed annotations on this
+        callable. The modules declaring all objects transitively visitable
+        from these annotations are recorded into the cached file, invalidating
+        this wrapper on modifying any of these modules. The names of all
+        parameters still annotated by PEP-noncompliant tuple unions are also
+        recorded, enabling the :func:`load_cached_wrapper` function to coerce
+        all other tuple unions exactly as decoration does.
+    func_wrapper_name : str
+        Name of this wrapper.
+    func_code_compiled : Optional[CodeType]
+        Either the code object of the module defining this wrapper *or*
+        ``None`` if the decorated callable reduces to a noop.
+    func_wrapper_locals : dict
+        Dictionary mapping from the name of each private parameter
+        conditionally accepted by this wrapper to its default value.
+
+    .. _PEP 563:
+       https://www.python.org/dev/peps/pep-0563
+    '''
+    assert isinstance(cache_key, str), f'{repr(cache_key)} not string.'
+    assert isinstance(func_wrapper_locals, dict), (
+        f'{repr(func_wrapper_locals)} not dictionary.')
+
+    # Tuple of 2-tuples "(hint_param_name, hint_packed)" packing the default
+    # values of all private hint parameters accepted by this wrapper.
+    hint_params_packed = tuple(
+        (hint_param_name, _pack_hint(hint))
+        for hint_param_name, hint in func_wrapper_locals.items()
+    )
+
+    # If any such value is unpackable, this wrapper is uncacheable. In this
+    # case, silently reduce to a noop.
+    for _, hint_packed in hint_params_packed:
+        if hint_packed is None:
+            return
+    # Else, all such values are packable.
+
+    # Set of the fully-qualified names of all modules declaring objects
+    # transitively visitable from these resolved annotations.
+    module_names = set()
+    for hint in func_hints.values():
+        _add_hint_module_names(hint, module_names)
+
+    # Tuple of 2-tuples "(module_name, module_file_stat)" describing the files
+    # declaring these modules.
+    module_file_stats = tuple(
+        (module_name, _get_module_file_stat(module_name))
+        for module_name in sorted(module_names)
+    )
+
+    # Tuple of the names of all parameters and returns still annotated by
+    # PEP-noncompliant tuple unions that decoration did *NOT* coerce.
+    hint_pith_names_tuple = tuple(
+        pith_name
+        for pith_name, hint in func_hints.items()
+        if hint.__class__ is tuple
+    )
+
+    # Marshalled contents of the file caching this wrapper.
+    cache_data = marshal.dumps((
+        func_wrapper_name,
+        func_code_compiled,
+        hint_params_packed,
+        module_file_stats,
+        hint_pith_names_tuple,
+    ))
+
+    # Attempt to atomically write this file. Since this cache is merely an
+    # optimization, silently ignore filesystem errors (e.g., due to this
+    # directory being read-only).
+    try:
+        os.makedirs(CACHE_DIRNAME, exist_ok=True)
+        cache_file_fd, cache_filename_temp = mkstemp(
+            dir=CACHE_DIRNAME, prefix=f'.{cache_key}.', suffix='.tmp')
+
+        try:
+            with os.fdopen(cache_file_fd, 'wb') as cache_file:
+                cache_file.write(cache_data)
+            os.replace(
+                cache_filename_temp, os.path.join(CACHE_DIRNAME, cache_key))
+        # If doing so fails, remove this temporary file *BEFORE* reraising.
+        except Exception:
+            os.unlink(cache_filename_temp)
+            raise
+    except OSError:
+        pass
+
+# ....................{ PRIVATE ~ getters                 }....................
+def _get_module_file_stat(module_name: str) -> 'Optional[Tuple[int, int]]':
+    '''
+    2-tuple ``(st_mtime_ns, st_size)`` describing the file declaring the
+    previously imported module with the passed fully-qualified name if any
+    *or* ``None`` otherwise.
+
+    Parameters
+    ----------
+    module_name : str
+        Fully-qualified name of this module.
+
+    Returns
+    ----------
+    Optional[Tuple[int, int]]
+        Either this 2-tuple if this module has an accessible file *or* ``None``
+        otherwise.
+    '''
+
+    # If this module has already been inspected, return the cached result.
+    if module_name in _MODULE_NAME_TO_FILE_STAT:
+        return _MODULE_NAME_TO_FILE_STAT[module_name]
+    # Else, this module has yet to be inspected.
+
+    # Metadata describing this module's file, defaulting to "None".
+    module_file_stat = None
+
+    # Filename of this module if any *OR* "None" otherwise.
+    module_filename = getattr(sys_modules.get(module_name), '__file__', None)
+
+    # If this module has a file, inspect this file.
+    if module_filename:
+        try:
+            module_file_stat_result = os.stat(module_filename)
+            module_file_stat = (
+                module_file_stat_result.st_mtime_ns,
+                module_file_stat_result.st_size,
+            )
+        except OSError:
+            pass
+
+    # Cache and return this metadata.
+    _MODULE_NAME_TO_FILE_STAT[module_name] = module_file_stat
+    return module_file_stat
+
+
+def _add_hint_module_names(hint: object, module_names: set) -> None:
+    '''
+    Add the fully-qualified names of all modules declaring all objects
+    transitively visitable from the passed type hint (including this hint) to
+    the passed set.
+
+    This function visits the arguments subscripting PEP-compliant type hints,
+    the origin types of these hints, the bounds and constraints of type
+    variables, and the items of tuple unions and frozen sets of types.
+
+    Parameters
+    ----------
+    hint : object
+        Type hint to be visited.
+    module_names : set
+        Set of module names, updated in-place by this function.
+    '''
+
+    # Stack of all objects to be visited, initialized to this hint.
+    hints = [hint]
+
+    # Set of the object IDs of all objects already visited, avoiding infinite
+    # recursion on self-referential objects.
+    hint_ids = set()
+
+    # While one or more objects remain to be visited...
+    while hints:
+        hint = hints.pop()
+
+        # If this object has already been visited, skip to the next.
+        if id(hint) in hint_ids:
+            continue
+        hint_ids.add(id(hint))
+
+        # If this object is either a tuple union *OR* a frozen set of exact
+        # types, visit all items of this container.
+        if isinstance(hint, (tuple, frozenset)):
+            hints.extend(hint)
+            continue
+
+        # If this object declares the name of its module, add this name.
+        module_name = getattr(hint, '__module__', None)
+        if isinstance(module_name, str):
+            module_names.add(module_name)
+
+        # Visit all objects referenced by this object relevant to type-checking.
+        for hint_attr_name in (
+            '__args__', '__origin__', '__bound__', '__constraints__'):
+            hint_attr = getattr(hint, hint_attr_name, None)
+            if isinstance(hint_attr, tuple):
+                hints.extend(hint_attr)
+            elif hint_attr is not None:
+                hints.append(hint_attr)
+
+# ....................{ PRIVATE ~ packers                 }....................
+def _pack_hint(hint: object) -> 'Optional[tuple]':
+    '''
+    **Packed hint** (i.e., marshallable tuple describing the passed default
+    value of a private hint parameter) if this value is packable *or* ``None``
+    otherwise.
+
+    Parameters
+    ----------
+    hint : object
+        Type, tuple of types, frozen set of types, forward reference proxy,
+        union dispatch table, subclass cache, or marshallable scalar (e.g.,
+        literal object) to be packed.
+
+    Returns
+    ----------
+    Optional[tuple]
+        Either this packed hint if this value is packable *or* ``None``
+        otherwise.
+    '''
+
+    # If this value is a forward reference proxy, pack this proxy as the
+    # fully-qualified classname referred to by this proxy.
+    if hint.__class__ is BeartypistryForwardRef:
+        return (_HINT_PACKED_KIND_FORWARDREF, hint.hint_classname)
+    # Else if this value is a union dispatch table, pack the child types and
+    # indices describing this table.
+    elif hint.__class__ is UnionTypeDispatch:
+        hints_packed = tuple(
+            (_pack_hint(hint_child_type), hint_child_index)
+            for hint_child_type, hint_child_index in hint.hint_childs_meta
+        )
+        return (
+            None
+            if any(
+                hint_child_type_packed is None
+                for hint_child_type_packed, _ in hints_packed
+            ) else
+            (_HINT_PACKED_KIND_UNION_DISPATCH, hints_packed, hint.is_adaptive)
+        )
+    # Else if this value is a subclass cache, pack the superclasses checked by
+    # this cache.
+    elif hint.__class__ is SubclassCache:
+        hints_packed = _pack_hint(hint.hint_superclasses)
+        return (
+            None if hints_packed is None else
+            (_HINT_PACKED_KIND_SUBCLASS_CACHE, hints_packed)
+        )
+    # Else if this value is a tuple of types, pack all types in this tuple.
+    elif isinstance(hint, tuple):
+        hints_packed = tuple(_pack_hint(hint_item) for hint_item in hint)
+        return (
+            None if None in hints_packed else
+            (_HINT_PACKED_KIND_TUPLE, hints_packed)
+        )
+    # Else if this value is a frozen set of types, pack all types in this set.
+    elif isinstance(hint, frozenset):
+        hints_packed = tuple(_pack_hint(hint_item) for hint_item in hint)
+        return (
+            None if None in hints_packed else
+            (_HINT_PACKED_KIND_FROZENSET, hints_packed)
+        )
+    # Else if this value is a marshallable scalar, pack this scalar as is.
+    elif hint.__class__ in _HINT_PACKED_VALUE_TYPES:
+        return (_HINT_PACKED_KIND_VALUE, hint)
+    # Else if this value is a type...
+    elif isinstance(hint, type):
+        # Packed type.
+        hint_packed = (
+            _HINT_PACKED_KIND_TYPE, hint.__module__, hint.__qualname__)
+
+        # Attempt to unpack this type, returning this packed type only if
+        # doing so produces the same type. This ensures that types declared in
+        # the bodies of functions, dynamically generated types, and types
+        # shadowed by other module attributes of the same name are *NOT*
+        # cached.
+        try:
+            if _unpack_hint(hint_packed) is hint:
+                return hint_packed
+        except Exception:
+            pass
+
+    # Else, this value is unpackable.
+    return None
+
+
+def _unpack_hint(hint_packed: tuple) -> object:
+    '''
+    Default value of a private hint parameter described by the passed
+    packed hint previously returned by the :func:`_pack_hint` function.
+
+    Parameters
+    ----------
+    hint_packed : tuple
+        Packed hint to be unpacked.
+
+    Returns
+    ----------
+    object
+        Type, tuple of types, frozen set of types, forward reference proxy,
+        union dispatch table, subclass cache, or marshallable scalar described
+        by this packed hint.
+
+    Raises
+    ----------
+    Exception
+        If this packed hint is unpackable (e.g., due to the type described by
+        this hint no longer existing).
+    '''
+
+    # Kind of this packed hint.
+    hint_packed_kind = hint_packed[0]
+
+    # If this packed hint describes a type, import this type by name.
+    if hint_packed_kind == _HINT_PACKED_KIND_TYPE:
+        _, module_name, hint_qualname = hint_packed
+        hint = import_module(module_name)
+        for hint_basename in hint_qualname.split('.'):
+            hint = getattr(hint, hint_basename)
+
+        # If this attribute is *NOT* a type, raise an exception.
+        if not isinstance(hint, type):
+            raise TypeError(f'{repr(hint)} not type.')
+        return hint
+    # Else if this packed hint describes a tuple, unpack all items.
+    elif hint_packed_kind == _HINT_PACKED_KIND_TUPLE:
+        return tuple(
+            _unpack_hint(hint_item_packed)
+            for hint_item_packed in hint_packed[1]
+        )
+    # Else if this packed hint describes a frozen set, unpack all items.
+    elif hint_packed_kind == _HINT_PACKED_KIND_FROZENSET:
+        return frozenset(
+            _unpack_hint(hint_item_packed)
+            for hint_item_packed in hint_packed[1]
+        )
+    # Else if this packed hint describes a scalar, return this scalar as is.
+    elif hint_packed_kind == _HINT_PACKED_KIND_VALUE:
+        return hint_packed[1]
+    # Else if this packed hint describes a forward reference proxy, return
+    # the memoized unbound proxy referring to this classname.
+    elif hint_packed_kind == _HINT_PACKED_KIND_FORWARDREF:
+        return register_typistry_forwardref(hint_packed[1])
+    # Else if this packed hint describes a union dispatch table, return a new
+    # empty table describing the same child types and indices.
+    elif hint_packed_kind == _HINT_PACKED_KIND_UNION_DISPATCH:
+        return UnionTypeDispatch(
+            tuple(
+                (_unpack_hint(hint_child_type_packed), hint_child_index)
+                for hint_child_type_packed, hint_child_index in hint_packed[1]
+            ),
+            hint_packed[2],
+        )
+    # Else if this packed hint describes a subclass cache, return a new empty
+    # cache checking the same superclasses.
+    elif hint_packed_kind == _HINT_PACKED_KIND_SUBCLASS_CACHE:
+        return SubclassCache(_unpack_hint(hint_packed[1]))
+
+    # Else, this packed hint is unrecognized. Raise an exception.
+    raise ValueError(f'Packed hint {repr(hint_packed)} unrecognized.')
@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2020 Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Beartype decorator in-memory wrapper cache.**
+
+This private submodule caches the metadata describing wrapper functions
+generated by the :func:`beartype.beartype` decorator in memory, keyed by the
+code objects of the decorated callables. Closures and other functions
+dynamically created by factories (e.g., per-request handlers defined in a loop)
+share the same code object and (typically) the same annotations, enabling that
+decorator to skip inspecting the signature of, resolving `PEP 563`_-postponed
+annotations on, generating code for, and compiling each such function after the
+first by merely rebinding the previously compiled wrapper to that function.
+
+This cache is the in-process analogue of the on-disk wrapper cache implemented
+by the :mod:`beartype._decor._diskcache` submodule.
+
+This private submodule is *not* intended for importation by downstream callers.
+
+.. _PEP 563:
+   https://www.python.org/dev/peps/pep-0563
+'''
+
+# ....................{ IMPORTS                           }....................
+from beartype._decor._data import BeartypeIndexKind, BeartypeStrategyKind
+from beartype._decor._pep563 import (
+    get_func_hints_postponed_resolved,
+    is_func_hints_postponed,
+)
+from beartype._util.utilcallable import is_func_sig_codeobj
+from typing import Union
+from weakref import WeakKeyDictionary
+
+# See the "beartype.__init__" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ PRIVATE ~ globals                 }....................
+_FUNC_CODEOBJ_TO_WRAPPER_CACHED = WeakKeyDictionary()
+'''
+**In-memory wrapper cache** (i.e., dictionary weakly mapping from the code
+object of each pure-Python function previously decorated by the
+:func:`beartype.beartype` decorator to an 11-tuple
+``(strategy_kind, index_kind, is_types_cached, is_union_adaptive,
+func_globals, func_name, func_hints, func_hints_decorated, func_wrapper_name,
+func_code_compiled, func_wrapper_locals)`` describing the wrapper generated
+for that function).
+
+The first seven items of each tuple identify the properties of that function
+*not* implied by its code object but nonetheless influencing the code
+generated for that wrapper, where:
+
+* ``strategy_kind`` is the container type-checking strategy that wrapper was
+  generated under.
+* ``index_kind`` is the container index source that wrapper was generated
+  under.
+* ``is_types_cached`` is ``True`` only if that wrapper caches the types of
+  objects satisfying type-determined root hints.
+* ``is_union_adaptive`` is ``True`` only if that wrapper adaptively reorders
+  the child hints of unions.
+* ``func_globals`` is the global scope of that function, against which
+  `PEP 563`_-postponed annotations are resolved.
+* ``func_name`` is the unqualified name of that function.
+* ``func_hints`` is the tuple of all ``(pith_name, hint)`` annotations on that
+  function *before* decorating that function, compared by identity rather
+  than equality.
+
+The next item is the tuple ``func_hints_decorated`` of all
+``(pith_name, hint)`` annotations on that function *after* decorating that
+function, which replaces these annotations in-place (e.g., by resolving
+`PEP 563`_-postponed annotations and coercing PEP-noncompliant tuple unions).
+Since `PEP 563`_-postponed annotations are merely strings shared by all
+functions sharing the same code object, identical postponed annotations need
+*not* resolve to identical referents (e.g., if the global scope of those
+functions has since been modified). Postponed annotations on each
+subsequently decorated function are thus resolved and compared against these
+decorated annotations before reusing that wrapper. This item is ``func_hints``
+itself if decorating that function preserved these annotations as is.
+
+The default values of the parameters of that function are intentionally
+*not* compared, as wrappers never embed these values into their code. Instead,
+each wrapper binds these values at definition time from the ``__defaults__``
+and ``__kwdefaults__`` dunder attributes of the function it decorates.
+
+The remaining items are the same as those returned by the
+:func:`get_memcached_wrapper` getter.
+
+Since this dictionary weakly refers to these code objects, cached wrappers are
+implicitly discarded when all functions sharing these code objects are
+garbage-collected, preventing this cache from leaking memory in long-lived
+processes decorating arbitrarily many ephemeral closures.
+
+.. _PEP 563:
+   https://www.python.org/dev/peps/pep-0563
+'''
+
+# ....................{ GETTERS                           }....................
+def get_memcached_wrapper(
+    func: object,
+    strategy_kind: BeartypeStrategyKind,
+    index_kind: BeartypeIndexKind,
+    is_types_cached: bool,
+    is_union_adaptive: bool,
+) -> 'Optional[Tuple[str, Optional[CodeType], dict]]':
+    '''
+    3-tuple ``(func_wrapper_name, func_code_compiled, func_wrapper_locals)``
+    describing the wrapper function previously generated by the
+    :func:`beartype.beartype` decorator for another function sharing the same
+    code object, global scope, name, and annotations (including the referents
+    of all `PEP 563`_-postponed annotations) as the passed callable under the
+    passed container type-checking strategy, container index source, types
+    cache mode, and union adaptivity if any *or* ``None`` otherwise, where:
+
+    * ``func_wrapper_name`` is the name of that wrapper.
+    * ``func_code_compiled`` is either:
+
+      * If that wrapper type-checks one or more parameters or return values,
+        the code object of the module defining that wrapper.
+      * Else, ``None``, in which case the decorated callable should be
+        returned as is.
+
+    * ``func_wrapper_locals`` is the dictionary mapping from the name of each
+      private parameter conditionally accepted by that wrapper to the default
+      value of that parameter.
+
+    Parameters
+    ----------
+    func : object
+        Callable to be decorated.
+    strategy_kind : BeartypeStrategyKind
+        Container type-checking strategy to decorate this callable under.
+    index_kind : BeartypeIndexKind
+        Container index source to decorate this callable under.
+    is_types_cached : bool
+        ``True`` only if decorating this callable to cache the types of objects
+        satisfying type-determined root hints.
+    is_union_adaptive : bool
+        ``True`` only if decorating this callable to adaptively reorder the
+        child hints of unions.
+
+    Returns
+    ----------
+    Optional[Tuple[str, Optional[CodeType], dict]]
+        Either this 3-tuple if this wrapper is cached *or* ``None`` otherwise.
+        In the former case, the annotations on this callable are replaced
+        in-place exactly as decorating this callable would have (e.g., by
+        resolving `PEP 563`_-postponed annotations).
+
+    Raises
+    ----------
+    BeartypeDecorHintPep563Exception
+        If evaluating a `PEP 563`_-postponed annotation on this callable raises
+        an exception.
+
+    .. _PEP 563:
+       https://www.python.org/dev/peps/pep-0563
+    '''
+
+    # If this callable is uncacheable, return "None".
+    if not _is_func_memcacheable(func):
+        return None
+    # Else, this callable is cacheable.
+
+    # Metadata describing the wrapper previously cached for this callable if
+    # any *OR* "None" otherwise.
+    func_wrapper_cached = _FUNC_CODEOBJ_TO_WRAPPER_CACHED.get(func.__code__)
+
+    # If no wrapper was cached for this code object, return "None".
+    if func_wrapper_cached is None:
+        return None
+    # Else, a wrapper was cached for this code object.
+
+    # Unpack this metadata.
+    (
+        func_strategy_kind,
+        func_index_kind,
+        func_is_types_cached,
+        func_is_union_adaptive,
+        func_globals,
+        func_name,
+        func_hints,
+        func_hints_decorated,
+        func_wrapper_name,
+        func_code_compiled,
+        func_wrapper_locals,
+    ) = func_wrapper_cached
+
+    # If any property of this callable influencing the code generated for its
+    # wrapper differs from that of the callable this wrapper was generated
+    # for, return "None". For efficiency, the cheapest tests are performed
+    # first.
+    if not (
+        strategy_kind is func_strategy_kind and
+        index_kind is func_index_kind and
+        is_types_cached is func_is_types_cached and
+        is_union_adaptive is func_is_union_adaptive and
+        func.__globals__ is func_globals and
+        func.__name__ == func_name and
+        _is_func_hints_identical(func.__annotations__, func_hints) and
+        _decorate_func_hints(func, func_hints, func_hints_decorated)
+    ):
+        return None
+    # Else, this wrapper is reusable for this callable.
+
+    # Return the subset of this metadata required to define this wrapper.
+    return (func_wrapper_name, func_code_compiled, func_wrapper_locals)
+
+# ....................{ STORERS                           }....................
+def store_memcached_wrapper(
+    func: object,
+    func_hints: tuple,
+    strategy_kind: BeartypeStrategyKind,
+    index_kind: BeartypeIndexKind,
+    is_types_cached: bool,
+    is_union_adaptive: bool,
+    func_wrapper_name: str,
+    func_code_compiled: 'Optional[CodeType]',
+    func_wrapper_locals: dict,
+) -> None:
+    '''
+    Cache the wrapper function generated by the :func:`beartype.beartype`
+    decorator for the passed callable in memory if this callable is cacheable
+    *or* silently reduce to a noop otherwise.
+
+    Since this function caches the annotations on this callable as decorated
+    (e.g., with `PEP 563`_-postponed annotations resolved), the caller *must*
+    call this function only *after* decorating this callable.
+
+    Parameters
+    ----------
+    func : object
+        Decorated callable.
+    func_hints : tuple
+        Tuple of all ``(pith_name, hint)`` annotations on this callable
+        *before* this callable was decorated. Since decoration replaces these
+        annotations in-place (e.g., by resolving `PEP 563`_-postponed
+        annotations), the caller *must* capture this tuple from the
+        ``__annotations__`` dunder dictionary of this callable before
+        decorating this callable. Failing to do so would compare the original
+        annotations of each subsequently decorated callable against these
+        replaced annotations, preventing this wrapper from ever being reused.
+    strategy_kind : BeartypeStrategyKind
+        Container type-checking strategy this callable was decorated under.
+    index_kind : BeartypeIndexKind
+        Container index source this callable was decorated under.
+    is_types_cached : bool
+        ``True`` only if this callable was decorated to cache the types of
+        objects satisfying type-determined root hints.
+    is_union_adaptive : bool
+        ``True`` only if this callable was decorated to adaptively reorder the
+        child hints of unions.
+    func_wrapper_name : str
+        Name of this wrapper.
+    func_code_compiled : Optional[CodeType]
+        Either the code object of the module defining this wrapper *or*
+        ``None`` if this wrapper reduces to a noop.
+    func_wrapper_locals : dict
+        Dictionary mapping from the name of each private parameter
+        conditionally accepted by this wrapper to the default value of that
+        parameter. Since this dictionary is cached as is, the caller should
+        *not* subsequently modify this dictionary.
+
+    .. _PEP 563:
+       https://www.python.org/dev/peps/pep-0563
+    '''
+
+    # If this callable is uncacheable, silently reduce to a noop.
+    if not _is_func_memcacheable(func):
+        return
+    # Else, this callable is cacheable.
+
+    # Tuple of all "(pith_name, hint)" annotations on this callable *AFTER*
+    # decorating this callable, defaulting to the tuple of these annotations
+    # *BEFORE* decorating this callable if decoration preserved these
+    # annotations as is.
+    func_hints_decorated = tuple(func.__annotations__.items())
+    if _is_func_hints_identical(dict(func_hints_decorated), func_hints):
+        func_hints_decorated = func_hints
+
+    # Cache this wrapper under this code object, replacing any wrapper
+    # previously cached for another function sharing this code object but
+    # differing in other properties.
+    _FUNC_CODEOBJ_TO_WRAPPER_CACHED[func.__code__] = (
+        strategy_kind,
+        index_kind,
+        is_types_cached,
+        is_union_adaptive,
+        func.__globals__,
+        func.__name__,
+        func_hints,
+        func_hints_decorated,
+        func_wrapper_name,
+        func_code_compiled,
+        func_wrapper_locals,
+    )
+
+# ....................{ PRIVATE ~ testers                 }....................
+def _is_func_memcacheable(func: object) -> bool:
+    '''
+    ``True`` only if the wrapper function generated by the
+    :func:`beartype.beartype` decorator for the passed callable is cacheable
+    in memory.
+
+    Specifically, this tester returns ``True`` only if this callable is a
+    pure-Python function whose signature is that of its code object, as
+    decided by the
+    :func:`beartype._util.utilcallable.is_func_sig_codeobj` tester.
+
+    Parameters
+    ----------
+    func : object
+        Callable to be decorated.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if this callable is cacheable.
+    '''
+
+    return is_func_sig_codeobj(func)
+
+
+def _is_func_hints_identical(
+    func_hints: dict, func_hints_cached: tuple) -> bool:
+    '''
+    ``True`` only if the passed dictionary of annotations is **identical**
+    (i.e., maps the same pith names in the same order to the same hint
+    objects as compared by identity) to the passed tuple of previously cached
+    ``(pith_name, hint)`` annotations.
+
+    Hints are intentionally compared by identity rather than equality, both
+    for efficiency *and* because equal hints need not be interchangeable
+    (e.g., forward references resolved against different scopes).
+
+    Parameters
+    ----------
+    func_hints : dict
+        Annotations on the callable to be decorated.
+    func_hints_cached : tuple
+        Annotations on the callable whose wrapper was cached.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if these annotations are identical.
+    '''
+
+    # If these annotations differ in length, return false.
+    if len(func_hints) != len(func_hints_cached):
+        return False
+
+    # Return true only if each annotation is identical.
+    for (pith_name, hint), (pith_name_cached, hint_cached) in zip(
+        func_hints.items(), func_hints_cached):
+        if pith_name != pith_name_cached or hint is not hint_cached:
+            return False
+    return True
+
+# ....................{ PRIVATE ~ decorators              }....................
+def _decorate_func_hints(
+    func: object,
+    func_hints_cached: tuple,
+    func_hints_decorated: tuple,
+) -> bool:
+    '''
+    Replace the annotations on the passed callable in-place exactly as
+    decorating this callable would have *and* return ``True`` if these
+    replaced annotations are identical to the passed tuple of annotations on
+    the callable whose wrapper was cached after decorating that callable *or*
+    preserve these annotations as is and return ``False`` otherwise.
+
+    The caller *must* have already validated the annotations on this callable
+    to be identical to the passed tuple of annotations on the callable whose
+    wrapper was cached *before* decorating that callable.
+
+    Parameters
+    ----------
+    func : object
+        Callable to be decorated.
+    func_hints_cached : tuple
+        Annotations on the callable whose wrapper was cached *before*
+        decorating that callable.
+    func_hints_decorated : tuple
+        Annotations on the callable whose wrapper was cached *after*
+        decorating that callable.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if this wrapper is reusable for this callable.
+
+    Raises
+    ----------
+    BeartypeDecorHintPep563Exception
+        If evaluating a `PEP 563`_-postponed annotation on this callable raises
+        an exception.
+
+    .. _PEP 563:
+       https://www.python.org/dev/peps/pep-0563
+    '''
+
+    # If decorating the callable whose wrapper was cached preserved its
+    # annotations as is, preserve the identical annotations on this callable
+    # as is as well.
+    if func_hints_decorated is func_hints_cached:
+        return True
+    # Else, decorating that callable replaced its annotations.
+
+    # If PEP 563 is inactive for this callable, decorating that callable only
+    # coerced PEP-noncompliant tuple unions into PEP-compliant unions. Since
+    # the annotations on this callable are identical to those on that
+    # callable, replace the former with the latter in-place (as the
+    # pepcode.coerce_hint_pep() function would have).
+    if not is_func_hints_postponed(func):
+        func.__annotations__.update(func_hints_decorated)
+        return True
+    # Else, PEP 563 is active for this callable. In this case, these
+    # annotations are *NOT* safely reusable as is. Since postponed annotations
+    # are strings resolved against the global scope of this callable, the
+    # identical strings annotating this callable need *NOT* resolve to the
+    # same referents that those strings resolved to for that callable.
+
+    # Dictionary mapping from each pith name to its resolved annotation.
+    func_hints = get_func_hints_postponed_resolved(func)
+
+    # If any such annotation resolves to a different referent, this wrapper is
+    # *NOT* reusable for this callable. Note that these resolutions are
+    # memoized against the global scope of this callable by the "_pep563"
+    # submodule and are thus typically identical objects.
+    for (pith_name, hint), (_, hint_decorated) in zip(
+        func_hints.items(), func_hints_decorated):
+        if not (
+            hint is hint_decorated or (
+                hint.__class__ is tuple and
+                Union.__getitem__(hint) is hint_decorated
+            )
+        ):
+            return False
+    # Else, all such annotations resolve to the same referents.
+
+    # Replace these postponed annotations with these decorated annotations
+    # (as the _pep563.resolve_hints_postponed_if_needed() and
+    # pepcode.coerce_hint_pep() functions would have).
+    func.__annotations__ = dict(func_hints_decorated)
+    return True
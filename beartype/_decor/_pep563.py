@@ -24,16 +24,54 @@ from beartype.roar import (
 )
 from beartype._decor._data import BeartypeData
 from beartype._util.cache.pool.utilcachepoollistfixed import SIZE_BIG
+from beartype._util.cache.utilcachecall import callable_cached
 from beartype._util.py.utilpyversion import (
     IS_PYTHON_AT_LEAST_4_0,
     IS_PYTHON_AT_LEAST_3_7,
 )
 from beartype._util.text.utiltextlabel import label_callable_decorated_pith
 from sys import modules as sys_modules
+from weakref import WeakKeyDictionary
 
 # See the "beartype.__init__" submodule for further commentary.
 __all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
 
+# ....................{ PRIVATE ~ globals                 }....................
+_MODULE_TO_HINT_STR_TO_HINT = WeakKeyDictionary()
+'''
+Dictionary weakly mapping from each module declaring one or more callables
+previously decorated by the :func:`beartype.beartype` decorator to a
+dictionary mapping from each `PEP 563`_-formatted postponed string annotating
+these callables to a 2-tuple ``(hint, hint_names_referent)``, where:
+
+* ``hint`` is the referent to which that string was evaluated against the
+  global scope of that module.
+* ``hint_names_referent`` is the tuple of the objects to which each global
+  name accessed by that string (in the same order as the ``co_names`` tuple of
+  the code object compiled from that string) was bound in that scope at
+  evaluation time *or* :data:`_NAME_UNBOUND` if that name was unbound.
+
+Since modules using ``from __future__ import annotations`` typically repeat
+the same postponed strings across many callables (e.g.,
+``'Optional[List[int]]'``), this cache reduces the evaluation of each such
+string to at most once per module. Since module globals are mutable, each
+cached referent is reused *only* if all global names accessed by that string
+remain bound to the same objects.
+
+Since this dictionary weakly refers to these modules, cached referents are
+implicitly discarded when these modules are unloaded and garbage-collected.
+
+.. _PEP 563:
+   https://www.python.org/dev/peps/pep-0563
+'''
+
+# ....................{ PRIVATE ~ constants               }....................
+_NAME_UNBOUND = object()
+'''
+Sentinel object signifying a global name to be unbound in the global scope of
+a module (e.g., due to that name referring to a builtin instead).
+'''
+
 # ....................{ RESOLVERS                         }....................
 def resolve_hints_postponed_if_needed(data: BeartypeData) -> None:
     '''
@@ -84,10 +122,22 @@ def resolve_hints_postponed_if_needed(data: BeartypeData) -> None:
        https://www.python.org/dev/peps/pep-0563
     '''
 
+    assert data.__class__ is BeartypeData, (
+        '{!r} not @beartype data.'.format(data))
+
     # If this callable's annotations are postponed under PEP 563, resolve these
     # annotations to their referents.
-    if _is_hints_postponed(data):
-        _resolve_hints_postponed(data)
+    #
+    # While the @beartype decorator goes to great lengths to preserve the
+    # originating "__annotations__" dictionary as is, PEP 563 is sufficiently
+    # expensive, non-trivial, and general-purpose to implement that generally
+    # resolving postponed annotations for downstream third-party callers is
+    # justified. Everyone benefits from replacing useless postponed annotations
+    # with useful real annotations; so, we atomically (i.e., all-at-once)
+    # replace these annotations for safety and efficiency.
+    if is_func_hints_postponed(data.func):
+        data.func.__annotations__ = get_func_hints_postponed_resolved(
+            data.func)
 
     #FIXME: We currently no longer require this, but nonetheless preserve this
     #for both posterity and the unknowable future to come.
@@ -98,14 +148,14 @@ def resolve_hints_postponed_if_needed(data: BeartypeData) -> None:
     # else:
     #     data.func_hints = data.func.__annotations__.copy()
 
-# ....................{ PRIVATE ~ resolvers               }....................
-def _is_hints_postponed(data: BeartypeData) -> bool:
+# ....................{ TESTERS                           }....................
+def is_func_hints_postponed(func: 'Callable') -> bool:
     '''
-    ``True`` only if `PEP 563`_ is active for the currently decorated callable.
+    ``True`` only if `PEP 563`_ is active for the passed callable.
 
     Parameters
     ----------
-    data : BeartypeData
+    func : Callable
         Decorated callable to be inspected.
 
     Returns
@@ -116,8 +166,7 @@ def _is_hints_postponed(data: BeartypeData) -> bool:
     .. _PEP 563:
        https://www.python.org/dev/peps/pep-0563
     '''
-    assert data.__class__ is BeartypeData, (
-        '{!r} not @beartype data.'.format(data))
+    assert callable(func), f'{repr(func)} not callable.'
 
     # True only if PEP 563 is active for this callable.
     #
@@ -130,7 +179,7 @@ def _is_hints_postponed(data: BeartypeData) -> bool:
     # is conditionally active only if...
     if not is_hints_postponed and IS_PYTHON_AT_LEAST_3_7:
         # Module declaring this callable.
-        func_module = sys_modules[data.func.__module__]
+        func_module = sys_modules[func.__module__]
 
         # "annotations" attribute declared by this module if any *OR* None.
         func_module_annotations_attr = getattr(
@@ -146,17 +195,29 @@ def _is_hints_postponed(data: BeartypeData) -> bool:
     # Return true only if PEP 563 is active for this callable.
     return is_hints_postponed
 
-
-def _resolve_hints_postponed(data: BeartypeData) -> None:
+# ....................{ GETTERS                           }....................
+def get_func_hints_postponed_resolved(func: 'Callable') -> dict:
     '''
-    Resolve all `PEP 563`_-based postponed annotations on the currently
-    decorated callable to their referents.
+    New dictionary mapping from the name of each annotated parameter (or
+    ``return`` for the return value) of the passed callable to the referent of
+    the `PEP 563`_-based postponed annotation on that parameter *or* that
+    annotation as is if that annotation is *not* postponed.
+
+    This getter intentionally does *not* replace the annotations on this
+    callable, enabling callers to compare these referents against those
+    previously resolved for other callables (e.g., closures sharing the same
+    code object) before deciding to do so.
 
     Parameters
     ----------
-    data : BeartypeData
+    func : Callable
         Decorated callable to be resolved.
 
+    Returns
+    ----------
+    dict
+        Dictionary mapping from each pith name to its resolved annotation.
+
     Raises
     ----------
     BeartypeDecorHintPep563Exception
@@ -167,14 +228,29 @@ def _resolve_hints_postponed(data: BeartypeData) -> None:
     .. _PEP 563:
        https://www.python.org/dev/peps/pep-0563
     '''
-    assert data.__class__ is BeartypeData, (
-        '{!r} not @beartype data.'.format(data))
+    assert callable(func), f'{repr(func)} not callable.'
     # print('annotations: {!r}'.format(func.__annotations__))
 
-    # Localize attributes of this metadata for negligible efficiency gains.
-    func = data.func
+    # Localize attributes of this callable for negligible efficiency gains.
     func_globals = func.__globals__
 
+    # Module declaring this callable if any *OR* "None" otherwise.
+    func_module = sys_modules.get(func.__module__)
+
+    # Dictionary mapping from each postponed string previously resolved
+    # against the global scope of this module to metadata describing that
+    # resolution if this callable is declared by this module (i.e., if the
+    # global scope of this callable is that of this module) *OR* "None"
+    # otherwise (e.g., if this callable was dynamically declared by exec()).
+    hint_str_to_hint = (
+        _MODULE_TO_HINT_STR_TO_HINT.setdefault(func_module, {})
+        if (
+            func_module is not None and
+            getattr(func_module, '__dict__', None) is func_globals
+        ) else
+        None
+    )
+
     # Dictionary mapping from parameter name to resolved annotation for each
     # annotated parameter and return value of this callable.
     func_hints = {}
@@ -236,7 +312,11 @@ def _resolve_hints_postponed(data: BeartypeData) -> None:
 
             # Attempt to resolve this postponed annotation to its referent.
             try:
-                func_hints[pith_name] = eval(pith_hint, func_globals)
+                func_hints[pith_name] = _resolve_hint_postponed(
+                    hint_str=pith_hint,
+                    func_globals=func_globals,
+                    hint_str_to_hint=hint_str_to_hint,
+                )
             # If this fails (as it commonly does), wrap the low-level (and
             # usually non-human-readable) exception raised by eval() with a
             # higher-level human-readable beartype-specific exception.
@@ -274,40 +354,131 @@ def _resolve_hints_postponed(data: BeartypeData) -> None:
         # * Non-orthogonally prohibits annotations from accessing local state.
         #
         # Because we should probably mention those complaints here.
+        #
+        # Note that the child limit is intentionally *NOT* validated here
+        # against the machine-readable representation of this annotation, as
+        # doing so would needlessly stringify this annotation. The
+        # pep_code_check_hint() function subsequently validates this limit
+        # structurally while traversing this annotation instead.
         else:
-            # If the machine-readable representation of this annotation (which
-            # internally encapsulates the same structural metadata as the
-            # PEP 563-formatted postponed string representation of this
-            # annotation) internally exceeds the child limit as tested above,
-            # again raise an exception.
-            #
-            # Note that obtaining the machine-readable representation of this
-            # annotation incurs a minor performance penalty. However, since
-            # effectively *ALL* annotations will be PEP 563-formatted postponed
-            # strings once the next major Python version officially instates
-            # PEP 563 as a mandatory backward compatibility-breaking change,
-            # this penalty will effectively cease to existence for the
-            # overwhelming majority of real-world annotations. *shrug*
-            _die_if_hint_repr_exceeds_child_limit(
-                hint_repr=repr(pith_hint),
-                pith_label=pith_label)
-
             # Silently preserve this annotation as is.
             func_hints[pith_name] = pith_hint
 
-    # Atomically (i.e., all-at-once) replace this callable's postponed
-    # annotations with these resolved annotations for safety and efficiency.
-    #
-    # While the @beartype decorator goes to great lengths to preserve the
-    # originating "__annotations__" dictionary as is, PEP 563 is sufficiently
-    # expensive, non-trivial, and general-purpose to implement that generally
-    # resolving postponed annotations for downstream third-party callers is
-    # justified. Everyone benefits from replacing useless postponed annotations
-    # with useful real annotations; so, we do so.
-    func.__annotations__ = func_hints
-
+    # Return these resolved annotations.
+    return func_hints
 
 # ....................{ PRIVATE ~ resolvers               }....................
+def _resolve_hint_postponed(
+    hint_str: str,
+    func_globals: dict,
+    hint_str_to_hint: 'Optional[dict]',
+) -> object:
+    '''
+    Referent of the passed `PEP 563`_-formatted postponed string evaluated
+    against the passed global scope, memoized into the passed dictionary if
+    non-``None``.
+
+    Parameters
+    ----------
+    hint_str : str
+        Postponed string to be resolved.
+    func_globals : dict
+        Global scope of the decorated callable annotated by this string.
+    hint_str_to_hint : Optional[dict]
+        Either:
+
+        * If this global scope is that of a module, the dictionary caching
+          postponed strings previously resolved against this scope as
+          documented by the :data:`_MODULE_TO_HINT_STR_TO_HINT` global.
+        * Else, ``None``, in which case this string is resolved uncached.
+
+    Returns
+    ----------
+    object
+        Referent of this string.
+
+    Raises
+    ----------
+    Exception
+        If evaluating this string raises an exception (e.g., due to this string
+        referring to a name unbound in this scope).
+
+    .. _PEP 563:
+       https://www.python.org/dev/peps/pep-0563
+    '''
+
+    # Code object compiled from this string, compiled at most once per string.
+    hint_code = _compile_hint_postponed(hint_str)
+
+    # If this string is uncacheable, evaluate this string uncached.
+    if hint_str_to_hint is None:
+        return eval(hint_code, func_globals)
+    # Else, this string is cacheable.
+
+    # Tuple of the objects to which each global name accessed by this string
+    # is currently bound.
+    hint_names_referent = tuple(
+        func_globals.get(hint_name, _NAME_UNBOUND)
+        for hint_name in hint_code.co_names
+    )
+
+    # Metadata describing the prior resolution of this string if any *OR*
+    # "None" otherwise.
+    hint_cached = hint_str_to_hint.get(hint_str)
+
+    # If this string was previously resolved *AND* all global names accessed
+    # by this string remain bound to the same objects, return the prior
+    # referent of this string.
+    if hint_cached is not None:
+        hint, hint_names_referent_cached = hint_cached
+        if all(
+            hint_name_referent is hint_name_referent_cached
+            for hint_name_referent, hint_name_referent_cached in zip(
+                hint_names_referent, hint_names_referent_cached)
+        ):
+            return hint
+    # Else, this string has yet to be resolved against the current bindings of
+    # these names.
+
+    # Resolve and cache this string.
+    hint = eval(hint_code, func_globals)
+    hint_str_to_hint[hint_str] = (hint, hint_names_referent)
+
+    # Return this referent.
+    return hint
+
+
+@callable_cached
+def _compile_hint_postponed(hint_str: str) -> 'CodeType':
+    '''
+    Code object compiled from the passed `PEP 563`_-formatted postponed string
+    in ``eval`` mode.
+
+    This function is memoized for efficiency, compiling each unique postponed
+    string exactly once across all modules.
+
+    Parameters
+    ----------
+    hint_str : str
+        Postponed string to be compiled.
+
+    Returns
+    ----------
+    CodeType
+        Code object compiled from this string.
+
+    Raises
+    ----------
+    SyntaxError
+        If this string is syntactically invalid.
+
+    .. _PEP 563:
+       https://www.python.org/dev/peps/pep-0563
+    '''
+
+    return compile(hint_str, '<string>', 'eval')
+
+
 def _die_if_hint_repr_exceeds_child_limit(
     hint_repr: str, pith_label: str) -> None:
     '''
@@ -28,7 +28,11 @@ from beartype.roar import (
     BeartypeDecorHintForwardRefException,
     _BeartypeDecorBeartypistryException,
 )
-from beartype._decor._code.codesnip import PARAM_NAME_TYPISTRY
+from beartype._decor._code.codesnip import (
+    ATTR_NAME_BUILTIN_PREFIX,
+    PARAM_NAME_HINT_PREFIX,
+    PARAM_NAME_TYPISTRY,
+)
 from beartype._util.cache.utilcachecall import callable_cached
 from beartype._util.hint.nonpep.utilhintnonpeptest import (
     die_unless_hint_nonpep)
@@ -77,35 +81,35 @@ beartypistry parameter.
 '''
 
 # ....................{ REGISTRARS ~ forwardref           }....................
-#FIXME: Unit test us up.
 @callable_cached
-def register_typistry_forwardref(hint_classname: str) -> str:
+def register_typistry_forwardref(
+    hint_classname: str) -> 'BeartypistryForwardRef':
     '''
-    Register the passed **fully-qualified forward reference** (i.e., string
-    whose value is the fully-qualified name of a user-defined class that
-    typically has yet to be defined) with the beartypistry singleton *and*
-    return a Python expression evaluating to this class when accessed via the
-    private ``__beartypistry`` parameter implicitly passed to all wrapper
-    functions generated by the :func:`beartype.beartype` decorator.
+    **Forward reference proxy** (i.e., :class:`BeartypistryForwardRef`
+    instance deferring the resolution of the passed **fully-qualified forward
+    reference** (i.e., string whose value is the fully-qualified name of a
+    user-defined class that typically has yet to be defined) to the first
+    ``isinstance`` or ``issubclass`` check against this proxy).
 
-    This function is memoized for both efficiency *and* safety, preventing
-    accidental reregistration.
+    Callers are expected to pass this proxy to wrapper functions generated by
+    the :func:`beartype.beartype` decorator as the default value of the private
+    hint parameter whose name is the :attr:`BeartypistryForwardRef.param_name`
+    instance variable of this proxy.
+
+    This function is memoized for both efficiency *and* safety, guaranteeing
+    *all* forward references to the same class to share the same proxy and
+    thus the same private hint parameter.
 
     Parameters
     ----------
-    hint_classname : object
-        Forward reference to be registered, defined as either:
-
-        * A string whose value is the syntactically valid name of a class.
-        * An instance of the :class:`typing.ForwardRef` class.
+    hint_classname : str
+        Forward reference to be registered, defined as a string whose value is
+        the syntactically valid fully-qualified name of a class.
 
     Returns
     ----------
-    str
-        Python expression evaluating to the user-defined referred to by this
-        forward reference when accessed via the private ``__beartypistry``
-        parameter implicitly passed to all wrapper functions generated by the
-        :func:`beartype.beartype` decorator.
+    BeartypistryForwardRef
+        Forward reference proxy deferring the resolution of this class.
 
     Raises
     ----------
@@ -122,15 +126,12 @@ def register_typistry_forwardref(hint_classname: str) -> str:
         exception_cls=BeartypeDecorHintForwardRefException,
     )
 
-    # Return a Python expression evaluating to this type *WITHOUT* explicitly
-    # registering this forward reference with the beartypistry singleton. Why?
-    # Because the Beartypistry.__missing__() dunder method implicitly handles
-    # forward references by dynamically registering types on their first access
-    # if *NOT* already registered. Ergo, our job is actually done here.
-    return (
-        f'{_CODE_TYPISTRY_HINT_NAME_TO_HINT_PREFIX}{repr(hint_classname)}'
-        f'{_CODE_TYPISTRY_HINT_NAME_TO_HINT_SUFFIX}'
-    )
+    # Return a forward reference proxy *WITHOUT* explicitly registering this
+    # forward reference with the beartypistry singleton. Why? Because the
+    # Beartypistry.__missing__() dunder method implicitly handles forward
+    # references by dynamically registering types on their first access if
+    # *NOT* already registered. Ergo, our job is actually done here.
+    return BeartypistryForwardRef(hint_classname)
 
 # ....................{ REGISTRARS ~ type                 }....................
 @callable_cached
@@ -187,9 +188,13 @@ def register_typistry_type(hint: type) -> str:
 
     # If this type is a builtin (i.e., globally accessible C-based type
     # requiring *no* explicit importation), this type requires no registration.
-    # In this case, return the unqualified basename of this type as is.
+    # In this case, return the private alias of the unqualified basename of
+    # this type, accessible as a global attribute of all wrappers. Since
+    # parameters of decorated callables may shadow builtins in wrappers whose
+    # signatures mirror those callables, this basename *CANNOT* be returned as
+    # is (e.g., "def muh_func(str: list, list: str)").
     if is_class_builtin(hint):
-        return get_object_class_basename(hint)
+        return f'{ATTR_NAME_BUILTIN_PREFIX}{get_object_class_basename(hint)}'
     # Else, this type is *NOT* a builtin and thus requires registration.
     # assert hint_basename != 'NoneType'
 
@@ -320,8 +325,100 @@ def register_typistry_tuple(
     :func:`register_typistry_tuple_from_frozenset`
         Further details.
     '''
-    assert isinstance(is_types_unique, bool), (
-        f'{repr(is_types_unique)} not bool.')
+    # If this tuple only contains one type, register only this type.
+    if _is_typistry_tuple_singular(hint):
+        return register_typistry_type(hint[0])
+    # Else, this tuple either contains no types or two or more types.
+
+    # Name uniquely identifying this tuple as a beartypistry key.
+    hint_name = _register_typistry_tuple_name(hint, is_types_unique)
+
+    # Return a Python expression evaluating to this tuple.
+    return (
+        f'{_CODE_TYPISTRY_HINT_NAME_TO_HINT_PREFIX}{repr(hint_name)}'
+        f'{_CODE_TYPISTRY_HINT_NAME_TO_HINT_SUFFIX}'
+    )
+
+
+@callable_cached
+def get_typistry_tuple(
+    # Mandatory parameters.
+    hint: tuple,
+
+    # Optional parameters.
+    is_types_unique: bool = False,
+) -> object:
+    '''
+    Register the passed tuple of one or more **PEP-noncompliant types** (i.e.,
+    classes neither defined by the :mod:`typing` module *nor* subclassing such
+    classes) with the beartypistry singleton *and* return the object registered
+    for this tuple, enabling callers to pass this object directly to wrapper
+    functions generated by the :func:`beartype.beartype` decorator (e.g., as
+    the default value of a private hint parameter) rather than accessing this
+    object via the private ``__beartypistry`` parameter.
+
+    This function is memoized for both efficiency *and* safety, preventing
+    accidental reregistration.
+
+    Parameters
+    ----------
+    hint : tuple
+        Tuple of all PEP-noncompliant types to be registered.
+    is_types_unique : bool
+        ``True`` only if the caller guarantees this tuple to contain *no*
+        duplicates. See :func:`register_typistry_tuple` for further details.
+
+    Returns
+    ----------
+    object
+        Either:
+
+        * If this tuple contains exactly one type, that type.
+        * Else, the possibly different tuple registered for this tuple (e.g.,
+          ignoring duplicate types in this tuple) with this singleton.
+
+    Raises
+    ----------
+    _BeartypeDecorBeartypistryException
+        If this tuple is invalid. See :func:`register_typistry_tuple` for
+        further details.
+    '''
+
+    # If this tuple only contains one type, return only this type.
+    if _is_typistry_tuple_singular(hint):
+        # If this object is *NOT* a type, raise an exception.
+        die_unless_class(hint[0])
+
+        # Return this type.
+        return hint[0]
+    # Else, this tuple either contains no types or two or more types.
+
+    # Return the tuple registered under the name uniquely identifying this
+    # tuple as a beartypistry key.
+    return bear_typistry[_register_typistry_tuple_name(hint, is_types_unique)]
+
+# ....................{ PRIVATE ~ tuple                   }....................
+def _is_typistry_tuple_singular(hint: tuple) -> bool:
+    '''
+    ``True`` only if the passed tuple to be registered with the beartypistry
+    singleton contains exactly one item *or* raise an exception if this object
+    is *not* a tuple.
+
+    Parameters
+    ----------
+    hint : tuple
+        Tuple to be inspected.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if this tuple contains exactly one item.
+
+    Raises
+    ----------
+    _BeartypeDecorBeartypistryException
+        If this object is *not* a tuple.
+    '''
 
     # If this object is *NOT* a tuple, raise an exception.
     if not isinstance(hint, tuple):
@@ -333,10 +430,43 @@ def register_typistry_tuple(
     # to the Beartypistry.__setitem__() method, implicitly invoked on
     # subsequently assigning a "bear_typistry" key-value pair.
 
-    # If this tuple only contains one type, register only this type.
-    if len(hint) == 1:
-        return register_typistry_type(hint[0])
-    # Else, this tuple either contains no types or two or more types.
+    # Return true only if this tuple contains exactly one item.
+    return len(hint) == 1
+
+
+@callable_cached
+def _register_typistry_tuple_name(hint: tuple, is_types_unique: bool) -> str:
+    '''
+    Register the passed tuple of zero, two, or more **PEP-noncompliant types**
+    (i.e., classes neither defined by the :mod:`typing` module *nor*
+    subclassing such classes) with the beartypistry singleton *and* return the
+    name uniquely identifying this tuple as a beartypistry key.
+
+    This function is memoized for both efficiency *and* safety, preventing
+    accidental reregistration by the higher-level
+    :func:`register_typistry_tuple` and :func:`get_typistry_tuple` functions
+    both registering the same tuple.
+
+    Parameters
+    ----------
+    hint : tuple
+        Tuple of all PEP-noncompliant types to be registered.
+    is_types_unique : bool
+        ``True`` only if the caller guarantees this tuple to contain *no*
+        duplicates.
+
+    Returns
+    ----------
+    str
+        Name uniquely identifying this tuple as a beartypistry key.
+
+    See Also
+    ----------
+    :func:`register_typistry_tuple`
+        Further details.
+    '''
+    assert isinstance(is_types_unique, bool), (
+        f'{repr(is_types_unique)} not bool.')
 
     # If the caller failed to guarantee this tuple to be duplicate-free...
     if not is_types_unique:
@@ -370,11 +500,8 @@ def register_typistry_tuple(
     # Register this tuple with the beartypistry singleton.
     bear_typistry[hint_name] = hint
 
-    # Return a Python expression evaluating to this tuple.
-    return (
-        f'{_CODE_TYPISTRY_HINT_NAME_TO_HINT_PREFIX}{repr(hint_name)}'
-        f'{_CODE_TYPISTRY_HINT_NAME_TO_HINT_SUFFIX}'
-    )
+    # Return this name.
+    return hint_name
 
 # ....................{ CLASSES                           }....................
 class Beartypistry(dict):
@@ -631,6 +758,172 @@ class Beartypistry(dict):
         #     self[hint_classname] = hint_class
         return hint_class
 
+# ....................{ CLASSES ~ forwardref              }....................
+class BeartypistryForwardRef(object):
+    '''
+    **Forward reference proxy** (i.e., object standing in for the user-defined
+    class referred to by a fully-qualified forward reference in ``isinstance``
+    and ``issubclass`` checks performed by wrapper functions generated by the
+    :func:`beartype.beartype` decorator until the first such check resolves
+    that class).
+
+    Each such wrapper accepts this proxy as the default value of a private
+    hint parameter. On the first check against this proxy, this proxy:
+
+    #. Resolves this class via the beartypistry singleton, dynamically
+       importing this class if needed.
+    #. If this proxy is bound to a wrapper (i.e., :meth:`bind` created this
+       proxy), **self-patches** that wrapper by replacing this proxy with this
+       class as the default value of this parameter.
+    #. Performs the same check against this class.
+
+    Since the default values of keyword-only parameters are looked up from the
+    ``__kwdefaults__`` dictionary on each call, all subsequent calls to that
+    wrapper access this class directly as a fast local variable. Ergo, wrappers
+    type-checking forward references (e.g., under :pep:`563` or between
+    mutually dependent modules) incur the same per-call cost as wrappers
+    type-checking the same classes directly -- rather than one beartypistry
+    dictionary lookup per check per call.
+
+    Attributes
+    ----------
+    hint_classname : str
+        Fully-qualified name of the class referred to by this forward
+        reference.
+    param_name : str
+        Name of the private hint parameter whose default value is this proxy,
+        shared by both this unbound proxy and all bound proxies created from
+        this proxy.
+    _func_wrapper : Optional[Callable]
+        Wrapper function to be self-patched on the first check against this
+        proxy if this proxy is bound *or* ``None`` otherwise.
+    '''
+
+    # ..................{ CLASS VARIABLES                   }..................
+    # Slot all instance variables defined on this object to minimize the time
+    # complexity of both reading and writing variables across frequently
+    # called @beartype decorations.
+    __slots__ = (
+        'hint_classname',
+        'param_name',
+        '_func_wrapper',
+    )
+
+    # ..................{ INITIALIZERS                      }..................
+    def __init__(
+        self,
+        hint_classname: str,
+        param_name: 'Optional[str]' = None,
+        func_wrapper: 'Optional[Callable]' = None,
+    ) -> None:
+        '''
+        Initialize this forward reference proxy.
+
+        Parameters
+        ----------
+        hint_classname : str
+            Fully-qualified name of the class referred to by this forward
+            reference.
+        param_name : Optional[str]
+            Name of the private hint parameter whose default value is this
+            proxy. Defaults to ``None``, in which case this name is uniquified
+            by the object ID of this proxy.
+        func_wrapper : Optional[Callable]
+            Wrapper function to be self-patched on the first check against
+            this proxy. Defaults to ``None``, in which case this proxy is
+            unbound and thus *never* self-patches.
+        '''
+
+        # Classify all passed parameters.
+        self.hint_classname = hint_classname
+        self.param_name = (
+            f'{PARAM_NAME_HINT_PREFIX}{id(self)}'
+            if param_name is None else
+            param_name
+        )
+        self._func_wrapper = func_wrapper
+
+
+    def bind(self, func_wrapper: 'Callable') -> 'BeartypistryForwardRef':
+        '''
+        New forward reference proxy self-patching the passed wrapper function
+        on the first check against that proxy.
+
+        Parameters
+        ----------
+        func_wrapper : Callable
+            Wrapper function accepting this proxy as the default value of the
+            keyword-only private hint parameter named :attr:`param_name`.
+
+        Returns
+        ----------
+        BeartypistryForwardRef
+            Bound forward reference proxy.
+        '''
+
+        return BeartypistryForwardRef(
+            hint_classname=self.hint_classname,
+            param_name=self.param_name,
+            func_wrapper=func_wrapper,
+        )
+
+    # ..................{ DUNDERS                           }..................
+    def __instancecheck__(self, obj: object) -> bool:
+        '''
+        ``True`` only if the passed object is an instance of the class referred
+        to by this forward reference.
+        '''
+
+        return isinstance(obj, self._resolve())
+
+
+    def __subclasscheck__(self, cls: type) -> bool:
+        '''
+        ``True`` only if the passed class is a subclass of the class referred
+        to by this forward reference.
+        '''
+
+        return issubclass(cls, self._resolve())
+
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({repr(self.hint_classname)})'
+
+    # ..................{ PRIVATE                           }..................
+    def _resolve(self) -> type:
+        '''
+        Class referred to by this forward reference, self-patching the wrapper
+        function this proxy is bound to (if any) with this class.
+
+        Raises
+        ----------
+        BeartypeCallHintForwardRefException
+            If this class is unresolvable.
+        '''
+
+        # Class referred to by this forward reference, dynamically imported on
+        # the first such access by the Beartypistry.__missing__() method.
+        hint_class = bear_typistry[self.hint_classname]
+
+        # Wrapper function bound to this proxy if any *OR* "None" otherwise.
+        func_wrapper = self._func_wrapper
+
+        # If this proxy is bound to a wrapper...
+        if func_wrapper is not None:
+            # Replace this proxy with this class as the default value of the
+            # private hint parameter accepted by this wrapper. Since this
+            # mutation of a single dictionary item is atomic, no locking is
+            # required; at worst, concurrent first calls redundantly resolve
+            # this class and perform the same mutation.
+            func_wrapper.__kwdefaults__[self.param_name] = hint_class
+
+            # Unbind this proxy, breaking the reference cycle between this
+            # proxy and this wrapper.
+            self._func_wrapper = None
+
+        # Return this class.
+        return hint_class
+
 # ....................{ SINGLETONS                        }....................
 bear_typistry = Beartypistry()
 '''
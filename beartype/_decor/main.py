@@ -16,30 +16,6 @@ This private submodule is *not* intended for importation by downstream callers.
 '''
 
 # ....................{ TODO                              }....................
-#FIXME: [FEATURE] Define the following supplementary decorators:
-#* @beartype.beartype_O1(), identical to the current @beartype.beartype()
-#  decorator but provided for disambiguity. This decorator only type-checks
-#  exactly one item from each container for each call rather than all items.
-#* @beartype.beartype_Ologn(), type-checking log(n) random items from each
-#  container of "n" items for each call.
-#* @beartype.beartype_On(), type-checking all items from each container for
-#  each call. We have various ideas littered about GitHub on how to optimize
-#  this for various conditions, but this is never going to be ideal and should
-#  thus never be the default.
-#
-#To differentiate between these three strategies, consider:
-#* Declare an enumeration in "beartype._decor._data" resembling:
-#    from enum import Enum
-#    BeartypeStrategyKind = Enum('BeartypeStrategyKind ('O1', 'Ologn', 'On',))
-#* Define a new "BeartypeData.strategy_kind" instance variable.
-#* Set this variable to the corresponding "BeartypeStrategyKind" enumeration
-#  member based on which of the three decorators listed above was called.
-#* Explicitly pass the value of the "BeartypeData.strategy_kind" instance
-#  variable to the beartype._decor._code._pep._pephint.pep_code_check_hint()
-#  function as a new memoized "strategy_kind" parameter.
-#* Conditionally generate type-checking code throughout that function depending
-#  on the value of that parameter.
-
 #FIXME: Ensure that *ALL* calls to memoized callables throughout the codebase
 #are called with purely positional rather than keyword arguments. Currently, we
 #suspect the inverse is the case. To do so, we'll probably want to augment the
@@ -127,21 +103,54 @@ This private submodule is *not* intended for importation by downstream callers.
 #* Remove the "_PARAM_KIND_IGNORABLE" set entirely.
 
 # ....................{ IMPORTS                           }....................
-import functools, random
+import builtins, functools, random
+from itertools import count
 from beartype.roar import (
     BeartypeDecorWrappeeException,
     BeartypeDecorWrapperException,
 )
 from beartype._decor._code.codemain import generate_code
 from beartype._decor._code.codesnip import (
-    PARAM_NAME_FUNC, PARAM_NAME_TYPISTRY)
-from beartype._decor._data import BeartypeData
-from beartype._decor._typistry import bear_typistry
+    ATTR_NAME_BUILTIN_PREFIX,
+    CODE_TRAMPOLINE,
+    FUNC_WRAPPER_NAME_CANONICAL,
+    PARAM_NAME_FUNC,
+    PARAM_NAME_INDEX_NEXT,
+    PARAM_NAME_TRAMPOLINE,
+    PARAM_NAME_TYPISTRY,
+)
+from beartype._decor._data import (
+    BeartypeData, BeartypeIndexKind, BeartypeStrategyKind)
+from beartype._decor._diskcache import (
+    get_cache_key,
+    load_cached_wrapper,
+    store_cached_wrapper,
+)
+from beartype._decor._memcache import (
+    get_memcached_wrapper,
+    store_memcached_wrapper,
+)
+from beartype._decor._typistry import (
+    BeartypistryForwardRef,
+    bear_typistry,
+)
 from beartype._util.cache.pool.utilcachepoolobjecttyped import (
     acquire_object_typed, release_object_typed)
 from beartype._decor._code._pep._error.peperror import (
     raise_pep_call_exception)
+from beartype._decor._code._pep._pephomogeneous import (
+    is_sequence_homogeneous)
+from beartype._decor._code._pep._pepsample import (
+    get_mapping_item,
+    get_mapping_items_log,
+    get_reiterable_item,
+    get_reiterable_items,
+    get_reiterable_items_log,
+    get_sequence_items_log,
+)
+from beartype._decor._code._pep._pepunion import freeze_union_dispatches
 from beartype._util.text.utiltextmunge import number_lines
+from beartype._util.utilobject import SENTINEL
 from typing import TYPE_CHECKING
 # from beartype._util.utilobject import get_object_name
 # from types import FunctionType
@@ -151,8 +160,16 @@ __all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
 
 # ....................{ CONSTANTS                         }....................
 _GLOBAL_ATTRS = {
+    '__beartype_get_mapping_item': get_mapping_item,
+    '__beartype_get_mapping_items_log': get_mapping_items_log,
+    '__beartype_get_reiterable_item': get_reiterable_item,
+    '__beartype_get_reiterable_items': get_reiterable_items,
+    '__beartype_get_reiterable_items_log': get_reiterable_items_log,
+    '__beartype_get_sequence_items_log': get_sequence_items_log,
     '__beartype_getrandbits': random.getrandbits,
+    '__beartype_is_sequence_homogeneous': is_sequence_homogeneous,
     '__beartype_raise_pep_call_exception': raise_pep_call_exception,
+    '__beartype_sentinel': SENTINEL,
 }
 '''
 Dictionary mapping from the name to value of all attributes internally
@@ -166,16 +183,74 @@ constants declared by one or more snippet submodules (e.g.,
 arbitrary caller-defined parameters, these names *must* be aliased under
 alternate names prefixed by ``__beartype_``.
 
+This dictionary also maps from the private alias of each builtin type to that
+type (e.g., from ``__beartype_builtin_int`` to :class:`int`), enabling these
+functions to type-check builtin types *without* accessing these types by
+their unqualified names shadowable by caller-defined parameters.
+
 Caveats
 ----------
 **Attributes frequently accessed in the body of these functions should instead
 be externally passed as default parameters into these functions.** This
-includes the frequently accessed ``__beartypistry`` local, which is thus passed
-as a private default parameter to the signatures of these functions.
+includes the frequently accessed ``__beartypistry`` local and builtins listed
+by :data:`beartype._decor._code.codesnip.BUILTIN_NAMES_PARAM`, which are thus
+passed as private default parameters to the signatures of these functions.
+
+See Also
+----------
+:data:`beartype._decor._code.codesnip.ATTR_NAME_BUILTIN_PREFIX`
+    Further details.
+'''
+_GLOBAL_ATTRS.update(
+    (f'{ATTR_NAME_BUILTIN_PREFIX}{builtin_type.__name__}', builtin_type)
+    for builtin_type in vars(builtins).values()
+    if isinstance(builtin_type, type)
+)
+
+
+_FUNC_CODE_COMPILED_CACHE_SIZE = 1024
+'''
+Maximum number of code objects of modules defining wrapper functions cached by
+the :func:`_compile_func_code` function, bounding the memory consumed by that
+cache for long-lived processes decorating arbitrarily many callables.
+'''
+
+
+_INDEX_ROUND_ROBIN_STRIDE = 2654435761
+'''
+**Round-robin index stride** (i.e., prime by which the counter passed to each
+wrapper function generated under the
+:attr:`beartype._decor._data.BeartypeIndexKind.ROUND_ROBIN` container index
+source is incremented on each call to that wrapper).
+
+This prime is Knuth's multiplicative hashing constant (i.e., a prime near
+``2**32`` divided by the golden ratio). Since this stride is prime, this stride
+is coprime to the length ``n`` of every container smaller than this stride,
+guaranteeing that ``n`` successive calls passed such a container select ``n``
+distinct indices of that container. Since the fractional part of this stride
+divided by ``2**32`` approximates that of the golden ratio, consecutive indices
+are also well-dispersed across that container rather than adjacent.
+'''
+
+
+_FUNC_TRAMPOLINE_CODE = compile(CODE_TRAMPOLINE, '<string>', 'exec')
+'''
+Code object of the module defining the trampoline function returned by the
+:func:`beartype` decorator in lazy mode, compiled exactly once at importation
+time to reduce each lazy decoration to the mere execution of a single
+``MAKE_FUNCTION`` instruction.
 '''
 
 # ....................{ DECORATORS                        }....................
-def beartype(func):
+def beartype(
+    func=None,
+    *,
+    lazy=False,
+    strategy_kind=BeartypeStrategyKind.O1,
+    index_kind=BeartypeIndexKind.RANDOM,
+    is_types_cached=False,
+    is_union_adaptive=False,
+):
     '''
     Decorate the passed **callable** (e.g., function, method) to validate both
     all annotated parameters passed to this callable *and* the annotated value
@@ -193,12 +268,91 @@ def beartype(func):
     option ``-O`` passed to this interpreter), this decorator reduces to a
     noop.
 
+    If the optional ``lazy`` parameter is ``True``, this decorator instead
+    returns a lightweight **trampoline** deferring all decoration-time work
+    (e.g., signature inspection, `PEP 563`_ resolution, code generation) to the
+    first call of that trampoline, at which time that trampoline generates the
+    wrapper type-checking this callable and replaces its own code with that of
+    that wrapper. Since many decorated callables are never called (e.g., in
+    short-lived command-line applications), this reduces importation time to
+    scale with the number of callables actually called rather than defined.
+    Note that exceptions otherwise raised at decoration time (e.g., due to
+    unsupported type hints) are then raised on each call of that trampoline
+    instead.
+
+    By default, this decorator type-checks only a single pseudo-random item of
+    each container passed to or returned from this callable on each call,
+    guaranteeing ``O(1)`` type-checking regardless of container size. The
+    optional ``strategy_kind`` parameter (typically passed implicitly by the
+    :func:`beartype_O1`, :func:`beartype_Ologn`, and :func:`beartype_On`
+    decorators) selects another container type-checking strategy instead.
+
+    By default, these items are selected by a pseudo-random integer generated
+    on each call. The optional ``index_kind`` parameter selects another
+    container index source instead: e.g.,
+
+    .. code-block:: python
+
+       @beartype(index_kind=BeartypeIndexKind.ROUND_ROBIN)
+       def muh_func(muh_param: List[int]) -> int: ...
+
+    Under :attr:`BeartypeIndexKind.ROUND_ROBIN`, these items are instead
+    selected by a counter private to the returned wrapper stepping through
+    indices with a large prime stride, guaranteeing that ``n`` successive calls
+    passed a container of fixed length ``n`` type-check every item of that
+    container in a reproducible order.
+
+    If the optional ``is_types_cached`` parameter is ``True``, the returned
+    wrapper additionally caches the type of the last object passed as each
+    parameter (or returned) to have satisfied a **type-determined hint** (i.e.,
+    hint whose satisfaction depends only on the type of that object, including
+    classes, unions of classes, and unsubscripted :mod:`typing` attributes),
+    reducing type-checking of each subsequent object of that exact type to a
+    single identity test. This inline cache substantially accelerates hints
+    type-checked by comparatively slow ``__instancecheck__`` dunder methods
+    (e.g., abstract base classes, wide unions).
+
+    If the optional ``is_union_adaptive`` parameter is ``True``, the returned
+    wrapper additionally counts which child hint of each union dispatched on
+    the exact type of the passed object (i.e., union subscripted by two or
+    more container hints like ``Union[List[int], Sequence[str]]``) is
+    satisfied by objects whose type could satisfy several such hints. After a
+    warm-up of prior calls, that wrapper tests the child hint most frequently
+    satisfied by objects of that type first. Call the
+    :func:`beartype_freeze_unions` function to freeze the learned order.
+
     Parameters
     ----------
-    func : CallableTypes
+    func : Optional[CallableTypes]
         **Non-class callable** (i.e., callable object that is *not* a class) to
         be decorated by a dynamically generated new callable wrapping this
-        original callable with pure-Python type-checking.
+        original callable with pure-Python type-checking. Defaults to ``None``,
+        in which case this decorator returns a new decorator configured by the
+        passed keyword parameters: e.g.,
+
+        .. code-block:: python
+
+           @beartype(lazy=True)
+           def muh_func(muh_param: int) -> str: ...
+    lazy : bool
+        ``True`` only if decoration is to be deferred until the first call of
+        this callable. Defaults to ``False``.
+    strategy_kind : BeartypeStrategyKind
+        **Container type-checking strategy** (i.e., member of the
+        :class:`BeartypeStrategyKind` enumeration governing how many items of
+        each container are type-checked on each call). Defaults to
+        :attr:`BeartypeStrategyKind.O1`.
+    index_kind : BeartypeIndexKind
+        **Container index source** (i.e., member of the
+        :class:`BeartypeIndexKind` enumeration governing which items of each
+        container are type-checked on each call). Defaults to
+        :attr:`BeartypeIndexKind.RANDOM`.
+    is_types_cached : bool
+        ``True`` only if the returned wrapper is to cache the types of objects
+        satisfying type-determined hints. Defaults to ``False``.
+    is_union_adaptive : bool
+        ``True`` only if the returned wrapper is to adaptively reorder the
+        child hints of unions by observed frequency. Defaults to ``False``.
 
     Returns
     ----------
@@ -241,6 +395,20 @@ def beartype(func):
        https://www.python.org/dev/peps/pep-0563
     '''
 
+    # If no callable was passed, this decorator was called with only keyword
+    # parameters (e.g., "@beartype(lazy=True)"). In this case, return a new
+    # decorator configured by these parameters.
+    if func is None:
+        return functools.partial(
+            beartype,
+            lazy=lazy,
+            strategy_kind=strategy_kind,
+            index_kind=index_kind,
+            is_types_cached=is_types_cached,
+            is_union_adaptive=is_union_adaptive,
+        )
+    # Else, a callable was passed.
+
     # Validate the type of the decorated object *BEFORE* performing any work
     # assuming this object to define attributes (e.g., "func.__name__").
     #
@@ -269,6 +437,16 @@ def beartype(func):
         # Efficiently reduce to a noop (i.e., the identity decorator) by
         # returning this callable as is.
         return func
+    # Else if deferring decoration until the first call of this callable,
+    # return a trampoline doing so.
+    elif lazy:
+        return _define_func_trampoline(
+            func,
+            strategy_kind,
+            index_kind,
+            is_types_cached,
+            is_union_adaptive,
+        )
 
     #FIXME: Optimize by caching and reusing previously cached "BeartypeData"
     #instances across @beartype decorations. To do so:
@@ -285,9 +463,81 @@ def beartype(func):
     #  func_data = utilcachepoolobj.acquire_object(BeartypeData)
     #  func_data.init(func)
 
+    # Metadata describing the wrapper previously generated for another
+    # callable sharing the same code object and annotations as this callable
+    # (e.g., another closure created by the same factory) if any *OR* "None".
+    func_wrapper_cached = get_memcached_wrapper(
+        func, strategy_kind, index_kind, is_types_cached, is_union_adaptive)
+
+    # Cache key uniquely identifying the wrapper to be generated for this
+    # callable if the on-disk wrapper cache is enabled *AND* this callable is
+    # cacheable *OR* "None" otherwise.
+    cache_key = None
+
+    # Tuple of all "(pith_name, hint)" annotations on this callable *BEFORE*
+    # decorating this callable, which replaces these annotations in-place
+    # (e.g., by resolving PEP 563-postponed annotations). Since subsequently
+    # decorated callables sharing the same code object are compared against
+    # these original annotations, the in-memory wrapper cache *MUST* cache
+    # these original rather than replaced annotations.
+    func_hints = None
+
+    # If no such wrapper was cached in memory...
+    if func_wrapper_cached is None:
+        func_hints = tuple(func.__annotations__.items())
+        cache_key = get_cache_key(
+            func,
+            strategy_kind,
+            index_kind,
+            is_types_cached,
+            is_union_adaptive,
+        )
+
+        # If this callable is cacheable on disk, attempt to load the metadata
+        # describing the wrapper previously cached for this callable by a
+        # prior run of the active Python interpreter.
+        if cache_key is not None:
+            func_wrapper_cached = load_cached_wrapper(func, cache_key)
+
+            # If this wrapper was cached on disk, also cache this wrapper in
+            # memory.
+            if func_wrapper_cached is not None:
+                store_memcached_wrapper(
+                    func,
+                    func_hints,
+                    strategy_kind,
+                    index_kind,
+                    is_types_cached,
+                    is_union_adaptive,
+                    *func_wrapper_cached
+                )
+
+    # If this wrapper was cached, skip all decoration-time inspection, code
+    # generation, and compilation by defining this wrapper directly from this
+    # cached code object.
+    if func_wrapper_cached is not None:
+        func_wrapper_name, func_code_compiled, func_wrapper_locals = (
+            func_wrapper_cached)
+
+        # If this wrapper was cached as a noop, reduce to a noop.
+        if func_code_compiled is None:
+            return func
+        # Else, this wrapper type-checks this callable.
+
+        # Define and return this wrapper.
+        return _define_func_wrapper(
+            func=func,
+            func_wrapper_name=func_wrapper_name,
+            func_code_compiled=func_code_compiled,
+            func_wrapper_locals=func_wrapper_locals,
+            index_kind=index_kind,
+        )
+    # Else, this wrapper has yet to be cached.
+
     # Previously cached callable metadata reinitialized from this callable.
     func_data = acquire_object_typed(BeartypeData)
-    func_data.reinit(func)
+    func_data.reinit(
+        func, strategy_kind, index_kind, is_types_cached, is_union_adaptive)
 
     # Generate the raw string of Python statements implementing this wrapper.
     func_code, is_func_code_noop = generate_code(func_data)
@@ -296,26 +546,28 @@ def beartype(func):
     # efficiently reduce to a noop (i.e., the identity decorator) by returning
     # this callable as is.
     if is_func_code_noop:
-        return func
+        # Cache this wrapper as a noop.
+        store_memcached_wrapper(
+            func=func,
+            func_hints=func_hints,
+            strategy_kind=strategy_kind,
+            index_kind=index_kind,
+            is_types_cached=is_types_cached,
+            is_union_adaptive=is_union_adaptive,
+            func_wrapper_name=func_data.func_wrapper_name,
+            func_code_compiled=None,
+            func_wrapper_locals={},
+        )
+        if cache_key is not None:
+            store_cached_wrapper(
+                cache_key=cache_key,
+                func_hints=func.__annotations__,
+                func_wrapper_name=func_data.func_wrapper_name,
+                func_code_compiled=None,
+                func_wrapper_locals={},
+            )
 
-    # Dictionary mapping from local attribute names to values passed to the
-    # module-scoped outermost definition (but *NOT* the actual body) of this
-    # wrapper. Note that:
-    #
-    # * For efficiency, only attributes specific to the body of this wrapper
-    #   are copied from the current namespace. Attributes generically
-    #   applicable to the body of all wrappers are instead implicitly imported
-    #   from this submodule by passing "_GLOBAL_ATTRS" below.
-    # * For each attribute specified here, one new keyword parameter of the
-    #   form "{local_attr_key_name}={local_attr_key_name}" *MUST* be added to
-    #   the signature for this wrapper defined by the "CODE_SIGNATURE" string.
-    #
-    # For the above reasons, the *ONLY* attribute that should be passed is the
-    # wrapper-specific "__beartype_func" attribute.
-    local_attrs = {
-        PARAM_NAME_FUNC: func,
-        PARAM_NAME_TYPISTRY: bear_typistry,
-    }
+        return func
 
     # Fully-qualified name of this undecorated callable to be decorated.
     # func_name_qualified = get_object_name(func)
@@ -381,41 +633,19 @@ def beartype(func):
     #Indeed, see the _make() function of the "makefun.main" submodule:
     #    https://github.com/smarie/python-makefun/blob/master/makefun/main.py
 
-    # Attempt to define this wrapper as a closure of this decorator. For
-    # obscure and presumably uninteresting reasons, Python fails to locally
-    # declare this closure when the locals() dictionary is passed; to capture
-    # this closure, a local dictionary must be passed instead.
-    #
-    # Note that the same result may also be achieved via the compile() builtin
-    # and "types.FunctionType" class: e.g.,
-    #
-    #     func_code_compiled = compile(
-    #         func_code, "<string>", "exec").co_consts[0]
-    #     return types.FunctionType(
-    #         code=func_code_compiled,
-    #         globals=_GLOBAL_ATTRS,
-    #         argdefs=('__beartype_func', func)
-    #     )
-    #
-    # Since doing so is both more verbose and obfuscatory for no tangible gain,
-    # the current circumspect approach is preferred.
+    # Attempt to compile this code into the code object of a module whose
+    # execution defines this wrapper *AND* define this wrapper.
     try:
         # print('\n@beartyped {} wrapper:\n\n{}\n'.format(func_data.func_name, func_code))
         # print('\n@beartyped {} wrapper:\n\n{}\n'.format(func_data.func_name, number_lines(func_code)))
-        exec(func_code, _GLOBAL_ATTRS, local_attrs)
-
-        #FIXME: See above.
-        #FIXME: Should "exec" be "single" instead? Does it matter? Is there any
-        #performance gap between the two?
-        # func_code_compiled = compile(
-        #     func_code, func_wrapper_filename, "exec").co_consts[0]
-        # return FunctionType(
-        #     code=func_code_compiled,
-        #     globals=_GLOBAL_ATTRS,
-        #
-        #     #FIXME: This really doesn't seem right, but... *shrug*
-        #     argdefs=tuple(local_attrs.values()),
-        # )
+        func_code_compiled = _compile_func_code(func_code)
+        func_wrapper = _define_func_wrapper(
+            func=func,
+            func_wrapper_name=func_data.func_wrapper_name,
+            func_code_compiled=func_code_compiled,
+            func_wrapper_locals=func_data.func_wrapper_locals,
+            index_kind=index_kind,
+        )
     # If doing so fails for any reason, raise an exception suffixed by
     # debuggable wrapper code such that each line of this code is prefixed by
     # that line's number, rendering "SyntaxError" exceptions referencing
@@ -430,19 +660,227 @@ def beartype(func):
             f'{number_lines(func_code)}'
         ) from exception
 
+    # Cache this wrapper.
+    store_memcached_wrapper(
+        func=func,
+        func_hints=func_hints,
+        strategy_kind=strategy_kind,
+        index_kind=index_kind,
+        is_types_cached=is_types_cached,
+        is_union_adaptive=is_union_adaptive,
+        func_wrapper_name=func_data.func_wrapper_name,
+        func_code_compiled=func_code_compiled,
+        func_wrapper_locals=func_data.func_wrapper_locals,
+    )
+    if cache_key is not None:
+        store_cached_wrapper(
+            cache_key=cache_key,
+            func_hints=func.__annotations__,
+            func_wrapper_name=func_data.func_wrapper_name,
+            func_code_compiled=func_code_compiled,
+            func_wrapper_locals=func_data.func_wrapper_locals,
+        )
+
+    # Release this callable metadata back to its object pool.
+    release_object_typed(func_data)
+
+    # Return this wrapper.
+    return func_wrapper
+
+# ....................{ DECORATORS ~ strategy             }....................
+def beartype_O1(func=None, **kwargs):
+    '''
+    Decorate the passed callable with ``O(1)`` container type-checking (i.e.,
+    type-checking exactly one pseudo-random item of each container passed to
+    or returned from this callable on each call).
+
+    This decorator is identical to the default :func:`beartype` decorator but
+    provided for disambiguity. All remaining keyword parameters (e.g.,
+    ``lazy``) are passed as is to that decorator. See that decorator for
+    further details.
+    '''
+
+    return beartype(func, strategy_kind=BeartypeStrategyKind.O1, **kwargs)
+
+
+def beartype_Ologn(func=None, **kwargs):
+    '''
+    Decorate the passed callable with ``O(lgn)`` container type-checking
+    (i.e., type-checking ``ceil(log2(n + 1))`` items at distinct pseudo-random
+    indices of each container of ``n`` items passed to or returned from this
+    callable on each call).
+
+    This decorator strikes a balance between the :func:`beartype_O1` and
+    :func:`beartype_On` decorators, detecting sparse invalid items
+    substantially more reliably than the former at a fraction of the cost of
+    the latter for large containers. All remaining keyword parameters (e.g.,
+    ``lazy``) are passed as is to the :func:`beartype` decorator. See that
+    decorator for further details.
+    '''
+
+    return beartype(func, strategy_kind=BeartypeStrategyKind.Ologn, **kwargs)
+
+
+def beartype_On(func=None, **kwargs):
+    '''
+    Decorate the passed callable with ``O(n)`` container type-checking (i.e.,
+    type-checking *all* items of each container passed to or returned from
+    this callable on each call, short-circuiting on the first invalid item).
+
+    Since the cost of each call of the returned wrapper then scales with the
+    size of these containers, this decorator should *only* be applied to
+    callables whose containers are known to be small *or* whose callers
+    require exhaustive validation. All remaining keyword parameters (e.g.,
+    ``lazy``) are passed as is to the :func:`beartype` decorator. See that
+    decorator for further details.
+    '''
+
+    return beartype(func, strategy_kind=BeartypeStrategyKind.On, **kwargs)
+
+# ....................{ FREEZERS                          }....................
+def beartype_freeze_unions() -> None:
+    '''
+    Freeze the order in which all wrappers previously generated by the
+    :func:`beartype` decorator passed ``is_union_adaptive=True`` type-check
+    the child hints of unions, preserving the child hints these wrappers have
+    learned to test first *and* ceasing to record further fallbacks.
+
+    Call this function after a representative warm-up (e.g., after application
+    startup or a load test) to render subsequent type-checking reproducible
+    and free of all recording overhead. Wrappers subsequently generated for
+    unions *not* previously type-checked are *not* frozen.
+    '''
+
+    freeze_union_dispatches()
+
+# ....................{ PRIVATE ~ definers                }....................
+def _define_func_wrapper(
+    func: 'Callable',
+    func_wrapper_name: str,
+    func_code_compiled: 'CodeType',
+    func_wrapper_locals: dict,
+    index_kind: BeartypeIndexKind,
+) -> 'Callable':
+    '''
+    Define and return the wrapper function type-checking the passed callable
+    by executing the passed code object of a module defining that wrapper.
+
+    Parameters
+    ----------
+    func : Callable
+        Decorated callable to be wrapped.
+    func_wrapper_name : str
+        Name of this wrapper as declared by this code object.
+    func_code_compiled : CodeType
+        Code object of the module defining this wrapper, either freshly
+        compiled from generated code *or* loaded from the on-disk wrapper
+        cache.
+    func_wrapper_locals : dict
+        Dictionary mapping from the name of each private parameter
+        conditionally accepted by this wrapper to the default value of that
+        parameter.
+    index_kind : BeartypeIndexKind
+        Container index source this wrapper was generated under.
+
+    Returns
+    ----------
+    Callable
+        This wrapper.
+    '''
+
+    # Dictionary mapping from local attribute names to values passed to the
+    # module-scoped outermost definition (but *NOT* the actual body) of this
+    # wrapper. Note that:
+    #
+    # * For efficiency, only attributes specific to the body of this wrapper
+    #   are copied from the current namespace. Attributes generically
+    #   applicable to the body of all wrappers are instead implicitly imported
+    #   from this submodule by passing "_GLOBAL_ATTRS" below.
+    # * For each attribute specified here, one new keyword parameter of the
+    #   form "{local_attr_key_name}={local_attr_key_name}" *MUST* be added to
+    #   the signature for this wrapper defined by the "CODE_SIGNATURE" string.
+    #
+    # For the above reasons, the *ONLY* attributes that should be passed are
+    # the wrapper-specific "__beartype_func" attribute and private parameters
+    # conditionally required by this wrapper (e.g., "__beartype_hint_*" types
+    # and tuples of types type-checked by this wrapper).
+    local_attrs = {
+        PARAM_NAME_FUNC: func,
+        PARAM_NAME_TYPISTRY: bear_typistry,
+    }
+    local_attrs.update(func_wrapper_locals)
+
+    # If this wrapper selects container items in a round-robin manner, pass
+    # this wrapper a new counter private to this wrapper. Since the private
+    # parameters recorded by the "func_wrapper_locals" dictionary are shared
+    # between all wrappers defined from the same cached code object, this
+    # counter is intentionally created here rather than recorded there.
+    if index_kind is BeartypeIndexKind.ROUND_ROBIN:
+        local_attrs[PARAM_NAME_INDEX_NEXT] = count(
+            0, _INDEX_ROUND_ROBIN_STRIDE).__next__
+
+    # Define this wrapper as a closure of this decorator. For obscure and
+    # presumably uninteresting reasons, Python fails to locally declare this
+    # closure when the locals() dictionary is passed; to capture this closure,
+    # a local dictionary must be passed instead.
+    #
+    # Note that this code object is that of the module defining this wrapper
+    # rather than that of this wrapper itself, enabling the default values of
+    # all parameters accepted by this wrapper to be evaluated by Python rather
+    # than manually passed as the "argdefs" of a "types.FunctionType" call.
+    exec(func_code_compiled, _GLOBAL_ATTRS, local_attrs)
+
     # This wrapper.
     #
     # Note that, as the above logic successfully compiled this wrapper, this
-    # dictionary is guaranteed to contain a key with this wrapper's name whose
-    # value is this wrapper. Ergo, no additional validation of the existence of
-    # this key or type of this wrapper is needed.
-    func_wrapper = local_attrs[func_data.func_wrapper_name]
+    # dictionary is guaranteed to contain a key with this wrapper's name as
+    # declared by this code object whose value is this wrapper. Ergo, no
+    # additional validation of the existence of this key or type of this
+    # wrapper is needed.
+    func_wrapper = local_attrs[
+        FUNC_WRAPPER_NAME_CANONICAL or func_wrapper_name]
+
+    # If this code object declares this wrapper under the canonical wrapper
+    # name shared by all wrappers, rename this wrapper to its actual name.
+    # Since this only shallowly copies the code object of this wrapper, all
+    # wrappers defined from this code object continue to share the same
+    # bytecode, constants, and names. Renaming this code object ensures
+    # exceptions raised by the active Python interpreter on passing invalid
+    # parameters to this wrapper (e.g., "TypeError: muh_func() got an
+    # unexpected keyword argument 'muh_arg'") refer to the decorated callable.
+    if FUNC_WRAPPER_NAME_CANONICAL:
+        func_wrapper_code = func_wrapper.__code__
+
+        # If this code object declares a fully-qualified name (i.e., under
+        # Python >= 3.11), also rename this code object to the fully-qualified
+        # name of the decorated callable. Since these interpreters embed this
+        # name rather than the unqualified name in these exceptions *AND* in
+        # tracebacks, failing to do so would expose the canonical wrapper name.
+        if hasattr(func_wrapper_code, 'co_qualname'):
+            func_wrapper.__code__ = func_wrapper_code.replace(
+                co_name=func_wrapper_name, co_qualname=func.__qualname__)
+        # Else, this code object only declares an unqualified name.
+        else:
+            func_wrapper.__code__ = func_wrapper_code.replace(
+                co_name=func_wrapper_name)
 
     # Declare this wrapper to be generated by @beartype, which tests for the
     # existence of this attribute above to avoid re-decorating callables
     # already decorated by @beartype by efficiently reducing to a noop.
     func_wrapper.__beartype_wrapper = True
 
+    # For each private hint parameter accepted by this wrapper...
+    for hint_param_name, hint in func_wrapper_locals.items():
+        # If the default value of this parameter is a forward reference proxy,
+        # replace this proxy with a new proxy bound to this wrapper. Since
+        # unbound proxies are memoized and thus shared across all wrappers
+        # type-checking the same forward reference, doing so enables the first
+        # call to this wrapper resolving this reference to self-patch this
+        # wrapper by replacing this bound proxy with the referred class.
+        if hint.__class__ is BeartypistryForwardRef:
+            func_wrapper.__kwdefaults__[hint_param_name] = hint.bind(
+                func_wrapper)
+
     # Propagate identifying metadata (stored as special attributes) from the
     # original function to this wrapper for debuggability, including:
     #
@@ -451,12 +889,183 @@ def beartype(func):
     # * "__module__", the fully-qualified name of this function's module.
     functools.update_wrapper(wrapper=func_wrapper, wrapped=func)
 
-    # Release this callable metadata back to its object pool.
-    release_object_typed(func_data)
-
     # Return this wrapper.
     return func_wrapper
 
+# ....................{ PRIVATE ~ compilers               }....................
+@functools.lru_cache(maxsize=_FUNC_CODE_COMPILED_CACHE_SIZE)
+def _compile_func_code(func_code: str) -> 'CodeType':
+    '''
+    Code object of the module defining the wrapper function implemented by the
+    passed Python code.
+
+    This function is memoized into a bounded least recently used (LRU) cache
+    keyed by this code. Since the code generated for decorated callables with
+    the same signatures and type hints is byte-identical (including the name of
+    this wrapper, canonicalized to
+    :data:`beartype._decor._code.codesnip.FUNC_WRAPPER_NAME_CANONICAL`), this
+    function compiles that code exactly once into a code object shared by all
+    of these callables. Each subsequent decoration of such a callable then
+    merely defines a new wrapper from this code object *without* recompiling
+    that code.
+
+    Parameters
+    ----------
+    func_code : str
+        Python code declaring this wrapper.
+
+    Returns
+    ----------
+    CodeType
+        Code object of the module declaring this wrapper.
+
+    Raises
+    ----------
+    SyntaxError
+        If this code is syntactically invalid.
+    '''
+
+    return compile(func_code, '<string>', 'exec')
+
+# ....................{ PRIVATE ~ trampolines             }....................
+def _define_func_trampoline(
+    func: 'Callable',
+    strategy_kind: BeartypeStrategyKind,
+    index_kind: BeartypeIndexKind,
+    is_types_cached: bool,
+    is_union_adaptive: bool,
+) -> 'Callable':
+    '''
+    Define and return the trampoline function deferring the generation of the
+    wrapper function type-checking the passed callable until the first call of
+    that trampoline.
+
+    Parameters
+    ----------
+    func : Callable
+        Decorated callable to be wrapped.
+    strategy_kind : BeartypeStrategyKind
+        Container type-checking strategy to subsequently decorate this
+        callable under.
+    index_kind : BeartypeIndexKind
+        Container index source to subsequently decorate this callable under.
+    is_types_cached : bool
+        ``True`` only if subsequently decorating this callable to cache the
+        types of objects satisfying type-determined hints.
+    is_union_adaptive : bool
+        ``True`` only if subsequently decorating this callable to adaptively
+        reorder the child hints of unions.
+
+    Returns
+    ----------
+    Callable
+        This trampoline.
+
+    See Also
+    ----------
+    :data:`beartype._decor._code.codesnip.CODE_TRAMPOLINE`
+        Further details.
+    '''
+
+    # Define this trampoline by executing the precompiled code object of the
+    # module defining this trampoline.
+    local_attrs = {PARAM_NAME_FUNC: func}
+    exec(_FUNC_TRAMPOLINE_CODE, _GLOBAL_ATTRS, local_attrs)
+    func_trampoline = local_attrs[PARAM_NAME_TRAMPOLINE]
+
+    # Mark this trampoline as unresolved by passing this trampoline to itself.
+    func_trampoline.__kwdefaults__[PARAM_NAME_TRAMPOLINE] = func_trampoline
+
+    # Declare this trampoline to be generated by @beartype, avoiding
+    # re-decorating this trampoline.
+    func_trampoline.__beartype_wrapper = True
+
+    # Propagate identifying metadata from the original function to this
+    # trampoline for debuggability.
+    functools.update_wrapper(wrapper=func_trampoline, wrapped=func)
+
+    # Record all options to subsequently decorate this callable under on the
+    # first call of this trampoline.
+    func_trampoline.__beartype_strategy_kind = strategy_kind
+    func_trampoline.__beartype_index_kind = index_kind
+    func_trampoline.__beartype_is_types_cached = is_types_cached
+    func_trampoline.__beartype_is_union_adaptive = is_union_adaptive
+
+    # Return this trampoline.
+    return func_trampoline
+
+
+def _resolve_func_trampoline(
+    func: 'Callable', func_trampoline: 'Callable') -> 'Callable':
+    '''
+    Resolve the passed trampoline function by generating the wrapper function
+    type-checking the passed callable *and* replacing the code object and
+    default values of this trampoline with those of this wrapper.
+
+    This function is called by each unresolved trampoline on its first call.
+
+    Parameters
+    ----------
+    func : Callable
+        Decorated callable wrapped by this trampoline.
+    func_trampoline : Callable
+        Trampoline to be resolved.
+
+    Returns
+    ----------
+    Callable
+        Callable to be called in lieu of this trampoline by this first call:
+        either this resolved trampoline if this callable requires
+        type-checking *or* this callable otherwise.
+    '''
+
+    # Wrapper type-checking this callable if this callable requires
+    # type-checking *OR* this callable as is otherwise.
+    func_wrapper = beartype(
+        func,
+        strategy_kind=func_trampoline.__beartype_strategy_kind,
+        index_kind=func_trampoline.__beartype_index_kind,
+        is_types_cached=func_trampoline.__beartype_is_types_cached,
+        is_union_adaptive=func_trampoline.__beartype_is_union_adaptive,
+    )
+
+    # If this callable requires no type-checking, mark this trampoline as
+    # resolved, reducing all subsequent calls to calling this callable as is.
+    if func_wrapper is func:
+        func_trampoline.__kwdefaults__[PARAM_NAME_TRAMPOLINE] = None
+        return func
+    # Else, this callable requires type-checking.
+
+    # Dictionary mapping from the name to default value of each keyword-only
+    # parameter accepted by this wrapper.
+    func_wrapper_kwdefaults = func_wrapper.__kwdefaults__
+
+    # Preserve this trampoline as unresolved in this dictionary. Since the
+    # following assignments are *NOT* collectively atomic, this ensures that
+    # concurrent calls to this trampoline between the assignment of this
+    # dictionary and its code object safely re-resolve this trampoline.
+    func_wrapper_kwdefaults[PARAM_NAME_TRAMPOLINE] = func_trampoline
+
+    # Replace the default values and code object of this trampoline with those
+    # of this wrapper. Since this wrapper and this trampoline share the same
+    # globals and neither is a closure, this trampoline is now semantically
+    # identical to this wrapper. Note that:
+    # * The code object is intentionally replaced last, ensuring that the
+    #   current code object is valid for all prior default values.
+    # * This dictionary is shared rather than copied, ensuring that forward
+    #   reference proxies bound to this wrapper self-patch this trampoline.
+    func_trampoline.__defaults__ = func_wrapper.__defaults__
+    func_trampoline.__kwdefaults__ = func_wrapper_kwdefaults
+    func_trampoline.__code__ = func_wrapper.__code__
+
+    # Return this resolved trampoline.
+    return func_trampoline
+
+
+# Register this resolver as a global attribute accessible to trampolines,
+# which this dictionary could *NOT* have been initialized with above.
+_GLOBAL_ATTRS['__beartype_resolve_trampoline'] = _resolve_func_trampoline
+
 # ....................{ OPTIMIZATION                      }....................
 # If the active Python interpreter is either...
 if (
@@ -482,7 +1091,15 @@ if (
 #         return
 #
 # Tragically, Python fails to support module-scoped "return" statements. *sigh*
-    def beartype(func):
+    def beartype(
+        func=None,
+        *,
+        lazy=False,
+        strategy_kind=BeartypeStrategyKind.O1,
+        index_kind=BeartypeIndexKind.RANDOM,
+        is_types_cached=False,
+        is_union_adaptive=False,
+    ):
         '''
         Identity decorator.
 
@@ -491,4 +1108,4 @@ if (
         interpreter at execution time).
         '''
 
-        return func
+        return beartype if func is None else func
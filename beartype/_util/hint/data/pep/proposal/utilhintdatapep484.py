@@ -216,11 +216,28 @@ def add_data(data_module: 'ModuleType') -> None:
         HINT_PEP484_BASE_FORWARDREF,
     ))
     data_module.HINT_PEP_SIGNS_SUPPORTED_DEEP.update((
+        AbstractSet,
+        ChainMap,
+        Collection,
+        Counter,
+        DefaultDict,
+        Dict,
+        FrozenSet,
         Generic,
+        ItemsView,
+        Iterable,
+        KeysView,
         List,
+        Mapping,
+        MutableMapping,
+        typing.OrderedDict,
         MutableSequence,
+        MutableSet,
         Sequence,
+        Set,
         Tuple,
+        Type,
+        ValuesView,
 
         # Note that "typing.Union" implicitly subsumes "typing.Optional" *ONLY*
         # under Python <= 3.9. The implementations of the "typing" module under
@@ -334,11 +351,34 @@ def add_data(data_module: 'ModuleType') -> None:
             HINT_PEP484_SIGNS_TYPE_ORIGIN)
 
     # ..................{ SETS ~ signs : subtype            }..................
+    data_module.HINT_PEP_SIGNS_MAPPING.update((
+        ChainMap,
+        Counter,
+        DefaultDict,
+        Dict,
+        Mapping,
+        MutableMapping,
+        typing.OrderedDict,
+    ))
+    data_module.HINT_PEP_SIGNS_REITERABLE.update((
+        AbstractSet,
+        Collection,
+        FrozenSet,
+        ItemsView,
+        Iterable,
+        KeysView,
+        MutableSet,
+        Set,
+        ValuesView,
+    ))
     data_module.HINT_PEP_SIGNS_SEQUENCE_STANDARD.update((
         List,
         MutableSequence,
         Sequence,
     ))
+    data_module.HINT_PEP_SIGNS_SUBCLASS.update((
+        Type,
+    ))
     data_module.HINT_PEP_SIGNS_TUPLE.update((
         Tuple,
     ))
@@ -145,20 +145,60 @@ def add_data(data_module: 'ModuleType') -> None:
 
     # ..................{ SETS ~ signs : supported          }..................
     data_module.HINT_PEP_SIGNS_SUPPORTED_DEEP.update((
+        defaultdict,
+        dict,
+        frozenset,
         list,
+        set,
         tuple,
+        type,
         ByteString,
+        ChainMap,
+        Collection,
+        Counter,
+        ItemsView,
+        Iterable,
+        KeysView,
+        Mapping,
+        MutableMapping,
         MutableSequence,
+        MutableSet,
+        OrderedDict,
         Sequence,
+        Set,
+        ValuesView,
     ))
 
     # ..................{ SETS ~ signs : subtypes           }..................
+    data_module.HINT_PEP_SIGNS_MAPPING.update((
+        defaultdict,
+        dict,
+        ChainMap,
+        Counter,
+        Mapping,
+        MutableMapping,
+        OrderedDict,
+    ))
+    data_module.HINT_PEP_SIGNS_REITERABLE.update((
+        frozenset,
+        set,
+        Collection,
+        ItemsView,
+        Iterable,
+        KeysView,
+        MutableSet,
+        Set,
+        ValuesView,
+    ))
     data_module.HINT_PEP_SIGNS_SEQUENCE_STANDARD.update((
         list,
         ByteString,
         MutableSequence,
         Sequence,
     ))
+    data_module.HINT_PEP_SIGNS_SUBCLASS.update((
+        type,
+    ))
     data_module.HINT_PEP_SIGNS_TUPLE.update((
         tuple,
     ))
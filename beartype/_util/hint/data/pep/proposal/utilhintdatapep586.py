@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2020 Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Beartype `PEP 586`_**-compliant type hint data.**
+
+This private submodule is *not* intended for importation by downstream callers.
+
+.. _PEP 586:
+    https://www.python.org/dev/peps/pep-0586
+'''
+
+# ....................{ IMPORTS                           }....................
+from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_8
+
+# See the "beartype.__init__" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ SIGNS                             }....................
+# If the active Python interpreter targets at least Python >= 3.8 and thus
+# supports PEP 586, define this set to contain the "typing.Literal" singleton.
+if IS_PYTHON_AT_LEAST_3_8:
+    # Defer version-dependent imports.
+    from typing import Literal
+
+    HINT_PEP586_SIGNS_LITERAL = frozenset((Literal,))
+# Else, the active Python interpreter targets at most Python < 3.8 and thus
+# fails to support PEP 586. In this case, define this set to be empty.
+else:
+    HINT_PEP586_SIGNS_LITERAL = frozenset()
+
+
+# Docstring for this set regardless of the implementation details above.
+'''
+Frozen set of all **literal signs** (i.e., arbitrary objects uniquely
+identifying `PEP 586`_-compliant type hints subscripted by one or more literal
+objects, each of which satisfies only objects of the same exact type comparing
+equal to that literal object).
+
+.. _PEP 586:
+    https://www.python.org/dev/peps/pep-0586
+'''
+
+# ....................{ ADDERS                            }....................
+def add_data(data_module: 'ModuleType') -> None:
+    '''
+    Add `PEP 586`_**-compliant type hint data to various global containers
+    declared by the passed module.
+
+    Parameters
+    ----------
+    data_module : ModuleType
+        Module to be added to.
+
+    .. _PEP 586:
+        https://www.python.org/dev/peps/pep-0586
+    '''
+
+    # ..................{ SETS ~ signs                      }..................
+    # Register the version-specific signs introduced in this version. If the
+    # active Python interpreter fails to support PEP 586, this set is empty
+    # and this registration silently reduces to a noop.
+    data_module.HINT_PEP_SIGNS_SUPPORTED_DEEP.update(HINT_PEP586_SIGNS_LITERAL)
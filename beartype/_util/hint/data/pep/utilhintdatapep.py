@@ -16,6 +16,7 @@ from beartype._util.hint.data.pep.proposal import (
     utilhintdatapep484,
     utilhintdatapep544,
     utilhintdatapep585,
+    utilhintdatapep586,
     utilhintdatapep593,
 )
 
@@ -126,6 +127,50 @@ user-defined types are instances of these superclasses).
 '''
 
 
+# Initialized by the _init() function below.
+HINT_PEP_SIGNS_MAPPING = set()
+'''
+Frozen set of all **mapping signs** (i.e., arbitrary objects uniquely
+identifying PEP-compliant type hints accepting either one or two subscripted
+type hint arguments constraining *all* keys and (if two) values of compliant
+mappings, which necessarily satisfy the :class:`collections.abc.Mapping`
+protocol).
+
+Since mappings provide no ``O(1)`` indexation across all mapping items, mapping
+items are instead sampled by the helpers declared by the
+:mod:`beartype._decor._code._pep._pepsample` submodule.
+
+This set includes the :attr:`typing.Counter` sign, which accepts only one
+subscripted type hint argument constraining *all* keys of compliant counters
+whose values are implicitly integers.
+'''
+
+
+# Initialized by the _init() function below.
+HINT_PEP_SIGNS_REITERABLE = set()
+'''
+Frozen set of all **reiterable signs** (i.e., arbitrary objects uniquely
+identifying PEP-compliant type hints accepting either one or two subscripted
+type hint arguments constraining *all* items of compliant containers that are
+neither sequences nor mappings, which necessarily satisfy either the
+:class:`collections.abc.Iterable` or :class:`collections.abc.Collection`
+protocols and are thus iterable but provide no ``O(1)`` indexation).
+
+Since these containers provide no ``O(1)`` indexation across all items, these
+items are instead sampled by the helpers declared by the
+:mod:`beartype._decor._code._pep._pepsample` submodule. Since iterating
+arbitrary iterables may have arbitrary side effects (e.g., consuming the items
+of **one-shot iterators,** iterators whose ``__iter__`` methods return
+themselves), these helpers only sample the items of builtin containers known
+to be safely iterable (e.g., sets, frozen sets, dictionary views). All other
+iterables are only shallowly type-checked.
+
+This set includes the :attr:`typing.ItemsView` sign, which accepts two
+subscripted type hint arguments constraining the keys and values of all
+2-tuples ``(key, value)`` iterated by compliant items views.
+'''
+
+
 # Initialized by the _init() function below.
 HINT_PEP_SIGNS_SEQUENCE_STANDARD = set()
 '''
@@ -165,6 +210,15 @@ This set intentionally excludes the:
 '''
 
 
+# Initialized by the _init() function below.
+HINT_PEP_SIGNS_SUBCLASS = set()
+'''
+Frozen set of all **subclass signs** (i.e., arbitrary objects uniquely
+identifying PEP-compliant type hints accepting exactly one subscripted type
+hint argument constraining the superclasses of compliant classes).
+'''
+
+
 # Initialized by the _init() function below.
 HINT_PEP_SIGNS_TUPLE = set()
 '''
@@ -190,7 +244,10 @@ def add_data(data_module: 'ModuleType') -> None:
         HINT_PEP_BASES_FORWARDREF, \
         HINT_PEP_SIGNS_DEPRECATED, \
         HINT_PEP_SIGNS_IGNORABLE, \
+        HINT_PEP_SIGNS_MAPPING, \
+        HINT_PEP_SIGNS_REITERABLE, \
         HINT_PEP_SIGNS_SEQUENCE_STANDARD, \
+        HINT_PEP_SIGNS_SUBCLASS, \
         HINT_PEP_SIGNS_SUPPORTED, \
         HINT_PEP_SIGNS_SUPPORTED_DEEP, \
         HINT_PEP_SIGNS_SUPPORTED_SHALLOW, \
@@ -207,6 +264,7 @@ def add_data(data_module: 'ModuleType') -> None:
         utilhintdatapep484,
         utilhintdatapep544,
         utilhintdatapep585,
+        utilhintdatapep586,
         utilhintdatapep593,
     )
 
@@ -225,8 +283,14 @@ def add_data(data_module: 'ModuleType') -> None:
         'Set global "HINT_PEP_SIGNS_SUPPORTED_SHALLOW" empty.')
     assert HINT_PEP_SIGNS_IGNORABLE, (
         'Set global "HINT_PEP_SIGNS_IGNORABLE" empty.')
+    assert HINT_PEP_SIGNS_MAPPING, (
+        'Set global "HINT_PEP_SIGNS_MAPPING" empty.')
+    assert HINT_PEP_SIGNS_REITERABLE, (
+        'Set global "HINT_PEP_SIGNS_REITERABLE" empty.')
     assert HINT_PEP_SIGNS_SEQUENCE_STANDARD, (
         'Set global "HINT_PEP_SIGNS_SEQUENCE_STANDARD" empty.')
+    assert HINT_PEP_SIGNS_SUBCLASS, (
+        'Set global "HINT_PEP_SIGNS_SUBCLASS" empty.')
     assert HINT_PEP_SIGNS_TUPLE, (
         'Set global "HINT_PEP_SIGNS_TUPLE" empty.')
     assert HINT_PEP_SIGNS_TYPE_ORIGIN, (
@@ -240,8 +304,11 @@ def add_data(data_module: 'ModuleType') -> None:
     # thus the lower-level globals required by these sets.
     HINT_PEP_SIGNS_DEPRECATED = frozenset(HINT_PEP_SIGNS_DEPRECATED)
     HINT_PEP_SIGNS_IGNORABLE = frozenset(HINT_PEP_SIGNS_IGNORABLE)
+    HINT_PEP_SIGNS_MAPPING = frozenset(HINT_PEP_SIGNS_MAPPING)
+    HINT_PEP_SIGNS_REITERABLE = frozenset(HINT_PEP_SIGNS_REITERABLE)
     HINT_PEP_SIGNS_SEQUENCE_STANDARD = frozenset(
         HINT_PEP_SIGNS_SEQUENCE_STANDARD)
+    HINT_PEP_SIGNS_SUBCLASS = frozenset(HINT_PEP_SIGNS_SUBCLASS)
     HINT_PEP_SIGNS_SUPPORTED_DEEP = frozenset(HINT_PEP_SIGNS_SUPPORTED_DEEP)
     HINT_PEP_SIGNS_SUPPORTED_SHALLOW = frozenset(
         HINT_PEP_SIGNS_SUPPORTED_SHALLOW)
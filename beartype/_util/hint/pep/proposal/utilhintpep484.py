@@ -25,7 +25,7 @@ from beartype._util.hint.data.pep.proposal.utilhintdatapep484 import (
 )
 from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_7
 from beartype._util.utilobject import is_object_subclass
-from typing import Generic, NewType
+from typing import Generic, NewType, Union
 
 # See the "beartype.__init__" submodule for further commentary.
 __all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
@@ -801,3 +801,298 @@ def get_hint_pep484_generic_bases_unerased(hint: object) -> 'Tuple[object]':
     # * The "typing.Generic" superclass.
     # * The "object" root superclass.
     return hint_bases[1:-2]
+
+# ....................{ GETTERS ~ namedtuple              }....................
+@callable_cached
+def get_hint_pep484_namedtuple_fields(hint: object) -> 'Tuple[tuple]':
+    '''
+    Tuple of all **type-checkable fields** (i.e., fields annotated by
+    unignorable type hints deeply type-checkable by :mod:`beartype`) of the
+    passed `PEP 484`_-compliant **named tuple** (i.e., class subclassing the
+    :class:`typing.NamedTuple` superclass) if this object is a named tuple
+    *or* the empty tuple otherwise.
+
+    Each item of this tuple is a 3-tuple ``(field_index, field_name,
+    field_hint)``, where:
+
+    * ``field_index`` is the 0-based index of this field in this named tuple.
+    * ``field_name`` is the name of this field.
+    * ``field_hint`` is the type hint annotating this field.
+
+    Fields annotated by forward references (e.g., strings, which the
+    :class:`typing.NamedTuple` superclass implicitly coerces into
+    :class:`typing.ForwardRef` instances) are silently ignored, as resolving
+    these references relative to the module declaring this named tuple rather
+    than the decorated callable is currently unsupported. Fields
+    annotated by PEP-noncompliant hints other than classes (e.g., tuple
+    unions) are also silently ignored. Since the :class:`typing.NamedTuple`
+    superclass fails to validate these annotations, these fields are instead
+    shallowly type-checked along with this named tuple.
+
+    This getter is memoized for efficiency. Since named tuples are immutable
+    classes whose fields are fixed on declaration, memoizing this tuple per
+    class enables callers to generate code type-checking these fields once.
+
+    Parameters
+    ----------
+    hint : object
+        Object to be inspected.
+
+    Returns
+    ----------
+    Tuple[tuple]
+        Either:
+
+        * If this object is a named tuple, the possibly empty tuple of all
+          type-checkable fields of this named tuple.
+        * Else, the empty tuple. This includes named tuples created by the
+          :func:`collections.namedtuple` factory function, whose fields are
+          unannotated.
+
+    .. _PEP 484:
+       https://www.python.org/dev/peps/pep-0484
+    '''
+
+    # If this hint is *NOT* a tuple subclass, this hint is *NOT* a named tuple.
+    if not (isinstance(hint, type) and issubclass(hint, tuple)):
+        return ()
+    # Else, this hint is a tuple subclass.
+
+    # Avoid circular import dependencies.
+    from beartype._util.hint.utilhinttest import is_hint_field_checkable
+
+    # For each class in the method resolution order (MRO) of this subclass...
+    for hint_base in hint.__mro__:
+        # Dictionary of all dunder variables declared by this class.
+        hint_base_dict = hint_base.__dict__
+
+        # If this class declares the fields of a named tuple, this class is
+        # the named tuple originally declaring these fields (rather than a
+        # subclass of that named tuple). Since the "__annotations__" dunder
+        # dictionary of a subclass annotates *ONLY* the class variables
+        # declared by that subclass, inspect only this class.
+        if '_fields' in hint_base_dict:
+            field_names = hint_base_dict['_fields']
+            field_name_to_hint = hint_base_dict.get('__annotations__')
+            break
+    # Else, this subclass subclasses *NO* named tuple. In this case, return the
+    # empty tuple.
+    else:
+        return ()
+
+    # If this named tuple is unannotated, return the empty tuple.
+    if not isinstance(field_name_to_hint, dict):
+        return ()
+    # Else, this named tuple is annotated.
+
+    # Return a tuple describing all type-checkable fields of this named tuple.
+    return tuple(
+        (field_index, field_name, field_name_to_hint.get(field_name))
+        for field_index, field_name in enumerate(field_names)
+        if is_hint_field_checkable(field_name_to_hint.get(field_name))
+    )
+
+# ....................{ REDUCERS ~ typevar                }....................
+def reduce_hint_pep484_typevar(hint: object) -> object:
+    '''
+    Type hint constraining all objects satisfying the passed `PEP
+    484`_-compliant **type variable** (i.e., :class:`typing.TypeVar` instance)
+    if this object is a type variable either bounded by a type hint *or*
+    constrained to two or more type hints *or* this object as is otherwise.
+
+    Specifically, this reducer reduces:
+
+    * Each type variable bounded by a type hint (e.g., ``TypeVar('T',
+      bound=int)``) to that type hint (e.g., :class:`int`).
+    * Each type variable constrained to two or more type hints (e.g.,
+      ``TypeVar('T', int, str)``) to the union of those type hints (e.g.,
+      ``Union[int, str]``), enabling callers to type-check these constraints
+      with the same code type-checking unions.
+
+    Since type variables are otherwise only meaningful to static type checkers
+    relating the types of different objects annotated by the same type
+    variable, each object annotated by a type variable is type-checked only
+    against the bound or constraints of that type variable.
+
+    This reducer is intentionally *not* memoized (e.g., by the
+    :func:`callable_cached` decorator), as the implementation trivially reduces
+    to a few attribute lookups.
+
+    Parameters
+    ----------
+    hint : object
+        Object to be reduced.
+
+    Returns
+    ----------
+    object
+        Either:
+
+        * If this object is a type variable bounded by a type hint, that hint.
+        * If this object is a type variable constrained to two or more type
+          hints, the union of those hints.
+        * Else, this object as is. This includes unbounded and unconstrained
+          type variables, which are ignorable.
+
+    .. _PEP 484:
+       https://www.python.org/dev/peps/pep-0484
+    '''
+
+    # Avoid circular import dependencies.
+    from beartype._util.hint.pep.utilhintpeptest import is_hint_pep_typevar
+
+    # If this hint is *NOT* a type variable, return this hint as is.
+    if not is_hint_pep_typevar(hint):
+        return hint
+    # Else, this hint is a type variable.
+    #
+    # If this type variable is bounded by a type hint, return that hint.
+    elif hint.__bound__ is not None:
+        return hint.__bound__
+    # Else, this type variable is unbounded.
+    #
+    # If this type variable is constrained to two or more type hints, return
+    # the union of those hints.
+    elif hint.__constraints__:
+        return Union.__getitem__(hint.__constraints__)
+    # Else, this type variable is unconstrained.
+
+    # Return this type variable as is.
+    return hint
+
+# ....................{ REDUCERS ~ union                  }....................
+@callable_cached
+def reduce_hint_pep484_union(hint: object) -> object:
+    '''
+    **Normalized union** (i.e., type hint semantically equivalent to the passed
+    `PEP 484`_-compliant union but subscripted by only the child hints of that
+    union that type-check distinct objects) reduced from the passed object if
+    this object is a union *or* this object as is otherwise.
+
+    Specifically, this reducer:
+
+    * Flattens all child unions subscripting this union into this union,
+      including the unions of the constraints of all constrained type variables
+      subscripting this union as reduced by the
+      :func:`reduce_hint_pep484_typevar` function.
+    * Removes all duplicate child hints from this union.
+    * Removes all child classes subclassing other child classes from this union
+      (e.g., :class:`bool` from ``Union[int, bool]``), as all instances of the
+      former are also instances of the latter.
+
+    Since the :mod:`typing` module memoizes unions on the sets of their child
+    hints, equivalent unions reduce to the same normalized union and thus share
+    the same code memoized by the :func:`callable_cached` decorator for that
+    union: e.g.,
+
+    .. code-block:: python
+
+       >>> from typing import Optional, Union
+       >>> reduce_hint_pep484_union(Union[int, bool, Optional[str]])
+       typing.Union[int, str, NoneType]
+       >>> reduce_hint_pep484_union(Union[int, bool])
+       <class 'int'>
+
+    This reducer is memoized for efficiency.
+
+    Parameters
+    ----------
+    hint : object
+        Object to be reduced.
+
+    Returns
+    ----------
+    object
+        Either:
+
+        * If this object is a `PEP 484`_-compliant union whose child hints are
+          reducible as above, the normalized union reduced from this union. If
+          this union reduces to only a single child hint, this is that hint.
+        * Else, this object as is.
+
+    .. _PEP 484:
+       https://www.python.org/dev/peps/pep-0484
+    '''
+
+    # Avoid circular import dependencies.
+    from beartype._util.hint.pep.utilhintpepget import (
+        get_hint_pep_args, get_hint_pep_sign)
+    from beartype._util.hint.pep.utilhintpeptest import is_hint_pep
+
+    # If this hint is *NOT* a union, return this hint as is.
+    if not (
+        is_hint_pep(hint) and
+        get_hint_pep_sign(hint) in HINT_PEP484_SIGNS_UNION
+    ):
+        return hint
+    # Else, this hint is a union.
+
+    # List of all child hints subscripting this union, flattened from all
+    # child unions subscripting this union and stripped of duplicates.
+    #
+    # Note that the "typing" module already flattens and deduplicates the
+    # child hints of unions it creates, in which case this list is merely the
+    # tuple of these child hints. Since this is *NOT* necessarily the case for
+    # unions created by other means, this reducer does so anyway.
+    hint_childs = []
+
+    # Stack of all child hints to be flattened into this list, reversed so as
+    # to preserve the order in which these child hints were subscripted.
+    hint_childs_unvisited = list(reversed(get_hint_pep_args(hint)))
+
+    # While one or more child hints remain to be flattened...
+    while hint_childs_unvisited:
+        # Child hint to be flattened, reduced to the bound or union of the
+        # constraints of this child hint if this child hint is a type
+        # variable.
+        hint_child = reduce_hint_pep484_typevar(hint_childs_unvisited.pop())
+
+        # If this child hint is itself a union, flatten its child hints into
+        # this stack.
+        if (
+            is_hint_pep(hint_child) and
+            get_hint_pep_sign(hint_child) in HINT_PEP484_SIGNS_UNION
+        ):
+            hint_childs_unvisited.extend(
+                reversed(get_hint_pep_args(hint_child)))
+        # Else if this child hint has yet to be flattened, do so.
+        elif hint_child not in hint_childs:
+            hint_childs.append(hint_child)
+
+    # Tuple of all PEP-noncompliant child classes subscripting this union.
+    hint_child_types = tuple(
+        hint_child
+        for hint_child in hint_childs
+        if isinstance(hint_child, type) and not is_hint_pep(hint_child)
+    )
+
+    # For each such class, remove this class if this class subclasses any
+    # other such class that has yet to be removed. (Testing the latter avoids
+    # removing both of two classes claiming to subclass each other.) Since
+    # classes overriding the __subclasscheck__() dunder method (e.g., abstract
+    # base classes) may raise arbitrary exceptions on being passed unexpected
+    # types, silently preserve classes raising these exceptions.
+    for hint_child_type in hint_child_types:
+        for hint_child_type_super in hint_child_types:
+            if (
+                hint_child_type is hint_child_type_super or
+                hint_child_type_super not in hint_childs
+            ):
+                continue
+
+            try:
+                if issubclass(hint_child_type, hint_child_type_super):
+                    hint_childs.remove(hint_child_type)
+                    break
+            except Exception:
+                pass
+
+    # Return either...
+    return (
+        # If this union reduced to the same child hints, this union as is;
+        hint
+        if tuple(hint_childs) == get_hint_pep_args(hint) else
+        # Else, the union of these child hints. If only one such hint remains,
+        # the "typing" module reduces this union to that hint.
+        Union.__getitem__(tuple(hint_childs))
+    )
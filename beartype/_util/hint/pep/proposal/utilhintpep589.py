@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2020 Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Beartype** `PEP 589`_**-compliant type hint utilities.**
+
+This private submodule is *not* intended for importation by downstream callers.
+
+.. _PEP 589:
+    https://www.python.org/dev/peps/pep-0589
+'''
+
+# ....................{ IMPORTS                           }....................
+from beartype._util.cache.utilcachecall import callable_cached
+from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_9
+
+# See the "beartype.__init__" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ TESTERS                           }....................
+def is_hint_pep589(hint: object) -> bool:
+    '''
+    ``True`` only if the passed object is a `PEP 589`_-compliant **typed
+    dictionary** (i.e., :class:`typing.TypedDict` subclass).
+
+    This tester is intentionally *not* memoized (e.g., by the
+    :func:`callable_cached` decorator), as the implementation trivially reduces
+    to an efficient one-liner.
+
+    Caveats
+    ----------
+    **Typed dictionaries are indistinguishable from PEP-noncompliant
+    dictionary subclasses declaring a** ``__total__`` **class variable.**
+    Since the :mod:`typing` module dynamically creates each typed dictionary as
+    a direct :class:`dict` subclass whose metaclass is private to that module,
+    this tester detects typed dictionaries by duck typing instead.
+
+    **Typed dictionaries prohibit** :func:`isinstance` **and**
+    :func:`issubclass` **checks.** Callers *must* instead type-check each
+    object against a typed dictionary by first type-checking that object to be
+    a :class:`dict` instance and then type-checking the keys and values of
+    that dictionary as described by this typed dictionary.
+
+    Parameters
+    ----------
+    hint : object
+        Object to be inspected.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if this object is a typed dictionary.
+
+    .. _PEP 589:
+       https://www.python.org/dev/peps/pep-0589
+    '''
+
+    # Return true only if this object is a dictionary subclass declaring the
+    # "__total__" class variable set on all typed dictionaries.
+    return (
+        isinstance(hint, type) and
+        issubclass(hint, dict) and
+        hasattr(hint, '__total__')
+    )
+
+# ....................{ GETTERS                           }....................
+@callable_cached
+def get_hint_pep589_keys(hint: object) -> 'Tuple[frozenset, tuple]':
+    '''
+    2-tuple ``(keys_required, keys_checkable)`` describing the keys of the
+    passed `PEP 589`_-compliant **typed dictionary** (i.e.,
+    :class:`typing.TypedDict` subclass), where:
+
+    * ``keys_required`` is the frozen set of the names of all **required
+      keys** of this typed dictionary (i.e., keys that *must* be present in
+      each dictionary satisfying this typed dictionary), including keys whose
+      values are *not* type-checkable.
+    * ``keys_checkable`` is the tuple of one 3-tuple ``(key_name, key_hint,
+      is_key_required)`` for each **type-checkable key** of this typed
+      dictionary (i.e., key annotated by a type hint satisfying the
+      :func:`beartype._util.hint.utilhinttest.is_hint_field_checkable`
+      tester), where:
+
+      * ``key_name`` is the name of this key.
+      * ``key_hint`` is the type hint annotating the value of this key.
+      * ``is_key_required`` is ``True`` only if this key is required.
+
+    This getter is memoized for efficiency.
+
+    Caveats
+    ----------
+    **Under Python 3.8, required keys are inferred from the** ``__total__``
+    **class variable of this typed dictionary.** Since Python 3.8 fails to
+    record which keys were declared by which of several possibly mutually
+    inconsistent totalities across a typed dictionary hierarchy, this getter
+    considers all keys of a total typed dictionary to be required and all keys
+    of a non-total typed dictionary to be optional under Python 3.8.
+
+    Parameters
+    ----------
+    hint : object
+        Typed dictionary to be inspected.
+
+    Returns
+    ----------
+    Tuple[frozenset, tuple]
+        2-tuple ``(keys_required, keys_checkable)`` describing these keys.
+
+    .. _PEP 589:
+       https://www.python.org/dev/peps/pep-0589
+    '''
+    assert is_hint_pep589(hint), f'{repr(hint)} not typed dictionary.'
+
+    # Avoid circular import dependencies.
+    from beartype._util.hint.utilhinttest import is_hint_field_checkable
+
+    # Dictionary mapping from the name of each key of this typed dictionary
+    # (including keys inherited from superclasses) to the hint annotating the
+    # value of that key.
+    key_name_to_hint = getattr(hint, '__annotations__', None)
+
+    # If this typed dictionary is unannotated, return an empty description.
+    if not isinstance(key_name_to_hint, dict):
+        return (frozenset(), ())
+    # Else, this typed dictionary is annotated.
+
+    # Frozen set of the names of all required keys of this typed dictionary,
+    # defined as either...
+    keys_required = (
+        # If the active Python interpreter targets Python >= 3.9, the set of
+        # these names explicitly recorded by the "typing" module.
+        frozenset(hint.__required_keys__)
+        if IS_PYTHON_AT_LEAST_3_9 else
+        # Else, the active Python interpreter targets Python 3.8. In this
+        # case, either all keys if this typed dictionary is total *OR* no keys
+        # otherwise.
+        frozenset(key_name_to_hint if hint.__total__ else ())
+    )
+
+    # Return a 2-tuple describing these keys.
+    return (
+        keys_required,
+        tuple(
+            (key_name, key_hint, key_name in keys_required)
+            for key_name, key_hint in key_name_to_hint.items()
+            if is_hint_field_checkable(key_hint)
+        ),
+    )
@@ -63,6 +63,7 @@ from beartype._util.hint.pep.proposal.utilhintpep484 import (
     is_hint_pep484_generic,
     is_hint_pep484_ignorable_or_none,
     is_hint_pep484_newtype,
+    reduce_hint_pep484_typevar,
 )
 from beartype._util.hint.pep.proposal.utilhintpep544 import (
     is_hint_pep544_ignorable_or_none)
@@ -570,16 +571,18 @@ def is_hint_pep_ignorable(hint: object) -> bool:
 
 
     # Avoid circular import dependencies.
+    from beartype._util.hint.utilhinttest import is_hint_ignorable
     from beartype._util.hint.pep.utilhintpepget import get_hint_pep_sign
 
-    #FIXME: Remove this *AFTER* properly supporting type variables. For
-    #now, ignoring type variables is required ta at least shallowly support
-    #generics parametrized by one or more type variables.
-
-    # If this hint is a type variable, return true. Type variables require
-    # non-trivial and currently unimplemented decorator support.
+    # If this hint is a type variable, return true only if this type variable
+    # is neither bounded nor constrained *OR* the bound or union of the
+    # constraints of this type variable is itself ignorable (e.g.,
+    # "TypeVar('T', bound=object)"). Since these type variables impose *NO*
+    # meaningful constraints, ignoring these type variables is also required
+    # to shallowly support generics parametrized by these type variables.
     if is_hint_pep_typevar(hint):
-        return True
+        hint_reduced = reduce_hint_pep484_typevar(hint)
+        return hint_reduced is hint or is_hint_ignorable(hint_reduced)
 
     # Sign uniquely identifying this hint.
     hint_sign = get_hint_pep_sign(hint)
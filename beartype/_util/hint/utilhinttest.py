@@ -232,6 +232,65 @@ def is_hint_ignorable(hint: object) -> bool:
     # unignorable. In this case, return false.
     return False
 
+# ....................{ TESTERS ~ field                   }....................
+def is_hint_field_checkable(hint: object) -> bool:
+    '''
+    ``True`` only if the passed object is a **type-checkable field hint**
+    (i.e., type hint annotating either a field of a :class:`typing.NamedTuple`
+    subclass *or* a key of a :class:`typing.TypedDict` subclass whose values
+    are deeply type-checked by :mod:`beartype`).
+
+    Specifically, this tester returns ``True`` only if this object is neither:
+
+    * A forward reference. Since forward references annotating these classes
+      are relative to the module declaring these classes rather than the
+      decorated callable, resolving these references is currently
+      unsupported.
+    * A PEP-compliant type hint unsupported by :mod:`beartype`.
+    * A PEP-noncompliant type hint other than a class (e.g., tuple union).
+    * An ignorable type hint.
+
+    Since the :mod:`typing` module fails to validate these annotations, this
+    tester returns ``False`` rather than raising an exception for malformed
+    type hints, silently reducing the fields annotated by these hints to
+    shallowly type-checked fields.
+
+    This tester is intentionally *not* memoized (e.g., by the
+    :func:`callable_cached` decorator), as this tester is only called by
+    memoized getters inspecting these classes.
+
+    Parameters
+    ----------
+    hint : object
+        Object to be inspected.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if this object is a type-checkable field hint.
+    '''
+
+    # Attempt to...
+    try:
+        # Return true only if this hint is neither...
+        return not (
+            # A forward reference *NOR*...
+            is_hint_forwardref(hint) or
+            (
+                # A PEP-compliant hint *NOT* supported by @beartype *NOR*...
+                not is_hint_pep_supported(hint)
+                if is_hint_pep(hint) else
+                # A PEP-noncompliant hint other than a class *NOR*...
+                not isinstance(hint, type)
+            ) or
+            # An ignorable hint.
+            is_hint_ignorable(hint)
+        )
+    # If doing so raises an exception (e.g., due to this hint being
+    # malformed), this hint is *NOT* type-checkable.
+    except Exception:
+        return False
+
 # ....................{ TESTERS ~ forwardref              }....................
 def is_hint_forwardref(hint: object) -> bool:
     '''
@@ -15,6 +15,50 @@ This private submodule is *not* intended for importation by downstream callers.
 
 # ....................{ IMPORTS                            }....................
 # from collections.abc import Callable
+from types import FunctionType
+
+# See the "beartype.__init__" submodule for further commentary.
+__all__ = ['STAR_IMPORTS_CONSIDERED_HARMFUL']
+
+# ....................{ TESTERS                           }....................
+def is_func_sig_codeobj(func: object) -> bool:
+    '''
+    ``True`` only if the passed object is a pure-Python function whose
+    signature is that of its code object.
+
+    Specifically, this tester returns ``True`` only if this object is a
+    pure-Python function defining neither:
+
+    * The ``__wrapped__`` dunder attribute (e.g., set by the
+      :func:`functools.wraps` decorator), whose signature the
+      :func:`inspect.signature` function reports instead.
+    * A non-``None`` ``__signature__`` dunder attribute, which that function
+      also reports instead. Since that function ignores this attribute when
+      this attribute is ``None``, so does this tester.
+
+    The signature of a function satisfying this tester is fully reflected by
+    the ``__code__``, ``__defaults__``, and ``__kwdefaults__`` dunder
+    attributes of that function, enabling callers to efficiently inspect that
+    signature *without* calling the comparatively inefficient
+    :func:`inspect.signature` function.
+
+    Parameters
+    ----------
+    func : object
+        Object to be inspected.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if this object is a pure-Python function whose signature
+        is that of its code object.
+    '''
+
+    return (
+        isinstance(func, FunctionType) and
+        not hasattr(func, '__wrapped__') and
+        getattr(func, '__signature__', None) is None
+    )
 
 # ....................{ GETTERS                           }....................
 #FIXME: Implement us up.
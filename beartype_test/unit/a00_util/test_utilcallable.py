@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2020 by Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Beartype callable utility unit tests.**
+
+This submodule unit tests the public API of the private
+:mod:`beartype._util.utilcallable` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTS                             }....................
+def test_is_func_sig_codeobj() -> None:
+    '''
+    Test the :func:`beartype._util.utilcallable.is_func_sig_codeobj` function.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype._util.utilcallable import is_func_sig_codeobj
+    from functools import wraps
+    from inspect import signature
+
+    # Pure-Python functions whose signatures are those of their code objects.
+    def the_moving_finger(writes: str) -> str:
+        return writes
+    def and_having_writ(moves_on: str) -> str:
+        return moves_on
+    and_having_writ.__signature__ = None
+
+    # Pure-Python functions whose signatures are *NOT* those of their code
+    # objects.
+    @wraps(the_moving_finger)
+    def nor_all_thy_piety(*args, **kwargs) -> str:
+        return the_moving_finger(*args, **kwargs)
+    def nor_wit(*args, **kwargs) -> str:
+        return args
+    nor_wit.__signature__ = signature(the_moving_finger)
+
+    # Assert this tester accepts the former.
+    assert is_func_sig_codeobj(the_moving_finger) is True
+    assert is_func_sig_codeobj(and_having_writ) is True
+
+    # Assert this tester rejects the latter *AND* non-functions.
+    assert is_func_sig_codeobj(nor_all_thy_piety) is False
+    assert is_func_sig_codeobj(nor_wit) is False
+    assert is_func_sig_codeobj(len) is False
+    assert is_func_sig_codeobj('Shall lure it back to cancel half a Line') is (
+        False)
@@ -54,6 +54,117 @@ def test_pep484_decor_no_type_check() -> None:
     # reduced to a noop by returning this callable undecorated.
     assert of_beechen_green is of_beechen_green_beartyped
 
+# ....................{ TESTS ~ hint : namedtuple         }....................
+def test_pep484_hint_namedtuple() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator against `PEP 484`_-compliant
+    named tuples (i.e., :class:`typing.NamedTuple` subclasses), including
+    named tuples nested in other hints *and* named tuples declaring more
+    fields than are type-checked by each call.
+
+    .. _PEP 484:
+       https://www.python.org/dev/peps/pep-0484
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype, beartype_On
+    from beartype.roar import BeartypeCallHintPepParamException
+    from beartype._util.hint.pep.proposal.utilhintpep484 import (
+        get_hint_pep484_namedtuple_fields)
+    from collections import namedtuple
+    from typing import Any, List, NamedTuple, Optional
+
+    # Named tuple annotated by both type-checkable and ignorable fields.
+    class Prelude(NamedTuple):
+        stanza: int
+        lines: List[str]
+        sonnet: Optional[str] = None
+        mood: Any = None
+        book: 'Prelude' = None
+
+    # Subclass of this named tuple declaring no additional fields.
+    class Recluse(Prelude): pass
+
+    # Named tuple declaring more fields than are type-checked by each call.
+    Excursion = NamedTuple(
+        'Excursion', [(f'book_{index}', int) for index in range(24)])
+
+    # Assert only the type-checkable fields of these named tuples are found.
+    assert get_hint_pep484_namedtuple_fields(Prelude) == (
+        (0, 'stanza', int),
+        (1, 'lines', List[str]),
+        (2, 'sonnet', Optional[str]),
+    )
+    assert get_hint_pep484_namedtuple_fields(Recluse) == (
+        get_hint_pep484_namedtuple_fields(Prelude))
+    assert get_hint_pep484_namedtuple_fields(
+        namedtuple('Tintern', ('abbey', 'revisited'))) == ()
+    assert get_hint_pep484_namedtuple_fields(tuple) == ()
+    assert get_hint_pep484_namedtuple_fields(int) == ()
+
+    # Callable annotated by these named tuples, including named tuples nested
+    # in both containers *AND* unions.
+    @beartype
+    def the_growth_of(
+        a_poets_mind: Prelude,
+        fair_seedtime: List[Prelude] = [],
+        had_my_soul: Optional[Prelude] = None,
+    ) -> Prelude:
+        return a_poets_mind
+
+    # Named tuples satisfying and violating these hints.
+    prelude_valid = Prelude(1, ['Oh there is blessing in this gentle breeze'])
+    prelude_invalid = Prelude(1, [b'A visitant that while it fans my cheek'])
+
+    # Assert this callable accepts objects satisfying these hints, including
+    # instances of subclasses of these named tuples.
+    assert the_growth_of(prelude_valid) is prelude_valid
+    assert the_growth_of(
+        prelude_valid, [Recluse(2, [])], prelude_valid) is prelude_valid
+
+    # Assert this callable rejects objects violating these hints, including
+    # tuples that are *NOT* named tuples.
+    with raises_uncached(BeartypeCallHintPepParamException):
+        the_growth_of((1, []))
+    with raises_uncached(BeartypeCallHintPepParamException):
+        the_growth_of(Prelude('1', []))
+    with raises_uncached(BeartypeCallHintPepParamException):
+        the_growth_of(Prelude(1, [], b'Doth seem half-conscious'))
+    with raises_uncached(BeartypeCallHintPepParamException):
+        the_growth_of(prelude_invalid)
+    with raises_uncached(BeartypeCallHintPepParamException):
+        the_growth_of(prelude_valid, [prelude_invalid])
+    with raises_uncached(BeartypeCallHintPepParamException):
+        the_growth_of(prelude_valid, [], prelude_invalid)
+
+    # Callables annotated by a named tuple declaring more fields than are
+    # type-checked by each call under the default O(1) strategy but *NOT*
+    # under the O(n) strategy.
+    @beartype
+    def the_excursion(book: Excursion) -> Excursion:
+        return book
+    @beartype_On
+    def the_excursion_On(book: Excursion) -> Excursion:
+        return book
+
+    # Named tuple violating only its last field.
+    excursion_invalid = Excursion(*range(23), 'The Wanderer')
+
+    # Assert the O(n) callable rejects this named tuple on every call.
+    with raises_uncached(BeartypeCallHintPepParamException):
+        the_excursion_On(excursion_invalid)
+
+    # Assert the O(1) callable rejects this named tuple on only some calls.
+    # Since this field is type-checked by one in three calls, the likelihood
+    # of this field remaining unchecked across 128 calls is negligible.
+    excursion_invalid_checks_len = 0
+    for _ in range(128):
+        try:
+            the_excursion(excursion_invalid)
+        except BeartypeCallHintPepParamException:
+            excursion_invalid_checks_len += 1
+    assert 0 < excursion_invalid_checks_len < 128
+
 # ....................{ TESTS ~ hint : noreturn           }....................
 def test_pep484_hint_noreturn() -> None:
     '''
@@ -182,6 +293,207 @@ def test_pep484_hint_sequence_standard_cached() -> None:
     ), 'All the sun long it was running, it was lovely, the hay').startswith(
         'And as I was green and carefree, famous among the barns')
 
+# ....................{ TESTS ~ hint : subclass           }....................
+def test_pep484_hint_subclass() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator against `PEP 484`_-compliant
+    subclass type hints (e.g., ``typing.Type[int]``), including subclass type
+    hints subscripted by unions of classes.
+
+    .. _PEP 484:
+       https://www.python.org/dev/peps/pep-0484
+    '''
+
+    # Defer heavyweight imports.
+    from abc import ABC
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+    from beartype._decor._code._pep._pepsubclass import (
+        SUBCLASS_CACHE_LEN_MAX,
+        SubclassCache,
+    )
+    from typing import Any, List, Optional, Type
+
+    # Abstract base class (ABC) and subclasses thereof.
+    class Thought(ABC): pass
+    class Feeling(Thought): pass
+    Thought.register(float)
+
+    # Callable annotated by subclass type hints, including subclass type hints
+    # subscripted by ABCs, unions, and ignorable hints *AND* subclass type
+    # hints nested in unions.
+    @beartype
+    def the_hill_of_dreams(
+        thought: Type[Thought],
+        or_feeling: Type[Union[int, str]] = int,
+        of_nothing: Type[Any] = object,
+        or_grief: Optional[Union[Type[Feeling], List[int]]] = None,
+    ) -> Type[Thought]:
+        return thought
+
+    # Assert this callable accepts classes satisfying these hints, including
+    # virtual subclasses registered with ABCs.
+    assert the_hill_of_dreams(Feeling) is Feeling
+    assert the_hill_of_dreams(float, bool, type, Feeling) is float
+    assert the_hill_of_dreams(Thought, str, int, [1]) is Thought
+
+    # Assert this callable rejects objects violating these hints, including
+    # non-classes and classes subclassing *NO* superclasses.
+    with raises_uncached(BeartypeCallHintPepParamException):
+        the_hill_of_dreams(int)
+    with raises_uncached(BeartypeCallHintPepParamException):
+        the_hill_of_dreams(Feeling())
+    with raises_uncached(BeartypeCallHintPepParamException):
+        the_hill_of_dreams(Feeling, bytes)
+    with raises_uncached(BeartypeCallHintPepParamException):
+        the_hill_of_dreams(Feeling, int, 'of nothing')
+    with raises_uncached(BeartypeCallHintPepParamException):
+        the_hill_of_dreams(Feeling, int, int, Thought)
+
+    # Assert subclass caches memoize at most the maximum number of classes.
+    subclass_cache = SubclassCache((Thought,))
+    for _ in range(SUBCLASS_CACHE_LEN_MAX + 1):
+        assert subclass_cache[type('Feeling', (Feeling,), {})] is True
+    assert subclass_cache[int] is False
+    assert len(subclass_cache) == SUBCLASS_CACHE_LEN_MAX
+
+# ....................{ TESTS ~ hint : typevar            }....................
+def test_pep484_hint_typevar() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator against `PEP 484`_-compliant
+    type variables, including type variables bounded by type hints, type
+    variables constrained to type hints, and unbounded unconstrained type
+    variables.
+
+    .. _PEP 484:
+       https://www.python.org/dev/peps/pep-0484
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import (
+        BeartypeCallHintPepParamException,
+        BeartypeCallHintPepReturnException,
+    )
+    from beartype._util.hint.pep.proposal.utilhintpep484 import (
+        reduce_hint_pep484_typevar, reduce_hint_pep484_union)
+    from beartype._util.hint.utilhinttest import is_hint_ignorable
+    from typing import List, Optional, Sequence, TypeVar
+
+    # Type variables bounded by, constrained to, and neither.
+    T = TypeVar('T', bound=int)
+    S = TypeVar('S', bytes, str)
+    U = TypeVar('U')
+
+    # Assert these type variables reduce to their bounds and constraints.
+    assert reduce_hint_pep484_typevar(T) is int
+    assert reduce_hint_pep484_typevar(S) == Union[bytes, str]
+    assert reduce_hint_pep484_typevar(U) is U
+    assert reduce_hint_pep484_union(Optional[S]) == Union[bytes, str, None]
+
+    # Assert only type variables imposing no constraints are ignorable.
+    assert not is_hint_ignorable(T)
+    assert not is_hint_ignorable(S)
+    assert is_hint_ignorable(U)
+    assert is_hint_ignorable(TypeVar('V', bound=object))
+
+    # Callables annotated by these type variables, including type variables
+    # nested in other hints.
+    @beartype
+    def bright_star(would_i: Sequence[T]) -> T:
+        return would_i[0]
+
+    @beartype
+    def were_steadfast(
+        as_thou_art: S, not_in: Optional[S] = None, lone: U = None,
+    ) -> List[U]:
+        return [as_thou_art, not_in, lone]
+
+    # Assert these callables accept objects satisfying these type variables.
+    assert bright_star([True, 2]) is True
+    assert were_steadfast(b'splendour', 'hung', 0.5) == [
+        b'splendour', 'hung', 0.5]
+
+    # Assert these callables reject objects violating these type variables.
+    with raises_uncached(BeartypeCallHintPepParamException):
+        bright_star(['aloft'])
+    with raises_uncached(BeartypeCallHintPepParamException):
+        were_steadfast(1.0)
+    with raises_uncached(BeartypeCallHintPepParamException):
+        were_steadfast('with eternal lids apart', 2)
+
+    # Callable returning an object violating a bounded type variable.
+    @beartype
+    def like_natures(patient: Sequence[T]) -> T:
+        return 'sleepless Eremite'
+
+    # Assert this callable raises the expected exception.
+    with raises_uncached(BeartypeCallHintPepReturnException):
+        like_natures([1])
+
+# ....................{ TESTS ~ hint : union              }....................
+def test_pep484_hint_union_reduced() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator against `PEP 484`_-compliant
+    unions reducible to normalized unions (e.g., unions subscripted by classes
+    subclassing other classes subscripting the same unions).
+
+    .. _PEP 484:
+       https://www.python.org/dev/peps/pep-0484
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+    from beartype._decor._code._pep._pephint import pep_code_check_hint
+    from beartype._decor._data import BeartypeStrategyKind
+    from beartype._util.hint.pep.proposal.utilhintpep484 import (
+        reduce_hint_pep484_union)
+    from typing import List, Optional
+
+    # Assert this reducer preserves irreducible hints as is.
+    assert reduce_hint_pep484_union(int) is int
+    assert reduce_hint_pep484_union(List[int]) == List[int]
+    hint_irreducible = Optional[List[int]]
+    assert reduce_hint_pep484_union(hint_irreducible) is hint_irreducible
+
+    # Assert this reducer removes child classes subclassing other child
+    # classes, reducing unions of one remaining child hint to that hint.
+    assert reduce_hint_pep484_union(Union[int, bool]) is int
+    assert reduce_hint_pep484_union(Union[bool, str, int, None]) == (
+        Union[str, int, None])
+
+    # Assert equivalent unions reduce to the same memoized code.
+    assert pep_code_check_hint(
+        reduce_hint_pep484_union(Union[bool, int, Optional[str]]),
+        BeartypeStrategyKind.O1,
+        False,
+    ) is pep_code_check_hint(
+        reduce_hint_pep484_union(Union[int, str, None]),
+        BeartypeStrategyKind.O1,
+        False,
+    )
+
+    # Callable annotated by reducible unions, including reducible unions
+    # nested in other hints.
+    @beartype
+    def of_the_wide_world(
+        i_dreamed_not: Union[bool, int, None],
+        nor_ever: List[Optional[Union[bool, int]]],
+    ) -> Optional[int]:
+        return i_dreamed_not
+
+    # Assert this callable accepts objects satisfying these unions.
+    assert of_the_wide_world(None, [None]) is None
+    assert of_the_wide_world(True, [False, 0]) is True
+    assert of_the_wide_world(1, []) == 1
+
+    # Assert this callable rejects objects violating these unions.
+    with raises_uncached(BeartypeCallHintPepParamException):
+        of_the_wide_world('Those who would', [None])
+    with raises_uncached(BeartypeCallHintPepParamException):
+        of_the_wide_world(None, ['have dreamed'])
+
 # ....................{ TESTS ~ hint : invalid            }....................
 def test_pep484_hint_invalid_types_nongeneric() -> None:
     '''
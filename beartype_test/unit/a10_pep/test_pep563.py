@@ -85,6 +85,59 @@ def test_pep563() -> None:
     assert isinstance(get_minecraft_end_txt_typed(player_name='Notch'), str)
 
 
+def test_pep563_resolve_cached() -> None:
+    '''
+    Test the private :func:`beartype._decor._pep563._resolve_hint_postponed`
+    function memoizing the resolution of `PEP 563`_-formatted postponed
+    strings.
+
+    .. _PEP 563:
+       https://www.python.org/dev/peps/pep-0563
+    '''
+
+    # Defer heavyweight imports.
+    from beartype._decor._pep563 import _resolve_hint_postponed
+    from typing import List
+
+    # Global scope against which to resolve postponed strings.
+    func_globals = {'List': List, 'TheEnd': int}
+
+    # Dictionary caching postponed strings resolved against this scope.
+    hint_str_to_hint = {}
+
+    # Assert that resolving a postponed string caches its referent.
+    hint = _resolve_hint_postponed(
+        hint_str='List[TheEnd]',
+        func_globals=func_globals,
+        hint_str_to_hint=hint_str_to_hint,
+    )
+    assert hint == List[int]
+    assert 'List[TheEnd]' in hint_str_to_hint
+
+    # Assert that re-resolving the same string returns the cached referent.
+    assert _resolve_hint_postponed(
+        hint_str='List[TheEnd]',
+        func_globals=func_globals,
+        hint_str_to_hint=hint_str_to_hint,
+    ) is hint
+
+    # Assert that rebinding a global name accessed by that string invalidates
+    # the cached referent.
+    func_globals['TheEnd'] = str
+    assert _resolve_hint_postponed(
+        hint_str='List[TheEnd]',
+        func_globals=func_globals,
+        hint_str_to_hint=hint_str_to_hint,
+    ) == List[str]
+
+    # Assert that resolving a string uncached still resolves that string.
+    assert _resolve_hint_postponed(
+        hint_str='List[TheEnd]',
+        func_globals=func_globals,
+        hint_str_to_hint=None,
+    ) == List[str]
+
+
 #FIXME: Hilariously, we can't even unit test whether the
 #beartype._decor._pep563._die_if_hint_repr_exceeds_child_limit() function
 #behaves as expected. See commentary in the
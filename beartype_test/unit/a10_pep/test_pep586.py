@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2020 by Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Beartype** `PEP 586`_ **unit tests.**
+
+This submodule unit tests `PEP 586`_ support implemented in the
+:func:`beartype.beartype` decorator.
+
+.. _PEP 586:
+   https://www.python.org/dev/peps/pep-0586
+'''
+
+# ....................{ IMPORTS                           }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from beartype_test.util.mark.pytskip import skip_if_python_version_less_than
+from beartype_test.util.pyterror import raises_uncached
+
+# ....................{ TESTS ~ literal                   }....................
+@skip_if_python_version_less_than('3.8.0')
+def test_pep586_literal() -> None:
+    '''
+    Test `PEP 586`_ support implemented in the :func:`beartype.beartype`
+    decorator, type-checking literals subscripted by both hashable and
+    unhashable literal objects.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import (
+        BeartypeCallHintPepParamException,
+        BeartypeCallHintPepReturnException,
+    )
+    from enum import Enum
+    from typing import List, Literal
+
+    # Enumeration whose members are valid literal objects.
+    class Elegy(Enum):
+        CURFEW = 'tolls the knell of parting day'
+        LOWING = 'herd wind slowly o\'er the lea'
+
+    # Callable annotated by literals, including literals subscripted by
+    # objects comparing equal despite differing in type *AND* literals
+    # subscripted by unhashable objects nested in other hints.
+    @beartype
+    def the_ploughman_homeward(
+        plods: Literal['r', 'w', 1, False, Elegy.CURFEW],
+        his_weary_way: List[Literal[[], 'leaves']] = ['leaves'],
+    ) -> Literal['the world to darkness']:
+        return 'the world to darkness' if plods != 'w' else 'and to me'
+
+    # Assert this callable accepts objects satisfying these literals.
+    for plods in ('r', 1, False, Elegy.CURFEW):
+        assert the_ploughman_homeward(plods) == 'the world to darkness'
+    assert the_ploughman_homeward('r', [[], 'leaves']) == (
+        'the world to darkness')
+
+    # Assert this callable rejects objects violating these literals, including
+    # objects comparing equal to but differing in type from literal objects.
+    for plods in (True, 0, 1.0, 'a', Elegy.LOWING, [1]):
+        with raises_uncached(BeartypeCallHintPepParamException):
+            the_ploughman_homeward(plods)
+    with raises_uncached(BeartypeCallHintPepParamException):
+        the_ploughman_homeward('r', [()])
+    with raises_uncached(BeartypeCallHintPepReturnException):
+        the_ploughman_homeward('w')
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2020 by Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Beartype** `PEP 589`_ **unit tests.**
+
+This submodule unit tests `PEP 589`_ support implemented in the
+:func:`beartype.beartype` decorator.
+
+.. _PEP 589:
+   https://www.python.org/dev/peps/pep-0589
+'''
+
+# ....................{ IMPORTS                           }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from beartype_test.util.mark.pytskip import skip_if_python_version_less_than
+from beartype_test.util.pyterror import raises_uncached
+
+# ....................{ TESTS ~ typeddict                 }....................
+@skip_if_python_version_less_than('3.8.0')
+def test_pep589_typeddict() -> None:
+    '''
+    Test `PEP 589`_ support implemented in the :func:`beartype.beartype`
+    decorator, type-checking both the required and optional keys of typed
+    dictionaries, including typed dictionaries nested in other hints *and*
+    typed dictionaries declaring more keys than are type-checked by each call.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype, beartype_On
+    from beartype.roar import (
+        BeartypeCallHintPepParamException,
+        BeartypeCallHintPepReturnException,
+    )
+    from beartype._util.hint.pep.proposal.utilhintpep589 import (
+        get_hint_pep589_keys,
+        is_hint_pep589,
+    )
+    from typing import Any, List, Optional, TypedDict, Union
+
+    # Total typed dictionary annotated by both type-checkable and ignorable
+    # keys, all of which are required.
+    class WestWind(TypedDict):
+        breath: str
+        leaves: List[str]
+        being: Any
+
+    # Subclass of this typed dictionary declaring an additional required key.
+    class Destroyer(WestWind):
+        preserver: Optional[int]
+
+    # Non-total typed dictionary, all of whose keys are optional.
+    Azure = TypedDict(
+        'Azure', {'sister': str, 'of the {spring}': int}, total=False)
+
+    # Typed dictionary declaring more keys than are type-checked by each call.
+    Dirge = TypedDict('Dirge', {f'year_{index}': int for index in range(24)})
+
+    # Assert these testers and getters inspect these typed dictionaries.
+    assert is_hint_pep589(WestWind) is True
+    assert is_hint_pep589(Azure) is True
+    assert is_hint_pep589(dict) is False
+    assert get_hint_pep589_keys(WestWind) == (
+        frozenset(('breath', 'leaves', 'being')),
+        (('breath', str, True), ('leaves', List[str], True)),
+    )
+    assert get_hint_pep589_keys(Destroyer) == (
+        frozenset(('breath', 'leaves', 'being', 'preserver')),
+        (
+            ('breath', str, True),
+            ('leaves', List[str], True),
+            ('preserver', Optional[int], True),
+        ),
+    )
+    assert get_hint_pep589_keys(Azure) == (
+        frozenset(),
+        (('sister', str, False), ('of the {spring}', int, False)),
+    )
+
+    # Callable annotated by these typed dictionaries, including typed
+    # dictionaries nested in both containers *AND* unions.
+    @beartype
+    def thou_breath(
+        of_autumns_being: WestWind,
+        pestilence_stricken: List[Destroyer] = [],
+        multitudes: Union[Azure, int, None] = None,
+    ) -> WestWind:
+        return of_autumns_being if multitudes != 0 else {}
+
+    # Typed dictionaries satisfying and violating these hints.
+    west_wind_valid = {
+        'breath': 'O wild West Wind, thou breath of Autumn\'s being',
+        'leaves': ['yellow', 'black', 'pale', 'hectic red'],
+        'being': None,
+    }
+    west_wind_invalid = {
+        'breath': 'Thou, from whose unseen presence the leaves dead',
+        'leaves': [b'Are driven, like ghosts from an enchanter fleeing'],
+        'being': None,
+    }
+
+    # Assert this callable accepts objects satisfying these hints, including
+    # dictionaries containing keys *NOT* declared by these typed dictionaries
+    # *AND* dictionaries omitting optional keys.
+    assert thou_breath(west_wind_valid) is west_wind_valid
+    assert thou_breath(
+        west_wind_valid,
+        [dict(west_wind_valid, preserver=None, hear='oh, hear!')],
+        {'sister': 'of the Spring'},
+    ) is west_wind_valid
+    assert thou_breath(west_wind_valid, [], {}) is west_wind_valid
+    assert thou_breath(
+        west_wind_valid, [], {'of the {spring}': 1}) is west_wind_valid
+
+    # Assert this callable rejects objects violating these hints, including
+    # dictionaries omitting required keys *AND* non-dictionaries.
+    with raises_uncached(BeartypeCallHintPepParamException):
+        thou_breath([('breath', 'Yellow, and black, and pale')])
+    with raises_uncached(BeartypeCallHintPepParamException):
+        thou_breath({'breath': 'Yellow', 'leaves': []})
+    with raises_uncached(BeartypeCallHintPepParamException):
+        thou_breath(west_wind_invalid)
+    with raises_uncached(BeartypeCallHintPepParamException):
+        thou_breath(west_wind_valid, [west_wind_valid])
+    with raises_uncached(BeartypeCallHintPepParamException):
+        thou_breath(west_wind_valid, [], {'sister': b'of the Spring'})
+    with raises_uncached(BeartypeCallHintPepParamException):
+        thou_breath(west_wind_valid, [], {'of the {spring}': 'shall blow'})
+    with raises_uncached(BeartypeCallHintPepReturnException):
+        thou_breath(west_wind_valid, [], 0)
+
+    # Callables annotated by a typed dictionary declaring more keys than are
+    # type-checked by each call under the default O(1) strategy but *NOT*
+    # under the O(n) strategy.
+    @beartype
+    def the_dying_year(dirge: Dirge) -> Dirge:
+        return dirge
+    @beartype_On
+    def the_dying_year_On(dirge: Dirge) -> Dirge:
+        return dirge
+
+    # Dictionary violating only the value of its last key.
+    dirge_invalid = {f'year_{index}': index for index in range(24)}
+    dirge_invalid['year_23'] = 'Vaulted with all thy congregated might'
+
+    # Assert both callables reject dictionaries omitting required keys on
+    # every call, regardless of strategy.
+    with raises_uncached(BeartypeCallHintPepParamException):
+        the_dying_year({'year_0': 0})
+    with raises_uncached(BeartypeCallHintPepParamException):
+        the_dying_year_On({'year_0': 0})
+
+    # Assert the O(n) callable rejects this dictionary on every call.
+    with raises_uncached(BeartypeCallHintPepParamException):
+        the_dying_year_On(dirge_invalid)
+
+    # Assert the O(1) callable rejects this dictionary on only some calls.
+    # Since this value is type-checked by one in three calls, the likelihood
+    # of this value remaining unchecked across 128 calls is negligible.
+    dirge_invalid_checks_len = 0
+    for _ in range(128):
+        try:
+            the_dying_year(dirge_invalid)
+        except BeartypeCallHintPepParamException:
+            dirge_invalid_checks_len += 1
+    assert 0 < dirge_invalid_checks_len < 128
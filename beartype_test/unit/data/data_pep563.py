@@ -108,6 +108,14 @@ _MINECRAFT_END_TXT_STANZAS = (
     'Wake up.',
 )
 
+
+MinecraftEndTxtHint = int
+'''
+Global type hint annotating closures returned by the
+:func:`make_minecraft_end_txt_hinted_getter` factory, intentionally rebound by
+the :func:`test_memcache_pep563_rebound_pass` unit test.
+'''
+
 # ....................{ CALLABLES                         }....................
 # Callable intentionally decorated by @beartype.
 @beartype
@@ -125,6 +133,42 @@ def get_minecraft_end_txt_stanza(
 def get_minecraft_end_txt(player_name: str) -> str:
     return ''.join(_MINECRAFT_END_TXT_STANZAS).format(player_name=player_name)
 
+# ....................{ CALLABLES ~ closure               }....................
+# Factory intentionally *NOT* decorated by @beartype. The
+# test_memcache_pep563_pass() unit test tests that @beartype reuses the wrapper
+# generated for the first closure returned by this factory for all subsequent
+# such closures, whose postponed annotations are identical strings.
+def make_minecraft_end_txt_stanza_getter(player_name: str) -> 'Callable':
+    '''
+    New closure annotated by postponed annotations sharing the same code object
+    as all other closures returned by this factory.
+    '''
+
+    def get_minecraft_end_txt_stanza_closure(stanza_index: IntType) -> str:
+        return _MINECRAFT_END_TXT_STANZAS[stanza_index].format(
+            player_name=player_name)
+
+    return get_minecraft_end_txt_stanza_closure
+
+
+# Factory intentionally *NOT* decorated by @beartype. The
+# test_memcache_pep563_rebound_pass() unit test tests that @beartype does *NOT*
+# reuse the wrapper generated for the first closure returned by this factory
+# after rebinding the global referred to by their identical postponed
+# annotations.
+def make_minecraft_end_txt_hinted_getter() -> 'Callable':
+    '''
+    New closure annotated by postponed annotations referring to the
+    :data:`MinecraftEndTxtHint` global sharing the same code object as all
+    other closures returned by this factory.
+    '''
+
+    def get_minecraft_end_txt_hinted_closure(
+        player_name: MinecraftEndTxtHint) -> str:
+        return _MINECRAFT_END_TXT_STANZAS[1].format(player_name=player_name)
+
+    return get_minecraft_end_txt_hinted_closure
+
 # ....................{ CALLABLES ~ child limit           }....................
 #FIXME: Hilariously, we can't even unit test whether the
 #beartype._decor._pep563._die_if_hint_repr_exceeds_child_limit() function
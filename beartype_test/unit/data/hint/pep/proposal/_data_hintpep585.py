@@ -343,6 +343,27 @@ def add_data(data_module: 'ModuleType') -> None:
                 # String constant.
                 PepHintPithUnsatisfiedMetadata(
                     'To that beep‐prattling, LED‐ and lead-rattling crux'),
+
+                # Dictionary mapping a string key to a string value.
+                PepHintPithUnsatisfiedMetadata(
+                    pith={'Lax‐cracked': 'and crux‐tracked'},
+                    # Match that the exception message raised for this object
+                    # identifies the key violating this hint.
+                    exception_str_match_regexes=(
+                        r'\bdict key\b',
+                    ),
+                ),
+
+                # Dictionary mapping an integer key to an integer value.
+                PepHintPithUnsatisfiedMetadata(
+                    pith={3: 0xBADBEEF},
+                    # Match that the exception message raised for this object
+                    # identifies the value violating this hint *AND* the key
+                    # of that value.
+                    exception_str_match_regexes=(
+                        r'\bdict value of key "3"',
+                    ),
+                ),
             ),
         ),
 
@@ -55,6 +55,7 @@ from typing import (
     Container,
     ContextManager,
     Dict,
+    FrozenSet,
     Generator,
     Generic,
     Hashable,
@@ -461,6 +462,27 @@ def add_data(data_module: 'ModuleType') -> None:
                 # String constant.
                 PepHintPithUnsatisfiedMetadata(
                     'To that beep‐prattling, LED‐ and lead-rattling crux'),
+
+                # Dictionary mapping a string key to a string value.
+                PepHintPithUnsatisfiedMetadata(
+                    pith={'Lax‐cracked': 'and crux‐tracked'},
+                    # Match that the exception message raised for this object
+                    # identifies the key violating this hint.
+                    exception_str_match_regexes=(
+                        r'\bdict key\b',
+                    ),
+                ),
+
+                # Dictionary mapping an integer key to an integer value.
+                PepHintPithUnsatisfiedMetadata(
+                    pith={3: 0xBADBEEF},
+                    # Match that the exception message raised for this object
+                    # identifies the value violating this hint *AND* the key
+                    # of that value.
+                    exception_str_match_regexes=(
+                        r'\bdict value of key "3"',
+                    ),
+                ),
             ),
         ),
 
@@ -854,6 +876,37 @@ def add_data(data_module: 'ModuleType') -> None:
             ),
         ),
 
+        # ................{ SET                               }................
+        # Flat frozen set.
+        PepHintMetadata(
+            hint=FrozenSet[str],
+            pep_sign=FrozenSet,
+            type_origin=frozenset,
+            piths_satisfied_meta=(
+                # Empty frozen set.
+                PepHintPithSatisfiedMetadata(frozenset()),
+                # Frozen set containing string constants.
+                PepHintPithSatisfiedMetadata(frozenset((
+                    'Of pleasure‐measured treasure,',
+                    'Unfettered—',
+                ))),
+            ),
+            piths_unsatisfied_meta=(
+                # Set containing string constants.
+                PepHintPithUnsatisfiedMetadata({'Set‐settled, unfettered'}),
+
+                # Frozen set containing only an integer constant.
+                PepHintPithUnsatisfiedMetadata(
+                    pith=frozenset((0xFEEDFACE,)),
+                    # Match that the exception message raised for this object
+                    # identifies the item violating this hint.
+                    exception_str_match_regexes=(
+                        r'\bfrozenset item\b',
+                    ),
+                ),
+            ),
+        ),
+
         # ................{ TUPLE                             }................
         # Unsubscripted "Tuple" attribute. Note that this attribute is *NOT*
         # parametrized by one or more type variables under any Python version,
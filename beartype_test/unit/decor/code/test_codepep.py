@@ -24,6 +24,7 @@ See Also
 # WARNING: To raise human-readable test errors, avoid importing from
 # package-specific submodules at module scope.
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from beartype_test.util.mark.pytskip import skip_if_python_version_less_than
 from beartype_test.util.pyterror import raises_uncached
 from typing import Any, Union
 
@@ -140,3 +141,550 @@ def test_pep_param_kind_variadic_fail() -> None:
             'The teeth tearing into it',
             'The tongue tasting its savour',
             teeth_tearing_into_it='And the hunger for that taste')
+
+# ....................{ TESTS ~ pass : hint : param       }....................
+def test_pep_hint_param_pass() -> None:
+    '''
+    Test that the :func:`beartype.beartype` decorator passes all types and
+    tuples of types type-checked by wrapper functions as the default values of
+    private hint parameters rather than accessing these objects via the
+    beartypistry singleton.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype._decor._code.codesnip import PARAM_NAME_HINT_PREFIX
+    from typing import List
+
+    # Decorated callable to be exercised.
+    @beartype
+    def deep_roots(
+        are_not: List[Union[bytes, str]], reached_by: int) -> Union[int, str]:
+        return are_not[0] if reached_by else reached_by
+
+    # Dictionary mapping from the name to value of each private hint parameter
+    # accepted by this wrapper.
+    hint_param_name_to_hint = {
+        param_name: param_value
+        for param_name, param_value in deep_roots.__kwdefaults__.items()
+        if param_name.startswith(PARAM_NAME_HINT_PREFIX)
+    }
+
+    # Set of the same values, with tuples coerced into frozen sets ignoring
+    # the order of types in these tuples.
+    hints = {
+        frozenset(hint) if isinstance(hint, tuple) else hint
+        for hint in hint_param_name_to_hint.values()
+    }
+
+    # Assert these parameters provide all types type-checked by this wrapper.
+    assert hints == {
+        list, int, frozenset((bytes, str)), frozenset((int, str))}
+
+    # Assert this wrapper behaves as expected.
+    assert deep_roots(['by the frost'], 1) == 'by the frost'
+    with raises_uncached(Exception):
+        deep_roots([b'The old that is strong', 0.5], 'does not wither')
+
+# ....................{ TESTS ~ pass : hint : sequence    }....................
+def test_pep_hint_sequence_homogeneous_pass() -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype` decorator for
+    callables annotated by PEP-compliant standard sequence type hints passed
+    builtin homogeneous sequences whose types or typecodes prove their items
+    to satisfy these hints *without* indexing into these sequences.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype, beartype_On
+    from beartype.roar import BeartypeCallHintPepParamException
+    from beartype._decor._code._pep._pephomogeneous import (
+        get_sequence_homogeneous_types_or_none,
+        is_sequence_homogeneous,
+    )
+    from array import array
+    from collections.abc import MutableSequence, Sequence as SequenceABC
+    from typing import List, Sequence
+
+    # Assert these provers prove the expected sequences.
+    assert is_sequence_homogeneous(range(0xDEAD), int)
+    assert is_sequence_homogeneous(b'Thou still unravish', int)
+    assert is_sequence_homogeneous(array('l', (1819,)), int)
+    assert is_sequence_homogeneous(array('d', (1819.0,)), float)
+    assert is_sequence_homogeneous(memoryview(array('d', (0.5,))), float)
+    assert not is_sequence_homogeneous(array('d', (1819.0,)), int)
+    assert not is_sequence_homogeneous(memoryview(b'bride').cast('c'), int)
+    assert not is_sequence_homogeneous(
+        memoryview(bytes(4)).cast('B', (2, 2)), int)
+    assert not is_sequence_homogeneous([1819], int)
+    assert range not in get_sequence_homogeneous_types_or_none(
+        MutableSequence, int)
+    assert get_sequence_homogeneous_types_or_none(SequenceABC, list) is None
+    assert get_sequence_homogeneous_types_or_none(list, int) is None
+
+    # Callables annotated by standard sequence hints, type-checking *ALL*
+    # items of these sequences unless proven otherwise.
+    @beartype_On
+    def of_quietness(thou_foster_child: Sequence[int]) -> int:
+        return len(thou_foster_child)
+
+    @beartype
+    def of_silence(and_slow_time: Sequence[float]) -> int:
+        return len(and_slow_time)
+
+    @beartype
+    def sylvan_historian(who_canst: List[int]) -> int:
+        return len(who_canst)
+
+    # Assert these callables accept provable sequences in constant time. If
+    # these sequences were instead iterated, this would be prohibitively slow.
+    assert of_quietness(range(2**62)) == 2**62
+    assert of_quietness(bytes(2**16)) == 2**16
+    assert of_silence(memoryview(array('d', (0.5,)*3))) == 3
+    assert sylvan_historian([1819]) == 1
+
+    # Assert these callables reject unprovable sequences violating these hints.
+    with raises_uncached(BeartypeCallHintPepParamException):
+        of_quietness(memoryview(b'thus express').cast('c'))
+    with raises_uncached(BeartypeCallHintPepParamException):
+        of_silence(memoryview(b'A flowery tale'))
+    with raises_uncached(BeartypeCallHintPepParamException):
+        sylvan_historian(range(1))
+
+def test_pep_hint_sequence_types_exact_pass() -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype_On` decorator for
+    callables annotated by PEP-compliant standard sequence type hints
+    subscripted by either classes *or* unions of classes, type-checking *all*
+    items of these sequences by comparing the set of the exact types of these
+    items against the frozen set of exact types satisfying these hints.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype_On
+    from beartype.roar import BeartypeCallHintPepParamException
+    from beartype._decor._code._pep._pepexact import get_types_exact
+    from numbers import Real
+    from typing import List, Tuple
+
+    # Assert this getter returns the expected exact types.
+    assert get_types_exact((int,)) == {bool, int}
+    assert {bool, float, int} <= get_types_exact((Real,))
+    assert str not in get_types_exact((Real,))
+
+    # User-defined subclass whose exact type is *NOT* in any such set.
+    class Heifer(int): pass
+
+    # Callables annotated by standard sequence hints.
+    @beartype_On
+    def lowing_at_the_skies(and_all: List[int]) -> int:
+        return len(and_all)
+
+    @beartype_On
+    def her_silken_flanks(with_garlands: Tuple[Union[Real, str], ...]) -> int:
+        return len(with_garlands)
+
+    # Assert these callables accept sequences satisfying these hints,
+    # including items whose exact types are *NOT* in these sets.
+    assert lowing_at_the_skies(list(range(1819)) + [True, Heifer(1)]) == 1821
+    assert her_silken_flanks((0.5, 'drest', Heifer(2))) == 3
+
+    # Assert these callables reject sequences violating these hints, including
+    # sequences whose only violating item is the last.
+    with raises_uncached(BeartypeCallHintPepParamException):
+        lowing_at_the_skies(list(range(1819)) + ['What little town'])
+    with raises_uncached(BeartypeCallHintPepParamException):
+        lowing_at_the_skies([Heifer(3), 0.5])
+    with raises_uncached(BeartypeCallHintPepParamException):
+        her_silken_flanks(('by river', b'or sea shore'))
+
+# ....................{ TESTS ~ pass : hint : union       }....................
+@skip_if_python_version_less_than('3.8.0')
+def test_pep_hint_union_dispatch_pass() -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype` decorator for
+    callables annotated by unions subscripted by two or more PEP-compliant
+    container type hints, type-checking these unions by dispatching on the
+    exact types of piths via union dispatch tables under Python >= 3.8.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+    from beartype._decor._code._pep._pepunion import (
+        UNION_DISPATCH_INDEX_DETERMINED,
+        UNION_DISPATCH_INDEX_FALLBACK,
+        UNION_DISPATCH_LEN_MAX,
+        UnionTypeDispatch,
+    )
+    from collections.abc import Mapping, Sequence
+    from typing import Dict, List
+
+    # Assert union dispatch tables resolve and memoize the expected indices.
+    union_dispatch = UnionTypeDispatch((
+        (int, UNION_DISPATCH_INDEX_DETERMINED),
+        (list, 1),
+        (Sequence, 2),
+        (dict, 3),
+    ))
+    assert union_dispatch[bool] == UNION_DISPATCH_INDEX_DETERMINED
+    assert union_dispatch[dict] == 3
+    assert union_dispatch[tuple] == 2
+    assert union_dispatch[list] == UNION_DISPATCH_INDEX_FALLBACK
+    assert union_dispatch[str] == 2
+    assert union_dispatch[bytes] == 2
+    assert union_dispatch[float] == UNION_DISPATCH_INDEX_FALLBACK
+    assert len(union_dispatch) == 7
+
+    # Assert union dispatch tables memoize no more than the maximum number of
+    # exact types.
+    for type_index in range(UNION_DISPATCH_LEN_MAX):
+        union_dispatch[type(f'AColdWind{type_index}', (), {})]
+    assert len(union_dispatch) == UNION_DISPATCH_LEN_MAX
+
+    # User-defined subclasses whose exact types are resolved on first use.
+    class Overgrown(list): pass
+    class Pastoral(dict): pass
+
+    # Callable annotated by a union dispatchable on the exact types of piths.
+    @beartype
+    def cold_pastoral(
+        thou_silent_form: Union[
+            int, List[int], Dict[str, int], Mapping, None]) -> str:
+        return 'dost tease us out of thought'
+
+    # Assert this callable accepts objects satisfying this union, including
+    # objects of types satisfying this union in multiple ways.
+    for thou_silent_form in (
+        0, True, None, [1], Overgrown((2,)), {'a': 3}, Pastoral(b=4),
+        {b'c': 5},
+    ):
+        assert cold_pastoral(thou_silent_form) == 'dost tease us out of thought'
+
+    # Assert this callable rejects objects violating this union, including
+    # objects whose exact types dispatch to only one child hint.
+    for thou_silent_form in ('As doth eternity', ['Cold'], Overgrown(('P',))):
+        with raises_uncached(BeartypeCallHintPepParamException):
+            cold_pastoral(thou_silent_form)
+
+
+@skip_if_python_version_less_than('3.8.0')
+def test_pep_hint_union_dispatch_adaptive_pass() -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype` decorator for
+    callables annotated by unions subscripted by two or more PEP-compliant
+    container type hints, type-checking these unions by adaptively learning
+    the preferred child hint for each exact pith type under Python >= 3.8.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype, beartype_freeze_unions
+    from beartype.roar import BeartypeCallHintPepParamException
+    from beartype._decor._code._pep._pepunion import (
+        UNION_DISPATCH_HITS_WARMUP,
+        UNION_DISPATCH_INDEX_FALLBACK,
+        UnionTypeDispatch,
+        freeze_union_dispatches,
+    )
+    from collections.abc import Sequence
+    from typing import List
+
+    # Assert adaptive union dispatch tables learn the child hint most
+    # frequently satisfied by each ambiguous exact type after warming up.
+    union_dispatch = UnionTypeDispatch(((list, 1), (Sequence, 2)), True)
+    assert union_dispatch[list] == UNION_DISPATCH_INDEX_FALLBACK
+    assert union_dispatch.hit(list, 1) is True
+    for _ in range(UNION_DISPATCH_HITS_WARMUP - 2):
+        union_dispatch.hit(list, 2)
+    assert union_dispatch[list] == UNION_DISPATCH_INDEX_FALLBACK
+    union_dispatch.hit(list, 2)
+    assert union_dispatch[list] == ~2
+
+    # Assert frozen adaptive union dispatch tables learn nothing further.
+    union_dispatch = UnionTypeDispatch(((list, 1), (Sequence, 2)), True)
+    assert union_dispatch[list] == UNION_DISPATCH_INDEX_FALLBACK
+    freeze_union_dispatches()
+    assert union_dispatch.is_frozen is True
+    for _ in range(UNION_DISPATCH_HITS_WARMUP):
+        union_dispatch.hit(list, 2)
+    assert union_dispatch[list] == UNION_DISPATCH_INDEX_FALLBACK
+
+    # Callable annotated by a union adaptively dispatched on the exact types
+    # of piths.
+    @beartype(is_union_adaptive=True)
+    def thou_still_unravished(
+        bride_of_quietness: Union[int, List[int], Sequence[str]]) -> int:
+        return len(bride_of_quietness)
+
+    # Assert this callable accepts objects satisfying this union both before
+    # and after learning the preferred child hint for lists.
+    for _ in range(UNION_DISPATCH_HITS_WARMUP + 1):
+        assert thou_still_unravished(['Thou', 'foster-child']) == 2
+    assert thou_still_unravished([1, 2, 3]) == 3
+    assert thou_still_unravished(('of silence', 'and slow time')) == 2
+
+    # Assert this callable rejects objects violating this union.
+    with raises_uncached(BeartypeCallHintPepParamException):
+        thou_still_unravished([b'Sylvan historian'])
+
+    # Assert this callable still type-checks as before after freezing.
+    beartype_freeze_unions()
+    assert thou_still_unravished([1, 2, 3]) == 3
+    with raises_uncached(BeartypeCallHintPepParamException):
+        thou_still_unravished(0.5)
+
+# ....................{ TESTS ~ pass : hint : mapping     }....................
+def test_pep_hint_mapping_pass() -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype` decorator for
+    callables annotated by PEP-compliant mapping type hints, deeply
+    type-checking the keys and values of these mappings.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype, beartype_On
+    from beartype.roar import BeartypeCallHintPepParamException
+    from beartype._decor._code._pep._pepsample import (
+        get_mapping_item, get_mapping_items_log)
+    from collections import Counter, OrderedDict
+    from pickle import dumps, loads
+    from typing import Counter as CounterHint, Dict, Mapping
+
+    # Callables annotated by mapping hints under the default and "O(n)"
+    # strategies.
+    @beartype
+    def the_stars(are_mansions: Dict[str, Dict[str, int]]) -> int:
+        return len(are_mansions)
+
+    @beartype
+    def built_by_nature(as_a_sieve: Mapping[str, int]) -> int:
+        return len(as_a_sieve)
+
+    @beartype
+    def for_the_grand_tribe(of_those_who: CounterHint[str]) -> int:
+        return len(of_those_who)
+
+    @beartype_On
+    def in_the_dark(moon_has_set: Mapping[str, int]) -> int:
+        return len(moon_has_set)
+
+    # Assert these callables accept mappings of only valid items.
+    assert the_stars({'Of the grand': {'tribe': 1}}) == 1
+    assert for_the_grand_tribe(Counter(('Of', 'those', 'who'))) == 3
+    assert in_the_dark({'For the grand': 1, 'tribe': 2}) == 2
+
+    # Assert these callables reject nested mappings violating these hints by
+    # either key or value.
+    with raises_uncached(BeartypeCallHintPepParamException):
+        the_stars({'Rising by': {b'the stream': 1}})
+    with raises_uncached(BeartypeCallHintPepParamException):
+        the_stars({'Of the aged': {'wind': 'from the west'}})
+    with raises_uncached(BeartypeCallHintPepParamException):
+        for_the_grand_tribe(Counter((b'and chasten their',)))
+
+    # Assert the "O(n)" strategy rejects a mapping whose only invalid item is
+    # the last.
+    in_the_dark_mapping = {str(index): index for index in range(64)}
+    in_the_dark_mapping['sown'] = 'like frost'
+    with raises_uncached(BeartypeCallHintPepParamException):
+        in_the_dark(in_the_dark_mapping)
+
+    # Assert the default strategy eventually rejects an ordered dictionary of
+    # eight items whose only invalid item is the last by pseudo-randomly
+    # sampling one of the first or last four items of that dictionary on each
+    # call. Since the last item is sampled by one in eight calls, the
+    # likelihood of that item remaining unchecked across 512 calls is
+    # negligible.
+    with_the_night = OrderedDict((str(index), index) for index in range(7))
+    with_the_night['wind'] = b'that cries'
+    with raises_uncached(BeartypeCallHintPepParamException):
+        for _ in range(512):
+            built_by_nature(with_the_night)
+
+    # Assert the default strategy eventually rejects an ordered dictionary
+    # whose only invalid item is neither the first nor last item but still
+    # resides in the window of items sampled by the "O(1)" sampler.
+    with_the_night_middle = OrderedDict(
+        (str(index), index) for index in range(8))
+    with_the_night_middle['2'] = b'sown like frost'
+    with raises_uncached(BeartypeCallHintPepParamException):
+        for _ in range(512):
+            built_by_nature(with_the_night_middle)
+
+    # Assert the "O(1)" sampler selects the first or last items by the parity
+    # of the passed pseudo-random integer and the offset into these items by
+    # the remaining bits of that integer.
+    assert get_mapping_item(with_the_night, 0) == ('0', 0)
+    assert get_mapping_item(with_the_night, 1) == ('wind', b'that cries')
+    assert get_mapping_item(with_the_night, 4) == ('2', 2)
+    assert get_mapping_item(with_the_night, 5) == ('5', 5)
+    assert get_mapping_item(with_the_night, 8) == ('0', 0)
+
+    # Assert doing so neither adds attributes to this dictionary nor
+    # prevents this dictionary from being pickled as is.
+    assert vars(with_the_night) == {}
+    assert loads(dumps(with_the_night)) == with_the_night
+    assert b'beartype' not in dumps(with_the_night)
+
+    # Mapping whose dictionary is itself.
+    class ThatCries(dict):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            self.__dict__ = self
+
+    # Assert the default strategy accepts such a valid mapping on successive
+    # calls *WITHOUT* modifying that mapping.
+    the_wind = ThatCries(that=1, cries=2)
+    for _ in range(8):
+        assert built_by_nature(the_wind) == 2
+    assert the_wind == {'that': 1, 'cries': 2}
+
+    # Assert the "O(lgn)" sampler yields the expected number of items.
+    mapping = {index: str(index) for index in range(100)}
+    for random_int in range(4):
+        assert len(get_mapping_items_log(mapping, random_int)) == (
+            (100).bit_length())
+
+# ....................{ TESTS ~ pass : hint : reiterable  }....................
+def test_pep_hint_reiterable_pass() -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype` decorator for
+    callables annotated by PEP-compliant reiterable type hints, deeply
+    type-checking the items of these reiterables *without* consuming one-shot
+    iterators.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype, beartype_Ologn, beartype_On
+    from beartype.roar import BeartypeCallHintPepParamException
+    from beartype._decor._code._pep._pepsample import (
+        get_reiterable_item, get_reiterable_items_log)
+    from beartype._util.utilobject import SENTINEL
+    from typing import AbstractSet, Collection, ItemsView, Iterable, Set
+
+    # Callables annotated by reiterable hints under all strategies.
+    @beartype
+    def the_world_is(too_much_with_us: Set[int]) -> int:
+        return len(too_much_with_us)
+
+    @beartype
+    def late_and_soon(getting_and_spending: Iterable[str]) -> str:
+        return ''.join(getting_and_spending)
+
+    @beartype
+    def we_lay_waste(our_powers: ItemsView[str, int]) -> int:
+        return len(our_powers)
+
+    @beartype_Ologn
+    def little_we_see(in_nature: Collection[int]) -> int:
+        return len(in_nature)
+
+    @beartype_On
+    def that_is_ours(we_have_given: AbstractSet[int]) -> int:
+        return len(we_have_given)
+
+    # Assert these callables accept reiterables of only valid items.
+    assert the_world_is({1807, 1802}) == 2
+    assert the_world_is(set()) == 0
+    assert late_and_soon(['our hearts ', 'away']) == 'our hearts away'
+    assert we_lay_waste({'a sordid boon': 1}.items()) == 1
+    assert little_we_see({1, 2, 3}) == 3
+    assert that_is_ours(frozenset(range(64))) == 64
+
+    # Assert these callables neither type-check nor consume the items of
+    # one-shot iterators, which are only shallowly type-checked.
+    assert late_and_soon(iter(('This Sea ', 'that bares'))) == (
+        'This Sea that bares')
+    assert late_and_soon(
+        sea_item for sea_item in ('her bosom ', 'to the moon')) == (
+        'her bosom to the moon')
+
+    # Assert these callables reject reiterables violating these hints.
+    with raises_uncached(BeartypeCallHintPepParamException):
+        the_world_is({b'The winds that will be howling'})
+    with raises_uncached(BeartypeCallHintPepParamException):
+        late_and_soon([b'at all hours'])
+    with raises_uncached(BeartypeCallHintPepParamException):
+        we_lay_waste({'And are up-gathered': 'now like'}.items())
+    with raises_uncached(BeartypeCallHintPepParamException):
+        little_we_see({'sleeping flowers'})
+
+    # Assert the "O(n)" strategy rejects a frozen set whose only invalid item
+    # is *NOT* the first item iterated by this set.
+    with raises_uncached(BeartypeCallHintPepParamException):
+        that_is_ours(frozenset(tuple(range(64)) + ('For this',)))
+
+    # Assert the default strategy eventually rejects a dictionary view of
+    # eight items whose only invalid item is the last by pseudo-randomly
+    # sampling one of the first or last four items of that view on each call.
+    # Since the last item is sampled by one in eight calls, the likelihood of
+    # that item remaining unchecked across 512 calls is negligible.
+    we_have_given = {str(index): index for index in range(7)}
+    we_have_given['our hearts away'] = b'a sordid boon'
+    with raises_uncached(BeartypeCallHintPepParamException):
+        for _ in range(512):
+            we_lay_waste(we_have_given.items())
+
+    # Set subclass with a dictionary *AND* user-defined collection whose
+    # iteration has side effects.
+    class ForThisForEverything(set): pass
+    class WeAreOutOfTune(object):
+        def __init__(self) -> None:
+            self.iterations = 0
+        def __contains__(self, item: object) -> bool:
+            return False
+        def __iter__(self):
+            self.iterations += 1
+            return iter(('It moves us not.',))
+        def __len__(self) -> int:
+            return 1
+
+    # Assert these callables only shallowly type-check reiterables *NOT*
+    # known to be safely iterable, neither iterating nor modifying these
+    # reiterables.
+    we_are_out_of_tune = ForThisForEverything(range(7))
+    we_are_out_of_tune.add('It moves us not.')
+    assert the_world_is(we_are_out_of_tune) == 8
+    assert vars(we_are_out_of_tune) == {}
+    it_moves_us_not = WeAreOutOfTune()
+    assert little_we_see(it_moves_us_not) == 1
+    assert it_moves_us_not.iterations == 0
+
+    # Assert these samplers never consume one-shot iterators.
+    great_god = iter(('Great God!',))
+    assert get_reiterable_item(great_god, 0) is SENTINEL
+    assert get_reiterable_items_log(great_god, 0) == ()
+    assert next(great_god) == 'Great God!'
+
+    # Assert the "O(1)" sampler selects the item at the offset into the first
+    # items of a reiterable selected by the passed pseudo-random integer.
+    assert get_reiterable_item(frozenset((1,)), 6) == 1
+    assert get_reiterable_item({'0': 0, '1': 1}.keys(), 2) == '1'
+
+    # Assert these samplers yield the expected number of items.
+    assert get_reiterable_item(set(), 0) is SENTINEL
+    assert len(get_reiterable_items_log(set(range(100)), 0)) == (
+        (100).bit_length())
+
+# ....................{ TESTS ~ fail : hint               }....................
+def test_pep_hint_child_limit_fail() -> None:
+    '''
+    Test unsuccessful usage of the :func:`beartype.beartype` decorator for a
+    callable annotated by a PEP-compliant type hint transitively subscripted
+    by more child hints than supported by that decorator.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeDecorHintPepException
+    from beartype._util.cache.pool.utilcachepoollistfixed import SIZE_BIG
+    from typing import Tuple
+
+    # Assert that decorating a callable annotated by a fixed tuple hint
+    # subscripted by more child hints than this limit raises the expected
+    # exception.
+    def ice_and_fire(
+        of_the_seventy_and_four: Tuple[(int,)*SIZE_BIG]) -> str:
+        pass
+    with raises_uncached(BeartypeDecorHintPepException):
+        beartype(ice_and_fire)
@@ -80,6 +80,56 @@ def test_hint_ref_param_pass() -> None:
     assert sisters_of_battle('Abbess Sanctorum', Random()) in range(
         ESTABLISHMENT_DATE_MIN, ESTABLISHMENT_DATE_MAX + 1)
 
+
+def test_hint_ref_param_self_patch_pass() -> None:
+    '''
+    Test that the first successful call to a callable decorated by the
+    :func:`beartype.beartype` decorator and passed a parameter annotated with
+    a PEP-noncompliant fully-qualified forward reference self-patches the
+    wrapper generated by that decorator by replacing the forward reference
+    proxy passed to that wrapper with the class referred to by that reference.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype._decor._typistry import BeartypistryForwardRef
+
+    # Function to be type-checked.
+    @beartype
+    def adepta_sororitas(
+        order: str, establishment: 'random.Random') -> 'random.Random':
+        return establishment
+
+    # Forward reference proxies passed to this wrapper before the first call.
+    hints_forwardref = [
+        hint for hint in adepta_sororitas.__kwdefaults__.values()
+        if isinstance(hint, BeartypistryForwardRef)
+    ]
+
+    # Assert this wrapper was passed exactly one such proxy shared between
+    # this parameter and return value.
+    assert len(hints_forwardref) == 1
+
+    # Name of the private hint parameter whose default value is this proxy.
+    hint_param_name = hints_forwardref[0].param_name
+
+    # Import the stdlib module referenced above *AFTER* that forward reference.
+    from random import Random
+
+    # Assert the first call to this function succeeds.
+    order_of_our_martyred_lady = Random()
+    assert adepta_sororitas(
+        'Order of Our Martyred Lady', order_of_our_martyred_lady) is (
+        order_of_our_martyred_lady)
+
+    # Assert this call replaced this proxy with this class.
+    assert adepta_sororitas.__kwdefaults__[hint_param_name] is Random
+
+    # Assert subsequent calls to this function continue to succeed.
+    assert adepta_sororitas(
+        'Order of the Valorous Heart', order_of_our_martyred_lady) is (
+        order_of_our_martyred_lady)
+
 # ....................{ TESTS ~ fail                      }....................
 def test_hint_ref_decor_fail() -> None:
     '''
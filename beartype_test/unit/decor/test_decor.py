@@ -16,6 +16,7 @@ concerns (e.g., PEP-compliance, PEP-noncompliance).
 # WARNING: To raise human-readable test errors, avoid importing from
 # package-specific submodules at module scope.
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from beartype_test.util.mark.pytskip import skip_if_python_version_less_than
 from pytest import raises
 
 # ....................{ TODO                              }....................
@@ -139,3 +140,515 @@ def test_decor_param_call_keyword_unknown_fail() -> None:
     # currently stable across Python versions and thus robustly testable.
     assert str(exception.value) == (
         "tau() got an unexpected keyword argument 'nicassar'")
+
+# ....................{ TESTS ~ signature                 }....................
+def test_decor_sig_mirrored_pass() -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype` decorator for
+    callables whose signatures are mirrored by their wrapper functions.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+    from inspect import signature
+    from typing import Optional
+
+    # Default value violating the type hint annotating its parameter.
+    ALONE_DEFAULT = b'The Emperor Protects'
+
+    # Decorated callable accepting all mirrorable kinds of parameters.
+    @beartype
+    def battle_brother(
+        chapter: str,
+        company: str = 'First Company',
+        *squads: str,
+        alone: str = ALONE_DEFAULT,
+        sergeant: Optional[str] = None,
+        **wargear
+    ) -> tuple:
+        return (chapter, company, squads, alone, sergeant, wargear)
+
+    # Assert this wrapper accepts the same parameters as this callable
+    # *WITHOUT* variadic parameters this callable does *NOT* accept.
+    wrapper_code = battle_brother.__code__
+    assert wrapper_code.co_name == 'battle_brother'
+    assert wrapper_code.co_varnames[:wrapper_code.co_argcount] == (
+        'chapter', 'company')
+    assert 'args' not in wrapper_code.co_varnames
+
+    # If code objects declare fully-qualified names (i.e., under Python >=
+    # 3.11), assert this wrapper declares that of this callable.
+    if hasattr(wrapper_code, 'co_qualname'):
+        assert wrapper_code.co_qualname == battle_brother.__qualname__
+        assert wrapper_code.co_qualname.endswith('<locals>.battle_brother')
+
+    # Assert this wrapper privately retains the default values of this
+    # callable *AND* publicly reports the same signature as this callable.
+    assert battle_brother.__kwdefaults__[
+        '__beartype_default_company'] == 'First Company'
+    assert battle_brother.__kwdefaults__[
+        '__beartype_default_alone'] is ALONE_DEFAULT
+    battle_brother_params = signature(battle_brother).parameters
+    assert battle_brother_params['company'].default == 'First Company'
+    assert battle_brother_params['alone'].default is ALONE_DEFAULT
+
+    # Assert this wrapper passes default values as is *WITHOUT* type-checking
+    # these values.
+    assert battle_brother('Ultramarines') == (
+        'Ultramarines', 'First Company', (), ALONE_DEFAULT, None, {})
+
+    # Assert this wrapper passes all passed parameters as is.
+    assert battle_brother(
+        'Blood Angels', 'Fifth Company', 'Tactical', 'Assault',
+        alone='Sanguinius', sergeant='Lemartes', relic='Blade Encarmine',
+    ) == (
+        'Blood Angels', 'Fifth Company', ('Tactical', 'Assault'),
+        'Sanguinius', 'Lemartes', {'relic': 'Blade Encarmine'},
+    )
+
+    # Assert this wrapper type-checks passed parameters of each kind.
+    with raises(BeartypeCallHintPepParamException):
+        battle_brother('Dark Angels', b'Deathwing')
+    with raises(BeartypeCallHintPepParamException):
+        battle_brother('Dark Angels', 'Ravenwing', b'Inner Circle')
+    with raises(BeartypeCallHintPepParamException):
+        battle_brother('Dark Angels', alone=b'Fallen')
+    with raises(BeartypeCallHintPepParamException):
+        battle_brother('Dark Angels', sergeant=b'Azrael')
+
+    # Assert this wrapper type-checks parameters explicitly passed their
+    # default values.
+    with raises(BeartypeCallHintPepParamException):
+        battle_brother('Dark Angels', alone=ALONE_DEFAULT)
+
+
+def test_decor_sig_mirrored_default_passed_fail() -> None:
+    '''
+    Test unsuccessful usage of the :func:`beartype.beartype` decorator for
+    callables whose signatures are mirrored by their wrapper functions, passed
+    parameters whose values are their ``None`` default values violating the
+    type hints annotating these parameters.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+
+    # Decorated callable whose parameters default to "None" *WITHOUT* being
+    # annotated as optional.
+    @beartype
+    def penitent_engine(martyr: int = None, *, pilot: str = None) -> tuple:
+        return (martyr, pilot)
+
+    # Assert this wrapper passes unpassed default values as is.
+    assert penitent_engine() == (None, None)
+    assert penitent_engine(1, pilot='Sister Repentia') == (
+        1, 'Sister Repentia')
+
+    # Assert this wrapper type-checks passed "None" values.
+    with raises(BeartypeCallHintPepParamException):
+        penitent_engine(None)
+    with raises(BeartypeCallHintPepParamException):
+        penitent_engine(martyr=None)
+    with raises(BeartypeCallHintPepParamException):
+        penitent_engine(pilot=None)
+
+
+def test_decor_sig_mirrored_builtin_shadow_pass() -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype` decorator for
+    callables accepting parameters shadowing builtins accessed by the code
+    type-checking those callables, whose signatures are mirrored by their
+    wrapper functions.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+    from typing import List, Type, Union
+
+    # Decorated callable accepting parameters shadowing both builtin types
+    # annotating these parameters *AND* builtin functions called by the code
+    # type-checking these parameters.
+    @beartype
+    def tech_priest(
+        type: str,
+        str: Union[int, List[bytes]] = 0,
+        isinstance: Type[int] = bool,
+        len: tuple = (),
+        id: int = 0,
+    ) -> tuple:
+        return (type, str, isinstance, len, id)
+
+    # Assert this wrapper accepts the same parameters as this callable.
+    wrapper_code = tech_priest.__code__
+    assert 'args' not in wrapper_code.co_varnames
+    assert wrapper_code.co_varnames[:wrapper_code.co_argcount] == (
+        'type', 'str', 'isinstance', 'len', 'id')
+
+    # Assert this wrapper behaves as expected.
+    assert tech_priest('Magos') == ('Magos', 0, bool, (), 0)
+    assert tech_priest(
+        'Magos', [b'Mechanicus'], int, ('Omnissiah',), 40000) == (
+        'Magos', [b'Mechanicus'], int, ('Omnissiah',), 40000)
+    with raises(BeartypeCallHintPepParamException):
+        tech_priest(type=b'Heresy')
+    with raises(BeartypeCallHintPepParamException):
+        tech_priest('Magos', ['Heresy'])
+    with raises(BeartypeCallHintPepParamException):
+        tech_priest('Magos', isinstance=str)
+    with raises(BeartypeCallHintPepParamException):
+        tech_priest('Magos', len=['Heresy'])
+    with raises(BeartypeCallHintPepParamException):
+        tech_priest('Magos', id='Heresy')
+
+
+def test_decor_sig_variadic_pass() -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype` decorator for
+    callables whose signatures are *not* mirrorable by their wrapper functions,
+    which then fallback to accepting all parameters variadically.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+    from functools import wraps
+
+    def undecorated_proxy(func):
+        @wraps(func)
+        def _proxy(*args, **kwargs):
+            return func(*args, **kwargs)
+        return _proxy
+
+    # Decorated callable whose signature is merely proxied by another
+    # callable rather than reflected by its code object.
+    @beartype
+    @undecorated_proxy
+    def servitor(lobotomy: str) -> str:
+        return lobotomy
+
+    # Assert this wrapper accepts parameters variadically.
+    assert 'args' in servitor.__code__.co_varnames
+
+    # Assert this wrapper behaves as expected.
+    assert servitor('Omnissiah') == 'Omnissiah'
+    with raises(BeartypeCallHintPepParamException):
+        servitor(b'Heresy')
+
+
+@skip_if_python_version_less_than('3.8.0')
+def test_decor_sig_mirrored_positional_only_pass() -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype` decorator for
+    callables accepting positional-only parameters under Python >= 3.8, whose
+    signatures are mirrored by their wrapper functions.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+
+    # Define a callable accepting positional-only parameters dynamically, as
+    # this syntax is invalid under older Python versions.
+    func_locals = {}
+    exec(
+        'def ordo_malleus(daemon, /, banished=True, *, by: str) -> tuple:\n'
+        '    return (daemon, banished, by)\n',
+        {'__name__': __name__}, func_locals,
+    )
+    ordo_malleus = beartype(func_locals['ordo_malleus'])
+
+    # Assert this wrapper accepts these parameters only positionally.
+    assert ordo_malleus.__code__.co_posonlyargcount == 1
+    assert ordo_malleus('Angron', by='Grey Knights') == (
+        'Angron', True, 'Grey Knights')
+    with raises(TypeError):
+        ordo_malleus(daemon='Angron', by='Grey Knights')
+
+# ....................{ TESTS ~ code                      }....................
+@skip_if_python_version_less_than('3.8.0')
+def test_decor_code_shared_pass() -> None:
+    '''
+    Test that the :func:`beartype.beartype` decorator compiles the code of
+    wrappers of distinct callables with identical signatures and type hints
+    exactly once under Python >= 3.8.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype._decor.main import _compile_func_code
+    from typing import Sequence
+
+    # Callables with distinct names but identical signatures and type hints.
+    def the_lamps_are_going_out(all_over: Sequence[str]) -> str:
+        return all_over[0]
+    def we_shall_not_see_them(all_over: Sequence[str]) -> str:
+        return all_over[-1]
+
+    # Decorate the first callable, compiling its wrapper.
+    europe = beartype(the_lamps_are_going_out)
+
+    # Decorate the second callable, reusing the code compiled above.
+    compile_hits_old = _compile_func_code.cache_info().hits
+    in_our_lifetime = beartype(we_shall_not_see_them)
+    assert _compile_func_code.cache_info().hits == compile_hits_old + 1
+
+    # Assert these wrappers share the same bytecode but retain their names.
+    assert europe.__code__.co_code == in_our_lifetime.__code__.co_code
+    assert europe.__code__.co_name == 'the_lamps_are_going_out'
+    assert in_our_lifetime.__code__.co_name == 'we_shall_not_see_them'
+    if hasattr(europe.__code__, 'co_qualname'):
+        assert europe.__code__.co_qualname == (
+            the_lamps_are_going_out.__qualname__)
+        assert in_our_lifetime.__code__.co_qualname == (
+            we_shall_not_see_them.__qualname__)
+
+    # Assert these wrappers still call their respective callables.
+    assert europe(('Sir Edward', 'Grey')) == 'Sir Edward'
+    assert in_our_lifetime(('Sir Edward', 'Grey')) == 'Grey'
+
+# ....................{ TESTS ~ lazy                      }....................
+def test_decor_lazy_pass() -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype` decorator in lazy
+    mode.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+    from typing import List
+
+    # Callable decorated in lazy mode.
+    @beartype(lazy=True)
+    def the_sun_is_lost(
+        and_the_earth: List[str], *, and_no_mans_wit: int = 1) -> str:
+        return and_the_earth[0] * and_no_mans_wit
+
+    # Code object of the unresolved trampoline wrapping this callable.
+    func_trampoline_code = the_sun_is_lost.__code__
+
+    # Assert this trampoline preserves the metadata of this callable.
+    assert the_sun_is_lost.__name__ == 'the_sun_is_lost'
+    assert the_sun_is_lost.__wrapped__ is not None
+
+    # Assert the first call to this trampoline both succeeds *AND* replaces
+    # the code object of this trampoline with that of the resolved wrapper.
+    assert the_sun_is_lost(['Can well direct'], and_no_mans_wit=2) == (
+        'Can well direct' * 2)
+    assert the_sun_is_lost.__code__ is not func_trampoline_code
+
+    # Assert subsequent calls to this resolved trampoline type-check.
+    assert the_sun_is_lost(['where to look for it']) == 'where to look for it'
+    with raises(BeartypeCallHintPepParamException):
+        the_sun_is_lost([b'And freely men confess that this world'])
+    with raises(BeartypeCallHintPepParamException):
+        the_sun_is_lost(['is spent'], and_no_mans_wit='When in the planets')
+
+    # Assert that re-decorating this trampoline reduces to a noop.
+    assert beartype(the_sun_is_lost) is the_sun_is_lost
+
+    # Callable decorated in lazy mode requiring no type-checking.
+    @beartype(lazy=True)
+    def and_in_the_firmament(they_seek_so_many_new: object) -> object:
+        return they_seek_so_many_new
+
+    # Assert calls to this trampoline succeed.
+    assert and_in_the_firmament('they see that this') == 'they see that this'
+    assert and_in_the_firmament(b'Is crumbled out again') == (
+        b'Is crumbled out again')
+
+
+def test_decor_lazy_fail() -> None:
+    '''
+    Test unsuccessful usage of the :func:`beartype.beartype` decorator in lazy
+    mode.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeDecorHintNonPepException
+
+    # Assert that decorating a callable annotated by an invalid type hint in
+    # lazy mode succeeds, deferring the resulting exception to each call.
+    @beartype(lazy=True)
+    def to_his_atomies(tis_all_in_pieces: 1611):
+        return tis_all_in_pieces
+
+    with raises(BeartypeDecorHintNonPepException):
+        to_his_atomies('All just supply')
+    with raises(BeartypeDecorHintNonPepException):
+        to_his_atomies('and all relation')
+
+# ....................{ TESTS ~ strategy                  }....................
+def test_decor_strategy_On_pass() -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype_On` decorator,
+    type-checking *all* items of each container.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype_On
+    from beartype.roar import BeartypeCallHintPepParamException
+    from typing import List, Tuple
+
+    # Callables decorated in both eager and lazy modes.
+    @beartype_On
+    def the_sea_of_faith(was_once_too: List[Tuple[str, ...]]) -> int:
+        return len(was_once_too)
+
+    @beartype_On(lazy=True)
+    def at_the_full(and_round_earths_shore: List[str]) -> int:
+        return len(and_round_earths_shore)
+
+    # Assert these callables accept containers of only valid items.
+    assert the_sea_of_faith([('Lay like the folds',), ()]) == 2
+    assert at_the_full(['of a bright girdle furled']) == 1
+
+    # Assert these callables reject containers whose only invalid item is the
+    # last, which single-item sampling would almost always fail to detect.
+    with raises(BeartypeCallHintPepParamException):
+        the_sea_of_faith([('But now I only hear',)]*63 + [(b'Its',)])
+    with raises(BeartypeCallHintPepParamException):
+        at_the_full(['long, withdrawing roar']*63 + [0xDEADBEEF])
+
+
+def test_decor_strategy_Ologn_pass() -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype_Ologn` decorator,
+    type-checking a logarithmic number of items of each container.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype, beartype_Ologn
+    from beartype.roar import BeartypeCallHintPepParamException
+    from beartype._decor._code._pep._pepsample import get_sequence_items_log
+    from typing import List
+
+    # Assert this sampler yields the expected number of distinct items.
+    sequence = list(range(100))
+    for random_int in range(0, 1000, 7):
+        items = get_sequence_items_log(sequence, random_int)
+        assert len(items) == len(set(items)) == (100).bit_length()
+    assert get_sequence_items_log(['Retreating'], 0xCAFEBABE) == ['Retreating']
+
+    # Undecorated callable.
+    def to_the_breath(of_the_night_wind: List[int]) -> int:
+        return len(of_the_night_wind)
+
+    # Assert decorating this callable under this and the default strategy
+    # produces distinct wrappers.
+    down_the_vast_edges = beartype_Ologn(to_the_breath)
+    assert down_the_vast_edges is not beartype(to_the_breath)
+    assert down_the_vast_edges([1867]*100) == 100
+
+    # Assert this wrapper rejects a container whose last half of items are
+    # invalid, which sampling seven evenly spaced items is guaranteed to
+    # detect.
+    with raises(BeartypeCallHintPepParamException):
+        down_the_vast_edges([1867]*50 + ['drear']*50)
+
+# ....................{ TESTS ~ index                     }....................
+def test_decor_index_round_robin_pass() -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype` decorator under the
+    :attr:`beartype.BeartypeIndexKind.ROUND_ROBIN` container index source,
+    type-checking *every* item of each container of fixed length ``n`` in at
+    most ``n`` calls.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import BeartypeIndexKind, beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+    from typing import List
+
+    # Undecorated callable.
+    def ah_love(let_us_be: List[str]) -> int:
+        return len(let_us_be)
+
+    # Wrappers decorated from this callable in both eager and lazy modes.
+    true_to_one_another = beartype(
+        ah_love, index_kind=BeartypeIndexKind.ROUND_ROBIN)
+    for_the_world = beartype(
+        ah_love, lazy=True, index_kind=BeartypeIndexKind.ROUND_ROBIN)
+
+    # Assert these wrappers differ from that decorated by the default source.
+    assert true_to_one_another is not beartype(ah_love)
+
+    # Container whose only invalid item is in the middle.
+    which_seems = ['To lie before us like a land of dreams']*36
+    which_seems[17] = b'So various, so beautiful, so new'
+
+    # Assert each wrapper rejects this container in at most as many calls as
+    # this container has items, each wrapper privately counting its own calls.
+    for func_wrapper in (true_to_one_another, for_the_world):
+        with raises(BeartypeCallHintPepParamException):
+            for _ in range(len(which_seems)):
+                func_wrapper(which_seems)
+
+# ....................{ TESTS ~ types cache               }....................
+def test_decor_types_cached_pass() -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype` decorator passed
+    ``is_types_cached=True``, caching the types of objects satisfying only
+    type-determined hints.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import (
+        BeartypeCallHintPepParamException,
+        BeartypeCallHintPepReturnException,
+    )
+    from numbers import Real
+    from typing import List, Optional, TypeVar, Union
+
+    # Undecorated callable annotated by both type-determined hints and a
+    # deeply type-checked hint.
+    def the_mountain_sheep(
+        and_the_grouse: Real,
+        ah_sunflower: List[int],
+        weary_of_time: Optional[Union[int, str]] = None,
+    ) -> Real:
+        return and_the_grouse if weary_of_time != 'Who countest' else b'steps'
+
+    # Wrappers decorated from this callable, each privately caching the types
+    # of the parameters and return value satisfying these hints.
+    seeking_after = beartype(the_mountain_sheep, is_types_cached=True)
+    that_sweet = beartype(the_mountain_sheep, is_types_cached=True)
+    types_cache = seeking_after.__kwdefaults__['__beartype_types_cache']
+    assert types_cache == [None, None, None]
+    assert that_sweet.__kwdefaults__['__beartype_types_cache'] is not (
+        types_cache)
+
+    # Assert this wrapper caches the types of valid parameters and returns.
+    assert seeking_after(0.5, [1], 7) == 0.5
+    assert types_cache == [float, int, float]
+
+    # Assert this wrapper still rejects invalid parameters and returns of
+    # uncached types.
+    with raises(BeartypeCallHintPepParamException):
+        seeking_after('golden clime', [1])
+    with raises(BeartypeCallHintPepParamException):
+        seeking_after(0.5, [1], 0.5)
+    with raises(BeartypeCallHintPepReturnException):
+        seeking_after(0.5, [1], 'Who countest')
+
+    # Assert this wrapper still deeply type-checks lists, whose types are
+    # *NOT* cached.
+    with raises(BeartypeCallHintPepParamException):
+        seeking_after(0.5, ['Where the traveller’s journey is done'])
+
+    # Type variable bounded by a deeply type-checked hint.
+    T = TypeVar('T', bound=List[int])
+
+    # Wrapper annotated by this type variable, whose types are *NOT* cached.
+    @beartype(is_types_cached=True)
+    def arise_from_their_graves(and_aspire: T) -> T:
+        return and_aspire
+
+    # Assert this wrapper still deeply type-checks lists of cached types.
+    assert arise_from_their_graves([1]) == [1]
+    with raises(BeartypeCallHintPepParamException):
+        arise_from_their_graves(['Where my Sun-flower wishes to go'])
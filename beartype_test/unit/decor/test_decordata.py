@@ -31,3 +31,56 @@ def test_decor_data() -> None:
     # Assert that instances of this dataclass are unhashable.
     with raises(TypeError):
         hash(beartype_data)
+
+
+def test_decor_data_params() -> None:
+    '''
+    Test that the private parameter extractor underlying the
+    :meth:`beartype._decor._data.BeartypeData.reinit` method agrees with the
+    :func:`inspect.signature` function.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype._decor._data import _get_func_params
+    from functools import wraps
+    from inspect import signature
+
+    def of_old_there(
+        lived_a_monarch: int,
+        in_whose_breast: str = 'Fear',
+        *with_hellish: bytes,
+        its_ward: float,
+        kept_every: complex = 1j,
+        **sense_and_feeling: list
+    ) -> bool:
+        pass
+
+    class Ahriman(object):
+        def whose_power(self, was_the_grave: int) -> str:
+            pass
+
+        @classmethod
+        def fired_by(cls, the_lamp=None):
+            pass
+
+    @wraps(of_old_there)
+    def and_forbade(*args, **kwargs):
+        pass
+
+    # For each callable to be inspected, assert these parameters to be those
+    # of the signature of this callable.
+    for func in (
+        of_old_there,
+        Ahriman.whose_power,
+        Ahriman().whose_power,
+        Ahriman.fired_by,
+        and_forbade,
+    ):
+        func_sig = signature(func)
+        assert _get_func_params(func) == (
+            tuple(
+                (param.name, param.kind, param.default, param.annotation)
+                for param in func_sig.parameters.values()
+            ),
+            func_sig.return_annotation,
+        )
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2020 by Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Beartype on-disk wrapper cache unit tests.**
+
+This submodule unit tests the :mod:`beartype._decor._diskcache` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from beartype_test.util.pyterror import raises_uncached
+from typing import List, Union
+
+# ....................{ PRIVATE ~ factories               }....................
+def _make_the_wanderer() -> 'Callable':
+    '''
+    New function whose qualified name, signature, and annotations are
+    identical to those of all other functions returned by this factory.
+    '''
+
+    def the_wanderer(
+        who_hears_the_waves: List[Union[int, str]],
+        moaning: 'random.Random' = None,
+    ) -> str:
+        return str(who_hears_the_waves[0])
+
+    return the_wanderer
+
+# ....................{ TESTS                             }....................
+def test_diskcache_pass(monkeypatch, tmp_path) -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype` decorator when the
+    on-disk wrapper cache is enabled.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+    from beartype._decor import _diskcache, _memcache, main
+    from random import Random
+    from weakref import WeakKeyDictionary
+
+    # Enable the on-disk wrapper cache in a temporary directory *AND* clear
+    # the in-memory wrapper cache.
+    monkeypatch.setattr(_diskcache, 'CACHE_DIRNAME', str(tmp_path))
+    monkeypatch.setattr(
+        _memcache, '_FUNC_CODEOBJ_TO_WRAPPER_CACHED', WeakKeyDictionary())
+
+    # Assert that decorating a cacheable function caches its wrapper.
+    the_wanderer = beartype(_make_the_wanderer())
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # Clear the in-memory wrapper cache, guaranteeing that subsequent
+    # decorations load their wrappers from the on-disk wrapper cache instead.
+    monkeypatch.setattr(
+        _memcache, '_FUNC_CODEOBJ_TO_WRAPPER_CACHED', WeakKeyDictionary())
+
+    # Prohibit code generation, guaranteeing that all subsequent decorations
+    # of identical functions load their wrappers from this cache.
+    def generate_code_uncached(data: object) -> None:
+        raise RuntimeError('Wrapper code generated despite being cached.')
+    monkeypatch.setattr(main, 'generate_code', generate_code_uncached)
+
+    # Assert that decorating an identical function loads its wrapper from this
+    # cache *WITHOUT* caching another wrapper.
+    and_cold_stars = beartype(_make_the_wanderer())
+    assert and_cold_stars is not the_wanderer
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # Assert that both wrappers behave identically.
+    for func_wrapper in (the_wanderer, and_cold_stars):
+        assert func_wrapper([8, 'Abandoned'], Random()) == '8'
+        assert func_wrapper.__wrapped__([8, 'Abandoned']) == '8'
+        with raises_uncached(BeartypeCallHintPepParamException):
+            func_wrapper([b'Adrift in the hull'])
+        with raises_uncached(BeartypeCallHintPepParamException):
+            func_wrapper([8], 'Of a derelict ship')
+
+
+def test_diskcache_corrupt_pass(monkeypatch, tmp_path) -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype` decorator when the
+    on-disk wrapper cache is enabled but contains corrupted files.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype._decor import _diskcache, _memcache
+    from weakref import WeakKeyDictionary
+
+    # Enable the on-disk wrapper cache in a temporary directory *AND* disable
+    # the in-memory wrapper cache for the duration of this test.
+    monkeypatch.setattr(_diskcache, 'CACHE_DIRNAME', str(tmp_path))
+    monkeypatch.setattr(_memcache, '_is_func_memcacheable', lambda func: False)
+
+    # Cache the wrapper of a cacheable function *AND* corrupt this file.
+    beartype(_make_the_wanderer())
+    cache_file_path = next(tmp_path.iterdir())
+    cache_file_path.write_bytes(b'Through the storm and the night')
+
+    # Assert that decorating an identical function ignores this corrupted
+    # file, regenerating and recaching its wrapper.
+    and_no_lighthouse = beartype(_make_the_wanderer())
+    assert and_no_lighthouse([0xFF]) == '255'
+    assert cache_file_path.read_bytes() != b'Through the storm and the night'
+
+
+def test_diskcache_pep563_stale_pass(monkeypatch, tmp_path) -> None:
+    '''
+    Test that the :func:`beartype.beartype` decorator invalidates wrappers
+    cached to disk for callables annotated by `PEP 563`_-postponed type hints
+    on modifying the modules declaring the objects these hints refer to
+    *without* modifying the modules declaring these callables.
+
+    .. _PEP 563:
+       https://www.python.org/dev/peps/pep-0563
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+    from beartype._decor import _diskcache, _memcache, main
+    from importlib import import_module, invalidate_caches
+    from sys import modules as sys_modules
+    from weakref import WeakKeyDictionary
+
+    # Enable the on-disk wrapper cache in a temporary directory *AND* disable
+    # the in-memory wrapper cache for the duration of this test.
+    cache_dirpath = tmp_path / 'cache'
+    cache_dirpath.mkdir()
+    monkeypatch.setattr(_diskcache, 'CACHE_DIRNAME', str(cache_dirpath))
+    monkeypatch.setattr(_memcache, '_is_func_memcacheable', lambda func: False)
+
+    # Temporary modules declaring a named tuple and a function annotated by a
+    # PEP 563-postponed type hint referring to that named tuple respectively.
+    module_dirpath = tmp_path / 'modules'
+    module_dirpath.mkdir()
+    monkeypatch.syspath_prepend(str(module_dirpath))
+    hint_module_path = module_dirpath / 'beartype_diskcache_the_shore.py'
+    func_module_path = module_dirpath / 'beartype_diskcache_the_dune.py'
+    func_module_path.write_text(
+        'from __future__ import annotations\n'
+        'from beartype_diskcache_the_shore import TheShore\n'
+        'def the_dune(sand: TheShore):\n'
+        '    return sand.wave\n'
+    )
+
+    def import_func_module(hint_type_name: str) -> 'ModuleType':
+        '''
+        Write the module declaring the named tuple with a field annotated by
+        the type with the passed name *AND* (re)import both temporary modules.
+        '''
+
+        hint_module_path.write_text(
+            'from typing import NamedTuple\n'
+            'class TheShore(NamedTuple):\n'
+            f'    wave: {hint_type_name}\n'
+        )
+        for module_name in (
+            'beartype_diskcache_the_dune', 'beartype_diskcache_the_shore'):
+            sys_modules.pop(module_name, None)
+        monkeypatch.setattr(_diskcache, '_MODULE_NAME_TO_FILE_STAT', {})
+        invalidate_caches()
+        return import_module('beartype_diskcache_the_dune')
+
+    # Assert that decorating this function caches its wrapper.
+    try:
+        func_module = import_func_module('str')
+        the_dune = beartype(func_module.the_dune)
+        TheShore = sys_modules['beartype_diskcache_the_shore'].TheShore
+        assert the_dune(TheShore('Salt')) == 'Salt'
+        with raises_uncached(BeartypeCallHintPepParamException):
+            the_dune(TheShore(b'Brine'))
+        assert len(list(cache_dirpath.iterdir())) == 1
+
+        # Assert that decorating this function again after reimporting *ONLY*
+        # the unmodified module declaring this function loads its wrapper from
+        # this cache *AND* resolves the postponed annotations on this function.
+        def generate_code_uncached(data: object) -> None:
+            raise RuntimeError('Wrapper code generated despite being cached.')
+        sys_modules.pop('beartype_diskcache_the_dune')
+        func_module = import_module('beartype_diskcache_the_dune')
+        with monkeypatch.context() as monkeypatch_context:
+            monkeypatch_context.setattr(
+                main, 'generate_code', generate_code_uncached)
+            the_dune = beartype(func_module.the_dune)
+        assert the_dune.__wrapped__.__annotations__ == {'sand': TheShore}
+        assert the_dune(TheShore('Salt')) == 'Salt'
+
+        # Modify *ONLY* the module declaring this named tuple.
+        func_module = import_func_module('bytes')
+        the_dune = beartype(func_module.the_dune)
+        TheShore = sys_modules['beartype_diskcache_the_shore'].TheShore
+
+        # Assert that decorating this function regenerates its wrapper rather
+        # than loading the stale wrapper cached above.
+        assert the_dune(TheShore(b'Brine')) == b'Brine'
+        with raises_uncached(BeartypeCallHintPepParamException):
+            the_dune(TheShore('Salt'))
+    # Remove these temporary modules from the module cache.
+    finally:
+        for module_name in (
+            'beartype_diskcache_the_dune', 'beartype_diskcache_the_shore'):
+            sys_modules.pop(module_name, None)
+
+
+def test_diskcache_pack_hint_pass() -> None:
+    '''
+    Test that the private :func:`beartype._decor._diskcache._pack_hint` and
+    :func:`beartype._decor._diskcache._unpack_hint` functions round-trip all
+    kinds of default values of private hint parameters.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype._decor._code._pep._pepsubclass import SubclassCache
+    from beartype._decor._code._pep._pepunion import UnionTypeDispatch
+    from beartype._decor._diskcache import _pack_hint, _unpack_hint
+
+    # Assert that packable hints round-trip.
+    for hint in (int, (bytes, str), frozenset((bool, int))):
+        assert _unpack_hint(_pack_hint(hint)) == hint
+
+    # Assert that frozen sets of the type-qualified literal objects passed by
+    # code type-checking literals round-trip, preserving these types.
+    hint_literals = frozenset(((bool, True), (int, 1), (str, 'Unseen')))
+    hint_literals_unpacked = _unpack_hint(_pack_hint(hint_literals))
+    assert hint_literals_unpacked == hint_literals
+    assert {
+        hint_literal.__class__ for _, hint_literal in hint_literals_unpacked
+    } == {bool, int, str}
+
+    # Assert that union dispatch tables round-trip *WITHOUT* the exact types
+    # memoized by these tables.
+    union_dispatch = UnionTypeDispatch(((int, 0), (list, 1), (dict, 2)))
+    assert union_dispatch[bool] == 0
+    union_dispatch_unpacked = _unpack_hint(_pack_hint(union_dispatch))
+    assert union_dispatch_unpacked.__class__ is UnionTypeDispatch
+    assert union_dispatch_unpacked.hint_childs_meta == (
+        union_dispatch.hint_childs_meta)
+    assert not union_dispatch_unpacked
+
+    # Assert that subclass caches round-trip *WITHOUT* the classes memoized by
+    # these caches.
+    subclass_cache = SubclassCache((int, str))
+    assert subclass_cache[bool] is True
+    subclass_cache_unpacked = _unpack_hint(_pack_hint(subclass_cache))
+    assert subclass_cache_unpacked.__class__ is SubclassCache
+    assert subclass_cache_unpacked.hint_superclasses == (int, str)
+    assert not subclass_cache_unpacked
+
+    # Assert that containers of unpackable types are unpackable.
+    class TheHollowWind(object): pass
+    assert _pack_hint(frozenset((int, TheHollowWind))) is None
+    assert _pack_hint(([],)) is None
+    assert _pack_hint(UnionTypeDispatch(((TheHollowWind, 0),))) is None
+    assert _pack_hint(SubclassCache((TheHollowWind,))) is None
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2020 by Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Beartype in-memory wrapper cache unit tests.**
+
+This submodule unit tests the :mod:`beartype._decor._memcache` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from beartype_test.util.pyterror import raises_uncached
+from typing import Sequence, Union
+
+# ....................{ PRIVATE ~ factories               }....................
+def _make_a_tenant(hint: object, tenant_name: str) -> 'Callable':
+    '''
+    New closure annotated by the passed hint sharing the same code object as
+    all other closures returned by this factory.
+    '''
+
+    def a_lonely_tenant(
+        of_the_hall: hint, and_of_the_house: str = None) -> str:
+        return f'{tenant_name}: {of_the_hall[0]}'
+
+    return a_lonely_tenant
+
+# ....................{ TESTS                             }....................
+def test_memcache_pass(monkeypatch) -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype` decorator on
+    closures sharing the same code object *and* annotations.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+    from beartype._decor import main
+
+    # Type hint shared by all closures created below.
+    hint = Sequence[Union[int, str]]
+
+    # Decorate the first such closure, generating its wrapper.
+    keats = beartype(_make_a_tenant(hint, 'Keats'))
+
+    # Prohibit code generation, guaranteeing that all subsequent decorations
+    # of closures sharing this code object reuse this wrapper.
+    def generate_code_uncached(data: object) -> None:
+        raise RuntimeError('Wrapper code generated despite being cached.')
+    monkeypatch.setattr(main, 'generate_code', generate_code_uncached)
+
+    # Decorate another such closure, reusing this wrapper.
+    shelley = beartype(_make_a_tenant(hint, 'Shelley'))
+    assert shelley is not keats
+
+    # Assert that both wrappers call their respective closures.
+    assert keats(['Endymion']) == 'Keats: Endymion'
+    assert shelley((1818,)) == 'Shelley: 1818'
+
+    # Assert that both wrappers type-check their respective closures.
+    for func_wrapper in (keats, shelley):
+        with raises_uncached(BeartypeCallHintPepParamException):
+            func_wrapper([b'A thing of beauty is a joy for ever'])
+        with raises_uncached(BeartypeCallHintPepParamException):
+            func_wrapper([0], b'Its loveliness increases')
+
+
+def test_memcache_pep563_pass(monkeypatch) -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype` decorator on
+    closures sharing the same code object *and* `PEP 563`_-postponed
+    annotations.
+
+    .. _PEP 563:
+       https://www.python.org/dev/peps/pep-0563
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+    from beartype._decor import main
+    from beartype_test.unit.data.data_pep563 import (
+        make_minecraft_end_txt_stanza_getter)
+
+    # Decorate the first such closure, generating its wrapper *AND* resolving
+    # the postponed annotations on this closure.
+    julian = beartype(make_minecraft_end_txt_stanza_getter('Julian'))
+
+    # Prohibit code generation, guaranteeing that all subsequent decorations
+    # of closures sharing this code object reuse this wrapper despite the
+    # annotations on this wrapper having been resolved.
+    def generate_code_uncached(data: object) -> None:
+        raise RuntimeError('Wrapper code generated despite being cached.')
+    monkeypatch.setattr(main, 'generate_code', generate_code_uncached)
+
+    # Decorate another such closure, reusing this wrapper.
+    markus = beartype(make_minecraft_end_txt_stanza_getter('Markus'))
+    assert markus is not julian
+
+    # Assert that both wrappers call their respective closures.
+    assert julian(1) == 'Julian?'
+    assert markus(1) == 'Markus?'
+
+    # Assert that both wrappers type-check their respective closures.
+    for func_wrapper in (julian, markus):
+        with raises_uncached(BeartypeCallHintPepParamException):
+            func_wrapper('Wake up.')
+
+
+def test_memcache_pep563_rebound_pass(monkeypatch) -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype` decorator on
+    closures sharing the same code object *and* `PEP 563`_-postponed
+    annotations referring to a global rebound between decorations.
+
+    .. _PEP 563:
+       https://www.python.org/dev/peps/pep-0563
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+    from beartype._decor import main
+    from beartype_test.unit.data import data_pep563
+
+    # Decorate the first such closure while this global refers to one type.
+    ender = beartype(data_pep563.make_minecraft_end_txt_hinted_getter())
+
+    # Decorate another such closure after rebinding this global to another
+    # type, which must *NOT* reuse the wrapper generated above.
+    monkeypatch.setattr(data_pep563, 'MinecraftEndTxtHint', str)
+    dragon = beartype(data_pep563.make_minecraft_end_txt_hinted_getter())
+
+    # Assert that each wrapper type-checks the type this global referred to
+    # when decorating its closure.
+    assert ender(0xE) == '14?'
+    assert dragon('Ender') == 'Ender?'
+    with raises_uncached(BeartypeCallHintPepParamException):
+        ender('Dragon')
+    with raises_uncached(BeartypeCallHintPepParamException):
+        dragon(0xE)
+
+    # Assert that the annotations on both closures were resolved.
+    assert ender.__wrapped__.__annotations__['player_name'] is int
+    assert dragon.__wrapped__.__annotations__['player_name'] is str
+
+    # Prohibit code generation, guaranteeing that all subsequent decorations
+    # of closures sharing this code object reuse the prior wrapper.
+    def generate_code_uncached(data: object) -> None:
+        raise RuntimeError('Wrapper code generated despite being cached.')
+    monkeypatch.setattr(main, 'generate_code', generate_code_uncached)
+
+    # Decorate yet another such closure *WITHOUT* rebinding this global again,
+    # which must reuse the wrapper generated for the prior closure *AND*
+    # resolve the annotations on this closure.
+    netherite = beartype(data_pep563.make_minecraft_end_txt_hinted_getter())
+    assert netherite('Netherite') == 'Netherite?'
+    with raises_uncached(BeartypeCallHintPepParamException):
+        netherite(0xE)
+    assert netherite.__wrapped__.__annotations__ == (
+        dragon.__wrapped__.__annotations__)
+
+
+def test_memcache_hint_differ_pass() -> None:
+    '''
+    Test successful usage of the :func:`beartype.beartype` decorator on
+    closures sharing the same code object but *not* annotations.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintPepParamException
+
+    # Decorate closures sharing the same code object but annotated by
+    # different hints, which must *NOT* share the same wrapper.
+    ozymandias = beartype(_make_a_tenant(Sequence[int], 'Ozymandias'))
+    mutability = beartype(_make_a_tenant(Sequence[str], 'Mutability'))
+
+    # Assert that each wrapper type-checks its own hint.
+    assert ozymandias([1817]) == 'Ozymandias: 1817'
+    assert mutability(['We are as clouds']) == 'Mutability: We are as clouds'
+    with raises_uncached(BeartypeCallHintPepParamException):
+        ozymandias(['that veil the midnight moon'])
+    with raises_uncached(BeartypeCallHintPepParamException):
+        mutability([1816])
@@ -29,15 +29,17 @@ def _eval_registered_expr(hint_expr: str) -> (type, tuple):
     assert isinstance(hint_expr, str), '{repr(hint_expr)} not string.'
 
     # Defer heavyweight imports.
+    from beartype._decor.main import _GLOBAL_ATTRS
     from beartype._decor._typistry import bear_typistry
     from beartype._decor._code.codesnip import PARAM_NAME_TYPISTRY
 
     # Dictionary of all local variables required to evaluate this expression.
     eval_locals = {PARAM_NAME_TYPISTRY: bear_typistry}
 
-    # Evaluate this expression under these local variables and return the
-    # resulting value.
-    return eval(hint_expr, {}, eval_locals)
+    # Evaluate this expression under these local variables and a copy of the
+    # global variables of all wrapper functions (including private aliases of
+    # builtin types) and return the resulting value.
+    return eval(hint_expr, _GLOBAL_ATTRS.copy(), eval_locals)
 
 # ....................{ TESTS ~ callable : type           }....................
 def test_typistry_register_type_pass() -> None:
@@ -49,6 +51,7 @@ def test_typistry_register_type_pass() -> None:
     # Defer heavyweight imports.
     from beartype.cave import RegexCompiledType
     from beartype.roar import _BeartypeDecorBeartypistryException
+    from beartype._decor._code.codesnip import ATTR_NAME_BUILTIN_PREFIX
     from beartype._decor._typistry import register_typistry_type
     from beartype._util.utilobject import get_object_class_basename
 
@@ -70,11 +73,12 @@ def test_typistry_register_type_pass() -> None:
     hint_cached = _eval_registered_expr(hint_name_cached)
     assert hint is hint_cached
 
-    # Assert this function registers a builtin type under its unqualified
-    # basename.
+    # Assert this function registers a builtin type under the private alias of
+    # its unqualified basename.
     hint = list
     hint_name_cached = register_typistry_type(hint)
-    assert hint_name_cached == get_object_class_basename(hint)
+    assert hint_name_cached == (
+        f'{ATTR_NAME_BUILTIN_PREFIX}{get_object_class_basename(hint)}')
     hint_cached = _eval_registered_expr(hint_name_cached)
     assert hint is hint_cached
 
@@ -203,6 +207,120 @@ def test_typistry_register_tuple_fail() -> None:
     with raises(_BeartypeDecorBeartypistryException):
         register_typistry_tuple((int, Pep484GenericTypevaredSingle, str,))
 
+
+def test_typistry_get_tuple_pass() -> None:
+    '''
+    Test successful usage of the
+    :func:`beartype._decor._typistry.get_typistry_tuple` function.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype.cave import CallableTypes
+    from beartype._decor._typistry import (
+        get_typistry_tuple, register_typistry_tuple)
+
+    # Assert this function returns the same tuple registered by the
+    # register_typistry_tuple() function for the same tuple.
+    hint = CallableTypes
+    hint_cached = get_typistry_tuple(hint)
+    assert set(hint) == set(hint_cached)
+    assert hint_cached is _eval_registered_expr(register_typistry_tuple(hint))
+    assert hint_cached is get_typistry_tuple(hint)
+
+    # Assert this function reduces tuples of one type to merely that type.
+    assert get_typistry_tuple((int,)) is int
+
+    # Assert that tuples containing duplicate types reduce to tuples
+    # containing only the non-duplicate types.
+    assert get_typistry_tuple((bytes, bytes, bytes,)) == (bytes,)
+
+
+def test_typistry_get_tuple_fail() -> None:
+    '''
+    Test unsuccessful usage of the
+    :func:`beartype._decor._typistry.get_typistry_tuple` function.
+    '''
+
+    # Defer heavyweight imports
+    from beartype.roar import (
+        _BeartypeDecorBeartypistryException,
+        _BeartypeUtilClassException,
+    )
+    from beartype._decor._typistry import get_typistry_tuple
+
+    # Assert that non-tuple objects are *NOT* gettable via this function.
+    with raises(_BeartypeDecorBeartypistryException):
+        get_typistry_tuple('The Second Coming')
+
+    # Assert that tuples of one non-type are *NOT* gettable via this function.
+    with raises(_BeartypeUtilClassException):
+        get_typistry_tuple(('Slouches towards Bethlehem to be born',))
+
+# ....................{ TESTS ~ forwardref                }....................
+def test_typistry_register_forwardref_pass() -> None:
+    '''
+    Test successful usage of the
+    :func:`beartype._decor._typistry.register_typistry_forwardref` function.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype._decor._typistry import (
+        BeartypistryForwardRef, register_typistry_forwardref)
+    from random import Random
+
+    # Assert this function returns the same unbound proxy for the same
+    # fully-qualified forward reference.
+    hint = register_typistry_forwardref('random.Random')
+    assert isinstance(hint, BeartypistryForwardRef)
+    assert hint is register_typistry_forwardref('random.Random')
+
+    # Assert this unbound proxy behaves as the class referred to by this
+    # forward reference in both "isinstance" and "issubclass" checks.
+    assert isinstance(Random(), hint)
+    assert not isinstance('Turning and turning in the widening gyre', hint)
+    assert issubclass(Random, hint)
+
+    # Arbitrary function to be bound to this proxy.
+    def the_falcon() -> str:
+        return 'The falcon cannot hear the falconer;'
+
+    # Proxy bound to this function, preserving the parameter name of the
+    # unbound proxy this proxy was created from.
+    hint_bound = hint.bind(the_falcon)
+    assert hint_bound.param_name == hint.param_name
+
+    # Pass this bound proxy as the default value of this parameter.
+    the_falcon.__kwdefaults__ = {hint.param_name: hint_bound}
+
+    # Assert the first check against this bound proxy self-patches this
+    # function by replacing this proxy with this class.
+    assert isinstance(Random(), hint_bound)
+    assert the_falcon.__kwdefaults__[hint.param_name] is Random
+
+
+def test_typistry_register_forwardref_fail() -> None:
+    '''
+    Test unsuccessful usage of the
+    :func:`beartype._decor._typistry.register_typistry_forwardref` function.
+    '''
+
+    # Defer heavyweight imports.
+    from beartype.roar import (
+        BeartypeCallHintForwardRefException,
+        BeartypeDecorHintForwardRefException,
+    )
+    from beartype._decor._typistry import register_typistry_forwardref
+
+    # Assert that syntactically invalid classnames are *NOT* registrable.
+    with raises(BeartypeDecorHintForwardRefException):
+        register_typistry_forwardref('Things fall apart; the centre cannot')
+
+    # Assert that checks against proxies referring to non-existent classes
+    # raise the expected exception.
+    hint = register_typistry_forwardref('random.MereAnarchyIsLoosed')
+    with raises(BeartypeCallHintForwardRefException):
+        isinstance('upon the world', hint)
+
 # ....................{ TESTS ~ singleton                 }....................
 def test_typistry_singleton_pass() -> None:
     '''